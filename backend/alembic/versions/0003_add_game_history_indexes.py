@@ -0,0 +1,43 @@
+"""Index the game history access paths."""
+
+from __future__ import annotations
+
+from alembic import op
+
+revision = "0003_add_game_history_indexes"
+down_revision = "0002_add_game_history"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The composite index serves every lookup the single-column one did.
+    op.drop_index("ix_game_player_stats_user_id", table_name="game_player_stats")
+    op.create_index(
+        "ix_game_player_stats_user_id_session_id",
+        "game_player_stats",
+        ["user_id", "session_id"],
+    )
+    op.create_index(
+        "ix_game_sessions_session_code",
+        "game_sessions",
+        ["session_code"],
+    )
+    op.create_index(
+        "ix_game_sessions_finished_at_id",
+        "game_sessions",
+        ["finished_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_game_sessions_finished_at_id", table_name="game_sessions")
+    op.drop_index("ix_game_sessions_session_code", table_name="game_sessions")
+    op.drop_index(
+        "ix_game_player_stats_user_id_session_id", table_name="game_player_stats"
+    )
+    op.create_index(
+        "ix_game_player_stats_user_id",
+        "game_player_stats",
+        ["user_id"],
+    )
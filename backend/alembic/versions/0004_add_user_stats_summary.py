@@ -0,0 +1,60 @@
+"""Add per-user career stats summary."""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision = "0004_add_user_stats_summary"
+down_revision = "0003_add_game_history_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_stats_summary",
+        sa.Column(
+            "user_id", postgresql.UUID(as_uuid=True), primary_key=True, nullable=False
+        ),
+        sa.Column("games_played", sa.Integer(), nullable=False),
+        sa.Column("wins", sa.Integer(), nullable=False),
+        sa.Column("bankruptcies", sa.Integer(), nullable=False),
+        sa.Column("total_capital", sa.Float(), nullable=False),
+        sa.Column("best_capital", sa.Float(), nullable=False),
+        sa.Column("total_place", sa.Integer(), nullable=False),
+        sa.Column("last_finished_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+    )
+    # Backfill from the history recorded before the summary existed.
+    op.execute(
+        """
+        INSERT INTO user_stats_summary (
+            user_id, games_played, wins, bankruptcies, total_capital,
+            best_capital, total_place, last_finished_at
+        )
+        SELECT
+            stats.user_id,
+            COUNT(*),
+            SUM(CASE WHEN stats.is_top1 THEN 1 ELSE 0 END),
+            SUM(CASE WHEN stats.is_bankrupt THEN 1 ELSE 0 END),
+            SUM(stats.capital),
+            MAX(stats.capital),
+            SUM(stats.place),
+            MAX(sessions.finished_at)
+        FROM game_player_stats AS stats
+        JOIN game_sessions AS sessions ON sessions.id = stats.session_id
+        WHERE stats.user_id IS NOT NULL
+        GROUP BY stats.user_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("user_stats_summary")
@@ -0,0 +1,53 @@
+"""Add leaderboard daily totals and the all-time ranking index."""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision = "0005_add_leaderboard"
+down_revision = "0004_add_user_stats_summary"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "leaderboard_daily",
+        sa.Column("day", sa.Date(), primary_key=True, nullable=False),
+        sa.Column(
+            "user_id", postgresql.UUID(as_uuid=True), primary_key=True, nullable=False
+        ),
+        sa.Column("games_played", sa.Integer(), nullable=False),
+        sa.Column("wins", sa.Integer(), nullable=False),
+        sa.Column("total_place", sa.Integer(), nullable=False),
+    )
+    op.create_index(
+        "ix_user_stats_summary_wins",
+        "user_stats_summary",
+        [sa.text("wins DESC"), "games_played", "user_id"],
+    )
+    # Backfill from the history recorded before the table existed.
+    op.execute(
+        """
+        INSERT INTO leaderboard_daily (
+            day, user_id, games_played, wins, total_place
+        )
+        SELECT
+            CAST(timezone('UTC', sessions.finished_at) AS DATE),
+            stats.user_id,
+            COUNT(*),
+            SUM(CASE WHEN stats.is_top1 THEN 1 ELSE 0 END),
+            SUM(stats.place)
+        FROM game_player_stats AS stats
+        JOIN game_sessions AS sessions ON sessions.id = stats.session_id
+        WHERE stats.user_id IS NOT NULL
+        GROUP BY 1, stats.user_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_user_stats_summary_wins", table_name="user_stats_summary")
+    op.drop_table("leaderboard_daily")
@@ -5,7 +5,12 @@ from __future__ import annotations
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from fabricat_backend.api.routers import auth_router, history_router, session_router
+from fabricat_backend.api.routers import (
+    auth_router,
+    health_router,
+    history_router,
+    session_router,
+)
 
 
 def create_api() -> FastAPI:
@@ -23,6 +28,7 @@ def create_api() -> FastAPI:
         allow_headers=["*"],
     )
     app.include_router(auth_router)
+    app.include_router(health_router)
     app.include_router(history_router)
     app.include_router(session_router)
     return app
@@ -1,32 +1,89 @@
 """Dependency providers for FastAPI routers."""
 
+from functools import cache
 from typing import Annotated
 from uuid import UUID
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy.orm import Session
 
-from fabricat_backend.api.services import AuthService
-from fabricat_backend.database import UserRepository, get_session
-from fabricat_backend.database.schemas.user import UserSchema
+from fabricat_backend.api.services import (
+    AuthenticatedUser,
+    AuthService,
+    LeaderboardService,
+    PasswordHasher,
+    PasswordHashParams,
+    UserIdentityCache,
+    VerifiedTokenCache,
+)
+from fabricat_backend.database import (
+    AsyncDatabaseService,
+    AsyncUserRepository,
+    DatabaseService,
+    get_async_database,
+    get_database,
+)
 from fabricat_backend.settings import BackendSettings, get_settings
 
 _security = HTTPBearer(auto_error=False)
 SettingsDep = Annotated[BackendSettings, Depends(get_settings)]
 
 
+@cache
+def _build_password_hasher(
+    params: PasswordHashParams, max_workers: int, max_pending: int
+) -> PasswordHasher:
+    """Create the hashing pool shared by every :class:`AuthService`."""
+    return PasswordHasher(
+        params=params, max_workers=max_workers, max_pending=max_pending
+    )
+
+
+def get_password_hasher(settings: SettingsDep) -> PasswordHasher:
+    """Return the process-wide password hasher and its worker pool."""
+    return _build_password_hasher(
+        PasswordHashParams.from_settings(settings),
+        settings.auth_hash_workers,
+        settings.auth_hash_max_pending,
+    )
+
+
+@cache
+def _build_token_cache(secret_key: str) -> VerifiedTokenCache:  # noqa: ARG001
+    """Create the verified-token cache for tokens signed with ``secret_key``.
+
+    One cache per signing key, so a token is never accepted under another key.
+    """
+    return VerifiedTokenCache()
+
+
+@cache
+def get_identity_cache() -> UserIdentityCache:
+    """Return the process-wide cache of authenticated user identities."""
+    return UserIdentityCache()
+
+
 def get_auth_service(settings: SettingsDep) -> AuthService:
     """Instantiate :class:`AuthService` bound to application settings."""
-    return AuthService(settings=settings)
+    return AuthService(
+        settings=settings,
+        hasher=get_password_hasher(settings),
+        token_cache=_build_token_cache(settings.auth_secret_key),
+        identities=get_identity_cache(),
+    )
 
 
-def get_current_user(
+async def get_current_user(
     credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(_security)],
-    session: Annotated[Session, Depends(get_session)],
+    database: Annotated[AsyncDatabaseService, Depends(get_async_database)],
     auth_service: Annotated[AuthService, Depends(get_auth_service)],
-) -> UserSchema:
-    """Resolve the authenticated user from a bearer token."""
+    identities: Annotated[UserIdentityCache, Depends(get_identity_cache)],
+) -> AuthenticatedUser:
+    """Resolve the authenticated user from a bearer token.
+
+    Verified tokens and user identities are cached, so repeat requests
+    usually neither check a signature nor touch the database.
+    """
     if credentials is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Missing credentials"
@@ -39,7 +96,6 @@ def get_current_user(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token"
         ) from exc
 
-    repository = UserRepository(session)
     try:
         user_id = UUID(payload.sub)
     except ValueError as exc:
@@ -47,13 +103,36 @@ def get_current_user(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token subject"
         ) from exc
 
-    user = repository.get_by_id(user_id)
-    if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found"
-        )
+    identity = identities.get(user_id)
+    if identity is not None:
+        return identity
+
+    async with database.session() as session:
+        user = await AsyncUserRepository(session).get_by_id(user_id)
+        if user is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found"
+            )
+        return identities.put(AuthenticatedUser.from_schema(user))
+
+
+@cache
+def _build_leaderboard_service(database: DatabaseService) -> LeaderboardService:
+    """Create the leaderboard cache shared by every user of ``database``."""
+    return LeaderboardService(database=database)
+
 
-    return user
+def get_leaderboard_service(
+    database: Annotated[DatabaseService, Depends(get_database)],
+) -> LeaderboardService:
+    """Return the cached leaderboard service for the configured database."""
+    return _build_leaderboard_service(database)
 
 
-__all__ = ["get_auth_service", "get_current_user"]
+__all__ = [
+    "get_auth_service",
+    "get_current_user",
+    "get_identity_cache",
+    "get_leaderboard_service",
+    "get_password_hasher",
+]
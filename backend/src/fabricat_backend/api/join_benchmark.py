@@ -0,0 +1,146 @@
+"""Concurrency benchmark for the lobby join path of the session router."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+from dataclasses import asdict, dataclass
+from statistics import quantiles
+from typing import TYPE_CHECKING
+
+from fabricat_backend.api.routers import session as session_router
+from fabricat_backend.api.services import create_session_store
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from pydantic import BaseModel
+
+
+@dataclass(slots=True)
+class JoinBenchmarkResult:
+    """Latency distribution of one burst of concurrent joins."""
+
+    users: int
+    lobbies: int
+    joined: int
+    rejected: int
+    elapsed_seconds: float
+    p50_ms: float
+    p95_ms: float
+    max_ms: float
+
+    @property
+    def joins_per_second(self) -> float:
+        """Successful joins completed per wall-clock second."""
+        if self.elapsed_seconds == 0:
+            return 0.0
+        return self.joined / self.elapsed_seconds
+
+    def to_dict(self) -> dict[str, float | int]:
+        """Return a JSON-serialisable view of the result."""
+        return {**asdict(self), "joins_per_second": self.joins_per_second}
+
+
+async def _discard(_model: BaseModel) -> None:
+    """Outbound channel that drops everything, so only the join path is timed."""
+
+
+async def benchmark_joins(
+    *, users: int, lobbies: int, ramp_seconds: float = 0.0
+) -> JoinBenchmarkResult:
+    """Join ``users`` players spread over ``lobbies`` lobbies concurrently.
+
+    Every join runs in its own task, mirroring simultaneous websocket
+    connections. Arrivals are spread evenly over ``ramp_seconds``, so later
+    players join lobbies that already exist while new ones are still being
+    created. All connections are released again before returning.
+    """
+    if users < 1 or lobbies < 1:
+        msg = "Users and lobbies must be positive."
+        raise ValueError(msg)
+    if ramp_seconds < 0:
+        msg = "Ramp duration must be non-negative."
+        raise ValueError(msg)
+
+    loop = asyncio.get_running_loop()
+    run_id = f"{int(loop.time() * 1_000):x}"
+    latencies: list[float] = []
+    joined: list[tuple[session_router.SessionContext, str]] = []
+    rejected = 0
+
+    async def join(index: int) -> None:
+        nonlocal rejected
+        user_identifier = f"bench-{run_id}-{index}"
+        if ramp_seconds:
+            await asyncio.sleep(ramp_seconds * index / users)
+        started = loop.time()
+        try:
+            context, *_ = await session_router._register_connection(  # noqa: SLF001
+                requested_code=f"bench-{run_id}-{index % lobbies}",
+                user_identifier=user_identifier,
+                send=_discard,
+            )
+        except session_router.SessionJoinError:
+            rejected += 1
+            return
+        latencies.append(loop.time() - started)
+        joined.append((context, user_identifier))
+
+    started = loop.time()
+    await asyncio.gather(*(join(index) for index in range(users)))
+    elapsed = loop.time() - started
+
+    for context, user_identifier in joined:
+        await session_router._release_connection(  # noqa: SLF001
+            context, user_identifier=user_identifier, sender=_discard
+        )
+
+    if len(latencies) > 1:
+        cuts = quantiles(latencies, n=100, method="inclusive")
+        p50, p95 = cuts[49], cuts[94]
+    else:
+        p50 = p95 = latencies[0] if latencies else 0.0
+    return JoinBenchmarkResult(
+        users=users,
+        lobbies=lobbies,
+        joined=len(latencies),
+        rejected=rejected,
+        elapsed_seconds=elapsed,
+        p50_ms=p50 * 1_000,
+        p95_ms=p95 * 1_000,
+        max_ms=max(latencies, default=0.0) * 1_000,
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Command-line entry point for the join benchmark."""
+    parser = argparse.ArgumentParser(
+        description="Join N users across M lobbies concurrently and time it.",
+    )
+    parser.add_argument("--users", type=int, default=1_000)
+    parser.add_argument("--lobbies", type=int, default=250)
+    parser.add_argument("--ramp-seconds", type=float, default=0.0)
+    parser.add_argument(
+        "--session-store",
+        default=None,
+        help="Session store URL, e.g. sqlite:///tmp/sessions.db (default: memory).",
+    )
+    args = parser.parse_args(argv)
+
+    async def run() -> JoinBenchmarkResult:
+        if args.session_store is not None:
+            session_router._SESSION_STORE = create_session_store(  # noqa: SLF001
+                args.session_store
+            )
+        return await benchmark_joins(
+            users=args.users, lobbies=args.lobbies, ramp_seconds=args.ramp_seconds
+        )
+
+    result = asyncio.run(run())
+    sys.stdout.write(json.dumps(result.to_dict(), indent=2) + "\n")
+
+
+__all__ = ["JoinBenchmarkResult", "benchmark_joins", "main"]
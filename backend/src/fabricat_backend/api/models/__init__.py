@@ -8,18 +8,26 @@ from fabricat_backend.api.models.auth import (
     UserRegisterResponse,
     UserResponse,
 )
+from fabricat_backend.api.models.health import DatabasePoolHealth
 from fabricat_backend.api.models.history import (
+    LeaderboardEntry,
+    LeaderboardPage,
+    PlayerCareerStats,
     PlayerGameStats,
     PlayerGameStatsList,
 )
 
 __all__ = [
     "AuthTokenResponse",
+    "DatabasePoolHealth",
     "UserLoginRequest",
     "UserLoginResponse",
     "UserRegisterRequest",
     "UserRegisterResponse",
     "UserResponse",
+    "LeaderboardEntry",
+    "LeaderboardPage",
+    "PlayerCareerStats",
     "PlayerGameStats",
     "PlayerGameStatsList",
 ]
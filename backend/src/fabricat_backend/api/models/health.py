@@ -0,0 +1,20 @@
+"""Pydantic models for service health reports."""
+
+from pydantic import BaseModel, Field
+
+
+class DatabasePoolHealth(BaseModel):
+    """Connection pool usage and checkout latency."""
+
+    capacity: int = Field(description="Pool size plus allowed overflow.")
+    checked_out: int
+    peak_checked_out: int
+    saturation: float = Field(description="Checked-out share of capacity.")
+    checkouts: int
+    timeouts: int
+    wait_p50_ms: float
+    wait_p95_ms: float
+    wait_max_ms: float
+
+
+__all__ = ["DatabasePoolHealth"]
@@ -1,9 +1,12 @@
 """Pydantic models for game history queries."""
 
 from datetime import datetime
+from uuid import UUID
 
 from pydantic import BaseModel, Field
 
+from fabricat_backend.shared import LeaderboardMetric, LeaderboardWindow
+
 
 class PlayerGameStats(BaseModel):
     """Flattened view of a player's stats in a single session."""
@@ -27,6 +30,54 @@ class PlayerGameStatsList(BaseModel):
     """Paginated list wrapper for player game stats."""
 
     items: list[PlayerGameStats]
+    next_cursor: str | None = Field(
+        default=None,
+        description="Opaque cursor for the next page, absent on the last page.",
+    )
+
+
+class PlayerCareerStats(BaseModel):
+    """Aggregated results of every game the player finished."""
+
+    games_played: int
+    wins: int
+    bankruptcies: int
+    win_rate: float
+    bankruptcy_rate: float
+    average_capital: float
+    best_capital: float
+    average_place: float
+    last_finished_at: datetime | None
+
+
+class LeaderboardEntry(BaseModel):
+    """A ranked player on a leaderboard page."""
+
+    rank: int = Field(ge=1)
+    user_id: UUID
+    nickname: str | None
+    icon: str | None
+    games_played: int
+    wins: int
+    average_place: float
+
+
+class LeaderboardPage(BaseModel):
+    """One page of a leaderboard, ordered by rank."""
+
+    metric: LeaderboardMetric
+    window: LeaderboardWindow
+    items: list[LeaderboardEntry]
+    next_offset: int | None = Field(
+        default=None,
+        description="Offset of the next page, absent on the last page.",
+    )
 
 
-__all__ = ["PlayerGameStats", "PlayerGameStatsList"]
+__all__ = [
+    "LeaderboardEntry",
+    "LeaderboardPage",
+    "PlayerCareerStats",
+    "PlayerGameStats",
+    "PlayerGameStatsList",
+]
@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Annotated, Any, Literal
 
 from pydantic import BaseModel, Field
 
-from fabricat_backend.game_logic.phases import GamePhase, PhaseAnalytics, PhaseReport, PhaseTick
+from fabricat_backend.game_logic.phases import (
+    GamePhase,
+    PhaseAnalytics,
+    PhaseJournalEntry,
+    PhaseReport,
+    PhaseTick,
+)
 from fabricat_backend.game_logic.session import (
     Bid,
     GameSettings,
@@ -19,7 +26,7 @@ class SubmitBuyBidPayload(BaseModel):
     """Client request to submit a raw-material buy bid."""
 
     kind: Literal["submit_buy_bid"]
-    quantity: int = Field(ge=0)
+    quantity: int = Field(ge=0, le=9_999)
     price: float = Field(gt=0)
 
     def to_bid(self) -> Bid:
@@ -31,7 +38,7 @@ class SubmitSellBidPayload(BaseModel):
     """Client request to submit a finished-good sell bid."""
 
     kind: Literal["submit_sell_bid"]
-    quantity: int = Field(ge=0)
+    quantity: int = Field(ge=0, le=9_999)
     price: float = Field(gt=0)
 
     def to_bid(self) -> Bid:
@@ -51,7 +58,7 @@ class LoanDecisionPayload(BaseModel):
     """Request to change the status of a specific loan slot."""
 
     kind: Literal["loan_decision"]
-    slot: int = Field(ge=0)
+    slot: int = Field(ge=0, le=9_999)
     decision: Literal["call", "skip"]
 
 
@@ -79,11 +86,19 @@ PhaseActionPayload = Annotated[
 ]
 
 
+WsProtocol = Literal["full", "delta"]
+
+
 class JoinSessionRequest(BaseModel):
-    """First message sent by the client when connecting."""
+    """First message sent by the client when connecting.
+
+    ``protocol="delta"`` opts into receiving one analytics snapshot followed
+    by sequence-numbered field-level deltas instead of full reports.
+    """
 
     type: Literal["join"]
     session_code: str | None = None
+    protocol: WsProtocol = "full"
 
 
 class PhaseStatusRequest(BaseModel):
@@ -107,6 +122,12 @@ class PhaseActionRequest(BaseModel):
     payload: PhaseActionPayload
 
 
+class ResyncRequest(BaseModel):
+    """Delta client asking for a fresh snapshot after detecting a gap."""
+
+    type: Literal["resync"]
+
+
 class SessionControlRequest(BaseModel):
     """Out-of-band command that controls the gameplay runtime."""
 
@@ -120,6 +141,7 @@ InboundWsMessage = Annotated[
     | PhaseStatusRequest
     | HeartbeatRequest
     | PhaseActionRequest
+    | ResyncRequest
     | SessionControlRequest,
     Field(discriminator="type"),
 ]
@@ -137,6 +159,8 @@ class SessionWelcomeResponse(BaseModel):
     seniority: list[SenioritySnapshot]
     tie_break_log: list[SeniorityRollLogEntry]
     settings: GameSettings
+    protocol: WsProtocol = "full"
+    analytics_seq: int | None = None
 
 
 class PhaseTickResponse(BaseModel):
@@ -153,6 +177,47 @@ class PhaseReportResponse(BaseModel):
     report: PhaseReport
 
 
+class PlayerAnalyticsDelta(BaseModel):
+    """Changed fields of one player's analytics entry."""
+
+    player_id: int
+    changes: dict[str, Any]
+
+
+class AnalyticsDelta(BaseModel):
+    """Field-level difference between two analytics snapshots.
+
+    A client holding the snapshot numbered ``base_seq`` applies the changes to
+    obtain snapshot ``seq``; any other base means a message was missed and the
+    client should send a `ResyncRequest`.
+    """
+
+    seq: int
+    base_seq: int
+    players: list[PlayerAnalyticsDelta] = Field(default_factory=list)
+    removed_players: list[int] = Field(default_factory=list)
+    fields: dict[str, Any] = Field(default_factory=dict)
+
+
+class PhaseReportDeltaResponse(BaseModel):
+    """Phase report for delta clients, carrying analytics as a delta."""
+
+    type: Literal["phase_report_delta"] = "phase_report_delta"
+    phase: GamePhase
+    month: int
+    completed_at: datetime
+    journal: list[PhaseJournalEntry]
+    delta: AnalyticsDelta
+
+
+class AnalyticsSnapshotResponse(BaseModel):
+    """Full analytics snapshot that delta clients resynchronize against."""
+
+    type: Literal["analytics_snapshot"] = "analytics_snapshot"
+    seq: int
+    analytics: PhaseAnalytics
+
+
 class FinalPlayerResult(BaseModel):
     """Final placement payload for a player."""
 
@@ -187,9 +252,11 @@ class PhaseStatusResponse(BaseModel):
     type: Literal["phase_status"] = "phase_status"
     month: int
     phase: GamePhase
-    analytics: PhaseAnalytics
+    analytics: PhaseAnalytics | None = None
     remaining_seconds: int | None = None
-    settings: GameSettings
+    settings: GameSettings | None = None
+    analytics_seq: int | None = None
+    analytics_delta: AnalyticsDelta | None = None
 
 
 class ErrorResponse(BaseModel):
@@ -213,6 +280,8 @@ OutboundWsMessage = Annotated[
     SessionWelcomeResponse
     | PhaseTickResponse
     | PhaseReportResponse
+    | PhaseReportDeltaResponse
+    | AnalyticsSnapshotResponse
     | ActionAckResponse
     | PhaseStatusResponse
     | ErrorResponse
@@ -223,6 +292,8 @@ OutboundWsMessage = Annotated[
 
 __all__ = [
     "ActionAckResponse",
+    "AnalyticsDelta",
+    "AnalyticsSnapshotResponse",
     "ConstructionRequestPayload",
     "ErrorResponse",
     "HeartbeatRequest",
@@ -231,16 +302,20 @@ __all__ = [
     "LoanDecisionPayload",
     "OutboundWsMessage",
     "PhaseActionRequest",
+    "PhaseReportDeltaResponse",
     "PhaseReportResponse",
     "PhaseStatusRequest",
     "PhaseStatusResponse",
     "PhaseTickResponse",
+    "PlayerAnalyticsDelta",
     "ProductionPlanPayload",
     "GameSettings",
+    "ResyncRequest",
     "SessionControlAckResponse",
     "SessionControlRequest",
     "SessionWelcomeResponse",
     "SkipActionPayload",
     "SubmitBuyBidPayload",
     "SubmitSellBidPayload",
+    "WsProtocol",
 ]
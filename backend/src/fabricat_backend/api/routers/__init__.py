@@ -1,7 +1,8 @@
 """Route definitions for public HTTP and WebSocket endpoints."""
 
 from fabricat_backend.api.routers.auth import router as auth_router
+from fabricat_backend.api.routers.health import router as health_router
 from fabricat_backend.api.routers.history import router as history_router
 from fabricat_backend.api.routers.session import router as session_router
 
-__all__ = ["auth_router", "history_router", "session_router"]
+__all__ = ["auth_router", "health_router", "history_router", "session_router"]
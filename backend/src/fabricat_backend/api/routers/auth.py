@@ -4,7 +4,7 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from fabricat_backend.api.dependencies import get_auth_service
 from fabricat_backend.api.models import (
@@ -17,27 +17,37 @@ from fabricat_backend.api.models import (
 )
 from fabricat_backend.api.services import (
     AuthService,
+    HashingBusyError,
     InvalidCredentialsError,
     UserAlreadyExistsError,
 )
-from fabricat_backend.database import get_session
+from fabricat_backend.database import get_async_session
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 _security = HTTPBearer(auto_error=False)
+_HASHING_RETRY_AFTER_SECONDS = 1
+
+
+def _hashing_busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Authentication is busy, retry shortly",
+        headers={"Retry-After": str(_HASHING_RETRY_AFTER_SECONDS)},
+    )
 
 
 @router.post(
     "/register",
     status_code=status.HTTP_201_CREATED,
 )
-def register_user(
+async def register_user(
     payload: UserRegisterRequest,
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     auth_service: Annotated[AuthService, Depends(get_auth_service)],
 ) -> UserRegisterResponse:
     """Register a new user and issue an access token."""
     try:
-        user, token = auth_service.register_user(
+        user, token = await auth_service.aregister_user(
             session=session,
             nickname=payload.nickname,
             password=payload.password,
@@ -47,6 +57,8 @@ def register_user(
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT, detail="User already exists"
         ) from exc
+    except HashingBusyError as exc:
+        raise _hashing_busy() from exc
 
     user_model = UserResponse.model_validate(user, from_attributes=True)
     token_model = AuthTokenResponse(access_token=token)
@@ -54,20 +66,22 @@ def register_user(
 
 
 @router.post("/login")
-def login_user(
+async def login_user(
     payload: UserLoginRequest,
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
     auth_service: Annotated[AuthService, Depends(get_auth_service)],
 ) -> UserLoginResponse:
     """Authenticate an existing user using nickname and password."""
     try:
-        user, token = auth_service.authenticate_user(
+        user, token = await auth_service.aauthenticate_user(
             session=session, nickname=payload.nickname, password=payload.password
         )
     except InvalidCredentialsError as exc:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials"
         ) from exc
+    except HashingBusyError as exc:
+        raise _hashing_busy() from exc
 
     user_model = UserResponse.model_validate(user, from_attributes=True)
     token_model = AuthTokenResponse(access_token=token)
@@ -75,7 +89,7 @@ def login_user(
 
 
 @router.post("/refresh", response_model=AuthTokenResponse)
-def refresh_token(
+async def refresh_token(
     credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(_security)],
     auth_service: Annotated[AuthService, Depends(get_auth_service)],
 ) -> AuthTokenResponse:
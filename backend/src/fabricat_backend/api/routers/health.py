@@ -0,0 +1,47 @@
+"""HTTP endpoints reporting service health."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, status
+
+from fabricat_backend.api.models.health import DatabasePoolHealth
+from fabricat_backend.database import (
+    AsyncDatabaseService,
+    DatabaseService,
+    get_async_database,
+    get_database,
+)
+
+router = APIRouter(prefix="/health", tags=["health"])
+
+
+@router.get(
+    "/database",
+    response_model=DatabasePoolHealth,
+    status_code=status.HTTP_200_OK,
+)
+def get_database_health(
+    database: Annotated[DatabaseService, Depends(get_database)],
+) -> DatabasePoolHealth:
+    """Return connection pool saturation and checkout latency."""
+
+    return DatabasePoolHealth(**asdict(database.pool_metrics()))
+
+
+@router.get(
+    "/database/async",
+    response_model=DatabasePoolHealth,
+    status_code=status.HTTP_200_OK,
+)
+async def get_async_database_health(
+    database: Annotated[AsyncDatabaseService, Depends(get_async_database)],
+) -> DatabasePoolHealth:
+    """Return pool metrics of the async engine serving HTTP endpoints."""
+
+    return DatabasePoolHealth(**asdict(database.pool_metrics()))
+
+
+__all__ = ["router"]
@@ -2,25 +2,66 @@
 
 from __future__ import annotations
 
+import base64
+import binascii
+from datetime import datetime
 from typing import Annotated
+from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
-
-from fabricat_backend.api.dependencies import get_current_user
-from fabricat_backend.api.models.history import PlayerGameStats, PlayerGameStatsList
-from fabricat_backend.database import GameHistoryRepository, get_session
-from fabricat_backend.database.schemas import UserSchema
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fabricat_backend.api.dependencies import get_current_user, get_leaderboard_service
+from fabricat_backend.api.models.history import (
+    LeaderboardEntry,
+    LeaderboardPage,
+    PlayerCareerStats,
+    PlayerGameStats,
+    PlayerGameStatsList,
+)
+from fabricat_backend.api.services import AuthenticatedUser, LeaderboardService
+from fabricat_backend.database import (
+    AsyncGameHistoryRepository,
+    AsyncUserStatsSummaryRepository,
+    get_async_session,
+)
+from fabricat_backend.database.schemas import UserStatsSummarySchema
+from fabricat_backend.shared import LeaderboardMetric, LeaderboardWindow
 
 router = APIRouter(prefix="/history", tags=["history"])
 
 
-def get_history_repository(
-    session: Annotated[Session, Depends(get_session)],
-) -> GameHistoryRepository:
-    """Resolve a GameHistoryRepository bound to the current session."""
+async def get_history_repository(
+    session: Annotated[AsyncSession, Depends(get_async_session)],
+) -> AsyncGameHistoryRepository:
+    """Resolve an AsyncGameHistoryRepository bound to the current session."""
+
+    return AsyncGameHistoryRepository(session)
+
+
+async def get_user_stats_repository(
+    session: Annotated[AsyncSession, Depends(get_async_session)],
+) -> AsyncUserStatsSummaryRepository:
+    """Resolve an AsyncUserStatsSummaryRepository bound to the current session."""
+
+    return AsyncUserStatsSummaryRepository(session)
 
-    return GameHistoryRepository(session)
+
+def _encode_cursor(finished_at: datetime, session_id: UUID) -> str:
+    raw = f"{finished_at.isoformat()}|{session_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded).decode()
+        finished_at, session_id = raw.split("|")
+        return datetime.fromisoformat(finished_at), UUID(session_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        ) from exc
 
 
 def _to_model(row: tuple) -> PlayerGameStats:
@@ -42,19 +83,46 @@ def _to_model(row: tuple) -> PlayerGameStats:
     )
 
 
+def _to_career_model(summary: UserStatsSummarySchema | None) -> PlayerCareerStats:
+    if summary is None or summary.games_played == 0:
+        return PlayerCareerStats(
+            games_played=0,
+            wins=0,
+            bankruptcies=0,
+            win_rate=0.0,
+            bankruptcy_rate=0.0,
+            average_capital=0.0,
+            best_capital=0.0,
+            average_place=0.0,
+            last_finished_at=None,
+        )
+    games = summary.games_played
+    return PlayerCareerStats(
+        games_played=games,
+        wins=summary.wins,
+        bankruptcies=summary.bankruptcies,
+        win_rate=summary.wins / games,
+        bankruptcy_rate=summary.bankruptcies / games,
+        average_capital=summary.total_capital / games,
+        best_capital=summary.best_capital,
+        average_place=summary.total_place / games,
+        last_finished_at=summary.last_finished_at,
+    )
+
+
 @router.get(
     "/games/{session_code}/me",
     response_model=PlayerGameStats,
     status_code=status.HTTP_200_OK,
 )
-def get_my_game_stats(
+async def get_my_game_stats(
     session_code: str,
-    current_user: Annotated[UserSchema, Depends(get_current_user)],
-    repository: Annotated[GameHistoryRepository, Depends(get_history_repository)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
+    repository: Annotated[AsyncGameHistoryRepository, Depends(get_history_repository)],
 ) -> PlayerGameStats:
     """Return the current user's stats for the specified session code."""
 
-    row = repository.get_player_stats_for_session(
+    row = await repository.get_player_stats_for_session(
         user_id=current_user.id,
         session_code=session_code,
     )
@@ -68,15 +136,82 @@ def get_my_game_stats(
     response_model=PlayerGameStatsList,
     status_code=status.HTTP_200_OK,
 )
-def get_recent_my_games(
-    current_user: Annotated[UserSchema, Depends(get_current_user)],
-    repository: Annotated[GameHistoryRepository, Depends(get_history_repository)],
+async def get_recent_my_games(
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
+    repository: Annotated[AsyncGameHistoryRepository, Depends(get_history_repository)],
     limit: int = Query(10, ge=1, le=100),
+    cursor: str | None = Query(None),
 ) -> PlayerGameStatsList:
-    """Return the most recent games for the current user."""
+    """Return the most recent games for the current user, newest first.
+
+    Pass ``next_cursor`` from a response as ``cursor`` to fetch the next page.
+    """
 
-    rows = repository.get_recent_player_stats(user_id=current_user.id, limit=limit)
-    return PlayerGameStatsList(items=[_to_model(row) for row in rows])
+    before = None if cursor is None else _decode_cursor(cursor)
+    rows = await repository.get_recent_player_stats(
+        user_id=current_user.id, limit=limit + 1, before=before
+    )
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last_session, _ = rows[-1]
+        next_cursor = _encode_cursor(last_session.finished_at, last_session.id)
+    return PlayerGameStatsList(
+        items=[_to_model(row) for row in rows], next_cursor=next_cursor
+    )
+
+
+@router.get(
+    "/stats/me",
+    response_model=PlayerCareerStats,
+    status_code=status.HTTP_200_OK,
+)
+async def get_my_career_stats(
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
+    repository: Annotated[
+        AsyncUserStatsSummaryRepository, Depends(get_user_stats_repository)
+    ],
+) -> PlayerCareerStats:
+    """Return the current user's aggregated results across all games."""
+
+    return _to_career_model(await repository.get(current_user.id))
+
+
+@router.get(
+    "/leaderboard",
+    response_model=LeaderboardPage,
+    status_code=status.HTTP_200_OK,
+)
+def get_leaderboard(
+    service: Annotated[LeaderboardService, Depends(get_leaderboard_service)],
+    metric: LeaderboardMetric = LeaderboardMetric.WINS,
+    window: LeaderboardWindow = LeaderboardWindow.ALL_TIME,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+) -> LeaderboardPage:
+    """Return one page of players ranked by ``metric`` over ``window``.
+
+    Kept synchronous: pages come from the in-memory top-K cache, whose
+    refreshes are shared with the history writer thread.
+    """
+
+    rows = service.page(metric=metric, window=window, offset=offset, limit=limit + 1)
+    next_offset = offset + limit if len(rows) > limit else None
+    items = [
+        LeaderboardEntry(
+            rank=offset + position,
+            user_id=row.user_id,
+            nickname=row.nickname,
+            icon=row.icon,
+            games_played=row.games_played,
+            wins=row.wins,
+            average_place=row.average_place,
+        )
+        for position, row in enumerate(rows[:limit], start=1)
+    ]
+    return LeaderboardPage(
+        metric=metric, window=window, items=items, next_offset=next_offset
+    )
 
 
 __all__ = ["router"]
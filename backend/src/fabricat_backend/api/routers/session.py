@@ -4,18 +4,26 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
-from collections.abc import Awaitable, Callable
+import json
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from pathlib import Path
 from typing import Any
 from uuid import UUID, uuid4
 
 from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect, status
 from pydantic import BaseModel, TypeAdapter, ValidationError
 
-from fabricat_backend.api.dependencies import get_auth_service
+from fabricat_backend.api.dependencies import (
+    get_auth_service,
+    get_leaderboard_service,
+)
 from fabricat_backend.api.models.session import (
     ActionAckResponse,
+    AnalyticsSnapshotResponse,
     ErrorResponse,
     FinalPlayerResult,
     GameFinishedResponse,
@@ -23,40 +31,56 @@ from fabricat_backend.api.models.session import (
     InboundWsMessage,
     JoinSessionRequest,
     PhaseActionRequest,
+    PhaseReportDeltaResponse,
     PhaseReportResponse,
     PhaseStatusRequest,
     PhaseStatusResponse,
     PhaseTickResponse,
+    ResyncRequest,
     SessionControlAckResponse,
     SessionControlRequest,
     SessionWelcomeResponse,
-    SubmitBuyBidPayload,
-    SubmitSellBidPayload,
+    WsProtocol,
 )
 from fabricat_backend.api.services import (
+    ANONYMOUS_PROFILE,
+    REPLAY_SUFFIX,
+    AnalyticsDeltaEncoder,
     AuthService,
+    EncodedSender,
+    GameHistoryEntry,
+    GameHistoryQueue,
     GameHistoryRecorder,
     PlayerHistoryPayload,
+    ReplayRecorder,
+    SessionSnapshot,
+    SessionStore,
+    SnapshotStore,
+    UserProfile,
+    UserProfileService,
+    apply_phase_action,
+    create_session_store,
+    encode_message,
 )
-from fabricat_backend.database.repositories import UserRepository
+from fabricat_backend.database import get_database
 from fabricat_backend.database.service import DatabaseService
 from fabricat_backend.game_logic.phases import (
     DEFAULT_PHASE_DURATION_SECONDS,
     PHASE_SEQUENCE,
     GamePhase,
+    PhaseAnalytics,
     PhaseTick,
     PhaseTimer,
 )
+from fabricat_backend.game_logic.retention import RetentionPolicy
 from fabricat_backend.game_logic.session import (
     GameSession,
     GameSettings,
     Player,
+    default_game_settings,
 )
 from fabricat_backend.settings import get_settings
 
-router = APIRouter(tags=["session"])
-
-
 ActionSender = Callable[[BaseModel], Awaitable[None]]
 
 INBOUND_WS_MESSAGE_ADAPTER = TypeAdapter(InboundWsMessage)
@@ -65,6 +89,10 @@ INBOUND_WS_MESSAGE_ADAPTER = TypeAdapter(InboundWsMessage)
 MIN_PLAYERS_TO_AUTO_START = 2
 MAX_PLAYERS = 4
 AUTO_START_DELAY_SECONDS = 60
+OUTBOUND_HIGH_WATER = 32
+OUTBOUND_HARD_LIMIT = 256
+OUTBOUND_OVERLOAD_GRACE_SECONDS = 10.0
+OUTBOUND_DRAIN_TIMEOUT_SECONDS = 2.0
 
 
 PHASE_ACTION_RULES: dict[GamePhase, set[str]] = {
@@ -78,7 +106,13 @@ PHASE_ACTION_RULES: dict[GamePhase, set[str]] = {
 
 @dataclass
 class SessionContext:
-    """Shared state for a joinable gameplay session."""
+    """Shared state for a joinable gameplay session.
+
+    ``lock`` serializes joins, departures and starts of this session only;
+    ``closed`` marks a context that was dropped from the registry and must not
+    accept new connections. ``restored`` marks a game brought back from a
+    snapshot whose runtime waits for its first player to reconnect.
+    """
 
     session_code: str
     session: GameSession
@@ -88,9 +122,13 @@ class SessionContext:
     assignments: dict[str, Player] = field(default_factory=dict)
     user_connections: dict[str, int] = field(default_factory=dict)
     listeners: list[ActionSender] = field(default_factory=list)
+    listener_protocols: dict[ActionSender, WsProtocol] = field(default_factory=dict)
     session_started: bool = False
     auto_start_task: asyncio.Task | None = None
     connections: int = 0
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False)
+    closed: bool = False
+    restored: bool = False
 
     def assign_player(
         self,
@@ -106,6 +144,7 @@ class SessionContext:
                 player.nickname = nickname
             if icon:
                 player.icon = icon
+            self.session.invalidate_analytics(player.id_)
             return player
         assigned_ids = {entry.id_ for entry in self.assignments.values()}
         for candidate in self.players:
@@ -114,6 +153,7 @@ class SessionContext:
                     candidate.nickname = nickname
                 if icon:
                     candidate.icon = icon
+                self.session.invalidate_analytics(candidate.id_)
                 self.assignments[user_identifier] = candidate
                 return candidate
         msg = "Session is full"
@@ -125,10 +165,15 @@ class SessionContext:
 
 
 _SESSION_REGISTRY: dict[str, SessionContext] = {}
-_SESSION_LOCK = asyncio.Lock()
+_SESSION_LOCK = asyncio.Lock()  # guards registry inserts and removals only
+_SESSION_STORE: SessionStore | None = None
+_RELAY_TASKS: set[asyncio.Task[None]] = set()
+_RESTORE_TASKS: set[asyncio.Task[None]] = set()
+_PENDING_CLAIMS: dict[str, asyncio.Future[str]] = {}
 _GAME_HISTORY_RECORDER: GameHistoryRecorder | None = None
-_DB_SERVICE: DatabaseService | None = None
-_USER_PROFILE_CACHE: dict[str, tuple[str | None, str | None]] = {}
+_HISTORY_QUEUE: GameHistoryQueue | None = None
+_PROFILE_SERVICE: UserProfileService | None = None
+_SNAPSHOT_STORE: SnapshotStore | None = None
 
 
 class SessionJoinError(Exception):
@@ -139,38 +184,67 @@ class SessionJoinError(Exception):
         self.detail = detail or {}
 
 
+class SessionRoutedError(SessionJoinError):
+    """Raised when the requested session is hosted by another worker."""
+
+    def __init__(self, session_code: str, owner: str) -> None:
+        super().__init__(
+            "Session is hosted by another worker",
+            {"session_code": session_code, "worker_id": owner},
+        )
+        self.owner = owner
+
+
 def _default_game_settings() -> GameSettings:
     """Return a baseline set of deterministic session settings."""
-    return GameSettings(
-        start_factory_count=2,
-        max_months=12,
-        basic_factory_monthly_expenses=1_000.0,
-        auto_factory_monthly_expenses=1_500.0,
-        raw_material_monthly_expenses=300.0,
-        finished_good_monthly_expenses=500.0,
-        basic_factory_launch_cost=2_000.0,
-        auto_factory_launch_cost=3_000.0,
-        bank_start_money=100_000.0,
-        loans_monthly_expenses_in_percents=0.01,
-        available_loans=[5_000.0, 10_000.0],
-        loan_terms_in_months=[2, 3],
-        bank_raw_material_sell_volume_range=(5, 9),
-        bank_finished_good_buy_volume_range=(5, 9),
-        bank_raw_material_sell_min_price_range=(200.0, 400.0),
-        bank_finished_good_buy_max_price_range=(400.0, 600.0),
-        month_for_upgrade=9,
-        upgrade_cost=7_000.0,
-        month_for_build_basic=5,
-        build_basic_cost=5_000.0,
-        month_for_build_auto=7,
-        build_auto_cost=10_000.0,
-        build_basic_payment_share=0.5,
-        build_basic_final_payment_offset=1,
-        build_auto_payment_share=0.5,
-        build_auto_final_payment_offset=1,
-        max_raw_material_storage=10,
-        max_finished_good_storage=10,
-        max_factories=6,
+    return default_game_settings()
+
+
+def _session_retention() -> RetentionPolicy:
+    """Return how much phase history a live session keeps in memory."""
+    try:
+        settings = get_settings()
+    except Exception:
+        return RetentionPolicy()
+    spill_dir = settings.session_spill_dir
+    return RetentionPolicy(
+        max_reports=settings.session_max_reports,
+        max_journal_entries=settings.session_max_journal_entries,
+        spill_dir=Path(spill_dir) if spill_dir else None,
+    )
+
+
+def _session_replay(
+    session_code: str, players: list[Player], settings: GameSettings
+) -> ReplayRecorder | None:
+    """Return a recorder for the session's replay log, if replays are kept."""
+    try:
+        replay_dir = get_settings().session_replay_dir
+    except Exception:
+        return None
+    if not replay_dir:
+        return None
+    code = "".join(char for char in session_code if char.isalnum() or char in "-_")
+    stamp = f"{datetime.now(tz=UTC):%Y%m%dT%H%M%S}-{uuid4().hex[:8]}"
+    path = Path(replay_dir) / f"{code[:32] or 'session'}-{stamp}{REPLAY_SUFFIX}"
+    return ReplayRecorder(players, settings, path=path)
+
+
+def _new_runtime(
+    session_code: str, players: list[Player], settings: GameSettings
+) -> SessionRuntime:
+    """Create a game session with bounded retention and its phase runtime."""
+    # Captures the roster before GameSession hands out starting assets.
+    replay = _session_replay(session_code, players, settings)
+    session = GameSession(
+        players=players, settings=settings, retention=_session_retention()
+    )
+    return SessionRuntime(
+        session=session,
+        phase_duration=DEFAULT_PHASE_DURATION_SECONDS,
+        sender=None,
+        session_code=session_code,
+        replay=replay,
     )
 
 
@@ -194,49 +268,66 @@ def _generate_session_code() -> str:
     return uuid4().hex[:8]
 
 
-def _get_db_service() -> DatabaseService | None:
-    """Return a cached database service instance if configuration is available."""
-    global _DB_SERVICE
-    if _DB_SERVICE is not None:
-        return _DB_SERVICE
+def _get_session_store() -> SessionStore:
+    """Return the store that tracks which worker owns each session."""
+    global _SESSION_STORE
+    if _SESSION_STORE is not None:
+        return _SESSION_STORE
 
     try:
-        settings = get_settings()
+        url = get_settings().session_store_url
     except Exception:
-        return None
+        url = "memory://"
+
+    _SESSION_STORE = create_session_store(url)
+    _SESSION_STORE.subscribe(
+        _worker_channel(_SESSION_STORE.worker_id), _accept_relayed_connection
+    )
+    return _SESSION_STORE
+
+
+def _worker_channel(worker_id: str) -> str:
+    """Relay channel on which a worker accepts forwarded connections."""
+    return f"worker:{worker_id}"
+
+
+def _relay_channels(connection_id: str) -> tuple[str, str]:
+    """Return the inbound and outbound relay channels of one connection."""
+    return f"relay:{connection_id}:in", f"relay:{connection_id}:out"
+
 
+def _relay_frame(data: str) -> str:
+    """Wrap a websocket text frame for the relay."""
+    return json.dumps({"kind": "frame", "data": data})
+
+
+def _get_db_service() -> DatabaseService | None:
+    """Return the shared database service if configuration is available."""
     try:
-        _DB_SERVICE = DatabaseService(settings.database_url)
+        return get_database(get_settings())
     except Exception:
         return None
-    return _DB_SERVICE
 
 
-def _load_user_profile(user_identifier: str) -> tuple[str | None, str | None]:
-    """Fetch nickname and icon for a given user identifier."""
-    if user_identifier in _USER_PROFILE_CACHE:
-        return _USER_PROFILE_CACHE[user_identifier]
+def _get_profile_service() -> UserProfileService | None:
+    """Return the cached profile lookup service if a database is configured."""
+    global _PROFILE_SERVICE
+    if _PROFILE_SERVICE is not None:
+        return _PROFILE_SERVICE
 
     service = _get_db_service()
     if service is None:
-        return (None, None)
+        return None
+    _PROFILE_SERVICE = UserProfileService(database=service)
+    return _PROFILE_SERVICE
 
-    try:
-        user_id = UUID(user_identifier)
-    except ValueError:
-        return (None, None)
 
-    try:
-        with service.session() as session:
-            repo = UserRepository(session)
-            user = repo.get_by_id(user_id)
-            if user is None:
-                return (None, None)
-            profile = (user.nickname, user.icon)
-            _USER_PROFILE_CACHE[user_identifier] = profile
-            return profile
-    except Exception:
-        return (None, None)
+async def _load_user_profile(user_identifier: str) -> UserProfile:
+    """Fetch nickname and icon for a given user identifier."""
+    service = _get_profile_service()
+    if service is None:
+        return ANONYMOUS_PROFILE
+    return await service.get(user_identifier)
 
 
 def _get_game_history_recorder() -> GameHistoryRecorder | None:
@@ -245,17 +336,14 @@ def _get_game_history_recorder() -> GameHistoryRecorder | None:
     if _GAME_HISTORY_RECORDER is not None:
         return _GAME_HISTORY_RECORDER
 
-    try:
-        settings = get_settings()
-    except Exception:
+    database = _get_db_service()
+    if database is None:
         return None
 
-    try:
-        _GAME_HISTORY_RECORDER = GameHistoryRecorder(
-            database=DatabaseService(settings.database_url),
-        )
-    except Exception:
-        return None
+    _GAME_HISTORY_RECORDER = GameHistoryRecorder(
+        database=database,
+        leaderboard=get_leaderboard_service(database),
+    )
     return _GAME_HISTORY_RECORDER
 
 
@@ -281,22 +369,212 @@ def _build_player_history_payload(
     return payloads
 
 
-async def _record_game_history(context: SessionContext) -> None:
-    """Persist the end-of-game snapshot if the recorder is configured."""
+def _get_history_queue(*, create: bool = True) -> GameHistoryQueue | None:
+    """Lazily build or return the queue that persists finished games.
+
+    With ``create=False`` a queue is only opened when a queue file left over
+    from a previous run exists.
+    """
+    global _HISTORY_QUEUE
+    if _HISTORY_QUEUE is not None:
+        return _HISTORY_QUEUE
+
+    try:
+        path = get_settings().history_queue_path
+    except Exception:
+        return None
+    if not create and not Path(path).exists():
+        return None
+
     recorder = _get_game_history_recorder()
     if recorder is None:
+        return None
+    try:
+        _HISTORY_QUEUE = GameHistoryQueue(recorder=recorder, path=path)
+    except Exception:
+        return None
+    return _HISTORY_QUEUE
+
+
+async def _record_game_history(context: SessionContext) -> None:
+    """Queue the end-of-game snapshot for background persistence."""
+    queue = _get_history_queue()
+    if queue is None:
         return
 
+    queue.start()
     try:
-        recorder.record(
-            session_code=context.session_code,
-            finished_at=datetime.now(tz=UTC),
-            stats=_build_player_history_payload(context),
+        await queue.put(
+            GameHistoryEntry(
+                session_code=context.session_code,
+                finished_at=datetime.now(tz=UTC),
+                stats=_build_player_history_payload(context),
+            )
         )
     except Exception:
         return
 
 
+def _get_snapshot_store() -> SnapshotStore | None:
+    """Return the store for snapshots of live games, if one is configured."""
+    global _SNAPSHOT_STORE
+    if _SNAPSHOT_STORE is not None:
+        return _SNAPSHOT_STORE
+
+    try:
+        settings = get_settings()
+    except Exception:
+        return None
+    if not settings.session_snapshot_dir:
+        return None
+
+    _SNAPSHOT_STORE = SnapshotStore(
+        Path(settings.session_snapshot_dir),
+        max_age_seconds=settings.session_snapshot_max_age_seconds,
+    )
+    return _SNAPSHOT_STORE
+
+
+def _snapshot_context(context: SessionContext) -> SessionSnapshot:
+    """Capture a started session together with its runtime position."""
+    phase_index, remaining_seconds = context.runtime.resume_point()
+    return SessionSnapshot(
+        session_code=context.session_code,
+        taken_at=datetime.now(tz=UTC),
+        settings=context.game_settings,
+        game=context.session.snapshot(),
+        phase_index=phase_index,
+        remaining_seconds=remaining_seconds,
+        assignments={
+            user_identifier: player.id_
+            for user_identifier, player in context.assignments.items()
+        },
+    )
+
+
+async def _persist_snapshot(context: SessionContext) -> None:
+    """Save the latest snapshot of a started game, or drop it once it ended."""
+    store = _get_snapshot_store()
+    if store is None or not context.session_started:
+        return
+
+    with contextlib.suppress(OSError):
+        if context.session.is_finished:
+            await store.adelete(context.session_code)
+            return
+        # Serialized on the loop, between phases, so the state is consistent;
+        # compressing and writing happen on the store's thread.
+        document = _snapshot_context(context).model_dump_json().encode()
+        await store.asave(context.session_code, document)
+
+
+def _restore_context(snapshot: SessionSnapshot) -> SessionContext:
+    """Rebuild a session context whose players have yet to reconnect."""
+    session = GameSession.restore(snapshot.game, retention=_session_retention())
+    runtime = SessionRuntime(
+        session=session,
+        phase_duration=DEFAULT_PHASE_DURATION_SECONDS,
+        sender=None,
+        session_code=snapshot.session_code,
+    )
+    runtime.resume_from(snapshot.phase_index, snapshot.remaining_seconds)
+    players = list(session.players)
+    players_by_id = {player.id_: player for player in players}
+    assignments = {
+        user_identifier: players_by_id[player_id]
+        for user_identifier, player_id in snapshot.assignments.items()
+        if player_id in players_by_id
+    }
+    context = SessionContext(
+        session_code=snapshot.session_code,
+        session=session,
+        runtime=runtime,
+        game_settings=snapshot.settings,
+        players=players,
+        assignments=assignments,
+        user_connections=dict.fromkeys(assignments, 0),
+        session_started=True,
+        restored=True,
+    )
+    _attach_history_hook(context)
+    _attach_snapshot_hook(context)
+    return context
+
+
+async def _restore_sessions() -> None:
+    """Register the games snapshotted by a previous run of this server."""
+    store = _get_snapshot_store()
+    if store is None:
+        return
+
+    session_store = _get_session_store()
+    for snapshot in await store.aload_all():
+        session_code = snapshot.session_code
+        if session_code in _SESSION_REGISTRY:
+            continue
+        owner = await _claim_session(session_store, session_code)
+        if owner != session_store.worker_id:
+            continue
+        context = _restore_context(snapshot)
+        _SESSION_REGISTRY[session_code] = context
+        task = asyncio.create_task(_expire_restored(context, store.max_age_seconds))
+        _RESTORE_TASKS.add(task)
+        task.add_done_callback(_RESTORE_TASKS.discard)
+
+
+async def _expire_restored(context: SessionContext, delay_seconds: float) -> None:
+    """Drop a restored game if none of its players came back in time."""
+    await asyncio.sleep(delay_seconds)
+    async with context.lock:
+        if not context.restored or context.closed:
+            return
+        context.closed = True
+        async with _SESSION_LOCK:
+            if _SESSION_REGISTRY.get(context.session_code) is context:
+                del _SESSION_REGISTRY[context.session_code]
+    context.session.close()
+    store = _get_snapshot_store()
+    if store is not None:
+        with contextlib.suppress(OSError):
+            await store.adelete(context.session_code)
+    await _get_session_store().release(context.session_code)
+
+
+async def _snapshot_live_sessions() -> None:
+    """Stop every running game and snapshot it before the server exits."""
+    for task in tuple(_RESTORE_TASKS):
+        task.cancel()
+    store = _get_snapshot_store()
+    if store is None:
+        return
+
+    for context in tuple(_SESSION_REGISTRY.values()):
+        await context.runtime.stop()
+        await _persist_snapshot(context)
+    store.close()
+
+
+@asynccontextmanager
+async def _lifespan(_app: object) -> AsyncIterator[None]:
+    """Resume unsaved game history and snapshotted games on startup.
+
+    On shutdown the games still running are snapshotted and the history
+    queue is flushed.
+    """
+    queue = _get_history_queue(create=False)
+    if queue is not None:
+        queue.start()
+    await _restore_sessions()
+    yield
+    await _snapshot_live_sessions()
+    queue = _HISTORY_QUEUE
+    if queue is not None:
+        await queue.aclose()
+
+
+router = APIRouter(tags=["session"], lifespan=_lifespan)
+
+
 def _refresh_unstarted_context(context: SessionContext) -> None:
     """Rebuild the runtime when the player roster changes pre-launch."""
     if context.session_started:
@@ -325,19 +603,15 @@ def _refresh_unstarted_context(context: SessionContext) -> None:
     context.assignments = new_assignments
 
     listeners = list(context.listeners)
-    session = GameSession(players=context.players, settings=context.game_settings)
-    runtime = SessionRuntime(
-        session=session,
-        phase_duration=DEFAULT_PHASE_DURATION_SECONDS,
-        sender=None,
-        session_code=context.session_code,
-        on_finished=None,
-    )
+    runtime = _new_runtime(context.session_code, context.players, context.game_settings)
     for listener in listeners:
-        runtime.add_sender(listener)
-    context.session = session
+        runtime.add_sender(
+            listener, protocol=context.listener_protocols.get(listener, "full")
+        )
+    context.session = runtime.session
     context.runtime = runtime
     _attach_history_hook(context)
+    _attach_snapshot_hook(context)
 
 
 def _attach_history_hook(context: SessionContext) -> None:
@@ -349,6 +623,15 @@ def _attach_history_hook(context: SessionContext) -> None:
     context.runtime.set_on_finished(_on_finished)
 
 
+def _attach_snapshot_hook(context: SessionContext) -> None:
+    """Wire the runtime to snapshot the game after every phase."""
+
+    async def _on_phase_completed(_session: GameSession) -> None:
+        await _persist_snapshot(context)
+
+    context.runtime.set_on_phase_completed(_on_phase_completed)
+
+
 def _spawn_player_slot(context: SessionContext) -> Player:
     """Create a fresh player seat with deterministic identifiers."""
     next_id = (
@@ -360,98 +643,180 @@ def _spawn_player_slot(context: SessionContext) -> Player:
     return Player(id_=next_id, money=10_000.0, priority=priority)
 
 
+def _create_context(  # noqa: PLR0913
+    session_code: str,
+    *,
+    user_identifier: str,
+    send: ActionSender,
+    protocol: WsProtocol,
+    nickname: str | None,
+    icon: str | None,
+) -> tuple[SessionContext, Player]:
+    """Build a lobby whose only seat belongs to the connecting user."""
+    players, controlled_player = _bootstrap_players(
+        user_identifier, nickname=nickname, icon=icon
+    )
+    game_settings = _default_game_settings()
+    runtime = _new_runtime(session_code, players, game_settings)
+    runtime.add_sender(send, protocol=protocol)
+    context = SessionContext(
+        session_code=session_code,
+        session=runtime.session,
+        runtime=runtime,
+        game_settings=game_settings,
+        players=players,
+        assignments={user_identifier: controlled_player},
+        user_connections={user_identifier: 1},
+        listeners=[send],
+        listener_protocols={send: protocol},
+        connections=1,
+    )
+    _attach_history_hook(context)
+    _attach_snapshot_hook(context)
+    return context, controlled_player
+
+
 async def _register_connection(
     *,
     requested_code: str | None,
     user_identifier: str,
     send: ActionSender,
+    protocol: WsProtocol = "full",
 ) -> tuple[SessionContext, str, Player, bool]:
-    """Create or reuse a session context and attach the user to it."""
-    nickname, icon = _load_user_profile(user_identifier)
-    async with _SESSION_LOCK:
-        session_code = requested_code or _generate_session_code()
+    """Create or reuse a session context and attach the user to it.
+
+    The global ``_SESSION_LOCK`` only guards inserting the context into the
+    registry; the join itself runs under the lock of the joined session, so
+    lobbies fill up independently of each other.
+    """
+    profile = await _load_user_profile(user_identifier)
+    nickname, icon = profile.nickname, profile.icon
+    session_code = requested_code or _generate_session_code()
+    while True:
         context = _SESSION_REGISTRY.get(session_code)
         if context is None:
-            players, controlled_player = _bootstrap_players(
-                user_identifier, nickname=nickname, icon=icon
-            )
-            game_settings = _default_game_settings()
-            session = GameSession(players=players, settings=game_settings)
-            runtime = SessionRuntime(
-                session=session,
-                phase_duration=DEFAULT_PHASE_DURATION_SECONDS,
-                sender=None,
-                session_code=session_code,
-                on_finished=None,
+            store = _get_session_store()
+            owner = await _claim_session(store, session_code)
+            if owner != store.worker_id:
+                raise SessionRoutedError(session_code, owner)
+            context, controlled_player = _create_context(
+                session_code,
+                user_identifier=user_identifier,
+                send=send,
+                protocol=protocol,
+                nickname=nickname,
+                icon=icon,
             )
-            runtime.add_sender(send)
-            context = SessionContext(
-                session_code=session_code,
-                session=session,
-                runtime=runtime,
-                game_settings=game_settings,
-                players=players,
-                assignments={user_identifier: controlled_player},
-                user_connections={user_identifier: 1},
-                listeners=[send],
-                connections=1,
+            async with _SESSION_LOCK:
+                if session_code not in _SESSION_REGISTRY:
+                    _SESSION_REGISTRY[session_code] = context
+                    return context, session_code, controlled_player, True
+            continue
+
+        async with context.lock:
+            if context.closed:
+                continue
+            controlled_player = _join_context(
+                context,
+                user_identifier=user_identifier,
+                send=send,
+                protocol=protocol,
+                nickname=nickname,
+                icon=icon,
             )
-            _SESSION_REGISTRY[session_code] = context
-            _attach_history_hook(context)
-            return context, session_code, controlled_player, True
+            if context.restored:
+                context.restored = False
+                await context.runtime.start()
+            return context, session_code, controlled_player, False
 
-        if context.session.is_finished:
-            msg = "Session already finished"
-            raise SessionJoinError(msg, {"session_code": session_code})
-        if (
-            context.session_started
-            and context.runtime.has_started
-            and user_identifier not in context.assignments
-        ):
-            msg = "Session already in progress"
-            raise SessionJoinError(msg, {"session_code": session_code})
-        if (
-            user_identifier not in context.assignments
-            and len(context.assignments) >= MAX_PLAYERS
-        ):
-            msg = "Session is full"
-            raise SessionJoinError(
-                msg,
-                {"session_code": session_code, "max_players": MAX_PLAYERS},
-            )
 
-        if (
-            user_identifier not in context.assignments
-            and len(context.players) < MAX_PLAYERS
-            and not context.session_started
-            and len(context.assignments) >= len(context.players)
-        ):
-            context.players.append(_spawn_player_slot(context))
-            _refresh_unstarted_context(context)
+async def _claim_session(store: SessionStore, session_code: str) -> str:
+    """Claim ``session_code`` once for all joins racing to create it."""
+    pending = _PENDING_CLAIMS.get(session_code)
+    if pending is not None:
+        return await asyncio.shield(pending)
 
-        controlled_player = context.assign_player(
-            user_identifier, nickname=nickname, icon=icon
-        )
-        context.runtime.add_sender(send)
-        if send not in context.listeners:
-            context.listeners.append(send)
-        context.connections += 1
-        context.user_connections[user_identifier] = (
-            context.user_connections.get(user_identifier, 0) + 1
+    pending = asyncio.get_running_loop().create_future()
+    _PENDING_CLAIMS[session_code] = pending
+    try:
+        owner = await store.claim(session_code)
+    except asyncio.CancelledError:
+        pending.cancel()
+        raise
+    except Exception as exc:
+        pending.set_exception(exc)
+        pending.exception()
+        raise
+    finally:
+        _PENDING_CLAIMS.pop(session_code, None)
+    pending.set_result(owner)
+    return owner
+
+
+def _join_context(  # noqa: PLR0913
+    context: SessionContext,
+    *,
+    user_identifier: str,
+    send: ActionSender,
+    protocol: WsProtocol,
+    nickname: str | None,
+    icon: str | None,
+) -> Player:
+    """Seat the user in an existing session; the caller holds ``context.lock``."""
+    session_code = context.session_code
+    if context.session.is_finished:
+        msg = "Session already finished"
+        raise SessionJoinError(msg, {"session_code": session_code})
+    if (
+        context.session_started
+        and (context.runtime.has_started or context.restored)
+        and user_identifier not in context.assignments
+    ):
+        msg = "Session already in progress"
+        raise SessionJoinError(msg, {"session_code": session_code})
+    if (
+        user_identifier not in context.assignments
+        and len(context.assignments) >= MAX_PLAYERS
+    ):
+        msg = "Session is full"
+        raise SessionJoinError(
+            msg,
+            {"session_code": session_code, "max_players": MAX_PLAYERS},
         )
-        if not context.session_started:
-            asyncio.create_task(
-                context.runtime.broadcast(
-                    PhaseStatusResponse(
-                        month=context.session.month,
-                        phase=context.runtime.current_phase,
-                        analytics=context.session.snapshot_analytics(),
-                        remaining_seconds=context.runtime.remaining_seconds,
-                        settings=context.game_settings,
-                    )
+
+    if (
+        user_identifier not in context.assignments
+        and len(context.players) < MAX_PLAYERS
+        and not context.session_started
+        and len(context.assignments) >= len(context.players)
+    ):
+        context.players.append(_spawn_player_slot(context))
+        _refresh_unstarted_context(context)
+
+    controlled_player = context.assign_player(
+        user_identifier, nickname=nickname, icon=icon
+    )
+    context.runtime.add_sender(send, protocol=protocol)
+    if send not in context.listeners:
+        context.listeners.append(send)
+    context.listener_protocols[send] = protocol
+    context.connections += 1
+    context.user_connections[user_identifier] = (
+        context.user_connections.get(user_identifier, 0) + 1
+    )
+    if not context.session_started:
+        asyncio.create_task(
+            context.runtime.broadcast(
+                PhaseStatusResponse(
+                    month=context.session.month,
+                    phase=context.runtime.current_phase,
+                    analytics=context.session.snapshot_analytics(),
+                    remaining_seconds=context.runtime.remaining_seconds,
+                    settings=context.game_settings,
                 )
             )
-        return context, session_code, controlled_player, False
+        )
+    return controlled_player
 
 
 async def _release_connection(
@@ -462,11 +827,12 @@ async def _release_connection(
 ) -> None:
     """Detach a websocket from the shared session context."""
     should_cleanup = False
-    async with _SESSION_LOCK:
+    async with context.lock:
         context.runtime.remove_sender(sender)
         context.connections = max(context.connections - 1, 0)
         with contextlib.suppress(ValueError):
             context.listeners.remove(sender)
+        context.listener_protocols.pop(sender, None)
         if user_identifier in context.user_connections:
             context.user_connections[user_identifier] = max(
                 context.user_connections[user_identifier] - 1, 0
@@ -477,11 +843,17 @@ async def _release_connection(
             ):
                 context.assignments.pop(user_identifier, None)
         if context.connections == 0:
-            _SESSION_REGISTRY.pop(context.session_code, None)
+            context.closed = True
             should_cleanup = True
+            async with _SESSION_LOCK:
+                if _SESSION_REGISTRY.get(context.session_code) is context:
+                    del _SESSION_REGISTRY[context.session_code]
     if should_cleanup:
         _cancel_auto_start(context)
         await context.runtime.stop()
+        await _persist_snapshot(context)
+        context.session.close()
+        await _get_session_store().release(context.session_code)
 
 
 def _cancel_auto_start(context: SessionContext) -> None:
@@ -545,7 +917,7 @@ async def _start_context_session(
     reason: str,
 ) -> tuple[bool, dict[str, Any]]:
     """Attempt to kick off the session runtime."""
-    async with _SESSION_LOCK:
+    async with context.lock:
         if context.session.is_finished:
             return False, {"reason": "session_finished"}
         if context.session_started or context.runtime.has_started:
@@ -577,76 +949,10 @@ def _is_action_allowed(phase: GamePhase, kind: str) -> bool:
     return kind in allowed
 
 
-def _clear_phase_state(player: Player, phase: GamePhase) -> None:
-    """Reset player state when they skip a phase."""
-    match phase:
-        case GamePhase.BUY:
-            player.buy_bid = None
-        case GamePhase.SELL:
-            player.sell_bid = None
-        case GamePhase.PRODUCTION:
-            player.production_call_for_basic = 0
-            player.production_call_for_auto = 0
-        case GamePhase.LOANS:
-            for loan in player.loans:
-                if loan.loan_status == "call":
-                    loan.loan_status = "idle"
-        case GamePhase.CONSTRUCTION:
-            player.build_or_upgrade_call = "idle"
-        case _:
-            return
-
-
-def _apply_phase_action(
-    player: Player, request: PhaseActionRequest
-) -> dict[str, Any]:
-    """Mutate the player according to the payload and return ack details."""
-    payload = request.payload
-    match payload.kind:
-        case "submit_buy_bid":
-            if not isinstance(payload, SubmitBuyBidPayload):
-                msg = "Invalid payload for submit_buy_bid action."
-                raise TypeError(msg)
-            player.buy_bid = payload.to_bid()
-            return {"buy_bid": player.buy_bid.model_dump()}
-        case "submit_sell_bid":
-            if not isinstance(payload, SubmitSellBidPayload):
-                msg = "Invalid payload for submit_sell_bid action."
-                raise TypeError(msg)
-            player.sell_bid = payload.to_bid()
-            return {"sell_bid": player.sell_bid.model_dump()}
-        case "production_plan":
-            player.production_call_for_basic = payload.basic
-            player.production_call_for_auto = payload.auto
-            return {
-                "production_call_for_basic": payload.basic,
-                "production_call_for_auto": payload.auto,
-            }
-        case "loan_decision":
-            slot = payload.slot
-            if slot < 0 or slot >= len(player.loans):
-                msg = f"Loan slot {slot} is invalid."
-                raise ValueError(msg)
-            loan = player.loans[slot]
-            if payload.decision == "call":
-                loan.loan_status = "call"
-            elif loan.loan_status == "call":
-                loan.loan_status = "idle"
-            return {"slot": slot, "loan_status": loan.loan_status}
-        case "construction_request":
-            player.build_or_upgrade_call = payload.project
-            return {"project": payload.project}
-        case "skip":
-            _clear_phase_state(player, request.phase)
-            return {"skipped": True}
-    msg = f"Unsupported action: {payload.kind}"
-    raise ValueError(msg)
-
-
 class SessionRuntime:
     """Managed runtime that streams phase ticks and reports."""
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         *,
         session: GameSession,
@@ -654,10 +960,13 @@ class SessionRuntime:
         sender: ActionSender,
         session_code: str,
         on_finished: Callable[[GameSession], Awaitable[None]] | None = None,
+        replay: ReplayRecorder | None = None,
     ) -> None:
         self._session = session
         self._phase_duration = phase_duration
         self._senders: list[ActionSender] = []
+        self._delta_senders: set[ActionSender] = set()
+        self._delta_encoder = AnalyticsDeltaEncoder()
         if sender is not None:
             self._senders.append(sender)
         self._session_code = session_code
@@ -669,6 +978,11 @@ class SessionRuntime:
         self._last_tick: PhaseTick | None = None
         self._has_started = False
         self._on_finished = on_finished
+        self._on_phase_completed: Callable[[GameSession], Awaitable[None]] | None = (
+            None
+        )
+        self._replay = replay
+        self._resume_elapsed = 0
 
     @property
     def current_phase(self) -> GamePhase:
@@ -697,15 +1011,36 @@ class SessionRuntime:
         """Return True if the phase loop has been started."""
         return self._has_started
 
-    def add_sender(self, sender: ActionSender) -> None:
-        """Register a new outbound channel."""
+    @property
+    def analytics_seq(self) -> int:
+        """Sequence number of the analytics last published to delta clients."""
+        return self._delta_encoder.seq
+
+    def analytics_snapshot(self) -> tuple[int, PhaseAnalytics]:
+        """Return the analytics snapshot delta clients build upon."""
+        return self._delta_encoder.snapshot(self._session.snapshot_analytics())
+
+    def add_sender(
+        self, sender: ActionSender, *, protocol: WsProtocol = "full"
+    ) -> None:
+        """Register a new outbound channel speaking the given protocol."""
         if sender not in self._senders:
             self._senders.append(sender)
+        if protocol == "delta":
+            self._delta_senders.add(sender)
+        else:
+            self._delta_senders.discard(sender)
 
     def remove_sender(self, sender: ActionSender) -> None:
         """Remove an outbound channel."""
         with contextlib.suppress(ValueError):
             self._senders.remove(sender)
+        self._delta_senders.discard(sender)
+
+    def record_action(self, player: Player, request: PhaseActionRequest) -> None:
+        """Add an applied player action to the session's replay log."""
+        if self._replay is not None:
+            self._replay.record_action(player.id_, request)
 
     def set_on_finished(
         self, callback: Callable[[GameSession], Awaitable[None]] | None
@@ -713,6 +1048,35 @@ class SessionRuntime:
         """Register a callback to run when the session reaches completion."""
         self._on_finished = callback
 
+    def set_on_phase_completed(
+        self, callback: Callable[[GameSession], Awaitable[None]] | None
+    ) -> None:
+        """Register a callback to run after every phase, the final one included."""
+        self._on_phase_completed = callback
+
+    def resume_point(self) -> tuple[int, int | None]:
+        """Return the phase index and countdown left to resume this runtime at.
+
+        The countdown is ``None`` when the current phase has not started
+        ticking yet.
+        """
+        tick = self._last_tick
+        if tick is None or tick.phase != self._current_phase:
+            return self._phase_index, None
+        return self._phase_index, tick.remaining_seconds
+
+    def resume_from(self, phase_index: int, remaining_seconds: int | None) -> None:
+        """Continue at a `resume_point` of an earlier runtime once started."""
+        if self._task is not None:
+            msg = "Cannot move a runtime that already started."
+            raise RuntimeError(msg)
+        self._phase_index = phase_index % len(PHASE_SEQUENCE)
+        self._current_phase = PHASE_SEQUENCE[self._phase_index]
+        if remaining_seconds is None:
+            self._resume_elapsed = 0
+        else:
+            self._resume_elapsed = max(self._phase_duration - remaining_seconds, 0)
+
     async def start(self) -> None:
         """Begin streaming ticks and reports."""
         if self._task is None:
@@ -727,6 +1091,8 @@ class SessionRuntime:
             self._task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
                 await self._task
+        if self._has_started:
+            await self._save_replay()
         self._has_started = False
 
     def fast_forward_phase(self) -> None:
@@ -737,13 +1103,18 @@ class SessionRuntime:
         """Iterate through the monthly phase sequence indefinitely."""
         while not self._stopped.is_set():
             phase = self._current_phase
+            elapsed, self._resume_elapsed = self._resume_elapsed, 0
             async for tick in self._timer.ticks(
-                phase=phase, duration_seconds=self._phase_duration
+                phase=phase,
+                duration_seconds=self._phase_duration,
+                elapsed_seconds=elapsed,
             ):
                 self._last_tick = tick
                 await self._broadcast(PhaseTickResponse(tick=tick))
 
             report = self._session.run_phase(phase)
+            if self._replay is not None:
+                self._replay.record_phase(phase, report.month)
             await self._broadcast(PhaseReportResponse(report=report))
 
             if self._session.is_finished:
@@ -766,25 +1137,362 @@ class SessionRuntime:
                     for stat in final_stats
                 ]
                 await self._broadcast(GameFinishedResponse(results=results))
+                if self._replay is not None:
+                    self._replay.finish(final_stats)
+                    await self._save_replay()
                 self._stopped.set()
                 if self._on_finished is not None:
                     with contextlib.suppress(Exception):
                         await self._on_finished(self._session)
+                await self._phase_completed()
                 break
 
             self._phase_index = (self._phase_index + 1) % len(PHASE_SEQUENCE)
             self._current_phase = PHASE_SEQUENCE[self._phase_index]
+            await self._phase_completed()
+
+    async def _phase_completed(self) -> None:
+        """Run the per-phase callback once the runtime points at what is next."""
+        if self._on_phase_completed is not None:
+            with contextlib.suppress(Exception):
+                await self._on_phase_completed(self._session)
+
+    async def _save_replay(self) -> None:
+        """Write the replay log of a game that was played, at most once."""
+        if self._replay is None or self._replay.saved:
+            return
+        with contextlib.suppress(OSError):
+            await asyncio.to_thread(self._replay.save)
+
+    def _delta_view(self, model: BaseModel) -> BaseModel:
+        """Translate analytics-bearing payloads for delta protocol clients.
+
+        Publishing happens even without delta listeners so the encoder always
+        tracks the latest analytics that a joining client resumes from.
+        """
+        match model:
+            case PhaseReportResponse(report=report):
+                return PhaseReportDeltaResponse(
+                    phase=report.phase,
+                    month=report.month,
+                    completed_at=report.completed_at,
+                    journal=report.journal,
+                    delta=self._delta_encoder.publish(report.analytics),
+                )
+            case PhaseStatusResponse(analytics=PhaseAnalytics() as analytics):
+                delta = self._delta_encoder.publish(analytics)
+                settings = model.settings
+                if settings is not None and not self._delta_encoder.settings_changed(
+                    settings
+                ):
+                    settings = None
+                return model.model_copy(
+                    update={
+                        "analytics": None,
+                        "settings": settings,
+                        "analytics_seq": delta.seq,
+                        "analytics_delta": (
+                            delta if delta.seq != delta.base_seq else None
+                        ),
+                    }
+                )
+            case _:
+                return model
 
     async def _broadcast(self, model: BaseModel) -> None:
-        """Send a payload to all registered listeners."""
+        """Send a payload to all registered listeners.
+
+        Each protocol view of the payload is serialized at most once and the
+        same text is handed to every socket.
+        """
+        views = {False: model, True: self._delta_view(model)}
+        encoded: dict[bool, str] = {}
+        droppable = isinstance(model, PhaseTickResponse)
         for sender in list(self._senders):
-            await sender(model)
+            is_delta = sender in self._delta_senders
+            if not isinstance(sender, EncodedSender):
+                await sender(views[is_delta])
+                continue
+            if is_delta not in encoded:
+                encoded[is_delta] = encode_message(views[is_delta])
+            await sender.send_encoded(encoded[is_delta], droppable=droppable)
 
     async def broadcast(self, model: BaseModel) -> None:
         """Public wrapper used outside the runtime loop."""
         await self._broadcast(model)
 
 
+class WebSocketSender:
+    """Outbound channel of one websocket connection with its own writer task.
+
+    Frames are queued and written by a background task, so enqueueing never
+    waits on the network and one slow socket cannot hold up a broadcast.
+    Droppable frames (phase ticks) are coalesced so at most the latest one is
+    pending behind other frames; everything else is always delivered. A
+    socket that stays above ``high_water`` pending frames for
+    ``overload_grace_seconds``, or exceeds ``hard_limit``, is disconnected.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket | RelayedWebSocket,
+        *,
+        high_water: int = OUTBOUND_HIGH_WATER,
+        hard_limit: int = OUTBOUND_HARD_LIMIT,
+        overload_grace_seconds: float = OUTBOUND_OVERLOAD_GRACE_SECONDS,
+    ) -> None:
+        self._websocket = websocket
+        self._high_water = high_water
+        self._hard_limit = hard_limit
+        self._overload_grace_seconds = overload_grace_seconds
+        self._frames: deque[tuple[str, bool]] = deque()
+        self._ready = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._writer: asyncio.Task[None] | None = None
+        self._closer: asyncio.Task[None] | None = None
+        self._over_since: float | None = None
+        self._closed = False
+
+    @property
+    def pending(self) -> int:
+        """Number of frames waiting to be written."""
+        return len(self._frames)
+
+    @property
+    def closed(self) -> bool:
+        """Whether the channel stopped accepting frames."""
+        return self._closed
+
+    def start(self) -> None:
+        """Launch the background writer."""
+        if self._writer is None:
+            self._writer = asyncio.create_task(self._write_loop())
+
+    async def drain(self, wait_seconds: float = OUTBOUND_DRAIN_TIMEOUT_SECONDS) -> None:
+        """Wait up to ``wait_seconds`` for every queued frame to be written."""
+        if self._writer is None:
+            return
+        with contextlib.suppress(TimeoutError):
+            async with asyncio.timeout(wait_seconds):
+                await self._idle.wait()
+
+    async def aclose(self) -> None:
+        """Stop the writer and discard frames that were not sent."""
+        self._closed = True
+        self._frames.clear()
+        self._idle.set()
+        for task in (self._writer, self._closer):
+            if task is not None and task is not asyncio.current_task():
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+
+    async def __call__(self, model: BaseModel) -> None:
+        """Serialize and queue a payload addressed to this socket only."""
+        await self.send_encoded(encode_message(model))
+
+    async def send_encoded(self, data: str, *, droppable: bool = False) -> None:
+        """Queue an already serialized JSON text frame."""
+        if self._closed:
+            return
+        if droppable and self._frames and self._frames[-1][1]:
+            self._frames[-1] = (data, True)
+        else:
+            self._frames.append((data, droppable))
+        self._idle.clear()
+        self._ready.set()
+        self._check_backpressure()
+
+    def _check_backpressure(self) -> None:
+        """Shed stale ticks and disconnect sockets that cannot keep up."""
+        if len(self._frames) <= self._high_water:
+            self._over_since = None
+            return
+
+        ticks = [frame for frame in self._frames if frame[1]]
+        newest_tick = ticks[-1] if ticks else None
+        self._frames = deque(
+            frame for frame in self._frames if not frame[1] or frame is newest_tick
+        )
+
+        now = asyncio.get_running_loop().time()
+        if self._over_since is None:
+            self._over_since = now
+        if (
+            len(self._frames) > self._hard_limit
+            or now - self._over_since >= self._overload_grace_seconds
+        ):
+            self._closed = True
+            self._frames.clear()
+            self._idle.set()
+            self._closer = asyncio.create_task(self._disconnect_slow_consumer())
+
+    async def _disconnect_slow_consumer(self) -> None:
+        """Close the socket of a client that stayed over its high-water mark."""
+        if self._writer is not None:
+            self._writer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._writer
+        with contextlib.suppress(Exception):
+            await self._websocket.close(
+                code=status.WS_1013_TRY_AGAIN_LATER,
+                reason="Client is not keeping up",
+            )
+
+    async def _write_loop(self) -> None:
+        """Write queued frames in order until the channel closes."""
+        while not self._closed:
+            if not self._frames:
+                self._idle.set()
+                self._ready.clear()
+                await self._ready.wait()
+                continue
+            data, _ = self._frames.popleft()
+            if len(self._frames) <= self._high_water:
+                self._over_since = None
+            try:
+                await self._websocket.send_text(data)
+            except Exception:
+                self._closed = True
+                self._frames.clear()
+                self._idle.set()
+                return
+
+
+class RelayedWebSocket:
+    """Owner-side endpoint of a player socket held by another worker.
+
+    It offers the subset of the websocket interface the session handler uses,
+    reading frames forwarded by the edge worker and publishing replies back
+    over the session store.
+    """
+
+    def __init__(self, store: SessionStore, connection_id: str) -> None:
+        self._store = store
+        self._inbound, self._outbound = _relay_channels(connection_id)
+        self._frames: asyncio.Queue[str | None] = asyncio.Queue()
+        store.subscribe(self._inbound, self._on_message)
+
+    async def _on_message(self, data: str) -> None:
+        envelope = json.loads(data)
+        self._frames.put_nowait(
+            envelope["data"] if envelope.get("kind") == "frame" else None
+        )
+
+    async def receive_json(self) -> object:
+        """Return the next frame forwarded by the edge worker."""
+        data = await self._frames.get()
+        if data is None:
+            raise WebSocketDisconnect(code=status.WS_1000_NORMAL_CLOSURE)
+        return json.loads(data)
+
+    async def send_text(self, data: str) -> None:
+        """Forward a text frame to the edge worker."""
+        await self._store.publish(self._outbound, _relay_frame(data))
+
+    async def close(
+        self, code: int = status.WS_1000_NORMAL_CLOSURE, reason: str = ""
+    ) -> None:
+        """Ask the edge worker to close the player's socket."""
+        envelope = {"kind": "close", "code": code, "reason": reason}
+        await self._store.publish(self._outbound, json.dumps(envelope))
+
+    def detach(self) -> None:
+        """Stop following the inbound relay channel."""
+        self._store.unsubscribe(self._inbound, self._on_message)
+
+
+async def _accept_relayed_connection(data: str) -> None:
+    """Serve a connection forwarded to this worker by another one."""
+    envelope = json.loads(data)
+    if envelope.get("kind") != "open":
+        return
+    websocket = RelayedWebSocket(_get_session_store(), envelope["connection_id"])
+    task = asyncio.create_task(
+        _serve_relayed_connection(websocket, envelope["user_identifier"])
+    )
+    _RELAY_TASKS.add(task)
+    task.add_done_callback(_RELAY_TASKS.discard)
+
+
+async def _serve_relayed_connection(
+    websocket: RelayedWebSocket, user_identifier: str
+) -> None:
+    """Run the session handler for a relayed socket and close it afterwards."""
+    try:
+        await _serve_connection(websocket, user_identifier=user_identifier)
+    finally:
+        websocket.detach()
+        with contextlib.suppress(Exception):
+            await websocket.close()
+
+
+async def _relay_to_owner(
+    websocket: WebSocket | RelayedWebSocket,
+    send: WebSocketSender,
+    *,
+    owner: str,
+    user_identifier: str,
+    join_message: object,
+) -> None:
+    """Pipe a socket to the worker that owns its session until either side ends."""
+    store = _get_session_store()
+    connection_id = uuid4().hex
+    inbound, outbound = _relay_channels(connection_id)
+    owner_closed: asyncio.Future[tuple[int, str]] = (
+        asyncio.get_running_loop().create_future()
+    )
+
+    async def deliver(data: str) -> None:
+        envelope = json.loads(data)
+        if envelope.get("kind") == "frame":
+            await send.send_encoded(envelope["data"])
+        elif not owner_closed.done():
+            owner_closed.set_result((envelope["code"], envelope["reason"]))
+
+    async def pump() -> None:
+        while True:
+            try:
+                data = await websocket.receive_json()
+            except WebSocketDisconnect:
+                return
+            await store.publish(inbound, _relay_frame(json.dumps(data)))
+
+    store.subscribe(outbound, deliver)
+    pump_task: asyncio.Task[None] | None = None
+    try:
+        await store.publish(
+            _worker_channel(owner),
+            json.dumps(
+                {
+                    "kind": "open",
+                    "connection_id": connection_id,
+                    "user_identifier": user_identifier,
+                }
+            ),
+        )
+        await store.publish(inbound, _relay_frame(json.dumps(join_message)))
+        pump_task = asyncio.create_task(pump())
+        await asyncio.wait(
+            {pump_task, owner_closed}, return_when=asyncio.FIRST_COMPLETED
+        )
+        if owner_closed.done():
+            code, reason = owner_closed.result()
+            # Frames relayed just before the close are still queued on `send`.
+            await send.drain()
+            with contextlib.suppress(Exception):
+                await websocket.close(code=code, reason=reason)
+    finally:
+        if pump_task is not None:
+            pump_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await pump_task
+        store.unsubscribe(outbound, deliver)
+        with contextlib.suppress(Exception):
+            await store.publish(inbound, json.dumps({"kind": "close"}))
+
+
 @router.websocket("/ws/game")
 async def game_session(
     websocket: WebSocket,
@@ -807,16 +1515,25 @@ async def game_session(
         return
 
     await websocket.accept()
+    await _serve_connection(websocket, user_identifier=payload.sub)
+
 
-    send_lock = asyncio.Lock()
+async def _serve_connection(
+    websocket: WebSocket | RelayedWebSocket, *, user_identifier: str
+) -> None:
+    """Handle the messages of one authenticated player connection.
 
-    async def send(model: BaseModel) -> None:
-        async with send_lock:
-            await websocket.send_json(model.model_dump(mode="json"))
+    ``websocket`` is either a local socket or a socket relayed by the worker
+    the player connected to. Joins for sessions owned elsewhere are piped to
+    the owning worker.
+    """
+    send = WebSocketSender(websocket)
+    send.start()
 
     context: SessionContext | None = None
     session_code_value: str | None = None
-    user_identifier: str | None = None
+    joined_as: str | None = None
+    protocol: WsProtocol = "full"
 
     try:
         while True:
@@ -846,15 +1563,25 @@ async def game_session(
                     )
                     continue
 
-                user_identifier = payload.sub
+                joined_as = user_identifier
                 try:
                     (context, session_code_value, _controlled_player, _created) = (
                         await _register_connection(
                             requested_code=message.session_code,
-                            user_identifier=user_identifier,
+                            user_identifier=joined_as,
                             send=send,
+                            protocol=message.protocol,
                         )
                     )
+                except SessionRoutedError as exc:
+                    await _relay_to_owner(
+                        websocket,
+                        send,
+                        owner=exc.owner,
+                        user_identifier=joined_as,
+                        join_message=data,
+                    )
+                    return
                 except SessionJoinError as exc:
                     await send(
                         ErrorResponse(message=str(exc), detail=exc.detail),
@@ -862,16 +1589,24 @@ async def game_session(
                     continue
 
                 runtime = context.runtime
+                protocol = message.protocol
+                analytics_seq: int | None = None
+                if protocol == "delta":
+                    analytics_seq, analytics = runtime.analytics_snapshot()
+                else:
+                    analytics = context.session.snapshot_analytics()
                 await send(
                     SessionWelcomeResponse(
                         session_code=session_code_value,
                         month=context.session.month,
                         phase=runtime.current_phase,
                         phase_duration_seconds=DEFAULT_PHASE_DURATION_SECONDS,
-                        analytics=context.session.snapshot_analytics(),
+                        analytics=analytics,
                         seniority=context.session.seniority_history,
                         tie_break_log=context.session.tie_break_log,
                         settings=context.game_settings,
+                        protocol=protocol,
+                        analytics_seq=analytics_seq,
                     )
                 )
                 _ensure_auto_start(context)
@@ -961,6 +1696,16 @@ async def game_session(
                 continue
 
             if isinstance(message, PhaseStatusRequest):
+                if protocol == "delta":
+                    await send(
+                        PhaseStatusResponse(
+                            month=context.session.month,
+                            phase=context.runtime.current_phase,
+                            remaining_seconds=context.runtime.remaining_seconds,
+                            analytics_seq=context.runtime.analytics_seq,
+                        )
+                    )
+                    continue
                 await send(
                     PhaseStatusResponse(
                         month=context.session.month,
@@ -972,6 +1717,11 @@ async def game_session(
                 )
                 continue
 
+            if isinstance(message, ResyncRequest):
+                seq, analytics = context.runtime.analytics_snapshot()
+                await send(AnalyticsSnapshotResponse(seq=seq, analytics=analytics))
+                continue
+
             if isinstance(message, PhaseActionRequest):
                 if context is None:
                     await send(
@@ -991,7 +1741,7 @@ async def game_session(
                     )
                     continue
 
-                if user_identifier is None:
+                if joined_as is None:
                     await send(
                         ErrorResponse(
                             message="Session not ready for actions",
@@ -1000,7 +1750,7 @@ async def game_session(
                     )
                     continue
 
-                controlled_player = context.assignments.get(user_identifier)
+                controlled_player = context.assignments.get(joined_as)
                 if controlled_player is None:
                     await send(
                         ErrorResponse(
@@ -1035,7 +1785,7 @@ async def game_session(
                     continue
 
                 try:
-                    detail = _apply_phase_action(controlled_player, message)
+                    detail = apply_phase_action(controlled_player, message)
                 except (TypeError, ValueError) as exc:
                     await send(
                         ErrorResponse(
@@ -1044,6 +1794,7 @@ async def game_session(
                         )
                     )
                     continue
+                context.runtime.record_action(controlled_player, message)
 
                 await send(
                     ActionAckResponse(
@@ -1061,9 +1812,10 @@ async def game_session(
                 )
             )
     finally:
-        if context is not None and user_identifier is not None:
+        if context is not None and joined_as is not None:
             await _release_connection(
                 context,
-                user_identifier=user_identifier,
+                user_identifier=joined_as,
                 sender=send,
             )
+        await send.aclose()
@@ -1,21 +1,104 @@
 """Service layer for API-specific business logic."""
 
+from fabricat_backend.api.services.actions import apply_phase_action, clear_phase_state
+from fabricat_backend.api.services.analytics_delta import AnalyticsDeltaEncoder
 from fabricat_backend.api.services.auth import (
     AuthService,
     InvalidCredentialsError,
     TokenPayload,
     UserAlreadyExistsError,
 )
+from fabricat_backend.api.services.encoding import (
+    EncodedSender,
+    encode_message,
+)
 from fabricat_backend.api.services.game_history import (
+    GameHistoryEntry,
     GameHistoryRecorder,
     PlayerHistoryPayload,
 )
+from fabricat_backend.api.services.history_queue import GameHistoryQueue
+from fabricat_backend.api.services.identity import (
+    AuthenticatedUser,
+    UserIdentityCache,
+    VerifiedTokenCache,
+)
+from fabricat_backend.api.services.leaderboard import LeaderboardService
+from fabricat_backend.api.services.passwords import (
+    HashingBusyError,
+    PasswordHasher,
+    PasswordHashParams,
+)
+from fabricat_backend.api.services.profiles import (
+    ANONYMOUS_PROFILE,
+    UserProfile,
+    UserProfileService,
+)
+from fabricat_backend.api.services.replay import (
+    REPLAY_SUFFIX,
+    ReplayAction,
+    ReplayFormatError,
+    ReplayLog,
+    ReplayPhase,
+    ReplayRecorder,
+    ReplayResult,
+    replay,
+)
+from fabricat_backend.api.services.session_store import (
+    InProcessSessionStore,
+    SessionStore,
+    SqliteSessionStore,
+    create_session_store,
+)
+from fabricat_backend.api.services.snapshots import (
+    SNAPSHOT_VERSION,
+    SessionSnapshot,
+    SnapshotFormatError,
+    SnapshotStore,
+    decode_snapshot,
+    encode_snapshot,
+)
 
 __all__ = [
+    "ANONYMOUS_PROFILE",
+    "REPLAY_SUFFIX",
+    "SNAPSHOT_VERSION",
+    "AnalyticsDeltaEncoder",
     "AuthService",
+    "AuthenticatedUser",
+    "EncodedSender",
+    "GameHistoryEntry",
+    "GameHistoryQueue",
     "GameHistoryRecorder",
+    "HashingBusyError",
+    "InProcessSessionStore",
     "InvalidCredentialsError",
+    "LeaderboardService",
+    "PasswordHashParams",
+    "PasswordHasher",
     "PlayerHistoryPayload",
+    "ReplayAction",
+    "ReplayFormatError",
+    "ReplayLog",
+    "ReplayPhase",
+    "ReplayRecorder",
+    "ReplayResult",
+    "SessionSnapshot",
+    "SessionStore",
+    "SnapshotFormatError",
+    "SnapshotStore",
+    "SqliteSessionStore",
     "TokenPayload",
     "UserAlreadyExistsError",
+    "UserIdentityCache",
+    "UserProfile",
+    "UserProfileService",
+    "VerifiedTokenCache",
+    "apply_phase_action",
+    "clear_phase_state",
+    "create_session_store",
+    "decode_snapshot",
+    "encode_message",
+    "encode_snapshot",
+    "replay",
 ]
@@ -0,0 +1,83 @@
+"""Apply client phase actions to the players of a game session."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import TYPE_CHECKING, Any
+
+from fabricat_backend.api.models.session import (
+    SubmitBuyBidPayload,
+    SubmitSellBidPayload,
+)
+from fabricat_backend.game_logic.phases import GamePhase
+
+if TYPE_CHECKING:
+    from fabricat_backend.api.models.session import PhaseActionRequest
+    from fabricat_backend.game_logic.session import Player
+
+
+def clear_phase_state(player: Player, phase: GamePhase) -> None:
+    """Reset player state when they skip a phase."""
+    match phase:
+        case GamePhase.BUY:
+            player.buy_bid = None
+        case GamePhase.SELL:
+            player.sell_bid = None
+        case GamePhase.PRODUCTION:
+            player.production_call_for_basic = 0
+            player.production_call_for_auto = 0
+        case GamePhase.LOANS:
+            for loan in player.loans:
+                if loan.loan_status == "call":
+                    loan.loan_status = "idle"
+        case GamePhase.CONSTRUCTION:
+            player.build_or_upgrade_call = "idle"
+        case _:
+            return
+
+
+def apply_phase_action(player: Player, request: PhaseActionRequest) -> dict[str, Any]:
+    """Mutate the player according to the payload and return ack details."""
+    payload = request.payload
+    match payload.kind:
+        case "submit_buy_bid":
+            if not isinstance(payload, SubmitBuyBidPayload):
+                msg = "Invalid payload for submit_buy_bid action."
+                raise TypeError(msg)
+            player.buy_bid = payload.to_bid()
+            return {"buy_bid": asdict(player.buy_bid)}
+        case "submit_sell_bid":
+            if not isinstance(payload, SubmitSellBidPayload):
+                msg = "Invalid payload for submit_sell_bid action."
+                raise TypeError(msg)
+            player.sell_bid = payload.to_bid()
+            return {"sell_bid": asdict(player.sell_bid)}
+        case "production_plan":
+            player.production_call_for_basic = payload.basic
+            player.production_call_for_auto = payload.auto
+            return {
+                "production_call_for_basic": payload.basic,
+                "production_call_for_auto": payload.auto,
+            }
+        case "loan_decision":
+            slot = payload.slot
+            if slot < 0 or slot >= len(player.loans):
+                msg = f"Loan slot {slot} is invalid."
+                raise ValueError(msg)
+            loan = player.loans[slot]
+            if payload.decision == "call":
+                loan.loan_status = "call"
+            elif loan.loan_status == "call":
+                loan.loan_status = "idle"
+            return {"slot": slot, "loan_status": loan.loan_status}
+        case "construction_request":
+            player.build_or_upgrade_call = payload.project
+            return {"project": payload.project}
+        case "skip":
+            clear_phase_state(player, request.phase)
+            return {"skipped": True}
+    msg = f"Unsupported action: {payload.kind}"
+    raise ValueError(msg)
+
+
+__all__ = ["apply_phase_action", "clear_phase_state"]
@@ -0,0 +1,114 @@
+"""Sequence-numbered analytics deltas for bandwidth-sensitive clients."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from fabricat_backend.api.models.session import AnalyticsDelta, PlayerAnalyticsDelta
+
+if TYPE_CHECKING:
+    from fabricat_backend.game_logic.phases import PhaseAnalytics
+    from fabricat_backend.game_logic.session import GameSettings
+
+_SESSION_FIELDS = (
+    "bankrupt_players",
+    "bank_raw_material_volume",
+    "bank_raw_material_min_price",
+    "bank_finished_good_volume",
+    "bank_finished_good_max_price",
+    "bank_available_loans",
+    "bank_loan_nominals",
+    "bank_loan_terms",
+)
+
+
+class AnalyticsDeltaEncoder:
+    """Diff successive analytics snapshots of one session.
+
+    The encoder remembers the last published snapshot and its sequence number.
+    Each publication that changes anything bumps the sequence, so every delta
+    client of the session shares one stream and a single diff per phase.
+    """
+
+    def __init__(self) -> None:
+        self._seq = 0
+        self._last: PhaseAnalytics | None = None
+        self._last_settings: GameSettings | None = None
+
+    @property
+    def seq(self) -> int:
+        """Return the sequence number of the last published snapshot."""
+        return self._seq
+
+    def publish(self, analytics: PhaseAnalytics) -> AnalyticsDelta:
+        """Record ``analytics`` as the latest snapshot and return the delta.
+
+        When nothing changed the delta is empty and ``seq`` equals
+        ``base_seq``.
+        """
+        base_seq = self._seq
+        if analytics is self._last:
+            return AnalyticsDelta(seq=base_seq, base_seq=base_seq)
+
+        players, removed, fields = _diff(self._last, analytics)
+        self._last = analytics
+        if players or removed or fields:
+            self._seq += 1
+        return AnalyticsDelta(
+            seq=self._seq,
+            base_seq=base_seq,
+            players=players,
+            removed_players=removed,
+            fields=fields,
+        )
+
+    def snapshot(self, analytics: PhaseAnalytics) -> tuple[int, PhaseAnalytics]:
+        """Return the snapshot later deltas apply to, with its sequence number.
+
+        ``analytics`` is published first when nothing has been published yet.
+        """
+        if self._last is None:
+            self.publish(analytics)
+            return self._seq, analytics
+        return self._seq, self._last
+
+    def settings_changed(self, settings: GameSettings) -> bool:
+        """Return whether ``settings`` differ from the last ones delivered."""
+        if settings == self._last_settings:
+            return False
+        self._last_settings = settings
+        return True
+
+
+def _diff(
+    previous: PhaseAnalytics | None, current: PhaseAnalytics
+) -> tuple[list[PlayerAnalyticsDelta], list[int], dict[str, Any]]:
+    """Return changed players, removed player ids, and changed session fields."""
+    before = {entry.player_id: entry for entry in previous.players} if previous else {}
+    players: list[PlayerAnalyticsDelta] = []
+    for entry in current.players:
+        old = before.pop(entry.player_id, None)
+        if old is entry:
+            continue
+        values = entry.model_dump(exclude={"player_id"})
+        if old is not None:
+            old_values = old.model_dump(exclude={"player_id"})
+            values = {
+                name: value
+                for name, value in values.items()
+                if old_values[name] != value
+            }
+        if values:
+            players.append(
+                PlayerAnalyticsDelta(player_id=entry.player_id, changes=values)
+            )
+
+    fields = {
+        name: getattr(current, name)
+        for name in _SESSION_FIELDS
+        if previous is None or getattr(previous, name) != getattr(current, name)
+    }
+    return players, sorted(before), fields
+
+
+__all__ = ["AnalyticsDeltaEncoder"]
@@ -1,17 +1,19 @@
 """Authentication domain logic."""
 
-import base64
-import hashlib
-import hmac
-import secrets
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from uuid import uuid4
 
 import jwt
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from fabricat_backend.database import UserRepository, UserSchema
+from fabricat_backend.api.services.identity import (
+    UserIdentityCache,
+    VerifiedTokenCache,
+)
+from fabricat_backend.api.services.passwords import PasswordHasher
+from fabricat_backend.database import AsyncUserRepository, UserRepository, UserSchema
 from fabricat_backend.settings import BackendSettings
 from fabricat_backend.shared import AvatarIcon
 
@@ -33,36 +35,39 @@ class TokenPayload:
 
 
 class AuthService:
-    """Handles password hashing and token generation."""
+    """Handles password hashing and token generation.
 
-    def __init__(
+    Pass a shared ``hasher`` so every request hashes on the same bounded
+    worker pool; otherwise one is built from ``settings``. A shared
+    ``token_cache`` skips re-verifying tokens that were already decoded, and
+    ``identities`` is invalidated whenever a user's password changes.
+    """
+
+    def __init__(  # noqa: PLR0913
         self,
         *,
         settings: BackendSettings,
         secret_key: str | None = None,
         algorithm: str = "HS256",
         access_token_ttl_minutes: int = 60,
+        hasher: PasswordHasher | None = None,
+        token_cache: VerifiedTokenCache | None = None,
+        identities: UserIdentityCache | None = None,
     ) -> None:
         self._secret_key = secret_key or settings.auth_secret_key
         self._algorithm = algorithm
         self._access_token_ttl = timedelta(minutes=access_token_ttl_minutes)
+        self._hasher = hasher or PasswordHasher.from_settings(settings)
+        self._token_cache = token_cache
+        self._identities = identities
 
     def hash_password(self, password: str) -> str:
         """Hash a password using PBKDF2 with a random salt."""
-        salt = secrets.token_bytes(16)
-        digest = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, 100_000)
-        return f"{base64.b64encode(salt).decode()}:{base64.b64encode(digest).decode()}"
+        return self._hasher.hash_password(password)
 
     def verify_password(self, password: str, password_hash: str) -> bool:
         """Validate a password against a stored PBKDF2 hash."""
-        try:
-            salt_b64, hash_b64 = password_hash.split(":", 1)
-        except ValueError:
-            return False
-        salt = base64.b64decode(salt_b64.encode())
-        expected = base64.b64decode(hash_b64.encode())
-        actual = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, 100_000)
-        return hmac.compare_digest(actual, expected)
+        return self._hasher.verify_password(password, password_hash)
 
     def create_access_token(self, subject: str) -> str:
         """Create new acess token."""
@@ -71,11 +76,18 @@ class AuthService:
         return jwt.encode(payload, self._secret_key, algorithm=self._algorithm)
 
     def decode_access_token(self, token: str) -> TokenPayload:
-        """Decode access token via JWT."""
+        """Decode access token via JWT, reusing earlier verifications if cached."""
+        if self._token_cache is not None:
+            cached = self._token_cache.get(token)
+            if cached is not None:
+                return cached
         data = jwt.decode(token, self._secret_key, algorithms=[self._algorithm])
-        return TokenPayload(
+        payload = TokenPayload(
             sub=data["sub"], exp=datetime.fromtimestamp(data["exp"], tz=UTC)
         )
+        if self._token_cache is not None:
+            self._token_cache.put(token, payload)
+        return payload
 
     def refresh_access_token(self, token: str) -> str:
         """Issue a new access token based on an existing token (ignores expiry)."""
@@ -105,23 +117,74 @@ class AuthService:
             raise UserAlreadyExistsError(nickname)
 
         password_hash = self.hash_password(password)
-        user = UserSchema(
-            id=uuid4(),
-            nickname=nickname,
-            password_hash=password_hash,
-            icon=icon.value if hasattr(icon, "value") else str(icon),
-        )
-        user = repository.add(user)
+        user = repository.add(_new_user(nickname, password_hash, icon))
+        token = self.create_access_token(str(user.id))
+        return user, token
+
+    async def aregister_user(
+        self,
+        *,
+        session: AsyncSession,
+        nickname: str,
+        password: str,
+        icon: AvatarIcon,
+    ) -> tuple[UserSchema, str]:
+        """Async variant of :meth:`register_user` for ``async def`` endpoints.
+
+        Hashing runs on the hasher's worker pool so it does not stall the event
+        loop, and raises :class:`HashingBusyError` when that pool is saturated.
+        """
+        repository = AsyncUserRepository(session)
+        if await repository.get_by_nickname(nickname) is not None:
+            raise UserAlreadyExistsError(nickname)
+
+        password_hash = await self._hasher.ahash_password(password)
+        user = await repository.add(_new_user(nickname, password_hash, icon))
         token = self.create_access_token(str(user.id))
         return user, token
 
     def authenticate_user(
         self, *, session: Session, nickname: str, password: str
     ) -> tuple[UserSchema, str]:
-        """Get user from database, check password and create token."""
+        """Get user from database, check password and create token.
+
+        A password stored with outdated hash parameters is rehashed with the
+        current ones as part of the session's transaction.
+        """
         repository = UserRepository(session)
         user = repository.get_by_nickname(nickname)
         if user is None or not self.verify_password(password, user.password_hash):
             raise InvalidCredentialsError(nickname)
+        if self._hasher.needs_rehash(user.password_hash):
+            user.password_hash = self.hash_password(password)
+            self._password_changed(user)
         token = self.create_access_token(str(user.id))
         return user, token
+
+    async def aauthenticate_user(
+        self, *, session: AsyncSession, nickname: str, password: str
+    ) -> tuple[UserSchema, str]:
+        """Async variant of :meth:`authenticate_user` for ``async def`` endpoints."""
+        user = await AsyncUserRepository(session).get_by_nickname(nickname)
+        if user is None or not await self._hasher.averify_password(
+            password, user.password_hash
+        ):
+            raise InvalidCredentialsError(nickname)
+        if self._hasher.needs_rehash(user.password_hash):
+            user.password_hash = await self._hasher.ahash_password(password)
+            self._password_changed(user)
+        token = self.create_access_token(str(user.id))
+        return user, token
+
+    def _password_changed(self, user: UserSchema) -> None:
+        if self._identities is not None:
+            self._identities.invalidate(user.id)
+
+
+def _new_user(nickname: str, password_hash: str, icon: AvatarIcon) -> UserSchema:
+    return UserSchema(
+        id=uuid4(),
+        nickname=nickname,
+        password_hash=password_hash,
+        icon=icon.value if hasattr(icon, "value") else str(icon),
+    )
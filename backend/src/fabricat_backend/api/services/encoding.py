@@ -0,0 +1,28 @@
+"""Encode outbound WebSocket payloads once and share them across sockets."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Protocol, runtime_checkable
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+
+@runtime_checkable
+class EncodedSender(Protocol):
+    """Outbound channel that accepts an already serialized JSON text frame."""
+
+    async def send_encoded(self, data: str, *, droppable: bool = False) -> None:
+        """Deliver the encoded payload as-is.
+
+        ``droppable`` marks frames such as countdown ticks that a slow
+        consumer may skip in favour of a newer one.
+        """
+
+
+def encode_message(model: BaseModel) -> str:
+    """Serialize an outbound model to the JSON text sent over the wire."""
+    return model.model_dump_json()
+
+
+__all__ = ["EncodedSender", "encode_message"]
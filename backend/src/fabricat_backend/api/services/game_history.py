@@ -4,12 +4,20 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
+from typing import TYPE_CHECKING
 from uuid import UUID
 
-from fabricat_backend.database import GameHistoryRepository, PlayerStatsRecord
+from fabricat_backend.database import (
+    GameHistoryRepository,
+    PlayerStatsRecord,
+    SessionHistoryRecord,
+)
 from fabricat_backend.database.service import DatabaseService
 from fabricat_backend.game_logic.session import PlayerFinalStats
 
+if TYPE_CHECKING:
+    from fabricat_backend.api.services.leaderboard import LeaderboardService
+
 
 @dataclass(slots=True)
 class PlayerHistoryPayload:
@@ -19,11 +27,31 @@ class PlayerHistoryPayload:
     stats: PlayerFinalStats
 
 
+@dataclass(slots=True)
+class GameHistoryEntry:
+    """Final results of one finished session, ready to be persisted.
+
+    ``session_id`` is the id the session is stored under; entries carrying
+    one are written at most once however often they are retried.
+    """
+
+    session_code: str
+    finished_at: datetime
+    stats: list[PlayerHistoryPayload]
+    session_id: UUID | None = None
+
+
 class GameHistoryRecorder:
     """Facade that writes gameplay statistics to the database."""
 
-    def __init__(self, *, database: DatabaseService) -> None:
+    def __init__(
+        self,
+        *,
+        database: DatabaseService,
+        leaderboard: LeaderboardService | None = None,
+    ) -> None:
         self._database = database
+        self._leaderboard = leaderboard
 
     def record(
         self,
@@ -33,30 +61,52 @@ class GameHistoryRecorder:
         stats: list[PlayerHistoryPayload],
     ) -> None:
         """Persist the final state of a completed session."""
-        with self._database.session() as session:
-            repository = GameHistoryRepository(session)
-            repository.record_session(
-                session_code=session_code,
-                finished_at=finished_at,
-                player_stats=[
-                    PlayerStatsRecord(
-                        user_id=payload.user_id,
-                        player_slot_id=payload.stats.player_id,
-                        capital=payload.stats.capital,
-                        place=payload.stats.place,
-                        is_bankrupt=payload.stats.is_bankrupt,
-                        is_top1=payload.stats.is_top1,
-                        has_debt=payload.stats.has_debt,
-                        total_debt=payload.stats.total_debt,
-                        factories_basic=payload.stats.factories_basic,
-                        factories_auto=payload.stats.factories_auto,
-                        factories_builds_basic=payload.stats.factories_builds_basic,
-                        factories_builds_auto=payload.stats.factories_builds_auto,
-                        factories_upgrades=payload.stats.factories_upgrades,
-                    )
-                    for payload in stats
-                ],
+        self.record_batch(
+            [
+                GameHistoryEntry(
+                    session_code=session_code, finished_at=finished_at, stats=stats
+                )
+            ]
+        )
+
+    def record_batch(self, entries: list[GameHistoryEntry]) -> list[UUID]:
+        """Persist several completed sessions in a single transaction.
+
+        Cached leaderboards are refreshed once the transaction has committed.
+        """
+        records = [
+            SessionHistoryRecord(
+                session_code=entry.session_code,
+                finished_at=entry.finished_at,
+                player_stats=[_stats_record(payload) for payload in entry.stats],
+                session_id=entry.session_id,
             )
+            for entry in entries
+        ]
+        with self._database.session() as session:
+            session_ids = GameHistoryRepository(session).record_sessions(records)
+        if self._leaderboard is not None:
+            self._leaderboard.refresh()
+        return session_ids
+
+
+def _stats_record(payload: PlayerHistoryPayload) -> PlayerStatsRecord:
+    stats = payload.stats
+    return PlayerStatsRecord(
+        user_id=payload.user_id,
+        player_slot_id=stats.player_id,
+        capital=stats.capital,
+        place=stats.place,
+        is_bankrupt=stats.is_bankrupt,
+        is_top1=stats.is_top1,
+        has_debt=stats.has_debt,
+        total_debt=stats.total_debt,
+        factories_basic=stats.factories_basic,
+        factories_auto=stats.factories_auto,
+        factories_builds_basic=stats.factories_builds_basic,
+        factories_builds_auto=stats.factories_builds_auto,
+        factories_upgrades=stats.factories_upgrades,
+    )
 
 
-__all__ = ["GameHistoryRecorder", "PlayerHistoryPayload"]
+__all__ = ["GameHistoryEntry", "GameHistoryRecorder", "PlayerHistoryPayload"]
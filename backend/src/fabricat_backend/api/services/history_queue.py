@@ -0,0 +1,282 @@
+"""Durable background pipeline that persists finished games in batches."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, TypeVar
+from uuid import UUID, uuid4
+
+from fabricat_backend.api.services.game_history import (
+    GameHistoryEntry,
+    PlayerHistoryPayload,
+)
+from fabricat_backend.game_logic.session import PlayerFinalStats
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from fabricat_backend.api.services.game_history import GameHistoryRecorder
+
+_LOGGER = logging.getLogger(__name__)
+_T = TypeVar("_T")
+
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_FLUSH_INTERVAL_SECONDS = 0.5
+DEFAULT_RETRY_BASE_SECONDS = 1.0
+DEFAULT_RETRY_MAX_SECONDS = 300.0
+
+
+class GameHistoryQueue:
+    """Local write-ahead queue in front of :class:`GameHistoryRecorder`.
+
+    Finished games are appended to a SQLite file before anything touches the
+    main database, so a game ending never waits on it and a failed write is
+    kept instead of dropped. A background worker drains the file in batches of
+    up to ``batch_size`` games per transaction. When a batch fails its games
+    are retried one by one, and games that still fail are rescheduled with an
+    exponential backoff capped at ``retry_max_seconds``. Entries left over
+    when the process stops are written after the next start.
+
+    Each entry is given its session id when it is enqueued, so a batch that
+    is retried after reaching the database is not recorded twice.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        recorder: GameHistoryRecorder,
+        path: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        retry_base_seconds: float = DEFAULT_RETRY_BASE_SECONDS,
+        retry_max_seconds: float = DEFAULT_RETRY_MAX_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if batch_size < 1:
+            msg = "Batch size must be positive."
+            raise ValueError(msg)
+        if flush_interval_seconds < 0 or retry_base_seconds < 0:
+            msg = "Queue intervals must be non-negative."
+            raise ValueError(msg)
+
+        self._recorder = recorder
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval_seconds
+        self._retry_base = retry_base_seconds
+        self._retry_max = retry_max_seconds
+        self._clock = clock
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS pending_history (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                payload TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                next_attempt_at REAL NOT NULL DEFAULT 0,
+                last_error TEXT
+            )
+            """
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="history-queue"
+        )
+        self._wakeup = asyncio.Event()
+        self._stopping = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._worker: asyncio.Task[None] | None = None
+        self._closed = False
+
+    async def put(self, entry: GameHistoryEntry) -> None:
+        """Durably enqueue ``entry`` and wake the background writer."""
+        if entry.session_id is None:
+            entry = replace(entry, session_id=uuid4())
+        await self._run(self._insert, _encode(entry))
+        self._wakeup.set()
+
+    async def pending(self) -> int:
+        """Return the number of games that are not persisted yet."""
+        return await self._run(self._count)
+
+    def start(self) -> None:
+        """Launch the background writer on the running loop."""
+        if self._worker is None and not self._closed:
+            self._worker = asyncio.create_task(self._work())
+
+    async def flush(self) -> int:
+        """Persist every entry that is due now and return how many were written.
+
+        Stops early after a failure so an unavailable database is not hammered;
+        the failed entries are already rescheduled.
+        """
+        written = 0
+        async with self._flush_lock:
+            while True:
+                rows = await self._run(self._due, self._clock(), self._batch_size)
+                if not rows:
+                    return written
+                persisted, failed = await self._persist(rows)
+                written += persisted
+                if failed:
+                    return written
+
+    async def aclose(self) -> None:
+        """Stop the writer after a last flush and close the queue file."""
+        if self._closed:
+            return
+        self._closed = True
+        self._stopping.set()
+        self._wakeup.set()
+        if self._worker is not None:
+            # Let a batch in progress finish so its rows are not written twice.
+            await self._worker
+        with contextlib.suppress(Exception):
+            await self.flush()
+        await self._run(self._connection.close)
+        self._executor.shutdown(wait=False)
+
+    async def _work(self) -> None:
+        """Drain the queue whenever entries arrive or retries become due."""
+        while not self._closed:
+            self._wakeup.clear()
+            delay: float | None = self._retry_base
+            try:
+                await self.flush()
+                delay = await self._run(self._seconds_until_due, self._clock())
+            except Exception:
+                _LOGGER.exception("Draining the game history queue failed")
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+            # Let games finishing on the same month boundary share one batch.
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(
+                    self._stopping.wait(), timeout=self._flush_interval
+                )
+
+    async def _persist(self, rows: list[tuple[int, int, str]]) -> tuple[int, int]:
+        """Write a batch, isolating failing entries; return (written, failed)."""
+        entries: list[tuple[int, int, GameHistoryEntry]] = []
+        failed = 0
+        for row_id, attempts, payload in rows:
+            try:
+                entries.append((row_id, attempts, _decode(payload)))
+            except (KeyError, TypeError, ValueError) as exc:
+                await self._run(self._reschedule, row_id, attempts, repr(exc))
+                failed += 1
+
+        if not entries:
+            return 0, failed
+        try:
+            await asyncio.to_thread(
+                self._recorder.record_batch, [entry for _, _, entry in entries]
+            )
+        except Exception as exc:  # noqa: BLE001
+            _LOGGER.warning("Writing %d finished games failed: %r", len(entries), exc)
+        else:
+            await self._run(self._delete, [row_id for row_id, _, _ in entries])
+            return len(entries), failed
+
+        written = 0
+        for row_id, attempts, entry in entries:
+            try:
+                await asyncio.to_thread(self._recorder.record_batch, [entry])
+            except Exception as exc:  # noqa: BLE001
+                await self._run(self._reschedule, row_id, attempts, repr(exc))
+                failed += 1
+            else:
+                await self._run(self._delete, [row_id])
+                written += 1
+        return written, failed
+
+    async def _run(self, function: Callable[..., _T], *args: object) -> _T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, function, *args)
+
+    def _insert(self, payload: str) -> None:
+        self._connection.execute(
+            "INSERT INTO pending_history (payload) VALUES (?)", (payload,)
+        )
+
+    def _count(self) -> int:
+        return self._connection.execute(
+            "SELECT COUNT(*) FROM pending_history"
+        ).fetchone()[0]
+
+    def _due(self, now: float, limit: int) -> list[tuple[int, int, str]]:
+        return self._connection.execute(
+            "SELECT id, attempts, payload FROM pending_history "
+            "WHERE next_attempt_at <= ? ORDER BY id LIMIT ?",
+            (now, limit),
+        ).fetchall()
+
+    def _seconds_until_due(self, now: float) -> float | None:
+        row = self._connection.execute(
+            "SELECT MIN(next_attempt_at) FROM pending_history"
+        ).fetchone()
+        if row[0] is None:
+            return None
+        return max(row[0] - now, 0.0)
+
+    def _delete(self, row_ids: list[int]) -> None:
+        self._connection.executemany(
+            "DELETE FROM pending_history WHERE id = ?",
+            [(row_id,) for row_id in row_ids],
+        )
+
+    def _reschedule(self, row_id: int, attempts: int, error: str) -> None:
+        delay = min(self._retry_base * 2**attempts, self._retry_max)
+        self._connection.execute(
+            "UPDATE pending_history SET attempts = ?, next_attempt_at = ?, "
+            "last_error = ? WHERE id = ?",
+            (attempts + 1, self._clock() + delay, error, row_id),
+        )
+
+
+def _encode(entry: GameHistoryEntry) -> str:
+    return json.dumps(
+        {
+            "session_id": None if entry.session_id is None else str(entry.session_id),
+            "session_code": entry.session_code,
+            "finished_at": entry.finished_at.isoformat(),
+            "stats": [
+                {
+                    "user_id": None if item.user_id is None else str(item.user_id),
+                    "stats": item.stats.model_dump(mode="json"),
+                }
+                for item in entry.stats
+            ],
+        }
+    )
+
+
+def _decode(payload: str) -> GameHistoryEntry:
+    data = json.loads(payload)
+    session_id = data.get("session_id")
+    return GameHistoryEntry(
+        session_id=None if session_id is None else UUID(session_id),
+        session_code=data["session_code"],
+        finished_at=datetime.fromisoformat(data["finished_at"]),
+        stats=[
+            PlayerHistoryPayload(
+                user_id=None if item["user_id"] is None else UUID(item["user_id"]),
+                stats=PlayerFinalStats.model_validate(item["stats"]),
+            )
+            for item in data["stats"]
+        ],
+    )
+
+
+__all__ = ["GameHistoryQueue"]
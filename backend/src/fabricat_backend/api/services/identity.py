@@ -0,0 +1,169 @@
+"""Process-wide caches that keep bearer-token authentication off the database."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from uuid import UUID
+
+    from fabricat_backend.api.services.auth import TokenPayload
+    from fabricat_backend.database import UserSchema
+
+DEFAULT_TOKEN_CACHE_SIZE = 10_000
+DEFAULT_IDENTITY_CACHE_SIZE = 4_096
+DEFAULT_IDENTITY_TTL_SECONDS = 30.0
+
+
+@dataclass(frozen=True, slots=True)
+class AuthenticatedUser:
+    """Identity of the user behind a request, detached from any session."""
+
+    id: UUID
+    nickname: str
+    icon: str
+
+    @classmethod
+    def from_schema(cls, user: UserSchema) -> AuthenticatedUser:
+        """Snapshot the identity fields of a loaded user row."""
+        return cls(id=user.id, nickname=user.nickname, icon=user.icon)
+
+
+class VerifiedTokenCache:
+    """Remember decoded access tokens until they expire.
+
+    Entries are keyed by a SHA-256 of the token, so raw bearer tokens are not
+    kept in memory, and are only added after PyJWT verified the signature.
+    A hit therefore skips signature checking for the token's remaining
+    lifetime. The ``max_entries`` most recently used tokens are kept.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = DEFAULT_TOKEN_CACHE_SIZE,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if max_entries < 1:
+            msg = "Token cache must hold at least one entry."
+            raise ValueError(msg)
+
+        self._max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[bytes, TokenPayload] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of cached tokens."""
+        return len(self._entries)
+
+    def get(self, token: str) -> TokenPayload | None:
+        """Return the payload of ``token`` if it was verified and is unexpired."""
+        key = _token_key(token)
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is None:
+                return None
+            if payload.exp.timestamp() <= self._clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return payload
+
+    def put(self, token: str, payload: TokenPayload) -> None:
+        """Remember a verified ``payload`` for ``token`` until its expiry."""
+        if payload.exp.timestamp() <= self._clock():
+            return
+        key = _token_key(token)
+        with self._lock:
+            self._entries[key] = payload
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Forget every verified token."""
+        with self._lock:
+            self._entries.clear()
+
+
+class UserIdentityCache:
+    """Short-lived cache of :class:`AuthenticatedUser` by user id.
+
+    Saves the user lookup on repeated requests. Entries expire after
+    ``ttl_seconds``; code that changes a user's profile or password calls
+    :meth:`invalidate` so the change is seen on the next request.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = DEFAULT_IDENTITY_CACHE_SIZE,
+        ttl_seconds: float = DEFAULT_IDENTITY_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_entries < 1:
+            msg = "Identity cache must hold at least one entry."
+            raise ValueError(msg)
+        if ttl_seconds < 0:
+            msg = "Identity cache TTL must be non-negative."
+            raise ValueError(msg)
+
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[UUID, tuple[float, AuthenticatedUser]] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        """Return the number of cached identities."""
+        return len(self._entries)
+
+    def get(self, user_id: UUID) -> AuthenticatedUser | None:
+        """Return the cached identity of ``user_id`` if it is still fresh."""
+        with self._lock:
+            cached = self._entries.get(user_id)
+            if cached is None:
+                return None
+            expires_at, identity = cached
+            if expires_at <= self._clock():
+                del self._entries[user_id]
+                return None
+            self._entries.move_to_end(user_id)
+            return identity
+
+    def put(self, identity: AuthenticatedUser) -> AuthenticatedUser:
+        """Cache ``identity`` and return it."""
+        with self._lock:
+            self._entries[identity.id] = (self._clock() + self._ttl_seconds, identity)
+            self._entries.move_to_end(identity.id)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return identity
+
+    def invalidate(self, user_id: UUID | None = None) -> None:
+        """Forget the identity of one user, or of everyone."""
+        with self._lock:
+            if user_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(user_id, None)
+
+
+def _token_key(token: str) -> bytes:
+    return hashlib.sha256(token.encode("utf-8")).digest()
+
+
+__all__ = [
+    "AuthenticatedUser",
+    "UserIdentityCache",
+    "VerifiedTokenCache",
+]
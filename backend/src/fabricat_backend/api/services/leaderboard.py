@@ -0,0 +1,131 @@
+"""Leaderboards served from a top-K cache over precomputed rankings."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from fabricat_backend.database import LeaderboardRepository
+from fabricat_backend.shared import LeaderboardMetric
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from fabricat_backend.database import LeaderboardRow
+    from fabricat_backend.database.service import DatabaseService
+    from fabricat_backend.shared import LeaderboardWindow
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_LEADERBOARD_TOP_K = 100
+DEFAULT_LEADERBOARD_TTL_SECONDS = 60.0
+DEFAULT_MIN_GAMES_FOR_AVERAGE = 5
+
+
+class LeaderboardService:
+    """Serve leaderboard pages, keeping the first ``top_k`` ranks in memory.
+
+    Pages inside the top ``top_k`` are sliced from a cached ranking; deeper
+    pages go to the database. :meth:`refresh` recomputes the cached rankings
+    and is called after new games are recorded. Entries also expire after
+    ``ttl_seconds`` so rolling windows move on without new games. Rankings by
+    average place only include users with ``min_games_for_average`` games.
+    """
+
+    def __init__(
+        self,
+        *,
+        database: DatabaseService,
+        top_k: int = DEFAULT_LEADERBOARD_TOP_K,
+        ttl_seconds: float = DEFAULT_LEADERBOARD_TTL_SECONDS,
+        min_games_for_average: int = DEFAULT_MIN_GAMES_FOR_AVERAGE,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if top_k < 1:
+            msg = "Leaderboard cache must hold at least one rank."
+            raise ValueError(msg)
+        if ttl_seconds < 0:
+            msg = "Leaderboard cache TTL must be non-negative."
+            raise ValueError(msg)
+
+        self._database = database
+        self._top_k = top_k
+        self._ttl_seconds = ttl_seconds
+        self._min_games_for_average = min_games_for_average
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._cache: dict[
+            tuple[LeaderboardMetric, LeaderboardWindow],
+            tuple[float, list[LeaderboardRow]],
+        ] = {}
+
+    def page(
+        self,
+        *,
+        metric: LeaderboardMetric,
+        window: LeaderboardWindow,
+        offset: int,
+        limit: int,
+    ) -> list[LeaderboardRow]:
+        """Return ``limit`` ranked users starting after the first ``offset``."""
+        if offset + limit <= self._top_k:
+            return self._top(metric, window)[offset : offset + limit]
+        return self._query(metric, window, offset=offset, limit=limit)
+
+    def refresh(self) -> None:
+        """Recompute every cached ranking, e.g. after games were recorded.
+
+        Failures are logged and drop the cache instead of propagating, so a
+        successful write is never reported as failed.
+        """
+        with self._lock:
+            keys = list(self._cache)
+            try:
+                for metric, window in keys:
+                    self._store(metric, window)
+            except Exception:
+                _LOGGER.exception("Refreshing the leaderboard cache failed")
+                self._cache.clear()
+
+    def _top(
+        self, metric: LeaderboardMetric, window: LeaderboardWindow
+    ) -> list[LeaderboardRow]:
+        with self._lock:
+            cached = self._cache.get((metric, window))
+            if cached is not None and cached[0] > self._clock():
+                return cached[1]
+            return self._store(metric, window)
+
+    def _store(
+        self, metric: LeaderboardMetric, window: LeaderboardWindow
+    ) -> list[LeaderboardRow]:
+        rows = self._query(metric, window, offset=0, limit=self._top_k)
+        self._cache[metric, window] = (self._clock() + self._ttl_seconds, rows)
+        return rows
+
+    def _query(
+        self,
+        metric: LeaderboardMetric,
+        window: LeaderboardWindow,
+        *,
+        offset: int,
+        limit: int,
+    ) -> list[LeaderboardRow]:
+        min_games = (
+            self._min_games_for_average
+            if metric is LeaderboardMetric.AVERAGE_PLACE
+            else 1
+        )
+        with self._database.session() as session:
+            return LeaderboardRepository(session).ranking(
+                metric=metric,
+                window=window,
+                limit=limit,
+                offset=offset,
+                min_games=min_games,
+            )
+
+
+__all__ = ["LeaderboardService"]
@@ -0,0 +1,188 @@
+"""PBKDF2 password hashing on a bounded worker pool."""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import hmac
+import secrets
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from fabricat_backend.settings import BackendSettings
+
+_PREFIX = "pbkdf2_"
+_LEGACY_ALGORITHM = "sha256"
+_LEGACY_ITERATIONS = 100_000
+
+
+class HashingBusyError(Exception):
+    """Raised when the hashing queue is full and the request is rejected."""
+
+
+@dataclass(frozen=True, slots=True)
+class PasswordHashParams:
+    """PBKDF2 parameters applied to newly hashed passwords."""
+
+    algorithm: str = "sha256"
+    iterations: int = 100_000
+    salt_bytes: int = 16
+
+    @classmethod
+    def from_settings(cls, settings: BackendSettings) -> PasswordHashParams:
+        """Read the hashing parameters from the backend settings."""
+        return cls(
+            algorithm=settings.auth_hash_algorithm,
+            iterations=settings.auth_hash_iterations,
+        )
+
+
+class PasswordHasher:
+    """Hash and verify passwords, off the event loop when called async.
+
+    Hashes are stored as ``pbkdf2_<algorithm>$<iterations>$<salt>$<digest>``
+    so each one is verified with the parameters it was created with. Older
+    ``<salt>:<digest>`` hashes are read as SHA-256 with 100k iterations.
+
+    ``hashlib`` releases the GIL while deriving keys, so the async methods
+    run on ``max_workers`` threads. At most ``max_pending`` hashes may be
+    queued or running; further calls fail fast with :class:`HashingBusyError`
+    instead of piling up behind a login storm.
+    """
+
+    def __init__(
+        self,
+        *,
+        params: PasswordHashParams | None = None,
+        max_workers: int = 4,
+        max_pending: int = 64,
+    ) -> None:
+        if max_workers < 1:
+            msg = "Password hashing needs at least one worker."
+            raise ValueError(msg)
+        if max_pending < max_workers:
+            msg = "Hashing queue must hold at least one task per worker."
+            raise ValueError(msg)
+
+        self._params = params or PasswordHashParams()
+        self._max_pending = max_pending
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="password-hasher"
+        )
+        self._lock = threading.Lock()
+        self._pending = 0
+
+    @classmethod
+    def from_settings(cls, settings: BackendSettings) -> PasswordHasher:
+        """Build a hasher configured by the backend settings."""
+        return cls(
+            params=PasswordHashParams.from_settings(settings),
+            max_workers=settings.auth_hash_workers,
+            max_pending=settings.auth_hash_max_pending,
+        )
+
+    @property
+    def pending(self) -> int:
+        """Number of hashes queued or running on the worker pool."""
+        return self._pending
+
+    def hash_password(self, password: str) -> str:
+        """Hash ``password`` with the current parameters."""
+        params = self._params
+        salt = secrets.token_bytes(params.salt_bytes)
+        digest = _derive(params.algorithm, password, salt, params.iterations)
+        return "$".join(
+            (
+                f"{_PREFIX}{params.algorithm}",
+                str(params.iterations),
+                base64.b64encode(salt).decode(),
+                base64.b64encode(digest).decode(),
+            )
+        )
+
+    def verify_password(self, password: str, password_hash: str) -> bool:
+        """Check ``password`` against a stored hash in either format."""
+        parsed = _parse(password_hash)
+        if parsed is None:
+            return False
+        algorithm, iterations, salt, expected = parsed
+        try:
+            actual = _derive(algorithm, password, salt, iterations)
+        except ValueError:
+            return False
+        return hmac.compare_digest(actual, expected)
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        """Return whether ``password_hash`` predates the current parameters.
+
+        Legacy hashes always qualify, moving them to the self-describing format.
+        """
+        parsed = _parse(password_hash)
+        if parsed is None or not password_hash.startswith(_PREFIX):
+            return True
+        algorithm, iterations, salt, _ = parsed
+        params = self._params
+        return (
+            algorithm != params.algorithm
+            or iterations < params.iterations
+            or len(salt) < params.salt_bytes
+        )
+
+    async def ahash_password(self, password: str) -> str:
+        """Hash ``password`` on the worker pool."""
+        return await self._submit(self.hash_password, password)
+
+    async def averify_password(self, password: str, password_hash: str) -> bool:
+        """Verify ``password`` on the worker pool."""
+        return await self._submit(self.verify_password, password, password_hash)
+
+    def close(self) -> None:
+        """Stop the worker threads once queued hashes finish."""
+        self._executor.shutdown(wait=True)
+
+    async def _submit[T](self, function: Callable[..., T], *args: str) -> T:
+        with self._lock:
+            if self._pending >= self._max_pending:
+                msg = "Password hashing queue is full."
+                raise HashingBusyError(msg)
+            self._pending += 1
+        future = self._executor.submit(function, *args)
+        # Released when the hash finishes, even if the caller stops waiting.
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def _release(self, _future: Future[Any]) -> None:
+        with self._lock:
+            self._pending -= 1
+
+
+def _derive(algorithm: str, password: str, salt: bytes, iterations: int) -> bytes:
+    return hashlib.pbkdf2_hmac(algorithm, password.encode("utf-8"), salt, iterations)
+
+
+def _parse(password_hash: str) -> tuple[str, int, bytes, bytes] | None:
+    try:
+        if password_hash.startswith(_PREFIX):
+            scheme, iterations, salt_b64, digest_b64 = password_hash.split("$")
+            algorithm = scheme.removeprefix(_PREFIX)
+            rounds = int(iterations)
+        else:
+            salt_b64, digest_b64 = password_hash.split(":", 1)
+            algorithm, rounds = _LEGACY_ALGORITHM, _LEGACY_ITERATIONS
+        return (
+            algorithm,
+            rounds,
+            base64.b64decode(salt_b64),
+            base64.b64decode(digest_b64),
+        )
+    except ValueError:
+        return None
+
+
+__all__ = ["HashingBusyError", "PasswordHashParams", "PasswordHasher"]
@@ -0,0 +1,149 @@
+"""Non-blocking, cached lookups of the profile shown for a player seat."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from fabricat_backend.database import UserRepository
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from fabricat_backend.database.service import DatabaseService
+
+DEFAULT_PROFILE_CACHE_SIZE = 4_096
+DEFAULT_PROFILE_TTL_SECONDS = 300.0
+DEFAULT_PROFILE_LOOKUP_WORKERS = 4
+
+
+@dataclass(frozen=True, slots=True)
+class UserProfile:
+    """Public appearance of a user inside a game session."""
+
+    nickname: str | None = None
+    icon: str | None = None
+
+
+ANONYMOUS_PROFILE = UserProfile()
+
+
+class UserProfileService:
+    """Resolve user profiles off the event loop with a bounded TTL cache.
+
+    Database reads run on a small dedicated thread pool. Concurrent lookups of
+    the same user share one query, and results are kept in an LRU cache of
+    ``max_entries`` users for ``ttl_seconds`` so profile edits become visible
+    without a restart. Failed lookups fall back to an anonymous profile and are
+    not cached.
+    """
+
+    def __init__(
+        self,
+        *,
+        database: DatabaseService,
+        max_entries: int = DEFAULT_PROFILE_CACHE_SIZE,
+        ttl_seconds: float = DEFAULT_PROFILE_TTL_SECONDS,
+        max_workers: int = DEFAULT_PROFILE_LOOKUP_WORKERS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_entries < 1:
+            msg = "Profile cache must hold at least one entry."
+            raise ValueError(msg)
+        if ttl_seconds < 0:
+            msg = "Profile cache TTL must be non-negative."
+            raise ValueError(msg)
+
+        self._database = database
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="profile-lookup"
+        )
+        self._cache: OrderedDict[UUID, tuple[float, UserProfile]] = OrderedDict()
+        self._inflight: dict[UUID, asyncio.Future[UserProfile]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of cached profiles."""
+        return len(self._cache)
+
+    async def get(self, user_identifier: str) -> UserProfile:
+        """Return the profile of ``user_identifier`` without blocking the loop."""
+        try:
+            user_id = UUID(user_identifier)
+        except ValueError:
+            return ANONYMOUS_PROFILE
+
+        cached = self._cache.get(user_id)
+        if cached is not None:
+            expires_at, profile = cached
+            if expires_at > self._clock():
+                self._cache.move_to_end(user_id)
+                return profile
+            del self._cache[user_id]
+
+        pending = self._inflight.get(user_id)
+        if pending is None:
+            loop = asyncio.get_running_loop()
+            pending = loop.run_in_executor(self._executor, self._fetch, user_id)
+            self._inflight[user_id] = pending
+            pending.add_done_callback(lambda future: self._settle(user_id, future))
+        try:
+            return await asyncio.shield(pending)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            return ANONYMOUS_PROFILE
+
+    def invalidate(self, user_identifier: str | None = None) -> None:
+        """Forget the cached profile of one user, or of everyone.
+
+        Lookups already in flight for the user are detached so their result
+        is not cached.
+        """
+        if user_identifier is None:
+            self._cache.clear()
+            self._inflight.clear()
+            return
+        try:
+            user_id = UUID(user_identifier)
+        except ValueError:
+            return
+        self._cache.pop(user_id, None)
+        self._inflight.pop(user_id, None)
+
+    def close(self) -> None:
+        """Stop the lookup threads once pending queries finish."""
+        self._executor.shutdown(wait=False)
+
+    def _fetch(self, user_id: UUID) -> UserProfile:
+        with self._database.session() as session:
+            user = UserRepository(session).get_by_id(user_id)
+            if user is None:
+                return ANONYMOUS_PROFILE
+            return UserProfile(nickname=user.nickname, icon=user.icon)
+
+    def _settle(self, user_id: UUID, future: asyncio.Future[UserProfile]) -> None:
+        failed = future.cancelled() or future.exception() is not None
+        if self._inflight.get(user_id) is not future:
+            return
+        del self._inflight[user_id]
+        if failed:
+            return
+        self._cache[user_id] = (self._clock() + self._ttl_seconds, future.result())
+        self._cache.move_to_end(user_id)
+        while len(self._cache) > self._max_entries:
+            self._cache.popitem(last=False)
+
+
+__all__ = [
+    "ANONYMOUS_PROFILE",
+    "UserProfile",
+    "UserProfileService",
+]
@@ -0,0 +1,456 @@
+"""Compact binary replay logs of game sessions and a headless replay engine.
+
+A log starts with a fixed header followed by framed records, each a one-byte
+tag and a two-byte body length::
+
+    header   magic "FABREPLY", format version, start time (unix seconds)
+    settings zlib-compressed ``GameSettings`` JSON, ``rng_seed`` included
+    roster   id, priority and starting money of every seat
+    action   ms since start, phase, player id, kind, packed payload fields
+    phase    ms since start, phase, month; marks one ``run_phase`` call
+    result   the recorded ``build_final_player_stats`` rows
+
+Because the session is seeded, applying the same actions between the same
+phases reproduces the game exactly, so no phase reports need to be stored.
+"""
+
+from __future__ import annotations
+
+import argparse
+import struct
+import sys
+import time
+import zlib
+from copy import deepcopy
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from pydantic import ValidationError
+
+from fabricat_backend.api.models.session import (
+    ConstructionRequestPayload,
+    LoanDecisionPayload,
+    PhaseActionRequest,
+    ProductionPlanPayload,
+    SubmitBuyBidPayload,
+    SubmitSellBidPayload,
+)
+from fabricat_backend.api.services.actions import apply_phase_action
+from fabricat_backend.game_logic.phases import GamePhase
+from fabricat_backend.game_logic.session import (
+    GameSession,
+    GameSettings,
+    Player,
+    PlayerFinalStats,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Sequence
+
+MAGIC = b"FABREPLY"
+FORMAT_VERSION = 1
+REPLAY_SUFFIX = ".fcreplay"
+
+_HEADER = struct.Struct("<8sBd")
+_FRAME = struct.Struct("<BH")
+_SEAT = struct.Struct("<iBd")
+_ACTION = struct.Struct("<IBiB")
+_BID = struct.Struct("<qd")
+_PLAN = struct.Struct("<HH")
+_LOAN = struct.Struct("<HB")
+_PROJECT = struct.Struct("<B")
+_PHASE = struct.Struct("<IBI")
+_STANDING = struct.Struct("<idI???dIIIII")
+_STANDING_FIELDS = tuple(PlayerFinalStats.model_fields)
+
+_TAG_SETTINGS = 1
+_TAG_ROSTER = 2
+_TAG_ACTION = 3
+_TAG_PHASE = 4
+_TAG_RESULT = 5
+
+_MAX_BODY = 0xFFFF
+_MAX_ELAPSED_MS = 0xFFFFFFFF
+
+_PHASES = tuple(GamePhase)
+_PHASE_CODES = {phase: code for code, phase in enumerate(_PHASES)}
+_KINDS = (
+    "submit_buy_bid",
+    "submit_sell_bid",
+    "production_plan",
+    "loan_decision",
+    "construction_request",
+    "skip",
+)
+_KIND_CODES = {kind: code for code, kind in enumerate(_KINDS)}
+_DECISIONS = ("call", "skip")
+_PROJECTS = ("idle", "build_basic", "build_auto", "upgrade")
+
+
+class ReplayFormatError(ValueError):
+    """Raised when bytes cannot be read as a replay log."""
+
+
+@dataclass(frozen=True, slots=True)
+class ReplayAction:
+    """A phase action accepted from a player."""
+
+    elapsed_ms: int
+    player_id: int
+    request: PhaseActionRequest
+
+
+@dataclass(frozen=True, slots=True)
+class ReplayPhase:
+    """A completed phase of the session."""
+
+    elapsed_ms: int
+    phase: GamePhase
+    month: int
+
+
+type ReplayEvent = ReplayAction | ReplayPhase
+
+
+@dataclass(slots=True)
+class ReplayLog:
+    """Decoded contents of a replay log."""
+
+    settings: GameSettings
+    roster: list[Player]
+    started_at: datetime
+    events: list[ReplayEvent] = field(default_factory=list)
+    final_stats: list[PlayerFinalStats] | None = None
+
+    def to_bytes(self) -> bytes:
+        """Encode the log in the binary replay format."""
+        buffer = _start_log(self.settings, self.roster, self.started_at)
+        for event in self.events:
+            if isinstance(event, ReplayPhase):
+                _append(buffer, _TAG_PHASE, _encode_phase(event))
+            else:
+                _append(buffer, _TAG_ACTION, _encode_action(event))
+        if self.final_stats is not None:
+            _append(buffer, _TAG_RESULT, _encode_result(self.final_stats))
+        return bytes(buffer)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> ReplayLog:
+        """Decode a log, raising :class:`ReplayFormatError` on malformed input."""
+        try:
+            return cls._decode(memoryview(data))
+        except (struct.error, IndexError, ValidationError, zlib.error) as exc:
+            msg = f"Corrupt replay log: {exc}"
+            raise ReplayFormatError(msg) from exc
+
+    @classmethod
+    def read(cls, path: Path) -> ReplayLog:
+        """Decode the log stored at ``path``."""
+        return cls.from_bytes(path.read_bytes())
+
+    @classmethod
+    def _decode(cls, data: memoryview) -> ReplayLog:
+        magic, version, started = _HEADER.unpack_from(data)
+        if magic != MAGIC:
+            msg = "Not a replay log."
+            raise ReplayFormatError(msg)
+        if version != FORMAT_VERSION:
+            msg = f"Unsupported replay format version {version}."
+            raise ReplayFormatError(msg)
+
+        settings: GameSettings | None = None
+        roster: list[Player] | None = None
+        log_events: list[ReplayEvent] = []
+        final_stats: list[PlayerFinalStats] | None = None
+        for tag, body in _frames(data, _HEADER.size):
+            if tag == _TAG_SETTINGS:
+                settings = GameSettings.model_validate_json(zlib.decompress(body))
+            elif tag == _TAG_ROSTER:
+                roster = _decode_roster(body)
+            elif tag == _TAG_ACTION:
+                log_events.append(_decode_action(body))
+            elif tag == _TAG_PHASE:
+                log_events.append(_decode_phase(body))
+            elif tag == _TAG_RESULT:
+                final_stats = _decode_result(body)
+            else:
+                msg = f"Unknown replay record {tag}."
+                raise ReplayFormatError(msg)
+
+        if settings is None or roster is None:
+            msg = "Replay log lacks its settings or roster."
+            raise ReplayFormatError(msg)
+        return cls(
+            settings=settings,
+            roster=roster,
+            started_at=datetime.fromtimestamp(started, tz=UTC),
+            events=log_events,
+            final_stats=final_stats,
+        )
+
+
+class ReplayRecorder:
+    """Encode a live session's replay log as it is played.
+
+    Create the recorder before the :class:`GameSession`, which hands out
+    starting factories and inventories to the players it is given, so the
+    roster captures the seats as the session received them. Records are
+    appended to an in-memory buffer of a few bytes per action and written
+    to ``path`` by :meth:`save`.
+    """
+
+    def __init__(
+        self,
+        players: Sequence[Player],
+        settings: GameSettings,
+        *,
+        path: Path | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._path = path
+        self._clock = clock
+        self._started = clock()
+        self._buffer = _start_log(settings, players, datetime.now(tz=UTC))
+        self._finished = False
+        self._saved = False
+
+    @property
+    def path(self) -> Path | None:
+        """Where :meth:`save` writes the log."""
+        return self._path
+
+    @property
+    def finished(self) -> bool:
+        """Whether the final standings were recorded."""
+        return self._finished
+
+    @property
+    def saved(self) -> bool:
+        """Whether the log was already written to disk."""
+        return self._saved
+
+    def record_action(self, player_id: int, request: PhaseActionRequest) -> None:
+        """Append an action that was applied to ``player_id``."""
+        if not self._finished:
+            event = ReplayAction(self._elapsed_ms(), player_id, request)
+            _append(self._buffer, _TAG_ACTION, _encode_action(event))
+
+    def record_phase(self, phase: GamePhase, month: int) -> None:
+        """Append a phase the session just ran."""
+        if not self._finished:
+            event = ReplayPhase(self._elapsed_ms(), phase, month)
+            _append(self._buffer, _TAG_PHASE, _encode_phase(event))
+
+    def finish(self, final_stats: Iterable[PlayerFinalStats]) -> None:
+        """Append the final standings; later records are ignored."""
+        if not self._finished:
+            _append(self._buffer, _TAG_RESULT, _encode_result(final_stats))
+            self._finished = True
+
+    def getvalue(self) -> bytes:
+        """Return the log encoded so far."""
+        return bytes(self._buffer)
+
+    def save(self) -> Path | None:
+        """Write the log to :attr:`path` once, creating its directory."""
+        if self._path is None or self._saved:
+            return None
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._path.write_bytes(self._buffer)
+        self._saved = True
+        return self._path
+
+    def _elapsed_ms(self) -> int:
+        elapsed = round((self._clock() - self._started) * 1_000)
+        return min(max(elapsed, 0), _MAX_ELAPSED_MS)
+
+
+@dataclass(frozen=True, slots=True)
+class ReplayResult:
+    """Outcome of replaying a log."""
+
+    expected: list[PlayerFinalStats] | None
+    actual: list[PlayerFinalStats]
+    phases: int
+    actions: int
+
+    @property
+    def matches(self) -> bool:
+        """Whether the replay reproduced the recorded final standings."""
+        return self.expected is not None and self.expected == self.actual
+
+
+def replay(log: ReplayLog) -> ReplayResult:
+    """Play ``log`` back headlessly and compare the final standings.
+
+    Actions are applied exactly as the session router applies them, and each
+    recorded phase runs through `GameSession.advance_phase`, which executes
+    the same phase handlers as `run_phase` without building reports.
+    """
+    players = deepcopy(log.roster)
+    session = GameSession(players=players, settings=log.settings)
+    seats = {player.id_: player for player in players}
+    phases = actions = 0
+    for event in log.events:
+        if isinstance(event, ReplayPhase):
+            session.advance_phase(event.phase)
+            phases += 1
+        else:
+            apply_phase_action(seats[event.player_id], event.request)
+            actions += 1
+    return ReplayResult(
+        expected=log.final_stats,
+        actual=session.build_final_player_stats(),
+        phases=phases,
+        actions=actions,
+    )
+
+
+def _start_log(
+    settings: GameSettings, players: Iterable[Player], started_at: datetime
+) -> bytearray:
+    buffer = bytearray(_HEADER.pack(MAGIC, FORMAT_VERSION, started_at.timestamp()))
+    _append(buffer, _TAG_SETTINGS, zlib.compress(settings.model_dump_json().encode()))
+    _append(buffer, _TAG_ROSTER, _encode_roster(players))
+    return buffer
+
+
+def _append(buffer: bytearray, tag: int, body: bytes) -> None:
+    if len(body) > _MAX_BODY:
+        msg = f"Replay record of {len(body)} bytes exceeds the frame limit."
+        raise ValueError(msg)
+    buffer += _FRAME.pack(tag, len(body))
+    buffer += body
+
+
+def _frames(data: memoryview, offset: int) -> Iterator[tuple[int, bytes]]:
+    while offset < len(data):
+        tag, length = _FRAME.unpack_from(data, offset)
+        offset += _FRAME.size
+        body = data[offset : offset + length]
+        if len(body) != length:
+            msg = "Replay log is truncated."
+            raise ReplayFormatError(msg)
+        offset += length
+        yield tag, bytes(body)
+
+
+def _encode_roster(players: Iterable[Player]) -> bytes:
+    return b"".join(_SEAT.pack(p.id_, p.priority, p.money) for p in players)
+
+
+def _decode_roster(body: bytes) -> list[Player]:
+    return [
+        Player(id_=player_id, priority=priority, money=money)
+        for player_id, priority, money in _SEAT.iter_unpack(body)
+    ]
+
+
+def _encode_action(event: ReplayAction) -> bytes:
+    payload = event.request.payload
+    head = _ACTION.pack(
+        event.elapsed_ms,
+        _PHASE_CODES[event.request.phase],
+        event.player_id,
+        _KIND_CODES[payload.kind],
+    )
+    match payload:
+        case SubmitBuyBidPayload() | SubmitSellBidPayload():
+            return head + _BID.pack(payload.quantity, payload.price)
+        case ProductionPlanPayload():
+            return head + _PLAN.pack(payload.basic, payload.auto)
+        case LoanDecisionPayload():
+            return head + _LOAN.pack(payload.slot, _DECISIONS.index(payload.decision))
+        case ConstructionRequestPayload():
+            return head + _PROJECT.pack(_PROJECTS.index(payload.project))
+    return head
+
+
+def _decode_action(body: bytes) -> ReplayAction:
+    elapsed_ms, phase_code, player_id, kind_code = _ACTION.unpack_from(body)
+    offset = _ACTION.size
+    kind = _KINDS[kind_code]
+    payload: dict[str, object] = {"kind": kind}
+    match kind:
+        case "submit_buy_bid" | "submit_sell_bid":
+            quantity, price = _BID.unpack_from(body, offset)
+            payload.update(quantity=quantity, price=price)
+        case "production_plan":
+            basic, auto = _PLAN.unpack_from(body, offset)
+            payload.update(basic=basic, auto=auto)
+        case "loan_decision":
+            slot, decision = _LOAN.unpack_from(body, offset)
+            payload.update(slot=slot, decision=_DECISIONS[decision])
+        case "construction_request":
+            (project,) = _PROJECT.unpack_from(body, offset)
+            payload.update(project=_PROJECTS[project])
+    request = PhaseActionRequest.model_validate(
+        {"type": "phase_action", "phase": _PHASES[phase_code], "payload": payload}
+    )
+    return ReplayAction(elapsed_ms=elapsed_ms, player_id=player_id, request=request)
+
+
+def _encode_phase(event: ReplayPhase) -> bytes:
+    return _PHASE.pack(event.elapsed_ms, _PHASE_CODES[event.phase], event.month)
+
+
+def _decode_phase(body: bytes) -> ReplayPhase:
+    elapsed_ms, phase_code, month = _PHASE.unpack(body)
+    return ReplayPhase(elapsed_ms=elapsed_ms, phase=_PHASES[phase_code], month=month)
+
+
+def _encode_result(final_stats: Iterable[PlayerFinalStats]) -> bytes:
+    return b"".join(
+        _STANDING.pack(*(getattr(stats, name) for name in _STANDING_FIELDS))
+        for stats in final_stats
+    )
+
+
+def _decode_result(body: bytes) -> list[PlayerFinalStats]:
+    return [
+        PlayerFinalStats(**dict(zip(_STANDING_FIELDS, row, strict=True)))
+        for row in _STANDING.iter_unpack(body)
+    ]
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Command-line entry point for checking recorded sessions."""
+    parser = argparse.ArgumentParser(
+        description="Replay recorded Fabricat sessions and check their standings.",
+    )
+    parser.add_argument("logs", nargs="+", type=Path, help="Replay log files.")
+    args = parser.parse_args(argv)
+
+    mismatches = 0
+    for path in args.logs:
+        result = replay(ReplayLog.read(path))
+        if result.expected is None:
+            status = "unfinished"
+        elif result.matches:
+            status = "ok"
+        else:
+            status = "MISMATCH"
+            mismatches += 1
+        sys.stdout.write(
+            f"{path}: {status} ({result.phases} phases, {result.actions} actions)\n"
+        )
+    if mismatches:
+        raise SystemExit(1)
+
+
+__all__ = [
+    "FORMAT_VERSION",
+    "MAGIC",
+    "REPLAY_SUFFIX",
+    "ReplayAction",
+    "ReplayEvent",
+    "ReplayFormatError",
+    "ReplayLog",
+    "ReplayPhase",
+    "ReplayRecorder",
+    "ReplayResult",
+    "main",
+    "replay",
+]
@@ -0,0 +1,329 @@
+"""Session ownership and cross-worker relay for multi-process deployments."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import sqlite3
+import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Protocol, TypeVar, runtime_checkable
+from uuid import uuid4
+
+RelayHandler = Callable[[str], Awaitable[None]]
+_T = TypeVar("_T")
+
+DEFAULT_LEASE_SECONDS = 30.0
+DEFAULT_POLL_INTERVAL_SECONDS = 0.05
+DEFAULT_RELAY_RETENTION_SECONDS = 60.0
+
+
+@runtime_checkable
+class SessionStore(Protocol):
+    """Directory of session owners plus a channel relay between workers.
+
+    Each live session is owned by exactly one worker, which runs its game loop.
+    Other workers forward the sockets of players who connect to them over
+    relay channels instead of hosting a second copy of the game.
+    """
+
+    @property
+    def worker_id(self) -> str:
+        """Identifier of the worker this store instance belongs to."""
+        ...
+
+    async def claim(self, session_code: str) -> str:
+        """Return the owner of ``session_code``, claiming it when unowned."""
+        ...
+
+    async def release(self, session_code: str) -> None:
+        """Drop this worker's ownership of ``session_code``."""
+        ...
+
+    async def publish(self, channel: str, data: str) -> None:
+        """Deliver ``data`` to every subscriber of ``channel``."""
+        ...
+
+    def subscribe(self, channel: str, handler: RelayHandler) -> None:
+        """Invoke ``handler`` for every message published to ``channel``."""
+        ...
+
+    def unsubscribe(self, channel: str, handler: RelayHandler) -> None:
+        """Stop delivering ``channel`` messages to ``handler``."""
+        ...
+
+    async def aclose(self) -> None:
+        """Release owned sessions and background resources."""
+        ...
+
+
+class _Subscriptions:
+    """Channel-to-handler registry shared by the store backends."""
+
+    def __init__(self) -> None:
+        self._handlers: dict[str, list[RelayHandler]] = {}
+
+    def add(self, channel: str, handler: RelayHandler) -> None:
+        handlers = self._handlers.setdefault(channel, [])
+        if handler not in handlers:
+            handlers.append(handler)
+
+    def remove(self, channel: str, handler: RelayHandler) -> None:
+        handlers = self._handlers.get(channel)
+        if handlers is None:
+            return
+        with contextlib.suppress(ValueError):
+            handlers.remove(handler)
+        if not handlers:
+            del self._handlers[channel]
+
+    async def dispatch(self, channel: str, data: str) -> None:
+        for handler in tuple(self._handlers.get(channel, ())):
+            with contextlib.suppress(Exception):
+                await handler(data)
+
+
+class InProcessSessionStore:
+    """Single-worker store: every session is local and relays stay in-process."""
+
+    def __init__(self, *, worker_id: str | None = None) -> None:
+        self._worker_id = worker_id or uuid4().hex
+        self._subscriptions = _Subscriptions()
+
+    @property
+    def worker_id(self) -> str:
+        """Identifier of this worker."""
+        return self._worker_id
+
+    async def claim(self, session_code: str) -> str:
+        """Return this worker, which owns every session."""
+        del session_code
+        return self._worker_id
+
+    async def release(self, session_code: str) -> None:
+        """Nothing to release; ownership is implicit."""
+        del session_code
+
+    async def publish(self, channel: str, data: str) -> None:
+        """Hand ``data`` to the local subscribers of ``channel``."""
+        await self._subscriptions.dispatch(channel, data)
+
+    def subscribe(self, channel: str, handler: RelayHandler) -> None:
+        """Register a local subscriber."""
+        self._subscriptions.add(channel, handler)
+
+    def unsubscribe(self, channel: str, handler: RelayHandler) -> None:
+        """Remove a local subscriber."""
+        self._subscriptions.remove(channel, handler)
+
+    async def aclose(self) -> None:
+        """Nothing to clean up."""
+
+
+class SqliteSessionStore:
+    """Store shared by the workers of one node through a SQLite database file.
+
+    Ownership is a lease that the owner renews while it keeps the session;
+    a lease left behind by a crashed worker expires after ``lease_seconds``
+    and can then be claimed by anyone. Relay messages are rows in an
+    append-only table that every worker polls for the channels it follows.
+    All database work runs in order on one dedicated thread.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        worker_id: str | None = None,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        poll_interval_seconds: float = DEFAULT_POLL_INTERVAL_SECONDS,
+        retention_seconds: float = DEFAULT_RELAY_RETENTION_SECONDS,
+    ) -> None:
+        if lease_seconds <= 0:
+            msg = "Lease duration must be positive."
+            raise ValueError(msg)
+        if poll_interval_seconds <= 0:
+            msg = "Poll interval must be positive."
+            raise ValueError(msg)
+
+        self._worker_id = worker_id or uuid4().hex
+        self._lease_seconds = lease_seconds
+        self._poll_interval = poll_interval_seconds
+        self._retention_seconds = retention_seconds
+        self._connection = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None, timeout=30.0
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="session-store"
+        )
+        self._subscriptions = _Subscriptions()
+        self._owned: set[str] = set()
+        self._poller: asyncio.Task[None] | None = None
+        self._closed = False
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS session_owners (
+                session_code TEXT PRIMARY KEY,
+                worker_id TEXT NOT NULL,
+                expires_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS relay_messages (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                channel TEXT NOT NULL,
+                data TEXT NOT NULL,
+                created_at REAL NOT NULL
+            );
+            """
+        )
+        row = self._connection.execute(
+            "SELECT COALESCE(MAX(id), 0) FROM relay_messages"
+        ).fetchone()
+        self._cursor: int = row[0]
+
+    @property
+    def worker_id(self) -> str:
+        """Identifier of this worker."""
+        return self._worker_id
+
+    async def claim(self, session_code: str) -> str:
+        """Return the owner of ``session_code``, taking over expired leases."""
+        owner = await self._run(self._claim, session_code)
+        if owner == self._worker_id:
+            self._owned.add(session_code)
+            self._ensure_poller()
+        return owner
+
+    async def release(self, session_code: str) -> None:
+        """Drop the lease on ``session_code`` if this worker holds it."""
+        self._owned.discard(session_code)
+        await self._run(
+            self._execute,
+            "DELETE FROM session_owners WHERE session_code = ? AND worker_id = ?",
+            (session_code, self._worker_id),
+        )
+
+    async def publish(self, channel: str, data: str) -> None:
+        """Append ``data`` to the relay table for the workers following it."""
+        await self._run(
+            self._execute,
+            "INSERT INTO relay_messages (channel, data, created_at) VALUES (?, ?, ?)",
+            (channel, data, time.time()),
+        )
+
+    def subscribe(self, channel: str, handler: RelayHandler) -> None:
+        """Follow ``channel`` and start polling if this is the first channel."""
+        self._subscriptions.add(channel, handler)
+        self._ensure_poller()
+
+    def unsubscribe(self, channel: str, handler: RelayHandler) -> None:
+        """Stop following ``channel`` with ``handler``."""
+        self._subscriptions.remove(channel, handler)
+
+    async def aclose(self) -> None:
+        """Stop polling, hand back owned sessions, and close the database."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._poller is not None:
+            self._poller.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._poller
+        for session_code in tuple(self._owned):
+            await self.release(session_code)
+        await self._run(self._connection.close)
+        self._executor.shutdown(wait=False)
+
+    async def _run(self, function: Callable[..., _T], *args: object) -> _T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, function, *args)
+
+    def _execute(self, sql: str, parameters: tuple[object, ...]) -> None:
+        self._connection.execute(sql, parameters)
+
+    def _claim(self, session_code: str) -> str:
+        now = time.time()
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            row = self._connection.execute(
+                "SELECT worker_id, expires_at FROM session_owners "
+                "WHERE session_code = ?",
+                (session_code,),
+            ).fetchone()
+            if row is not None and row[0] != self._worker_id and row[1] > now:
+                owner = row[0]
+            else:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO session_owners "
+                    "(session_code, worker_id, expires_at) VALUES (?, ?, ?)",
+                    (session_code, self._worker_id, now + self._lease_seconds),
+                )
+                owner = self._worker_id
+        except BaseException:
+            self._connection.execute("ROLLBACK")
+            raise
+        self._connection.execute("COMMIT")
+        return owner
+
+    def _renew_leases(self, session_codes: tuple[str, ...]) -> None:
+        expires_at = time.time() + self._lease_seconds
+        self._connection.executemany(
+            "UPDATE session_owners SET expires_at = ? "
+            "WHERE session_code = ? AND worker_id = ?",
+            [(expires_at, code, self._worker_id) for code in session_codes],
+        )
+        self._connection.execute(
+            "DELETE FROM relay_messages WHERE created_at < ?",
+            (time.time() - self._retention_seconds,),
+        )
+
+    def _fetch(self, cursor: int) -> list[tuple[int, str, str]]:
+        return self._connection.execute(
+            "SELECT id, channel, data FROM relay_messages WHERE id > ? ORDER BY id",
+            (cursor,),
+        ).fetchall()
+
+    def _ensure_poller(self) -> None:
+        if self._poller is None and not self._closed:
+            self._poller = asyncio.create_task(self._poll_loop())
+
+    async def _poll_loop(self) -> None:
+        """Deliver new relay rows and renew leases until the store closes."""
+        loop = asyncio.get_running_loop()
+        renew_every = self._lease_seconds / 3
+        next_renewal = loop.time() + renew_every
+        while not self._closed:
+            rows = await self._run(self._fetch, self._cursor)
+            for message_id, channel, data in rows:
+                self._cursor = message_id
+                await self._subscriptions.dispatch(channel, data)
+            if loop.time() >= next_renewal:
+                next_renewal = loop.time() + renew_every
+                await self._run(self._renew_leases, tuple(self._owned))
+            await asyncio.sleep(self._poll_interval)
+
+
+def create_session_store(url: str, *, worker_id: str | None = None) -> SessionStore:
+    """Build the store selected by ``url``.
+
+    ``memory://`` keeps every session in the current process; ``sqlite:///path``
+    shares sessions between the workers that point at the same database file.
+    """
+    if url == "memory://":
+        return InProcessSessionStore(worker_id=worker_id)
+    prefix = "sqlite:///"
+    if url.startswith(prefix) and len(url) > len(prefix):
+        return SqliteSessionStore(url.removeprefix(prefix), worker_id=worker_id)
+    msg = f"Unsupported session store URL: {url}"
+    raise ValueError(msg)
+
+
+__all__ = [
+    "InProcessSessionStore",
+    "RelayHandler",
+    "SessionStore",
+    "SqliteSessionStore",
+    "create_session_store",
+]
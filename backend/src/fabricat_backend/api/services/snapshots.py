@@ -0,0 +1,196 @@
+"""Versioned snapshots of live sessions, persisted to survive restarts."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import re
+import struct
+import tempfile
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
+
+from pydantic import BaseModel, ValidationError
+
+from fabricat_backend.game_logic.session import GameSessionSnapshot, GameSettings
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+SNAPSHOT_MAGIC = b"FABSNAP\x00"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_SUFFIX = ".fcsnap"
+DEFAULT_SNAPSHOT_MAX_AGE_SECONDS = 600.0
+
+_HEADER = struct.Struct("<8sH")
+_PLAIN_CODE = re.compile(r"[A-Za-z0-9_-]{1,64}")
+
+
+class SnapshotFormatError(ValueError):
+    """Raised when bytes cannot be read as a session snapshot."""
+
+
+class SessionSnapshot(BaseModel):
+    """Everything needed to resume a started session after a restart.
+
+    ``phase_index`` indexes ``PHASE_SEQUENCE``; ``remaining_seconds`` is left
+    of that phase's countdown, or ``None`` when it has not started yet.
+    ``assignments`` maps user identifiers to the ids of their players.
+    """
+
+    version: Literal[1] = SNAPSHOT_VERSION
+    session_code: str
+    taken_at: datetime
+    settings: GameSettings
+    game: GameSessionSnapshot
+    phase_index: int
+    remaining_seconds: int | None
+    assignments: dict[str, int]
+
+
+def encode_snapshot(document: bytes) -> bytes:
+    """Frame the JSON of a :class:`SessionSnapshot` with a versioned header."""
+    return _HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION) + zlib.compress(
+        document, level=1
+    )
+
+
+def decode_snapshot(data: bytes) -> SessionSnapshot:
+    """Parse bytes written by :func:`encode_snapshot`."""
+    try:
+        magic, version = _HEADER.unpack_from(data)
+    except struct.error as exc:
+        msg = "Snapshot is truncated."
+        raise SnapshotFormatError(msg) from exc
+    if magic != SNAPSHOT_MAGIC:
+        msg = "Not a session snapshot."
+        raise SnapshotFormatError(msg)
+    if version != SNAPSHOT_VERSION:
+        msg = f"Unsupported snapshot version {version}."
+        raise SnapshotFormatError(msg)
+    try:
+        return SessionSnapshot.model_validate_json(
+            zlib.decompress(data[_HEADER.size :])
+        )
+    except (zlib.error, ValidationError) as exc:
+        msg = f"Corrupt session snapshot: {exc}"
+        raise SnapshotFormatError(msg) from exc
+
+
+class SnapshotStore:
+    """Directory holding the latest snapshot of each live session.
+
+    Files are replaced atomically, so a crash mid-write leaves the previous
+    snapshot intact. All file work runs in order on one dedicated thread,
+    which keeps the event loop free and a late write from overtaking a
+    newer one. Snapshots older than ``max_age_seconds`` are not restored.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        max_age_seconds: float = DEFAULT_SNAPSHOT_MAX_AGE_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if max_age_seconds <= 0:
+            msg = "Snapshot max age must be positive."
+            raise ValueError(msg)
+
+        self._directory = directory
+        self._max_age_seconds = max_age_seconds
+        self._clock = clock
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="session-snapshots"
+        )
+
+    @property
+    def directory(self) -> Path:
+        """Directory the snapshots are written to."""
+        return self._directory
+
+    @property
+    def max_age_seconds(self) -> float:
+        """How long a snapshot stays eligible for restoring."""
+        return self._max_age_seconds
+
+    def path_for(self, session_code: str) -> Path:
+        """Return the file holding the snapshot of ``session_code``."""
+        name = session_code
+        if _PLAIN_CODE.fullmatch(session_code) is None:
+            name = hashlib.sha256(session_code.encode("utf-8")).hexdigest()[:32]
+        return self._directory / f"{name}{SNAPSHOT_SUFFIX}"
+
+    def save(self, session_code: str, document: bytes) -> Path:
+        """Atomically replace the snapshot of ``session_code``."""
+        self._directory.mkdir(parents=True, exist_ok=True)
+        path = self.path_for(session_code)
+        descriptor, temporary = tempfile.mkstemp(
+            prefix=f".{path.stem}-", dir=self._directory
+        )
+        try:
+            with os.fdopen(descriptor, "wb") as handle:
+                handle.write(encode_snapshot(document))
+            Path(temporary).replace(path)
+        except BaseException:
+            Path(temporary).unlink(missing_ok=True)
+            raise
+        return path
+
+    def delete(self, session_code: str) -> None:
+        """Forget the snapshot of ``session_code``."""
+        self.path_for(session_code).unlink(missing_ok=True)
+
+    def load_all(self) -> list[SessionSnapshot]:
+        """Return restorable snapshots, discarding expired or unreadable ones."""
+        if not self._directory.is_dir():
+            return []
+        oldest = self._clock() - self._max_age_seconds
+        snapshots: list[SessionSnapshot] = []
+        for path in sorted(self._directory.glob(f"*{SNAPSHOT_SUFFIX}")):
+            try:
+                if path.stat().st_mtime < oldest:
+                    path.unlink(missing_ok=True)
+                    continue
+                snapshots.append(decode_snapshot(path.read_bytes()))
+            except SnapshotFormatError:
+                path.unlink(missing_ok=True)
+            except OSError:
+                continue
+        return snapshots
+
+    async def asave(self, session_code: str, document: bytes) -> Path:
+        """Write a snapshot on the store's thread."""
+        return await self._run(self.save, session_code, document)
+
+    async def adelete(self, session_code: str) -> None:
+        """Delete a snapshot on the store's thread."""
+        await self._run(self.delete, session_code)
+
+    async def aload_all(self) -> list[SessionSnapshot]:
+        """Read the restorable snapshots on the store's thread."""
+        return await self._run(self.load_all)
+
+    def close(self) -> None:
+        """Wait for pending writes and stop the worker thread."""
+        self._executor.shutdown(wait=True)
+
+    async def _run[T](self, function: Callable[..., T], *args: object) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, function, *args)
+
+
+__all__ = [
+    "SNAPSHOT_SUFFIX",
+    "SNAPSHOT_VERSION",
+    "SessionSnapshot",
+    "SnapshotFormatError",
+    "SnapshotStore",
+    "decode_snapshot",
+    "encode_snapshot",
+]
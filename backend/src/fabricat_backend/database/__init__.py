@@ -1,30 +1,65 @@
 """Database connectivity helpers and configuration objects."""
 
 from fabricat_backend.database.base import BaseSchema
-from fabricat_backend.database.dependencies import get_database, get_session
+from fabricat_backend.database.dependencies import (
+    get_async_database,
+    get_async_session,
+    get_database,
+    get_session,
+)
 from fabricat_backend.database.repositories import (
+    AsyncGameHistoryRepository,
+    AsyncUserRepository,
+    AsyncUserStatsSummaryRepository,
     GameHistoryRepository,
+    LeaderboardRepository,
+    LeaderboardRow,
     PlayerStatsRecord,
+    SessionHistoryRecord,
     UserRepository,
+    UserStatsSummaryRepository,
 )
 from fabricat_backend.database.schemas import (
     GamePlayerStatsSchema,
     GameSessionSchema,
+    LeaderboardDailySchema,
     UserSchema,
+    UserStatsSummarySchema,
+)
+from fabricat_backend.database.service import (
+    AsyncDatabaseService,
+    DatabasePoolConfig,
+    DatabaseService,
+    PoolMetrics,
+    PoolMetricsSnapshot,
 )
-from fabricat_backend.database.service import DatabaseService
 from fabricat_backend.settings import BackendSettings, get_settings
 
 __all__ = [
+    "AsyncDatabaseService",
+    "AsyncGameHistoryRepository",
+    "AsyncUserRepository",
+    "AsyncUserStatsSummaryRepository",
     "BackendSettings",
     "BaseSchema",
+    "DatabasePoolConfig",
     "DatabaseService",
     "GameHistoryRepository",
     "GamePlayerStatsSchema",
     "GameSessionSchema",
+    "LeaderboardDailySchema",
+    "LeaderboardRepository",
+    "LeaderboardRow",
     "PlayerStatsRecord",
+    "PoolMetrics",
+    "PoolMetricsSnapshot",
+    "SessionHistoryRecord",
     "UserRepository",
     "UserSchema",
+    "UserStatsSummaryRepository",
+    "UserStatsSummarySchema",
+    "get_async_database",
+    "get_async_session",
     "get_database",
     "get_session",
     "get_settings",
@@ -1,27 +1,36 @@
 """FastAPI dependencies for database access."""
 
-from collections.abc import Iterator
+from collections.abc import AsyncIterator, Iterator
 from functools import cache
 from typing import Annotated
 
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from fabricat_backend.database.service import DatabaseService
+from fabricat_backend.database.service import (
+    AsyncDatabaseService,
+    DatabasePoolConfig,
+    DatabaseService,
+)
 from fabricat_backend.settings import BackendSettings, get_settings
 
 SettingsDep = Annotated[BackendSettings, Depends(get_settings)]
 
 
 @cache
-def _build_database_service(database_url: str) -> DatabaseService:
+def _build_database_service(
+    database_url: str, pool: DatabasePoolConfig
+) -> DatabaseService:
     """Create a cached :class:`DatabaseService` for the given connection string."""
-    return DatabaseService(database_url)
+    return DatabaseService(database_url, pool=pool)
 
 
 def get_database(settings: SettingsDep) -> DatabaseService:
-    """Return the cached database service instance."""
-    return _build_database_service(settings.database_url)
+    """Return the process-wide database service and its connection pool."""
+    return _build_database_service(
+        settings.database_url, DatabasePoolConfig.from_settings(settings)
+    )
 
 
 def get_session(
@@ -30,3 +39,26 @@ def get_session(
     """Yield a SQLAlchemy session managed by :class:`DatabaseService`."""
     with db.session() as session:
         yield session
+
+
+@cache
+def _build_async_database_service(
+    database_url: str, pool: DatabasePoolConfig
+) -> AsyncDatabaseService:
+    """Create a cached :class:`AsyncDatabaseService` for the connection string."""
+    return AsyncDatabaseService(database_url, pool=pool)
+
+
+def get_async_database(settings: SettingsDep) -> AsyncDatabaseService:
+    """Return the process-wide async database service and its connection pool."""
+    return _build_async_database_service(
+        settings.database_url, DatabasePoolConfig.from_settings(settings)
+    )
+
+
+async def get_async_session(
+    db: Annotated[AsyncDatabaseService, Depends(get_async_database)],
+) -> AsyncIterator[AsyncSession]:
+    """Yield an async session managed by :class:`AsyncDatabaseService`."""
+    async with db.session() as session:
+        yield session
@@ -0,0 +1,53 @@
+"""Command that recomputes user aggregates from raw game history."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import TYPE_CHECKING
+
+from fabricat_backend.database.repositories import (
+    LeaderboardRepository,
+    UserStatsSummaryRepository,
+)
+from fabricat_backend.database.service import DatabaseService
+from fabricat_backend.settings import get_settings
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+def rebuild_user_stats(database: DatabaseService) -> tuple[int, int]:
+    """Replace career summaries and leaderboard totals in one transaction.
+
+    Returns the number of summary rows and of daily leaderboard rows.
+    """
+    with database.session() as session:
+        summaries = UserStatsSummaryRepository(session).rebuild()
+        daily = LeaderboardRepository(session).rebuild()
+    return summaries, daily
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Command-line entry point for rebuilding user stats summaries."""
+    parser = argparse.ArgumentParser(
+        description=(
+            "Recompute user_stats_summary and leaderboard_daily from game_player_stats."
+        ),
+    )
+    parser.add_argument(
+        "--database-url",
+        default=None,
+        help="Database to rebuild (default: DATABASE_URL from the settings).",
+    )
+    args = parser.parse_args(argv)
+
+    url = args.database_url or get_settings().database_url
+    summaries, daily = rebuild_user_stats(DatabaseService(url))
+    sys.stdout.write(
+        f"Rebuilt career stats for {summaries} users "
+        f"and {daily} daily leaderboard rows.\n"
+    )
+
+
+__all__ = ["main", "rebuild_user_stats"]
@@ -1,13 +1,33 @@
 """Repository layer for persistence operations."""
 
 from fabricat_backend.database.repositories.game_history import (
+    AsyncGameHistoryRepository,
     GameHistoryRepository,
     PlayerStatsRecord,
+    SessionHistoryRecord,
+)
+from fabricat_backend.database.repositories.leaderboard import (
+    LeaderboardRepository,
+    LeaderboardRow,
+)
+from fabricat_backend.database.repositories.user import (
+    AsyncUserRepository,
+    UserRepository,
+)
+from fabricat_backend.database.repositories.user_stats import (
+    AsyncUserStatsSummaryRepository,
+    UserStatsSummaryRepository,
 )
-from fabricat_backend.database.repositories.user import UserRepository
 
 __all__ = [
+    "AsyncGameHistoryRepository",
+    "AsyncUserRepository",
+    "AsyncUserStatsSummaryRepository",
     "GameHistoryRepository",
+    "LeaderboardRepository",
+    "LeaderboardRow",
     "PlayerStatsRecord",
+    "SessionHistoryRecord",
     "UserRepository",
+    "UserStatsSummaryRepository",
 ]
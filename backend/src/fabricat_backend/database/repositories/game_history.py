@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from datetime import UTC, datetime
-from typing import Sequence
-from uuid import UUID
+from typing import Any, Sequence
+from uuid import UUID, uuid4
 
-from sqlalchemy import select
+from sqlalchemy import Select, insert, literal, select, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from fabricat_backend.database.repositories.leaderboard import LeaderboardRepository
+from fabricat_backend.database.repositories.user_stats import (
+    UserStatsSummaryRepository,
+)
 from fabricat_backend.database.schemas import GamePlayerStatsSchema, GameSessionSchema
 
 
@@ -32,6 +38,23 @@ class PlayerStatsRecord:
     factories_upgrades: int
 
 
+@dataclass(slots=True)
+class SessionHistoryRecord:
+    """Finished session together with the final state of every player.
+
+    A ``session_id`` chosen by the caller makes recording idempotent: a
+    session whose id is already stored is skipped.
+    """
+
+    session_code: str
+    player_stats: Sequence[PlayerStatsRecord]
+    finished_at: datetime | None = None
+    session_id: UUID | None = None
+
+
+_STATS_COLUMNS = tuple(field.name for field in fields(PlayerStatsRecord))
+
+
 class GameHistoryRepository:
     """Persist game completion metadata."""
 
@@ -45,7 +68,11 @@ class GameHistoryRepository:
         player_stats: Sequence[PlayerStatsRecord],
         finished_at: datetime | None = None,
     ) -> GameSessionSchema:
-        """Create a session record with attached player stats."""
+        """Create a session record with attached player stats.
+
+        The career summaries and leaderboard totals of the participating users
+        are updated in the same transaction.
+        """
         finished = finished_at or datetime.now(tz=UTC)
         session_row = GameSessionSchema(
             session_code=session_code,
@@ -75,8 +102,118 @@ class GameHistoryRepository:
         ]
         self._session.add_all(stats_rows)
         self._session.flush()
+        self._apply_aggregates([(finished, stat) for stat in player_stats])
         return session_row
 
+    def record_sessions(
+        self,
+        records: Sequence[SessionHistoryRecord],
+        *,
+        use_copy: bool = False,
+    ) -> list[UUID]:
+        """Insert many finished sessions at once and return their ids.
+
+        Identifiers are generated client-side so all sessions and all stats rows
+        are written with one executemany ``INSERT`` per table, which the driver
+        sends as multi-row batches, without the unit of work or a flush per
+        session. With ``use_copy`` the rows are streamed through ``COPY`` when
+        the session is bound to PostgreSQL; other dialects ignore the flag.
+        User career summaries and leaderboard totals are updated alongside; the
+        caller owns the transaction. Records whose ``session_id`` is already
+        stored are skipped, aggregates included, so a retried batch is not
+        counted twice. The ids of all records are returned.
+        """
+        now = datetime.now(tz=UTC)
+        session_ids = [record.session_id or uuid4() for record in records]
+        seen = self._existing_session_ids(
+            [record.session_id for record in records if record.session_id]
+        )
+        new_records: list[SessionHistoryRecord] = []
+        session_rows: list[dict[str, Any]] = []
+        stats_rows: list[dict[str, Any]] = []
+        for session_id, record in zip(session_ids, records, strict=True):
+            if session_id in seen:
+                continue
+            seen.add(session_id)
+            new_records.append(record)
+            session_rows.append(
+                {
+                    "id": session_id,
+                    "session_code": record.session_code,
+                    "finished_at": record.finished_at or now,
+                }
+            )
+            stats_rows.extend(
+                {
+                    "id": uuid4(),
+                    "session_id": session_id,
+                    **{column: getattr(stat, column) for column in _STATS_COLUMNS},
+                }
+                for stat in record.player_stats
+            )
+
+        if use_copy and self._session.get_bind().dialect.name == "postgresql":
+            self._copy_rows(GameSessionSchema, session_rows)
+            self._copy_rows(GamePlayerStatsSchema, stats_rows)
+        else:
+            self._insert_rows(GameSessionSchema, session_rows)
+            self._insert_rows(GamePlayerStatsSchema, stats_rows)
+        self._apply_aggregates(
+            [
+                (session_row["finished_at"], stat)
+                for session_row, record in zip(session_rows, new_records, strict=True)
+                for stat in record.player_stats
+            ]
+        )
+        return session_ids
+
+    def _existing_session_ids(self, session_ids: list[UUID]) -> set[UUID]:
+        if not session_ids:
+            return set()
+        stmt = select(GameSessionSchema.id).where(GameSessionSchema.id.in_(session_ids))
+        return set(self._session.scalars(stmt))
+
+    def _apply_aggregates(
+        self, results: list[tuple[datetime, PlayerStatsRecord]]
+    ) -> None:
+        UserStatsSummaryRepository(self._session).apply(results)
+        LeaderboardRepository(self._session).apply(results)
+
+    def _insert_rows(
+        self,
+        schema: type[GameSessionSchema | GamePlayerStatsSchema],
+        rows: list[dict[str, Any]],
+    ) -> None:
+        if not rows:
+            return
+        dialect = self._session.get_bind().dialect.name
+        if dialect in {"postgresql", "sqlite"}:
+            dialect_insert = (
+                postgresql.insert if dialect == "postgresql" else sqlite.insert
+            )
+            stmt = dialect_insert(schema).on_conflict_do_nothing(index_elements=["id"])
+            self._session.execute(stmt, rows)
+        else:
+            self._session.execute(insert(schema), rows)
+
+    def _copy_rows(
+        self,
+        schema: type[GameSessionSchema | GamePlayerStatsSchema],
+        rows: list[dict[str, Any]],
+    ) -> None:
+        connection = self._session.connection().connection.driver_connection
+        if connection is None:
+            # An invalidated connection has no driver handle to COPY through.
+            self._insert_rows(schema, rows)
+            return
+        if not rows:
+            return
+        columns = list(rows[0])
+        statement = f"COPY {schema.__tablename__} ({', '.join(columns)}) FROM STDIN"
+        with connection.cursor() as cursor, cursor.copy(statement) as copy:
+            for row in rows:
+                copy.write_row([row[column] for column in columns])
+
     def get_player_stats_for_session(
         self,
         *,
@@ -84,39 +221,96 @@ class GameHistoryRepository:
         session_code: str,
     ) -> tuple[GameSessionSchema, GamePlayerStatsSchema] | None:
         """Return the stats row for a user's participation in a session."""
-        stmt = (
-            select(GameSessionSchema, GamePlayerStatsSchema)
-            .join(
-                GamePlayerStatsSchema,
-                GamePlayerStatsSchema.session_id == GameSessionSchema.id,
-            )
-            .where(GamePlayerStatsSchema.user_id == user_id)
-            .where(GameSessionSchema.session_code == session_code)
-        )
-        result = self._session.execute(stmt).first()
-        if result is None:
-            return None
-        return result
+        stmt = _player_stats_for_session_query(user_id, session_code)
+        return self._session.execute(stmt).tuples().first()
 
     def get_recent_player_stats(
         self,
         *,
         user_id: UUID,
         limit: int,
+        before: tuple[datetime, UUID] | None = None,
     ) -> list[tuple[GameSessionSchema, GamePlayerStatsSchema]]:
-        """Return the most recent session stats for the user."""
-        stmt = (
-            select(GameSessionSchema, GamePlayerStatsSchema)
-            .join(
-                GamePlayerStatsSchema,
-                GamePlayerStatsSchema.session_id == GameSessionSchema.id,
-            )
-            .where(GamePlayerStatsSchema.user_id == user_id)
-            .order_by(GameSessionSchema.finished_at.desc())
-            .limit(limit)
+        """Return the most recent session stats for the user.
+
+        Rows are ordered by ``(finished_at, session id)`` descending. Passing the
+        key of the last row of a page as ``before`` returns the next page with a
+        keyset seek instead of an offset scan.
+        """
+        stmt = _recent_player_stats_query(user_id, limit, before)
+        return list(self._session.execute(stmt).tuples().all())
+
+
+class AsyncGameHistoryRepository:
+    """Read game history through an :class:`AsyncSession`.
+
+    Mirrors the queries of :class:`GameHistoryRepository` for ``async def``
+    endpoints. Recording games stays on the synchronous repository.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get_player_stats_for_session(
+        self,
+        *,
+        user_id: UUID,
+        session_code: str,
+    ) -> tuple[GameSessionSchema, GamePlayerStatsSchema] | None:
+        """Return the stats row for a user's participation in a session."""
+        stmt = _player_stats_for_session_query(user_id, session_code)
+        result = await self._session.execute(stmt)
+        return result.tuples().first()
+
+    async def get_recent_player_stats(
+        self,
+        *,
+        user_id: UUID,
+        limit: int,
+        before: tuple[datetime, UUID] | None = None,
+    ) -> list[tuple[GameSessionSchema, GamePlayerStatsSchema]]:
+        """Return the most recent session stats for the user, newest first."""
+        stmt = _recent_player_stats_query(user_id, limit, before)
+        result = await self._session.execute(stmt)
+        return list(result.tuples().all())
+
+
+def _player_stats_for_session_query(user_id: UUID, session_code: str) -> Select:
+    return (
+        select(GameSessionSchema, GamePlayerStatsSchema)
+        .join(
+            GamePlayerStatsSchema,
+            GamePlayerStatsSchema.session_id == GameSessionSchema.id,
+        )
+        .where(GamePlayerStatsSchema.user_id == user_id)
+        .where(GameSessionSchema.session_code == session_code)
+    )
+
+
+def _recent_player_stats_query(
+    user_id: UUID, limit: int, before: tuple[datetime, UUID] | None
+) -> Select:
+    stmt = (
+        select(GameSessionSchema, GamePlayerStatsSchema)
+        .join(
+            GamePlayerStatsSchema,
+            GamePlayerStatsSchema.session_id == GameSessionSchema.id,
+        )
+        .where(GamePlayerStatsSchema.user_id == user_id)
+        .order_by(GameSessionSchema.finished_at.desc(), GameSessionSchema.id.desc())
+        .limit(limit)
+    )
+    if before is not None:
+        stmt = stmt.where(
+            tuple_(GameSessionSchema.finished_at, GameSessionSchema.id)
+            < tuple_(literal(before[0]), literal(before[1]))
         )
-        result = self._session.execute(stmt).all()
-        return list(result)
+    return stmt
 
 
-__all__ = ["GameHistoryRepository", "PlayerStatsRecord"]
+__all__ = [
+    "AsyncGameHistoryRepository",
+    "GameHistoryRepository",
+    "PlayerStatsRecord",
+    "SessionHistoryRecord",
+]
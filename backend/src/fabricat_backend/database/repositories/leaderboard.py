@@ -0,0 +1,237 @@
+"""Repository maintaining and querying leaderboard rankings."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import (
+    Date,
+    Float,
+    case,
+    cast,
+    delete,
+    func,
+    insert,
+    literal_column,
+    select,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+
+from fabricat_backend.database.schemas import (
+    GamePlayerStatsSchema,
+    GameSessionSchema,
+    LeaderboardDailySchema,
+    UserSchema,
+    UserStatsSummarySchema,
+)
+from fabricat_backend.shared import LeaderboardMetric, LeaderboardWindow
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from uuid import UUID
+
+    from sqlalchemy.orm import Session
+
+    from fabricat_backend.database.repositories.game_history import (
+        PlayerStatsRecord,
+    )
+
+
+@dataclass(slots=True)
+class LeaderboardRow:
+    """A ranked user together with the totals the ranking is based on."""
+
+    user_id: UUID
+    nickname: str | None
+    icon: str | None
+    games_played: int
+    wins: int
+    average_place: float
+
+
+class LeaderboardRepository:
+    """Rank users from pre-aggregated tables instead of raw game history.
+
+    All-time rankings read :class:`UserStatsSummarySchema`. Rolling windows
+    sum the per-day rows of :class:`LeaderboardDailySchema`, which are
+    incremented in the transaction that records the games, so a ranking never
+    scans ``game_player_stats``.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def apply(self, results: Iterable[tuple[datetime, PlayerStatsRecord]]) -> None:
+        """Add finished-game results to the daily totals of their users."""
+        deltas: dict[tuple[date, UUID], list[int]] = {}
+        for finished_at, stat in results:
+            if stat.user_id is None:
+                continue
+            key = (_utc_day(finished_at), stat.user_id)
+            delta = deltas.setdefault(key, [0, 0, 0])
+            delta[0] += 1
+            delta[1] += int(stat.is_top1)
+            delta[2] += stat.place
+        if not deltas:
+            return
+
+        rows = [
+            {
+                "day": day,
+                "user_id": user_id,
+                "games_played": games,
+                "wins": wins,
+                "total_place": total_place,
+            }
+            for (day, user_id), (games, wins, total_place) in deltas.items()
+        ]
+        dialect = self._session.get_bind().dialect.name
+        if dialect in {"postgresql", "sqlite"}:
+            self._upsert(dialect, rows)
+        else:
+            self._merge(rows)
+
+    def ranking(  # noqa: PLR0913
+        self,
+        *,
+        metric: LeaderboardMetric,
+        window: LeaderboardWindow,
+        limit: int,
+        offset: int = 0,
+        min_games: int = 1,
+        today: date | None = None,
+    ) -> list[LeaderboardRow]:
+        """Return one page of the ranking of users by ``metric``.
+
+        Only users with at least ``min_games`` games inside ``window`` are
+        ranked. Ties are broken by games played, then by user id, so pages
+        are stable.
+        """
+        days = window.days
+        if days is None:
+            summary = UserStatsSummarySchema
+            source = select(
+                summary.user_id.label("user_id"),
+                summary.games_played.label("games_played"),
+                summary.wins.label("wins"),
+                summary.total_place.label("total_place"),
+            ).subquery()
+        else:
+            daily = LeaderboardDailySchema
+            since = (today or datetime.now(tz=UTC).date()) - timedelta(days=days - 1)
+            source = (
+                select(
+                    daily.user_id.label("user_id"),
+                    func.sum(daily.games_played).label("games_played"),
+                    func.sum(daily.wins).label("wins"),
+                    func.sum(daily.total_place).label("total_place"),
+                )
+                .where(daily.day >= since)
+                .group_by(daily.user_id)
+                .subquery()
+            )
+
+        columns = source.c
+        average_place = (cast(columns.total_place, Float) / columns.games_played).label(
+            "average_place"
+        )
+        if metric is LeaderboardMetric.WINS:
+            order = (columns.wins.desc(), columns.games_played.asc())
+        else:
+            order = (average_place.asc(), columns.games_played.desc())
+        stmt = (
+            select(
+                columns.user_id,
+                UserSchema.nickname,
+                UserSchema.icon,
+                columns.games_played,
+                columns.wins,
+                average_place,
+            )
+            .outerjoin(UserSchema, UserSchema.id == columns.user_id)
+            .where(columns.games_played >= min_games)
+            .order_by(*order, columns.user_id)
+            .offset(offset)
+            .limit(limit)
+        )
+        return [
+            LeaderboardRow(
+                user_id=row.user_id,
+                nickname=row.nickname,
+                icon=row.icon,
+                games_played=row.games_played,
+                wins=row.wins,
+                average_place=row.average_place,
+            )
+            for row in self._session.execute(stmt)
+        ]
+
+    def rebuild(self) -> int:
+        """Recompute every daily total from raw history and return the row count."""
+        stats = GamePlayerStatsSchema
+        finished_at = GameSessionSchema.finished_at
+        if self._session.get_bind().dialect.name == "postgresql":
+            # Inlined so the GROUP BY expression matches the selected one.
+            day = cast(func.timezone(literal_column("'UTC'"), finished_at), Date)
+        else:
+            day = func.date(finished_at)
+        aggregates = (
+            select(
+                day,
+                stats.user_id,
+                func.count(),
+                func.sum(case((stats.is_top1, 1), else_=0)),
+                func.sum(stats.place),
+            )
+            .join(GameSessionSchema, GameSessionSchema.id == stats.session_id)
+            .where(stats.user_id.is_not(None))
+            .group_by(day, stats.user_id)
+        )
+        self._session.execute(delete(LeaderboardDailySchema))
+        self._session.execute(
+            insert(LeaderboardDailySchema).from_select(
+                ["day", "user_id", "games_played", "wins", "total_place"], aggregates
+            )
+        )
+        count = select(func.count()).select_from(LeaderboardDailySchema)
+        return self._session.scalar(count) or 0
+
+    def _upsert(self, dialect: str, rows: list[dict[str, Any]]) -> None:
+        dialect_insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        stmt = dialect_insert(LeaderboardDailySchema)
+        current, new = LeaderboardDailySchema, stmt.excluded
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[current.day, current.user_id],
+            set_={
+                "games_played": current.games_played + new.games_played,
+                "wins": current.wins + new.wins,
+                "total_place": current.total_place + new.total_place,
+            },
+        )
+        self._session.execute(stmt, rows)
+
+    def _merge(self, rows: list[dict[str, Any]]) -> None:
+        for row in rows:
+            totals = self._session.get(
+                LeaderboardDailySchema,
+                (row["day"], row["user_id"]),
+                with_for_update=True,
+            )
+            if totals is None:
+                self._session.add(LeaderboardDailySchema(**row))
+                continue
+            totals.games_played += row["games_played"]
+            totals.wins += row["wins"]
+            totals.total_place += row["total_place"]
+        self._session.flush()
+
+
+def _utc_day(moment: datetime) -> date:
+    if moment.tzinfo is None:
+        return moment.date()
+    return moment.astimezone(UTC).date()
+
+
+__all__ = ["LeaderboardRepository", "LeaderboardRow"]
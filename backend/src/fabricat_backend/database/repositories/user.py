@@ -2,7 +2,8 @@
 
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from fabricat_backend.database.schemas import UserSchema
@@ -20,8 +21,7 @@ class UserRepository:
 
     def get_by_nickname(self, nickname: str) -> UserSchema | None:
         """Return user entity by user's nickname."""
-        stmt = select(UserSchema).where(UserSchema.nickname == nickname)
-        return self._session.scalar(stmt)
+        return self._session.scalar(_by_nickname(nickname))
 
     def add(self, user: UserSchema) -> UserSchema:
         """Add new user to database."""
@@ -29,3 +29,29 @@ class UserRepository:
         self._session.flush()
         self._session.refresh(user)
         return user
+
+
+class AsyncUserRepository:
+    """Async counterpart of :class:`UserRepository`."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get_by_id(self, user_id: UUID) -> UserSchema | None:
+        """Return user entity by user's ID."""
+        return await self._session.get(UserSchema, user_id)
+
+    async def get_by_nickname(self, nickname: str) -> UserSchema | None:
+        """Return user entity by user's nickname."""
+        return await self._session.scalar(_by_nickname(nickname))
+
+    async def add(self, user: UserSchema) -> UserSchema:
+        """Add new user to database."""
+        self._session.add(user)
+        await self._session.flush()
+        await self._session.refresh(user)
+        return user
+
+
+def _by_nickname(nickname: str) -> Select[tuple[UserSchema]]:
+    return select(UserSchema).where(UserSchema.nickname == nickname)
@@ -0,0 +1,208 @@
+"""Repository maintaining the per-user career stats summary."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import case, delete, func, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+
+from fabricat_backend.database.schemas import (
+    GamePlayerStatsSchema,
+    GameSessionSchema,
+    UserStatsSummarySchema,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from datetime import datetime
+    from uuid import UUID
+
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.orm import Session
+
+    from fabricat_backend.database.repositories.game_history import (
+        PlayerStatsRecord,
+    )
+
+
+@dataclass(slots=True)
+class _SummaryDelta:
+    """Contribution of a batch of games to one user's summary row."""
+
+    games_played: int
+    wins: int
+    bankruptcies: int
+    total_capital: float
+    best_capital: float
+    total_place: int
+    last_finished_at: datetime
+
+    def add(self, stat: PlayerStatsRecord, finished_at: datetime) -> None:
+        self.games_played += 1
+        self.wins += int(stat.is_top1)
+        self.bankruptcies += int(stat.is_bankrupt)
+        self.total_capital += stat.capital
+        self.best_capital = max(self.best_capital, stat.capital)
+        self.total_place += stat.place
+        self.last_finished_at = max(self.last_finished_at, finished_at)
+
+
+class UserStatsSummaryRepository:
+    """Read and maintain :class:`UserStatsSummarySchema` rows.
+
+    Game results are folded into the summary with counter increments, so a
+    profile page reads a single row instead of aggregating the user's whole
+    history. The increments join the caller's transaction, keeping the
+    summary consistent with the recorded games.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def get(self, user_id: UUID) -> UserStatsSummarySchema | None:
+        """Return the summary of ``user_id`` if they finished any game."""
+        return self._session.get(UserStatsSummarySchema, user_id)
+
+    def apply(self, results: Iterable[tuple[datetime, PlayerStatsRecord]]) -> None:
+        """Fold finished-game results into the summaries of their users.
+
+        Seats without a user are skipped. Results of the same user are merged
+        first so each affected summary row is written once.
+        """
+        deltas: dict[UUID, _SummaryDelta] = {}
+        for finished_at, stat in results:
+            if stat.user_id is None:
+                continue
+            delta = deltas.get(stat.user_id)
+            if delta is None:
+                delta = deltas[stat.user_id] = _SummaryDelta(
+                    games_played=0,
+                    wins=0,
+                    bankruptcies=0,
+                    total_capital=0.0,
+                    best_capital=stat.capital,
+                    total_place=0,
+                    last_finished_at=finished_at,
+                )
+            delta.add(stat, finished_at)
+        if not deltas:
+            return
+
+        rows = [
+            {
+                "user_id": user_id,
+                "games_played": delta.games_played,
+                "wins": delta.wins,
+                "bankruptcies": delta.bankruptcies,
+                "total_capital": delta.total_capital,
+                "best_capital": delta.best_capital,
+                "total_place": delta.total_place,
+                "last_finished_at": delta.last_finished_at,
+            }
+            for user_id, delta in deltas.items()
+        ]
+        dialect = self._session.get_bind().dialect.name
+        if dialect in {"postgresql", "sqlite"}:
+            self._upsert(dialect, rows)
+        else:
+            self._merge(rows)
+
+    def rebuild(self) -> int:
+        """Recompute every summary from raw history and return the row count."""
+        stats = GamePlayerStatsSchema
+        aggregates = (
+            select(
+                stats.user_id,
+                func.count(),
+                func.sum(case((stats.is_top1, 1), else_=0)),
+                func.sum(case((stats.is_bankrupt, 1), else_=0)),
+                func.sum(stats.capital),
+                func.max(stats.capital),
+                func.sum(stats.place),
+                func.max(GameSessionSchema.finished_at),
+            )
+            .join(GameSessionSchema, GameSessionSchema.id == stats.session_id)
+            .where(stats.user_id.is_not(None))
+            .group_by(stats.user_id)
+        )
+        self._session.execute(delete(UserStatsSummarySchema))
+        self._session.execute(
+            insert(UserStatsSummarySchema).from_select(
+                [
+                    "user_id",
+                    "games_played",
+                    "wins",
+                    "bankruptcies",
+                    "total_capital",
+                    "best_capital",
+                    "total_place",
+                    "last_finished_at",
+                ],
+                aggregates,
+            )
+        )
+        count = select(func.count()).select_from(UserStatsSummarySchema)
+        return self._session.scalar(count) or 0
+
+    def _upsert(self, dialect: str, rows: list[dict[str, Any]]) -> None:
+        dialect_insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        stmt = dialect_insert(UserStatsSummarySchema)
+        current, new = UserStatsSummarySchema, stmt.excluded
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[current.user_id],
+            set_={
+                "games_played": current.games_played + new.games_played,
+                "wins": current.wins + new.wins,
+                "bankruptcies": current.bankruptcies + new.bankruptcies,
+                "total_capital": current.total_capital + new.total_capital,
+                "best_capital": case(
+                    (new.best_capital > current.best_capital, new.best_capital),
+                    else_=current.best_capital,
+                ),
+                "total_place": current.total_place + new.total_place,
+                "last_finished_at": case(
+                    (
+                        new.last_finished_at > current.last_finished_at,
+                        new.last_finished_at,
+                    ),
+                    else_=current.last_finished_at,
+                ),
+                "updated_at": func.now(),
+            },
+        )
+        self._session.execute(stmt, rows)
+
+    def _merge(self, rows: list[dict[str, Any]]) -> None:
+        for row in rows:
+            summary = self._session.get(
+                UserStatsSummarySchema, row["user_id"], with_for_update=True
+            )
+            if summary is None:
+                self._session.add(UserStatsSummarySchema(**row))
+                continue
+            summary.games_played += row["games_played"]
+            summary.wins += row["wins"]
+            summary.bankruptcies += row["bankruptcies"]
+            summary.total_capital += row["total_capital"]
+            summary.best_capital = max(summary.best_capital, row["best_capital"])
+            summary.total_place += row["total_place"]
+            summary.last_finished_at = max(
+                summary.last_finished_at, row["last_finished_at"]
+            )
+        self._session.flush()
+
+
+class AsyncUserStatsSummaryRepository:
+    """Read :class:`UserStatsSummarySchema` rows through an async session."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get(self, user_id: UUID) -> UserStatsSummarySchema | None:
+        """Return the summary of ``user_id`` if they finished any game."""
+        return await self._session.get(UserStatsSummarySchema, user_id)
+
+
+__all__ = ["AsyncUserStatsSummaryRepository", "UserStatsSummaryRepository"]
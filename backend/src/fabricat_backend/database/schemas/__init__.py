@@ -5,5 +5,15 @@ from fabricat_backend.database.schemas.game_history import (
     GameSessionSchema,
 )
 from fabricat_backend.database.schemas.user import UserSchema
+from fabricat_backend.database.schemas.user_stats import (
+    LeaderboardDailySchema,
+    UserStatsSummarySchema,
+)
 
-__all__ = ["GamePlayerStatsSchema", "GameSessionSchema", "UserSchema"]
+__all__ = [
+    "GamePlayerStatsSchema",
+    "GameSessionSchema",
+    "LeaderboardDailySchema",
+    "UserSchema",
+    "UserStatsSummarySchema",
+]
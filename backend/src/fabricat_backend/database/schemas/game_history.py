@@ -5,7 +5,16 @@ from __future__ import annotations
 from datetime import datetime
 from uuid import UUID, uuid4
 
-from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Integer, String, func
+from sqlalchemy import (
+    Boolean,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    func,
+)
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -16,6 +25,10 @@ class GameSessionSchema(BaseSchema):
     """Represents a finished game session."""
 
     __tablename__ = "game_sessions"
+    __table_args__ = (
+        Index("ix_game_sessions_session_code", "session_code"),
+        Index("ix_game_sessions_finished_at_id", "finished_at", "id"),
+    )
 
     id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True), primary_key=True, default=uuid4
@@ -38,6 +51,9 @@ class GamePlayerStatsSchema(BaseSchema):
     """Stores per-player statistics for a completed session."""
 
     __tablename__ = "game_player_stats"
+    __table_args__ = (
+        Index("ix_game_player_stats_user_id_session_id", "user_id", "session_id"),
+    )
 
     id: Mapped[UUID] = mapped_column(
         PGUUID(as_uuid=True), primary_key=True, default=uuid4
@@ -0,0 +1,55 @@
+"""Database schema for per-user aggregates over finished games."""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+from uuid import UUID
+
+from sqlalchemy import Date, DateTime, Float, Index, Integer, func, text
+from sqlalchemy.dialects.postgresql import UUID as PGUUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from fabricat_backend.database.base import BaseSchema
+
+
+class UserStatsSummarySchema(BaseSchema):
+    """Running career totals of a user, kept in step with game history."""
+
+    __tablename__ = "user_stats_summary"
+    __table_args__ = (
+        Index(
+            "ix_user_stats_summary_wins", text("wins DESC"), "games_played", "user_id"
+        ),
+    )
+
+    user_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True)
+    games_played: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    wins: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    bankruptcies: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_capital: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    best_capital: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    total_place: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    last_finished_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+
+class LeaderboardDailySchema(BaseSchema):
+    """Per-user totals of one UTC day, summed up for rolling leaderboards."""
+
+    __tablename__ = "leaderboard_daily"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    user_id: Mapped[UUID] = mapped_column(PGUUID(as_uuid=True), primary_key=True)
+    games_played: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    wins: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_place: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+__all__ = ["LeaderboardDailySchema", "UserStatsSummarySchema"]
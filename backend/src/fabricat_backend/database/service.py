@@ -2,21 +2,160 @@
 
 from __future__ import annotations
 
-from contextlib import contextmanager
-from typing import TYPE_CHECKING
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, ClassVar
 
-from sqlalchemy import Engine, create_engine
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import AsyncIterator, Iterator
+
+    from sqlalchemy.engine import URL
+    from sqlalchemy.pool import PoolProxiedConnection
+
+    from fabricat_backend.settings import BackendSettings
+
+_WAIT_SAMPLES = 1_024
+_ASYNC_DRIVERS = {"sqlite": "aiosqlite", "postgresql": "psycopg"}
+_SYNC_DRIVERS = frozenset({"pysqlite", "psycopg", "psycopg2"})
+
+
+@dataclass(frozen=True, slots=True)
+class DatabasePoolConfig:
+    """Sizing and liveness options of the connection pool."""
+
+    size: int = 10
+    max_overflow: int = 20
+    timeout_seconds: float = 30.0
+    pre_ping: bool = True
+    recycle_seconds: int = 1_800
+
+    @classmethod
+    def from_settings(cls, settings: BackendSettings) -> DatabasePoolConfig:
+        """Read the pool options from the backend settings."""
+        return cls(
+            size=settings.db_pool_size,
+            max_overflow=settings.db_pool_max_overflow,
+            timeout_seconds=settings.db_pool_timeout_seconds,
+            pre_ping=settings.db_pool_pre_ping,
+            recycle_seconds=settings.db_pool_recycle_seconds,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class PoolMetricsSnapshot:
+    """Point-in-time view of connection pool health."""
+
+    capacity: int
+    checked_out: int
+    peak_checked_out: int
+    saturation: float
+    checkouts: int
+    timeouts: int
+    wait_p50_ms: float
+    wait_p95_ms: float
+    wait_max_ms: float
+
+
+class PoolMetrics:
+    """Thread-safe collector of checkout latency and pool saturation.
+
+    Latency covers the time a caller waits for a connection, including
+    opening one, and is kept for the most recent checkouts only.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self._capacity = capacity
+        self._lock = threading.Lock()
+        self._waits: deque[float] = deque(maxlen=_WAIT_SAMPLES)
+        self._wait_max = 0.0
+        self._checkouts = 0
+        self._timeouts = 0
+        self._checked_out = 0
+        self._peak_checked_out = 0
+
+    def record_wait(self, seconds: float, *, timed_out: bool = False) -> None:
+        """Record how long one checkout request waited."""
+        with self._lock:
+            if timed_out:
+                self._timeouts += 1
+                return
+            self._checkouts += 1
+            self._waits.append(seconds)
+            self._wait_max = max(self._wait_max, seconds)
+
+    def on_checkout(self, *_args: object) -> None:
+        """Pool event hook: a connection left the pool."""
+        with self._lock:
+            self._checked_out += 1
+            self._peak_checked_out = max(self._peak_checked_out, self._checked_out)
+
+    def on_checkin(self, *_args: object) -> None:
+        """Pool event hook: a connection returned to the pool."""
+        with self._lock:
+            self._checked_out = max(self._checked_out - 1, 0)
+
+    def snapshot(self) -> PoolMetricsSnapshot:
+        """Return the current counters and latency percentiles."""
+        with self._lock:
+            waits = sorted(self._waits)
+            checked_out = self._checked_out
+            return PoolMetricsSnapshot(
+                capacity=self._capacity,
+                checked_out=checked_out,
+                peak_checked_out=self._peak_checked_out,
+                saturation=checked_out / self._capacity if self._capacity else 0.0,
+                checkouts=self._checkouts,
+                timeouts=self._timeouts,
+                wait_p50_ms=_percentile(waits, 0.50) * 1_000,
+                wait_p95_ms=_percentile(waits, 0.95) * 1_000,
+                wait_max_ms=self._wait_max * 1_000,
+            )
+
+
+class _TimedPool(QueuePool):
+    """Queue pool that reports how long each checkout waited."""
+
+    metrics: ClassVar[PoolMetrics | None] = None
+
+    def connect(self) -> PoolProxiedConnection:
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            if self.metrics is not None:
+                self.metrics.record_wait(time.perf_counter() - started, timed_out=True)
+            raise
+        if self.metrics is not None:
+            self.metrics.record_wait(time.perf_counter() - started)
+        return connection
 
 
 class DatabaseService:
     """Wraps SQLAlchemy engine and session factory."""
 
-    def __init__(self, url: str) -> None:
-        self._engine = create_engine(url, future=True)
+    def __init__(self, url: str, *, pool: DatabasePoolConfig | None = None) -> None:
+        if pool is not None and not _supports_queue_pool(url):
+            pool = None
+        self._metrics = PoolMetrics(_capacity(pool))
+        self._engine = create_engine(
+            url, future=True, **_pool_options(pool, self._metrics, QueuePool)
+        )
+        _track_checkouts(self._engine, self._metrics)
         self._session_factory = sessionmaker(
             bind=self._engine,
             autoflush=False,
@@ -30,6 +169,10 @@ class DatabaseService:
         """Expose the SQLAlchemy engine."""
         return self._engine
 
+    def pool_metrics(self) -> PoolMetricsSnapshot:
+        """Return checkout latency and saturation of the connection pool."""
+        return self._metrics.snapshot()
+
     @contextmanager
     def session(self) -> Iterator[Session]:
         """Provide a transactional session scope."""
@@ -42,3 +185,122 @@ class DatabaseService:
             raise
         finally:
             session.close()
+
+
+class AsyncDatabaseService:
+    """Async counterpart of :class:`DatabaseService` for ``async def`` endpoints.
+
+    Synchronous URLs are mapped to an async driver of the same database, so
+    both services can be configured from one ``DATABASE_URL``. Queries awaited
+    on its sessions do not hold a worker thread while the database responds.
+    """
+
+    def __init__(self, url: str, *, pool: DatabasePoolConfig | None = None) -> None:
+        async_url = _async_url(url)
+        if pool is not None and not _supports_queue_pool(async_url):
+            pool = None
+        self._metrics = PoolMetrics(_capacity(pool))
+        self._engine = create_async_engine(
+            async_url, **_pool_options(pool, self._metrics, AsyncAdaptedQueuePool)
+        )
+        _track_checkouts(self._engine.sync_engine, self._metrics)
+        self._session_factory = async_sessionmaker(
+            bind=self._engine,
+            autoflush=False,
+            expire_on_commit=False,
+            class_=AsyncSession,
+        )
+
+    @property
+    def engine(self) -> AsyncEngine:
+        """Expose the SQLAlchemy async engine."""
+        return self._engine
+
+    def pool_metrics(self) -> PoolMetricsSnapshot:
+        """Return checkout latency and saturation of the connection pool."""
+        return self._metrics.snapshot()
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[AsyncSession]:
+        """Provide a transactional async session scope."""
+        session = self._session_factory()
+        try:
+            yield session
+            await session.commit()
+        except Exception:
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+
+    async def dispose(self) -> None:
+        """Close every pooled connection."""
+        await self._engine.dispose()
+
+
+def _capacity(pool: DatabasePoolConfig | None) -> int:
+    return 0 if pool is None else pool.size + max(pool.max_overflow, 0)
+
+
+def _pool_options(
+    pool: DatabasePoolConfig | None,
+    metrics: PoolMetrics,
+    base: type[QueuePool],
+) -> dict[str, Any]:
+    if pool is None:
+        return {}
+    return {
+        "poolclass": _timed_pool_class(metrics, base),
+        "pool_size": pool.size,
+        "max_overflow": pool.max_overflow,
+        "pool_timeout": pool.timeout_seconds,
+        "pool_pre_ping": pool.pre_ping,
+        "pool_recycle": pool.recycle_seconds,
+    }
+
+
+def _track_checkouts(engine: Engine, metrics: PoolMetrics) -> None:
+    event.listen(engine, "checkout", metrics.on_checkout)
+    event.listen(engine, "checkin", metrics.on_checkin)
+
+
+def _async_url(url: str) -> URL:
+    """Swap the default sync driver of ``url`` for its async counterpart."""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend in _ASYNC_DRIVERS and parsed.get_driver_name() in _SYNC_DRIVERS:
+        return parsed.set(drivername=f"{backend}+{_ASYNC_DRIVERS[backend]}")
+    return parsed
+
+
+def _supports_queue_pool(url: str | URL) -> bool:
+    """In-memory SQLite needs its single-connection pool to keep its data."""
+    parsed = make_url(url)
+    if parsed.get_backend_name() != "sqlite":
+        return True
+    return parsed.database not in {None, "", ":memory:"}
+
+
+def _timed_pool_class(metrics: PoolMetrics, base: type[QueuePool]) -> type[_TimedPool]:
+    """Return a subclass of ``base`` reporting to ``metrics``.
+
+    The pool is built by ``create_engine`` and rebuilt on ``dispose()``, so the
+    collector travels on the class rather than the instance.
+    """
+    return type(f"Timed{base.__name__}", (_TimedPool, base), {"metrics": metrics})
+
+
+def _percentile(ordered: list[float], fraction: float) -> float:
+    if not ordered:
+        return 0.0
+    index = min(int(fraction * len(ordered)), len(ordered) - 1)
+    return ordered[index]
+
+
+__all__ = [
+    "AsyncDatabaseService",
+    "DatabasePoolConfig",
+    "DatabaseService",
+    "PoolMetrics",
+    "PoolMetricsSnapshot",
+]
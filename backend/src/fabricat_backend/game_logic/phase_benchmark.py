@@ -0,0 +1,163 @@
+"""Microbenchmark for the per-phase cost of the game engine."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from fabricat_backend.game_logic.phases import PHASE_SEQUENCE
+from fabricat_backend.game_logic.session import (
+    GameSession,
+    Player,
+    default_game_settings,
+)
+from fabricat_backend.game_logic.simulation import (
+    DEFAULT_START_MONEY,
+    DEFAULT_STRATEGIES,
+    build_strategies,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+
+@dataclass(slots=True)
+class PhaseTiming:
+    """Accumulated wall-clock time spent executing one phase."""
+
+    phase: str
+    calls: int = 0
+    total_seconds: float = 0.0
+
+    @property
+    def mean_us(self) -> float:
+        """Average cost of one execution in microseconds."""
+        if self.calls == 0:
+            return 0.0
+        return self.total_seconds / self.calls * 1_000_000
+
+
+@dataclass(slots=True)
+class PhaseBenchmarkResult:
+    """Per-phase timings gathered over a batch of games."""
+
+    games: int
+    reports: bool
+    setup: PhaseTiming = field(default_factory=lambda: PhaseTiming("setup"))
+    phases: dict[str, PhaseTiming] = field(default_factory=dict)
+
+    @property
+    def month_us(self) -> float:
+        """Average cost of one full month of phases in microseconds."""
+        return sum(timing.mean_us for timing in self.phases.values())
+
+    def to_dict(self) -> dict[str, object]:
+        """Return a JSON-serialisable view of the result."""
+        return {
+            "games": self.games,
+            "reports": self.reports,
+            "setup_us": round(self.setup.mean_us, 2),
+            "month_us": round(self.month_us, 2),
+            "phases_us": {
+                name: round(timing.mean_us, 2) for name, timing in self.phases.items()
+            },
+        }
+
+
+def benchmark_phases(  # noqa: PLR0913
+    *,
+    games: int,
+    strategy_names: Sequence[str] = DEFAULT_STRATEGIES,
+    max_months: int | None = None,
+    seed: int = 0,
+    reports: bool = False,
+    clock: Callable[[], float] = perf_counter,
+) -> PhaseBenchmarkResult:
+    """Play ``games`` scripted games and time every phase the engine executes.
+
+    Only the engine is timed: session construction is reported as ``setup``
+    and each phase call on its own, while the strategies filling in orders
+    run outside the measured window. With ``reports`` phases go through
+    `GameSession.run_phase`, which adds the journal and analytics snapshot
+    connected clients receive; otherwise the headless `advance_phase` runs.
+    """
+    if games < 1:
+        msg = "Games must be positive."
+        raise ValueError(msg)
+
+    settings = default_game_settings()
+    if max_months is not None:
+        settings = settings.model_copy(update={"max_months": max_months})
+    result = PhaseBenchmarkResult(games=games, reports=reports)
+    timings = [
+        result.phases.setdefault(phase.value, PhaseTiming(phase.value))
+        for phase in PHASE_SEQUENCE
+    ]
+
+    for game in range(games):
+        game_seed = seed + game
+        strategies = build_strategies(strategy_names, seed=game_seed)
+        started = clock()
+        players = [
+            Player(id_=idx, money=DEFAULT_START_MONEY, priority=idx)
+            for idx in range(1, len(strategies) + 1)
+        ]
+        session = GameSession(
+            players=players,
+            settings=settings.model_copy(update={"rng_seed": game_seed}),
+        )
+        result.setup.total_seconds += clock() - started
+        result.setup.calls += 1
+        execute = session.run_phase if reports else session.advance_phase
+        seats = list(zip(players, strategies, strict=True))
+
+        while not session.is_finished:
+            for phase, timing in zip(PHASE_SEQUENCE, timings, strict=True):
+                for player, strategy in seats:
+                    if not player.is_bankrupt:
+                        strategy.act(phase, player, session)
+                started = clock()
+                execute(phase)
+                timing.total_seconds += clock() - started
+                timing.calls += 1
+                if session.is_finished:
+                    break
+
+    return result
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Command-line entry point for the phase benchmark."""
+    parser = argparse.ArgumentParser(
+        description="Time every phase of scripted games and print the means.",
+    )
+    parser.add_argument("--games", type=int, default=200)
+    parser.add_argument(
+        "--strategies",
+        default=",".join(DEFAULT_STRATEGIES),
+        help="Comma-separated seats, as accepted by the simulate command.",
+    )
+    parser.add_argument("--max-months", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--reports",
+        action="store_true",
+        help="Run phases with journal and analytics, as live sessions do.",
+    )
+    args = parser.parse_args(argv)
+
+    result = benchmark_phases(
+        games=args.games,
+        strategy_names=[name.strip() for name in args.strategies.split(",")],
+        max_months=args.max_months,
+        seed=args.seed,
+        reports=args.reports,
+    )
+    sys.stdout.write(json.dumps(result.to_dict(), indent=2) + "\n")
+
+
+__all__ = ["PhaseBenchmarkResult", "PhaseTiming", "benchmark_phases", "main"]
@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import UTC, datetime
+import heapq
+from datetime import UTC, datetime, timedelta
 from enum import StrEnum
+from itertools import count
+from math import ceil
 from typing import TYPE_CHECKING, Any
+from weakref import WeakKeyDictionary
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
@@ -41,6 +45,7 @@ PHASE_SEQUENCE: tuple[GamePhase, ...] = (
 )
 
 DEFAULT_PHASE_DURATION_SECONDS = 15
+DEFAULT_TICK_GRANULARITY_SECONDS = 0.05
 
 
 class PhaseTick(BaseModel):
@@ -101,14 +106,113 @@ class PhaseReport(BaseModel):
     analytics: PhaseAnalytics
 
 
+class TickScheduler:
+    """Shared deadline heap that wakes every timer of an event loop.
+
+    Deadlines are absolute ``loop.time()`` values. They are rounded up to
+    ``granularity_seconds`` slots, so all timers due in the same slot are
+    released by a single loop callback and none of them fires early. Only the
+    earliest slot is ever armed on the loop.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        *,
+        granularity_seconds: float = DEFAULT_TICK_GRANULARITY_SECONDS,
+    ) -> None:
+        if granularity_seconds < 0:
+            msg = "Tick granularity must be non-negative."
+            raise ValueError(msg)
+
+        self._loop = loop
+        self._granularity = granularity_seconds
+        self._heap: list[tuple[float, int, asyncio.Future[bool]]] = []
+        self._order = count()
+        self._handle: asyncio.TimerHandle | None = None
+        self._armed_at: float | None = None
+
+    @property
+    def pending(self) -> int:
+        """Number of deadlines that are still waiting to fire."""
+        return sum(1 for _, _, waiter in self._heap if not waiter.done())
+
+    def wait_until(self, deadline: float) -> asyncio.Future[bool]:
+        """Return a future resolved with ``True`` once ``deadline`` passes.
+
+        Resolving the future early (for example with ``False`` to signal a
+        cancellation) is allowed; the scheduler then skips the entry.
+        """
+        waiter: asyncio.Future[bool] = self._loop.create_future()
+        heapq.heappush(self._heap, (self._slot(deadline), next(self._order), waiter))
+        self._arm()
+        return waiter
+
+    def _slot(self, deadline: float) -> float:
+        if self._granularity == 0:
+            return deadline
+        return ceil(deadline / self._granularity) * self._granularity
+
+    def _arm(self) -> None:
+        """Schedule the loop callback for the earliest pending slot."""
+        while self._heap and self._heap[0][2].done():
+            heapq.heappop(self._heap)
+        if not self._heap:
+            if self._handle is not None:
+                self._handle.cancel()
+            self._handle = None
+            self._armed_at = None
+            return
+
+        when = self._heap[0][0]
+        if self._armed_at is not None and self._armed_at <= when:
+            return
+        if self._handle is not None:
+            self._handle.cancel()
+        self._handle = self._loop.call_at(when, self._fire)
+        self._armed_at = when
+
+    def _fire(self) -> None:
+        """Release every timer whose slot is due in one batch."""
+        due = max(self._armed_at or 0.0, self._loop.time())
+        self._handle = None
+        self._armed_at = None
+        while self._heap and self._heap[0][0] <= due:
+            _, _, waiter = heapq.heappop(self._heap)
+            if not waiter.done():
+                waiter.set_result(True)
+        self._arm()
+
+
+_SCHEDULERS: WeakKeyDictionary[asyncio.AbstractEventLoop, TickScheduler] = (
+    WeakKeyDictionary()
+)
+
+
+def get_tick_scheduler() -> TickScheduler:
+    """Return the tick scheduler shared by all timers of the running loop."""
+    loop = asyncio.get_running_loop()
+    scheduler = _SCHEDULERS.get(loop)
+    if scheduler is None:
+        scheduler = TickScheduler(loop)
+        _SCHEDULERS[loop] = scheduler
+    return scheduler
+
+
 class PhaseTimer:
-    """Asynchronous countdown helper used by the WebSocket API."""
+    """Asynchronous countdown helper used by the WebSocket API.
+
+    Tick ``k`` of a countdown is due ``k`` resolutions after its start on the
+    loop's monotonic clock, so time spent by consumers never accumulates as
+    drift; a consumer that falls behind skips straight to the current second.
+    """
 
     def __init__(
         self,
         *,
         default_duration_seconds: int = DEFAULT_PHASE_DURATION_SECONDS,
         tick_resolution_seconds: float = 1.0,
+        scheduler: TickScheduler | None = None,
     ) -> None:
         if default_duration_seconds < 0:
             msg = "Phase duration must be non-negative."
@@ -120,15 +224,23 @@ class PhaseTimer:
 
         self._default_duration = default_duration_seconds
         self._resolution = tick_resolution_seconds
-        self._cancel_event: asyncio.Event | None = None
+        self._scheduler = scheduler
+        self._active = False
+        self._cancelled = False
+        self._waiter: asyncio.Future[bool] | None = None
 
     async def ticks(
         self,
         *,
         phase: GamePhase,
         duration_seconds: int | None = None,
+        elapsed_seconds: int = 0,
     ) -> AsyncIterator[PhaseTick]:
-        """Yield countdown ticks until completion or cancellation."""
+        """Yield countdown ticks until completion or cancellation.
+
+        ``elapsed_seconds`` resumes a countdown that already ran that long,
+        for example before the server restarted.
+        """
         total = (
             duration_seconds if duration_seconds is not None else self._default_duration
         )
@@ -136,41 +248,57 @@ class PhaseTimer:
             msg = "Phase duration must be non-negative."
             raise ValueError(msg)
 
-        cancel_event = asyncio.Event()
-        self._cancel_event = cancel_event
-        started_at = datetime.now(tz=UTC)
-        remaining = total
-
-        while remaining >= 0:
-            yield PhaseTick(
-                phase=phase,
-                remaining_seconds=remaining,
-                total_seconds=total,
-                started_at=started_at,
-            )
-
-            if remaining == 0 or cancel_event.is_set():
-                break
-
-            try:
-                await asyncio.wait_for(cancel_event.wait(), timeout=self._resolution)
-            except TimeoutError:
-                remaining -= 1
-                continue
-
-            if cancel_event.is_set():
-                break
-
-        self._cancel_event = None
+        loop = asyncio.get_running_loop()
+        scheduler = self._scheduler or get_tick_scheduler()
+        self._active = True
+        self._cancelled = False
+        elapsed = min(max(elapsed_seconds, 0), total)
+        started_at = datetime.now(tz=UTC) - timedelta(
+            seconds=elapsed * self._resolution
+        )
+        start = loop.time() - elapsed * self._resolution
+
+        try:
+            while True:
+                yield PhaseTick(
+                    phase=phase,
+                    remaining_seconds=total - elapsed,
+                    total_seconds=total,
+                    started_at=started_at,
+                )
+
+                if elapsed >= total or self._cancelled:
+                    break
+
+                waiter = scheduler.wait_until(start + (elapsed + 1) * self._resolution)
+                self._waiter = waiter
+                try:
+                    await waiter
+                finally:
+                    self._waiter = None
+
+                if self._cancelled:
+                    break
+
+                elapsed += 1
+                if self._resolution > 0:
+                    behind = int((loop.time() - start) // self._resolution)
+                    elapsed = min(max(elapsed, behind), total)
+        finally:
+            self._active = False
 
     def cancel(self) -> None:
         """Stop the active countdown, if any."""
-        if self._cancel_event is not None:
-            self._cancel_event.set()
+        if not self._active:
+            return
+        self._cancelled = True
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(False)
 
 
 __all__ = [
     "DEFAULT_PHASE_DURATION_SECONDS",
+    "DEFAULT_TICK_GRANULARITY_SECONDS",
     "PHASE_SEQUENCE",
     "GamePhase",
     "PhaseAnalytics",
@@ -179,4 +307,6 @@ __all__ = [
     "PhaseTick",
     "PhaseTimer",
     "PlayerPhaseAnalytics",
+    "TickScheduler",
+    "get_tick_scheduler",
 ]
@@ -0,0 +1,145 @@
+"""Bounded in-memory logs that spill older entries to disk."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import weakref
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, TYPE_CHECKING
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+
+@dataclass(frozen=True, slots=True)
+class RetentionPolicy:
+    """How much of a session's history stays in memory.
+
+    ``None`` keeps everything in memory. Otherwise only the newest entries
+    are kept and older ones are appended to a JSON-lines file in
+    ``spill_dir`` (the system temp directory by default), from which they
+    can still be read back in order.
+    """
+
+    max_reports: int | None = None
+    max_journal_entries: int | None = None
+    spill_dir: Path | None = None
+
+    def __post_init__(self) -> None:
+        """Reject limits that could not hold the newest entry."""
+        for limit in (self.max_reports, self.max_journal_entries):
+            if limit is not None and limit < 1:
+                msg = "Retention limits must keep at least one entry."
+                raise ValueError(msg)
+
+
+class RetainedLog[T: BaseModel]:
+    """Append-only log that keeps its newest ``max_entries`` items in memory.
+
+    Evicted items are written as one JSON document per line to a spill file
+    created on first eviction and deleted when the log is closed or
+    collected. Iteration yields spilled items first, parsed lazily from
+    disk, then the retained tail without copying it.
+    """
+
+    def __init__(
+        self,
+        model: type[T],
+        *,
+        max_entries: int | None = None,
+        spill_dir: Path | None = None,
+        name: str = "log",
+    ) -> None:
+        self._model = model
+        self._retained: deque[T] = deque(maxlen=max_entries)
+        self._spill_dir = spill_dir
+        self._name = name
+        self._spill_path: Path | None = None
+        self._spill: IO[bytes] | None = None
+        self._spilled = 0
+        self._finalizer: weakref.finalize | None = None
+
+    def __len__(self) -> int:
+        """Return the number of items ever appended, spilled ones included."""
+        return self._spilled + len(self._retained)
+
+    def __iter__(self) -> Iterator[T]:
+        """Yield every item in insertion order."""
+        yield from self.spilled()
+        yield from self._retained
+
+    @property
+    def spilled_count(self) -> int:
+        """Number of items moved to the spill file."""
+        return self._spilled
+
+    def append(self, item: T) -> None:
+        """Add ``item``, spilling the oldest retained item if the log is full."""
+        retained = self._retained
+        if retained.maxlen is not None and len(retained) == retained.maxlen:
+            self._write_spill(retained[0])
+        retained.append(item)
+
+    def extend(self, items: Iterable[T]) -> None:
+        """Append every item of ``items`` in order."""
+        for item in items:
+            self.append(item)
+
+    def recent(self) -> Iterator[T]:
+        """Yield the items still held in memory, oldest first."""
+        return iter(self._retained)
+
+    def latest(self) -> T | None:
+        """Return the newest item, if any."""
+        return self._retained[-1] if self._retained else None
+
+    def spilled(self) -> Iterator[T]:
+        """Yield the items moved to disk, oldest first."""
+        if self._spill_path is None:
+            return
+        if self._spill is not None:
+            self._spill.flush()
+        remaining = self._spilled
+        with self._spill_path.open("rb") as source:
+            for line in source:
+                if remaining == 0:
+                    return
+                remaining -= 1
+                yield self._model.model_validate_json(line)
+
+    def close(self) -> None:
+        """Drop every item and delete the spill file."""
+        self._retained.clear()
+        self._spilled = 0
+        if self._finalizer is not None:
+            self._finalizer()
+        self._finalizer = None
+        self._spill = None
+        self._spill_path = None
+
+    def _write_spill(self, item: T) -> None:
+        if self._spill is None:
+            descriptor, path = tempfile.mkstemp(
+                prefix=f"fabricat-{self._name}-", suffix=".jsonl", dir=self._spill_dir
+            )
+            self._spill = os.fdopen(descriptor, "ab")
+            self._spill_path = Path(path)
+            self._finalizer = weakref.finalize(
+                self, _discard_spill, self._spill, self._spill_path
+            )
+        self._spill.write(item.model_dump_json().encode())
+        self._spill.write(b"\n")
+        self._spilled += 1
+
+
+def _discard_spill(handle: IO[bytes], path: Path) -> None:
+    handle.close()
+    path.unlink(missing_ok=True)
+
+
+__all__ = ["RetainedLog", "RetentionPolicy"]
@@ -1,13 +1,16 @@
 """Session manager for multiplayer and multi-session games."""
 
+import base64
+import struct
 from collections import Counter
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from math import ceil
 from random import Random
-from typing import Any, Literal
+from typing import Any, Literal, Self
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel
 
 from fabricat_backend.game_logic.phases import (
     GamePhase,
@@ -16,6 +19,26 @@ from fabricat_backend.game_logic.phases import (
     PhaseReport,
     PlayerPhaseAnalytics,
 )
+from fabricat_backend.game_logic.retention import RetainedLog, RetentionPolicy
+
+# Integral floats below this bound add and subtract without rounding, which is
+# what lets a bulk settlement reproduce the unit-by-unit arithmetic exactly.
+_EXACT_FLOAT_LIMIT = float(2**53)
+# Words in a Mersenne Twister state: 624 of key plus the position.
+_MT_STATE_WORDS = 625
+# Lowest seniority a player can hold; a table seats at most four.
+_MAX_PRIORITY = 4
+# Units one launch of a basic or automated factory turns out.
+BASIC_FACTORY_PRODUCTION = 1
+AUTO_FACTORY_PRODUCTION = 2
+
+
+def _is_exact_integral(*amounts: float) -> bool:
+    """Return True when all amounts are integral and exactly representable."""
+    return all(
+        float(amount).is_integer() and abs(amount) < _EXACT_FLOAT_LIMIT
+        for amount in amounts
+    )
 
 
 class GameSettings(BaseModel):
@@ -72,31 +95,103 @@ class GameSettings(BaseModel):
     max_factories: int
 
 
-class RawMaterial(BaseModel):
-    """Unprocessed inventory unit carrying a recurring storage expense.
+def default_game_settings() -> GameSettings:
+    """Return a baseline set of deterministic session settings."""
+    return GameSettings(
+        start_factory_count=2,
+        max_months=12,
+        basic_factory_monthly_expenses=1_000.0,
+        auto_factory_monthly_expenses=1_500.0,
+        raw_material_monthly_expenses=300.0,
+        finished_good_monthly_expenses=500.0,
+        basic_factory_launch_cost=2_000.0,
+        auto_factory_launch_cost=3_000.0,
+        bank_start_money=100_000.0,
+        loans_monthly_expenses_in_percents=0.01,
+        available_loans=[5_000.0, 10_000.0],
+        loan_terms_in_months=[2, 3],
+        bank_raw_material_sell_volume_range=(5, 9),
+        bank_finished_good_buy_volume_range=(5, 9),
+        bank_raw_material_sell_min_price_range=(200.0, 400.0),
+        bank_finished_good_buy_max_price_range=(400.0, 600.0),
+        month_for_upgrade=9,
+        upgrade_cost=7_000.0,
+        month_for_build_basic=5,
+        build_basic_cost=5_000.0,
+        month_for_build_auto=7,
+        build_auto_cost=10_000.0,
+        build_basic_payment_share=0.5,
+        build_basic_final_payment_offset=1,
+        build_auto_payment_share=0.5,
+        build_auto_final_payment_offset=1,
+        max_raw_material_storage=10,
+        max_finished_good_storage=10,
+        max_factories=6,
+    )
 
-    The monthly expense discourages stockpiling indefinitely and becomes a
-    primary input for production when factories convert these units into
-    finished goods.
+
+@dataclass(slots=True)
+class InventoryStock:
+    """Counted pile of interchangeable inventory units.
+
+    Units of one kind are indistinguishable, so the stock only keeps how many
+    of them a player holds and the upkeep every unit costs per month. All
+    operations are constant time regardless of the stock size.
     """
 
-    monthly_expenses: float
+    count: int = 0
+    unit_monthly_expenses: float = 0.0
+
+    def __post_init__(self) -> None:
+        """Reject a stock holding fewer than zero units."""
+        if self.count < 0:
+            msg = "Stock count cannot be negative."
+            raise ValueError(msg)
+
+    @property
+    def monthly_expenses(self) -> float:
+        """Return the upkeep of the whole stock for one month."""
+        return self.count * self.unit_monthly_expenses
+
+    def add(self, units: int) -> None:
+        """Put the given number of units into the stock."""
+        if units < 0:
+            msg = "Cannot add a negative number of units."
+            raise ValueError(msg)
+        self.count += units
+
+    def remove(self, units: int) -> None:
+        """Take the given number of units out of the stock."""
+        if units < 0 or units > self.count:
+            msg = "Cannot remove more units than the stock holds."
+            raise ValueError(msg)
+        self.count -= units
+
+
+@dataclass(slots=True)
+class RawMaterialStock(InventoryStock):
+    """Unprocessed inventory carrying a recurring storage expense per unit.
+
+    The monthly expense discourages stockpiling indefinitely and the units
+    become a primary input for production when factories convert them into
+    finished goods.
+    """
 
 
-class FinishedGood(BaseModel):
-    """Manufactured product that can be sold to the market or to opponents.
+@dataclass(slots=True)
+class FinishedGoodStock(InventoryStock):
+    """Manufactured products that can be sold to the market or to opponents.
 
     Even completed goods continue to accrue upkeep, creating pressure on
     players to balance inventory levels with market demand.
     """
 
-    monthly_expenses: float
-
 
 FactoryType = Literal["basic", "auto", "builds_basic", "builds_auto", "upgrades"]
 
 
-class Factory(BaseModel):
+@dataclass(slots=True)
+class Factory:
     """Player-owned facility that can produce goods or undergo transitions.
 
     The factory tracks both its operational status (basic or automated) and the
@@ -114,7 +209,8 @@ class Factory(BaseModel):
     next_payment_amount: float = 0.0
 
 
-class Bid(BaseModel):
+@dataclass(slots=True)
+class Bid:
     """Offer to trade a fixed quantity at a targeted price per unit.
 
     Buy bids move raw materials from the bank to players, while sell bids push
@@ -129,7 +225,8 @@ class Bid(BaseModel):
 LoanStatus = Literal["call", "in_progress", "idle"]
 
 
-class Loan(BaseModel):
+@dataclass(slots=True)
+class Loan:
     """Bank loan slot that tracks issued funds and repayment expectations.
 
     Each player receives a fixed number of slots; once a slot is in progress it
@@ -174,7 +271,8 @@ class PlayerFinalStats(BaseModel):
     factories_upgrades: int
 
 
-class Player(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class Player:
     """Participant that owns assets, executes strategies, and spends cash.
 
     Players interact with the bank through bids and loans, manage a roster of
@@ -197,23 +295,25 @@ class Player(BaseModel):
     production_call_for_basic: int = 0
     production_call_for_auto: int = 0
 
-    priority: int = Field(
-        ...,
-        ge=1,
-        le=4,
-        description="In game priority for tie situations.",
-    )
+    # In game priority for tie situations, from 1 to 4.
+    priority: int
 
-    factories: list[Factory] = Field(default_factory=list)
+    factories: list[Factory] = field(default_factory=list)
 
     build_or_upgrade_call: Literal["idle", "build_basic", "build_auto", "upgrade"] = (
         "idle"
     )
 
-    raw_materials: list[RawMaterial] = Field(default_factory=list)
-    finished_goods: list[FinishedGood] = Field(default_factory=list)
+    raw_materials: RawMaterialStock = field(default_factory=RawMaterialStock)
+    finished_goods: FinishedGoodStock = field(default_factory=FinishedGoodStock)
 
-    loans: list[Loan] = Field(default_factory=lambda: [Loan(), Loan()])
+    loans: list[Loan] = field(default_factory=lambda: [Loan(), Loan()])
+
+    def __post_init__(self) -> None:
+        """Reject priorities outside the four seats of a table."""
+        if not 1 <= self.priority <= _MAX_PRIORITY:
+            msg = f"Player priority must be between 1 and {_MAX_PRIORITY}."
+            raise ValueError(msg)
 
     def pay(self, amount: float) -> bool:
         """Attempt to deduct money; bankrupt immediately if funds are insufficient."""
@@ -233,22 +333,21 @@ class Player(BaseModel):
 
         Factories, raw materials, and finished goods each subtract their
         recurring costs, ensuring the player's liquidity reflects all holdings
-        before other actions execute in the monthly cycle.
+        before other actions execute in the monthly cycle. Each stock is
+        charged as one payment covering all of its units.
         """
         for factory in self.factories:
             if not self.pay(factory.monthly_expenses):
                 return
 
-        for raw_material in self.raw_materials:
-            if not self.pay(raw_material.monthly_expenses):
-                return
+        if not self.pay(self.raw_materials.monthly_expenses):
+            return
 
-        for finished_good in self.finished_goods:
-            if not self.pay(finished_good.monthly_expenses):
-                return
+        self.pay(self.finished_goods.monthly_expenses)
 
 
-class Bank(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class Bank:
     """Central counter-party that backs the economy with liquidity and trades.
 
     The bank supplies raw materials, purchases finished goods, and serves as
@@ -256,8 +355,6 @@ class Bank(BaseModel):
     unpredictable while remaining reproducible through the session RNG seed.
     """
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
-
     rng: Random
 
     money: float
@@ -306,7 +403,8 @@ class Bank(BaseModel):
         )
 
 
-class GameState(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class GameState:
     """Dynamic rule snapshot that evolves as turns progress.
 
     Unlike the immutable game settings, this model captures mutable parameters
@@ -323,8 +421,8 @@ class GameState(BaseModel):
     basic_factory_launch_cost: float
     auto_factory_launch_cost: float
 
-    basic_factory_production: int = 1
-    auto_factory_production: int = 2
+    basic_factory_production: int = BASIC_FACTORY_PRODUCTION
+    auto_factory_production: int = AUTO_FACTORY_PRODUCTION
 
     basic_factory_monthly_expenses: float
     auto_factory_monthly_expenses: float
@@ -349,6 +447,62 @@ class GameState(BaseModel):
     max_factories: int
 
 
+def _dump_random(rng: Random) -> str:
+    """Pack a Mersenne Twister state into base64, far smaller than its ints."""
+    version, internal, gauss_next = rng.getstate()
+    packed = struct.pack(f"<B{len(internal)}I", version, *internal)
+    if gauss_next is not None:
+        packed += struct.pack("<d", gauss_next)
+    return base64.b64encode(packed).decode("ascii")
+
+
+def _load_random(state: str) -> Random:
+    """Rebuild a generator from `_dump_random` output."""
+    packed = base64.b64decode(state)
+    version, *internal = struct.unpack_from(f"<B{_MT_STATE_WORDS}I", packed)
+    tail = packed[struct.calcsize(f"<B{_MT_STATE_WORDS}I") :]
+    gauss_next = struct.unpack("<d", tail)[0] if tail else None
+    rng = Random()
+    rng.setstate((version, tuple(internal), gauss_next))
+    return rng
+
+
+class BankSnapshot(BaseModel):
+    """State of the `Bank` in a `GameSessionSnapshot`, less its generator."""
+
+    money: float
+    available_loans: list[float]
+    loan_nominals: list[float]
+    loan_terms_in_months: list[int]
+    raw_material_sell_volume: int
+    finished_good_buy_volume: int
+    raw_material_sell_min_price: float
+    finished_good_buy_max_price: float
+    raw_material_sell_volume_range: tuple[int, int]
+    finished_good_buy_volume_range: tuple[int, int]
+    raw_material_sell_min_price_range: tuple[float, float]
+    finished_good_buy_max_price_range: tuple[float, float]
+
+
+class GameSessionSnapshot(BaseModel):
+    """State of a `GameSession` between phases, as taken by `snapshot`.
+
+    Phase reports and the action journal are history rather than state and
+    are not included.
+    """
+
+    players: list[Player]
+    state: GameState
+    bank: BankSnapshot
+    rng_state: str
+    bank_rng_state: str
+    is_finished: bool
+    winner_id: int | None
+    total_players: int
+    seniority_rolls: list[SeniorityRollLogEntry]
+    seniority_history: list[SenioritySnapshot]
+
+
 class GameSession:
     """High-level orchestrator that plays out the economic game loop.
 
@@ -364,28 +518,27 @@ class GameSession:
         *,
         rng: Random | None = None,
         seed_seniority: bool = True,
+        retention: RetentionPolicy | None = None,
     ) -> None:
         """Initialize players, state, and bank according to the settings.
 
         The constructor stores the player roster and delegates to `_init_game`
         so the session has a populated state snapshot and bank before any
-        gameplay methods run.
+        gameplay methods run. `retention` bounds how many phase reports and
+        journal entries stay in memory; by default all of them do.
         """
         self._players = players
         self._total_players = len(players)
         self._is_finished = False
         self._winner_id: int | None = None
         self._rng = rng or Random(settings.rng_seed)
-        self._journal: list[PhaseJournalEntry] = []
-        self._phase_reports: list[PhaseReport] = []
-        self._phase_event_buffer: list[PhaseJournalEntry] = []
-        self._active_phase: GamePhase | None = None
-        self._active_phase_month: int | None = None
         self._seniority_rolls: list[SeniorityRollLogEntry] = []
         self._seniority_history: list[SenioritySnapshot] = []
+        self._init_history(retention or RetentionPolicy())
 
         self._init_game(settings)
         self._synchronize_player_loans(expected_slots=len(settings.available_loans))
+        self._init_inventories(settings)
         self._init_factories(settings)
         if seed_seniority:
             self._seed_seniority_order()
@@ -399,6 +552,107 @@ class GameSession:
             )
             self._seniority_history.append(snapshot)
 
+    @classmethod
+    def restore(
+        cls, snapshot: GameSessionSnapshot, *, retention: RetentionPolicy | None = None
+    ) -> Self:
+        """Rebuild a session from `snapshot` without dealing starting assets.
+
+        The restored session continues exactly where the snapshotted one
+        stopped, random draws included. Its report and journal history
+        starts empty.
+        """
+        session = cls.__new__(cls)
+        session._load_snapshot(  # noqa: SLF001
+            snapshot.model_copy(deep=True), retention or RetentionPolicy()
+        )
+        return session
+
+    def snapshot(self) -> GameSessionSnapshot:
+        """Capture everything needed to `restore` this session.
+
+        Take it between phases. The snapshot shares the session's objects
+        instead of copying them, so serialize it before the session moves on.
+        """
+        bank = self._bank
+        return GameSessionSnapshot(
+            players=self._players,
+            state=self._state,
+            bank=BankSnapshot(
+                money=bank.money,
+                available_loans=bank.available_loans,
+                loan_nominals=bank.loan_nominals,
+                loan_terms_in_months=bank.loan_terms_in_months,
+                raw_material_sell_volume=bank.raw_material_sell_volume,
+                finished_good_buy_volume=bank.finished_good_buy_volume,
+                raw_material_sell_min_price=bank.raw_material_sell_min_price,
+                finished_good_buy_max_price=bank.finished_good_buy_max_price,
+                raw_material_sell_volume_range=bank.raw_material_sell_volume_range,
+                finished_good_buy_volume_range=bank.finished_good_buy_volume_range,
+                raw_material_sell_min_price_range=bank.raw_material_sell_min_price_range,
+                finished_good_buy_max_price_range=bank.finished_good_buy_max_price_range,
+            ),
+            rng_state=_dump_random(self._rng),
+            bank_rng_state=_dump_random(self._bank.rng),
+            is_finished=self._is_finished,
+            winner_id=self._winner_id,
+            total_players=self._total_players,
+            seniority_rolls=self._seniority_rolls,
+            seniority_history=self._seniority_history,
+        )
+
+    def _load_snapshot(
+        self, snapshot: GameSessionSnapshot, retention: RetentionPolicy
+    ) -> None:
+        """Adopt the state of `snapshot` in place of `__init__`."""
+        self._players = snapshot.players
+        self._total_players = snapshot.total_players
+        self._is_finished = snapshot.is_finished
+        self._winner_id = snapshot.winner_id
+        self._rng = _load_random(snapshot.rng_state)
+        self._seniority_rolls = snapshot.seniority_rolls
+        self._seniority_history = snapshot.seniority_history
+        self._state = snapshot.state
+        saved = snapshot.bank
+        self._bank = Bank(
+            rng=_load_random(snapshot.bank_rng_state),
+            money=saved.money,
+            available_loans=saved.available_loans,
+            loan_nominals=saved.loan_nominals,
+            loan_terms_in_months=saved.loan_terms_in_months,
+            raw_material_sell_volume=saved.raw_material_sell_volume,
+            finished_good_buy_volume=saved.finished_good_buy_volume,
+            raw_material_sell_min_price=saved.raw_material_sell_min_price,
+            finished_good_buy_max_price=saved.finished_good_buy_max_price,
+            raw_material_sell_volume_range=saved.raw_material_sell_volume_range,
+            finished_good_buy_volume_range=saved.finished_good_buy_volume_range,
+            raw_material_sell_min_price_range=saved.raw_material_sell_min_price_range,
+            finished_good_buy_max_price_range=saved.finished_good_buy_max_price_range,
+        )
+        self._init_history(retention)
+
+    def _init_history(self, retention: RetentionPolicy) -> None:
+        """Create the report and journal logs and the analytics caches."""
+        self._journal = RetainedLog(
+            PhaseJournalEntry,
+            max_entries=retention.max_journal_entries,
+            spill_dir=retention.spill_dir,
+            name="journal",
+        )
+        self._phase_reports = RetainedLog(
+            PhaseReport,
+            max_entries=retention.max_reports,
+            spill_dir=retention.spill_dir,
+            name="reports",
+        )
+        self._phase_event_buffer: list[PhaseJournalEntry] = []
+        self._active_phase: GamePhase | None = None
+        self._active_phase_month: int | None = None
+        self._player_analytics: dict[int, PlayerPhaseAnalytics] = {}
+        self._dirty_players: set[int] = {player.id_ for player in self._players}
+        self._bank_analytics: dict[str, Any] | None = None
+        self._analytics: PhaseAnalytics | None = None
+
     def _init_factories(self, settings: GameSettings) -> None:
         """Grant each player their starting complement of basic factories.
 
@@ -414,6 +668,16 @@ class GameSession:
                     )
                 )
 
+    def _init_inventories(self, settings: GameSettings) -> None:
+        """Apply the configured per-unit upkeep to every player's stocks."""
+        for player in self._players:
+            player.raw_materials.unit_monthly_expenses = (
+                settings.raw_material_monthly_expenses
+            )
+            player.finished_goods.unit_monthly_expenses = (
+                settings.finished_good_monthly_expenses
+            )
+
     def _seed_seniority_order(self) -> None:
         """Assign initial seniority via 1d6 rolls with tie re-rolls."""
         ordered_players = self._resolve_seniority_rolls(
@@ -608,9 +872,9 @@ class GameSession:
                     factory_value += self._state.build_basic_cost
             outstanding_payments += max(factory.next_payment_amount, 0.0)
 
-        raw_value = len(player.raw_materials) * self._bank.raw_material_sell_min_price
+        raw_value = player.raw_materials.count * self._bank.raw_material_sell_min_price
         finished_value = (
-            len(player.finished_goods) * self._bank.finished_good_buy_max_price
+            player.finished_goods.count * self._bank.finished_good_buy_max_price
         )
         loan_debt = sum(
             loan.amount for loan in player.loans if loan.loan_status == "in_progress"
@@ -703,36 +967,85 @@ class GameSession:
         )
         self._phase_event_buffer.append(entry)
 
+    def _mark_dirty(self, player: Player) -> None:
+        """Flag a player whose analytics entry must be rebuilt."""
+        self._dirty_players.add(player.id_)
+        self._analytics = None
+
+    def _mark_bank_dirty(self) -> None:
+        """Flag the bank block of the analytics snapshot for a rebuild."""
+        self._bank_analytics = None
+        self._analytics = None
+
+    def invalidate_analytics(self, player_id: int | None = None) -> None:
+        """Drop cached analytics after the session state changed externally.
+
+        Phase handlers keep the cache current on their own; callers that edit
+        a player directly (for example renaming a seat) pass its id, or omit
+        it to rebuild every entry.
+        """
+        if player_id is None:
+            self._dirty_players.update(player.id_ for player in self._players)
+            self._bank_analytics = None
+        else:
+            self._dirty_players.add(player_id)
+        self._analytics = None
+
+    @staticmethod
+    def _player_analytics_for(player: Player) -> PlayerPhaseAnalytics:
+        """Snapshot the compact analytics entry of a single player."""
+        return PlayerPhaseAnalytics(
+            player_id=player.id_,
+            nickname=player.nickname,
+            icon=player.icon,
+            money=player.money,
+            raw_materials=player.raw_materials.count,
+            finished_goods=player.finished_goods.count,
+            factories=len(player.factories),
+            bankrupt=player.is_bankrupt,
+            active_loans=sum(
+                1 for loan in player.loans if loan.loan_status == "in_progress"
+            ),
+        )
+
     def _build_phase_analytics(self) -> PhaseAnalytics:
-        """Build aggregated analytics payload for the current roster."""
-        players = [
-            PlayerPhaseAnalytics(
-                player_id=player.id_,
-                nickname=player.nickname,
-                icon=player.icon,
-                money=player.money,
-                raw_materials=len(player.raw_materials),
-                finished_goods=len(player.finished_goods),
-                factories=len(player.factories),
-                bankrupt=player.is_bankrupt,
-                active_loans=sum(
-                    1 for loan in player.loans if loan.loan_status == "in_progress"
+        """Return the analytics payload, rebuilding only what changed.
+
+        Entries of players marked dirty since the last call are replaced with
+        fresh snapshots, never mutated, so reports that already hold the
+        previous payload keep their values.
+        """
+        if self._analytics is not None:
+            return self._analytics
+
+        for player in self._players:
+            if (
+                player.id_ in self._dirty_players
+                or player.id_ not in self._player_analytics
+            ):
+                self._player_analytics[player.id_] = self._player_analytics_for(player)
+        self._dirty_players.clear()
+
+        if self._bank_analytics is None:
+            self._bank_analytics = {
+                "bank_raw_material_volume": self._bank.raw_material_sell_volume,
+                "bank_raw_material_min_price": self._bank.raw_material_sell_min_price,
+                "bank_finished_good_volume": self._bank.finished_good_buy_volume,
+                "bank_finished_good_max_price": (
+                    self._bank.finished_good_buy_max_price
                 ),
-            )
-            for player in self._players
-        ]
-        bankrupt_ids = [player.player_id for player in players if player.bankrupt]
-        return PhaseAnalytics(
+                "bank_available_loans": list(self._bank.available_loans),
+                "bank_loan_nominals": list(self._bank.loan_nominals),
+                "bank_loan_terms": list(self._bank.loan_terms_in_months),
+            }
+
+        players = [self._player_analytics[player.id_] for player in self._players]
+        self._analytics = PhaseAnalytics(
             players=players,
-            bankrupt_players=bankrupt_ids,
-            bank_raw_material_volume=self._bank.raw_material_sell_volume,
-            bank_raw_material_min_price=self._bank.raw_material_sell_min_price,
-            bank_finished_good_volume=self._bank.finished_good_buy_volume,
-            bank_finished_good_max_price=self._bank.finished_good_buy_max_price,
-            bank_available_loans=list(self._bank.available_loans),
-            bank_loan_nominals=list(self._bank.loan_nominals),
-            bank_loan_terms=list(self._bank.loan_terms_in_months),
+            bankrupt_players=[entry.player_id for entry in players if entry.bankrupt],
+            **self._bank_analytics,
         )
+        return self._analytics
 
     def snapshot_analytics(self) -> PhaseAnalytics:
         """Return the latest analytics snapshot without running a phase."""
@@ -763,6 +1076,15 @@ class GameSession:
         self._active_phase_month = None
         return report
 
+    def advance_phase(self, phase: GamePhase) -> None:
+        """Execute the given phase without journaling or building a report.
+
+        Headless simulations only care about the final standings, so this
+        skips the journal buffer, analytics snapshot, and report retention
+        that `run_phase` maintains for connected clients.
+        """
+        self._phase_handler_for(phase)()
+
     @property
     def is_finished(self) -> bool:
         """Whether the session already satisfied a victory condition."""
@@ -791,6 +1113,38 @@ class GameSession:
         """Return all published phase reports."""
         return list(self._phase_reports)
 
+    def iter_action_journal(
+        self, *, retained_only: bool = False
+    ) -> Iterator[PhaseJournalEntry]:
+        """Iterate the action journal without copying it.
+
+        Entries spilled to disk are read back first unless `retained_only`
+        restricts the walk to those still in memory.
+        """
+        return self._journal.recent() if retained_only else iter(self._journal)
+
+    def iter_phase_reports(
+        self, *, retained_only: bool = False
+    ) -> Iterator[PhaseReport]:
+        """Iterate published phase reports without copying them.
+
+        Reports spilled to disk are read back first unless `retained_only`
+        restricts the walk to those still in memory.
+        """
+        if retained_only:
+            return self._phase_reports.recent()
+        return iter(self._phase_reports)
+
+    @property
+    def latest_phase_report(self) -> PhaseReport | None:
+        """Return the most recent phase report, if any phase ran."""
+        return self._phase_reports.latest()
+
+    def close(self) -> None:
+        """Release retained history and delete its spill files."""
+        self._journal.close()
+        self._phase_reports.close()
+
     @property
     def seniority_history(self) -> list[SenioritySnapshot]:
         """Return the recorded seniority order per month."""
@@ -806,6 +1160,16 @@ class GameSession:
         """Expose the current roster."""
         return tuple(self._players)
 
+    @property
+    def bank(self) -> Bank:
+        """Expose the central bank, including the current market."""
+        return self._bank
+
+    @property
+    def state(self) -> GameState:
+        """Expose the evolving rule snapshot."""
+        return self._state
+
     @staticmethod
     def _sort_players_buy(player: Player) -> tuple[float, int]:
         """Return a composite key for ordering buy bids.
@@ -847,6 +1211,7 @@ class GameSession:
 
             cash_before = player.money
             player.collect_expenses()
+            self._mark_dirty(player)
             self._log_phase_event(
                 "expenses_deducted",
                 {
@@ -869,6 +1234,7 @@ class GameSession:
             return
 
         self._bank.set_market()
+        self._mark_bank_dirty()
         self._log_phase_event(
             "market_announced",
             {
@@ -884,8 +1250,8 @@ class GameSession:
 
         Players are processed by the sort order provided in `_sort_players_buy`,
         prioritizing higher bid prices before falling back to turn priority.
-        Every successful purchase transfers money to the bank and grants the
-        player a fresh `RawMaterial` entry subject to ongoing expenses.
+        Every successful purchase transfers money to the bank and adds a unit
+        to the player's raw material stock, subject to ongoing expenses.
         """
         if self._is_finished:
             return
@@ -901,26 +1267,10 @@ class GameSession:
             if bid.price < self._bank.raw_material_sell_min_price:
                 continue
 
-            purchased = 0
-
-            while (
-                purchased < bid.quantity
-                and self._bank.raw_material_sell_volume > 0
-                and len(player.raw_materials) < self._state.max_raw_material_storage
-                and player.money >= bid.price
-            ):
-                self._bank.raw_material_sell_volume -= 1
-                self._bank.money += bid.price
-
-                player.money -= bid.price
-                player.raw_materials.append(
-                    RawMaterial(
-                        monthly_expenses=self._state.raw_material_monthly_expenses,
-                    )
-                )
-                purchased += 1
-
+            purchased = self._settle_buy_bid(player, bid)
             if purchased > 0:
+                self._mark_dirty(player)
+                self._mark_bank_dirty()
                 self._log_phase_event(
                     "buy_bid_fulfilled",
                     {
@@ -931,6 +1281,57 @@ class GameSession:
                     },
                 )
 
+    def _settle_buy_bid(self, player: Player, bid: Bid) -> int:
+        """Fill a buy bid in one step and return the number of units bought.
+
+        The filled quantity is bounded by the bid, the bank supply, the
+        player's storage headroom, and how many units the player can afford.
+        Money moves as a single debit and credit whenever integral amounts
+        make that exactly equal to paying unit by unit; otherwise the
+        per-unit loop is used so results stay bit-for-bit identical.
+        """
+        if bid.price > 0 and _is_exact_integral(
+            bid.price, player.money, self._bank.money
+        ):
+            purchased = max(
+                min(
+                    bid.quantity,
+                    self._bank.raw_material_sell_volume,
+                    self._state.max_raw_material_storage - player.raw_materials.count,
+                    int(player.money // bid.price),
+                ),
+                0,
+            )
+            total = purchased * bid.price
+            if _is_exact_integral(total, abs(self._bank.money) + total):
+                self._bank.raw_material_sell_volume -= purchased
+                self._bank.money += total
+                player.money -= total
+                player.raw_materials.add(purchased)
+                return purchased
+
+        return self._settle_buy_bid_per_unit(player, bid)
+
+    def _settle_buy_bid_per_unit(self, player: Player, bid: Bid) -> int:
+        """Fill a buy bid one unit at a time and return the units bought."""
+        purchased = 0
+
+        while (
+            purchased < bid.quantity
+            and self._bank.raw_material_sell_volume > 0
+            and player.raw_materials.count + purchased
+            < self._state.max_raw_material_storage
+            and player.money >= bid.price
+        ):
+            self._bank.raw_material_sell_volume -= 1
+            self._bank.money += bid.price
+
+            player.money -= bid.price
+            purchased += 1
+
+        player.raw_materials.add(purchased)
+        return purchased
+
     @staticmethod
     def _resolve_production_runs(
         *,
@@ -992,14 +1393,15 @@ class GameSession:
             if player.is_bankrupt:
                 continue
 
-            available_rm = len(player.raw_materials)
-            available_fg_space = self._state.max_finished_good_storage - len(
-                player.finished_goods
+            available_rm = player.raw_materials.count
+            available_fg_space = (
+                self._state.max_finished_good_storage - player.finished_goods.count
             )
 
             if available_rm <= 0 or available_fg_space <= 0:
                 continue
 
+            self._mark_dirty(player)
             basic_factories = sum(
                 1
                 for factory in player.factories
@@ -1053,21 +1455,16 @@ class GameSession:
             if total_units <= 0:
                 continue
 
-            del player.raw_materials[-total_units:]
-            player.finished_goods.extend(
-                FinishedGood(
-                    monthly_expenses=self._state.finished_good_monthly_expenses,
-                )
-                for _ in range(total_units)
-            )
+            player.raw_materials.remove(total_units)
+            player.finished_goods.add(total_units)
             self._log_phase_event(
                 "production_launched",
                 {
                     "player_id": player.id_,
                     "produced_units": total_units,
                     "launch_cost": basic_cost + auto_cost,
-                    "raw_materials_after": len(player.raw_materials),
-                    "finished_goods_after": len(player.finished_goods),
+                    "raw_materials_after": player.raw_materials.count,
+                    "finished_goods_after": player.finished_goods.count,
                 },
             )
 
@@ -1094,21 +1491,10 @@ class GameSession:
             if bid.price > self._bank.finished_good_buy_max_price:
                 continue
 
-            sold = 0
-
-            while (
-                sold < bid.quantity
-                and self._bank.finished_good_buy_volume > 0
-                and player.finished_goods
-            ):
-                self._bank.finished_good_buy_volume -= 1
-                self._bank.money -= bid.price
-
-                player.money += bid.price
-                player.finished_goods.pop()
-                sold += 1
-
+            sold = self._settle_sell_bid(player, bid)
             if sold > 0:
+                self._mark_dirty(player)
+                self._mark_bank_dirty()
                 self._log_phase_event(
                     "sell_bid_cleared",
                     {
@@ -1119,6 +1505,54 @@ class GameSession:
                     },
                 )
 
+    def _settle_sell_bid(self, player: Player, bid: Bid) -> int:
+        """Fill a sell bid in one step and return the number of units sold.
+
+        Mirrors `_settle_buy_bid`: the sold quantity is the smallest of the
+        bid, the bank demand, and the player's finished goods, and the cash
+        moves at once when that is exact for the amounts involved.
+        """
+        if _is_exact_integral(bid.price, player.money, self._bank.money):
+            sold = max(
+                min(
+                    bid.quantity,
+                    self._bank.finished_good_buy_volume,
+                    player.finished_goods.count,
+                ),
+                0,
+            )
+            total = sold * bid.price
+            if _is_exact_integral(
+                total,
+                abs(player.money) + abs(total),
+                abs(self._bank.money) + abs(total),
+            ):
+                self._bank.finished_good_buy_volume -= sold
+                self._bank.money -= total
+                player.money += total
+                player.finished_goods.remove(sold)
+                return sold
+
+        return self._settle_sell_bid_per_unit(player, bid)
+
+    def _settle_sell_bid_per_unit(self, player: Player, bid: Bid) -> int:
+        """Fill a sell bid one unit at a time and return the units sold."""
+        sold = 0
+
+        while (
+            sold < bid.quantity
+            and self._bank.finished_good_buy_volume > 0
+            and sold < player.finished_goods.count
+        ):
+            self._bank.finished_good_buy_volume -= 1
+            self._bank.money -= bid.price
+
+            player.money += bid.price
+            sold += 1
+
+        player.finished_goods.remove(sold)
+        return sold
+
     def process_loans(self) -> None:
         """Update loan balances, collect repayments, and fund new calls.
 
@@ -1141,6 +1575,9 @@ class GameSession:
             if all(loan.loan_status == "idle" for loan in player.loans):
                 continue
 
+            self._mark_dirty(player)
+            self._mark_bank_dirty()
+
             for loan in player.loans:
                 if loan.loan_status != "in_progress":
                     continue
@@ -1250,6 +1687,7 @@ class GameSession:
             if player.is_bankrupt:
                 continue
 
+            self._mark_dirty(player)
             for factory in list(player.factories):
                 if (
                     factory.next_payment_month is not None
@@ -1470,6 +1908,7 @@ class GameSession:
         for player in self._players:
             if player.money < 0:
                 player.is_bankrupt = True
+                self._mark_dirty(player)
 
             player.priority -= 1
 
@@ -0,0 +1,441 @@
+"""Headless batch simulation used to balance game settings offline."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from math import ceil, floor
+from pathlib import Path
+from random import Random
+from typing import TYPE_CHECKING, Protocol
+
+from fabricat_backend.game_logic.phases import PHASE_SEQUENCE, GamePhase
+from fabricat_backend.game_logic.session import (
+    Bid,
+    GameSession,
+    GameSettings,
+    Player,
+    PlayerFinalStats,
+    default_game_settings,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+DEFAULT_START_MONEY = 10_000.0
+MAX_SEATS = 4
+DEFAULT_STRATEGIES: tuple[str, ...] = ("producer", "producer", "random", "passive")
+
+
+class PlayerStrategy(Protocol):
+    """Scripted decision maker that fills in a player's orders for a phase."""
+
+    def act(self, phase: GamePhase, player: Player, session: GameSession) -> None:
+        """Mutate the player's pending orders before the phase resolves."""
+
+
+class PassiveStrategy:
+    """Never trades, produces, borrows, or builds."""
+
+    def act(self, phase: GamePhase, player: Player, session: GameSession) -> None:
+        """Leave the player's orders untouched."""
+
+
+class ProducerStrategy:
+    """Runs every profitable factory at full capacity and sells the output.
+
+    A factory type is only used when selling its output at the announced
+    maximum price covers the raw materials and the launch cost. Raw materials
+    are bought at the minimum price up to what those factories can process,
+    finished goods are offered at the bank's maximum price, and a basic
+    factory is commissioned whenever cash comfortably covers its cost. With
+    ``borrow`` enabled every idle loan slot is called each month.
+    """
+
+    def __init__(self, *, expansion_reserve: float = 2.0, borrow: bool = False) -> None:
+        self._expansion_reserve = expansion_reserve
+        self._borrow = borrow
+
+    @staticmethod
+    def _capacity(player: Player, session: GameSession) -> tuple[int, int]:
+        """Return the units per month the profitable factories can produce."""
+        state = session.state
+        bank = session.bank
+        margin = bank.finished_good_buy_max_price - bank.raw_material_sell_min_price
+
+        basic = 0
+        if margin * state.basic_factory_production > state.basic_factory_launch_cost:
+            basic = state.basic_factory_production * sum(
+                1
+                for factory in player.factories
+                if factory.factory_type in {"basic", "upgrades"}
+            )
+        auto = 0
+        if margin * state.auto_factory_production > state.auto_factory_launch_cost:
+            auto = state.auto_factory_production * sum(
+                1 for factory in player.factories if factory.factory_type == "auto"
+            )
+        return basic, auto
+
+    def act(self, phase: GamePhase, player: Player, session: GameSession) -> None:
+        """Fill in the orders that keep the production line busy."""
+        state = session.state
+        bank = session.bank
+        match phase:
+            case GamePhase.BUY:
+                basic, auto = self._capacity(player, session)
+                headroom = state.max_raw_material_storage - player.raw_materials.count
+                quantity = max(
+                    min(basic + auto - player.raw_materials.count, headroom), 0
+                )
+                player.buy_bid = Bid(
+                    quantity=quantity,
+                    price=float(ceil(bank.raw_material_sell_min_price)),
+                )
+            case GamePhase.PRODUCTION:
+                basic, auto = self._capacity(player, session)
+                player.production_call_for_basic = basic
+                player.production_call_for_auto = auto
+            case GamePhase.SELL:
+                player.sell_bid = Bid(
+                    quantity=player.finished_goods.count,
+                    price=float(floor(bank.finished_good_buy_max_price)),
+                )
+            case GamePhase.CONSTRUCTION:
+                can_expand = (
+                    len(player.factories) < state.max_factories
+                    and player.money >= state.build_basic_cost * self._expansion_reserve
+                )
+                player.build_or_upgrade_call = "build_basic" if can_expand else "idle"
+            case GamePhase.LOANS if self._borrow:
+                for loan in player.loans:
+                    if loan.loan_status == "idle":
+                        loan.loan_status = "call"
+            case _:
+                return
+
+
+class RandomStrategy:
+    """Places seeded random orders, useful as noisy opposition."""
+
+    def __init__(self, *, rng: Random) -> None:
+        self._rng = rng
+
+    def act(self, phase: GamePhase, player: Player, session: GameSession) -> None:
+        """Pick a random order for the phase."""
+        bank = session.bank
+        match phase:
+            case GamePhase.BUY:
+                player.buy_bid = Bid(
+                    quantity=self._rng.randint(
+                        0, session.state.max_raw_material_storage
+                    ),
+                    price=float(ceil(bank.raw_material_sell_min_price))
+                    + self._rng.randint(0, 100),
+                )
+            case GamePhase.PRODUCTION:
+                player.production_call_for_basic = self._rng.randint(0, 4)
+                player.production_call_for_auto = self._rng.randint(0, 4)
+            case GamePhase.SELL:
+                player.sell_bid = Bid(
+                    quantity=self._rng.randint(0, player.finished_goods.count),
+                    price=float(floor(bank.finished_good_buy_max_price))
+                    - self._rng.randint(0, 100),
+                )
+            case GamePhase.LOANS:
+                for loan in player.loans:
+                    if loan.loan_status == "idle" and self._rng.random() < 0.1:  # noqa: PLR2004
+                        loan.loan_status = "call"
+            case GamePhase.CONSTRUCTION:
+                player.build_or_upgrade_call = self._rng.choice(
+                    ["idle", "idle", "idle", "build_basic", "build_auto", "upgrade"]
+                )
+            case _:
+                return
+
+
+STRATEGY_FACTORIES: dict[str, Callable[[Random], PlayerStrategy]] = {
+    "passive": lambda _rng: PassiveStrategy(),
+    "producer": lambda _rng: ProducerStrategy(),
+    "borrower": lambda _rng: ProducerStrategy(borrow=True),
+    "random": lambda rng: RandomStrategy(rng=rng),
+}
+
+
+def build_strategies(names: Sequence[str], *, seed: int) -> list[PlayerStrategy]:
+    """Instantiate named strategies with per-game deterministic randomness."""
+    strategies: list[PlayerStrategy] = []
+    for seat, name in enumerate(names):
+        try:
+            factory = STRATEGY_FACTORIES[name]
+        except KeyError as exc:
+            msg = f"Unknown strategy: {name}"
+            raise ValueError(msg) from exc
+        strategies.append(factory(Random(seed * 31 + seat)))
+    return strategies
+
+
+def simulate_game(
+    settings: GameSettings,
+    strategies: Sequence[PlayerStrategy],
+    *,
+    seed: int,
+    start_money: float = DEFAULT_START_MONEY,
+) -> list[PlayerFinalStats]:
+    """Play one game to completion and return its final standings.
+
+    Player ``i`` (1-based) is controlled by ``strategies[i - 1]``. Phases are
+    advanced headlessly, so no reports or journal entries are retained.
+    """
+    seeded = settings.model_copy(update={"rng_seed": seed})
+    players = [
+        Player(id_=idx, money=start_money, priority=idx)
+        for idx in range(1, len(strategies) + 1)
+    ]
+    session = GameSession(players=players, settings=seeded)
+    seats = list(zip(players, strategies, strict=True))
+
+    while not session.is_finished:
+        for phase in PHASE_SEQUENCE:
+            for player, strategy in seats:
+                if not player.is_bankrupt:
+                    strategy.act(phase, player, session)
+            session.advance_phase(phase)
+            if session.is_finished:
+                break
+
+    return session.build_final_player_stats()
+
+
+@dataclass(slots=True)
+class SeatSummary:
+    """Aggregated outcomes for one strategy seat across many games."""
+
+    strategy: str
+    games: int = 0
+    wins: int = 0
+    bankruptcies: int = 0
+    total_capital: float = 0.0
+    total_place: int = 0
+
+    def add(self, stats: PlayerFinalStats) -> None:
+        """Fold a single game's result into the summary."""
+        self.games += 1
+        self.wins += int(stats.is_top1)
+        self.bankruptcies += int(stats.is_bankrupt)
+        self.total_capital += stats.capital
+        self.total_place += stats.place
+
+    def merge(self, other: SeatSummary) -> None:
+        """Combine partial summaries computed by different workers."""
+        self.games += other.games
+        self.wins += other.wins
+        self.bankruptcies += other.bankruptcies
+        self.total_capital += other.total_capital
+        self.total_place += other.total_place
+
+    def to_dict(self) -> dict[str, float | int | str]:
+        """Return totals together with derived rates and averages."""
+        games = max(self.games, 1)
+        return {
+            **asdict(self),
+            "win_rate": self.wins / games,
+            "bankruptcy_rate": self.bankruptcies / games,
+            "average_capital": self.total_capital / games,
+            "average_place": self.total_place / games,
+        }
+
+
+@dataclass(slots=True)
+class SimulationSummary:
+    """Batch-level aggregate of `build_final_player_stats` outcomes."""
+
+    games: int = 0
+    seats: list[SeatSummary] = field(default_factory=list)
+
+    def merge(self, other: SimulationSummary) -> None:
+        """Combine another partial batch into this one."""
+        if not self.seats:
+            self.seats = [SeatSummary(strategy=seat.strategy) for seat in other.seats]
+        self.games += other.games
+        for mine, theirs in zip(self.seats, other.seats, strict=True):
+            mine.merge(theirs)
+
+    def to_dict(self) -> dict[str, object]:
+        """Return a JSON-serializable view of the summary."""
+        return {
+            "games": self.games,
+            "seats": [seat.to_dict() for seat in self.seats],
+        }
+
+
+def _simulate_seeds(
+    settings_payload: dict[str, object],
+    strategy_names: tuple[str, ...],
+    seeds: range,
+    start_money: float,
+) -> SimulationSummary:
+    """Worker entry point that simulates a contiguous block of seeds."""
+    settings = GameSettings.model_validate(settings_payload)
+    summary = SimulationSummary(
+        seats=[SeatSummary(strategy=name) for name in strategy_names],
+    )
+    for seed in seeds:
+        stats = simulate_game(
+            settings,
+            build_strategies(strategy_names, seed=seed),
+            seed=seed,
+            start_money=start_money,
+        )
+        summary.games += 1
+        for result in stats:
+            summary.seats[result.player_id - 1].add(result)
+    return summary
+
+
+def run_batch(  # noqa: PLR0913
+    *,
+    games: int,
+    settings: GameSettings | None = None,
+    strategy_names: Sequence[str] = DEFAULT_STRATEGIES,
+    base_seed: int = 0,
+    workers: int = 1,
+    start_money: float = DEFAULT_START_MONEY,
+) -> SimulationSummary:
+    """Simulate ``games`` seeded games, optionally across a process pool.
+
+    Game ``i`` uses seed ``base_seed + i``, so results do not depend on the
+    number of workers.
+    """
+    if games < 0:
+        msg = "Number of games must be non-negative."
+        raise ValueError(msg)
+    names = tuple(strategy_names)
+    if not 1 <= len(names) <= MAX_SEATS:
+        msg = f"Between 1 and {MAX_SEATS} strategies are required."
+        raise ValueError(msg)
+    build_strategies(names, seed=base_seed)
+    payload = (settings or default_game_settings()).model_dump()
+
+    summary = SimulationSummary(seats=[SeatSummary(strategy=name) for name in names])
+    if workers <= 1 or games <= 1:
+        summary.merge(
+            _simulate_seeds(
+                payload, names, range(base_seed, base_seed + games), start_money
+            )
+        )
+        return summary
+
+    chunk = max(ceil(games / (workers * 4)), 1)
+    blocks = [
+        range(start, min(start + chunk, base_seed + games))
+        for start in range(base_seed, base_seed + games, chunk)
+    ]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_simulate_seeds, payload, names, block, start_money)
+            for block in blocks
+        ]
+        for future in futures:
+            summary.merge(future.result())
+    return summary
+
+
+def _load_settings(path: str | None, *, max_months: int | None) -> GameSettings:
+    """Overlay a JSON settings file and CLI overrides on top of the defaults."""
+    settings = default_game_settings()
+    if path is not None:
+        overrides = json.loads(Path(path).read_text(encoding="utf-8"))
+        settings = GameSettings.model_validate({**settings.model_dump(), **overrides})
+    if max_months is not None:
+        settings = settings.model_copy(update={"max_months": max_months})
+    return settings
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Command-line entry point for batch simulations."""
+    parser = argparse.ArgumentParser(
+        description="Play seeded Fabricat games headlessly and aggregate results.",
+    )
+    parser.add_argument("--games", type=int, default=1_000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--strategies",
+        default=None,
+        help=(
+            f"Comma-separated seats, choose from: {', '.join(STRATEGY_FACTORIES)}. "
+            f"Defaults to {','.join(DEFAULT_STRATEGIES)}; the vectorized engine "
+            "swaps the random seat for a borrower."
+        ),
+    )
+    parser.add_argument("--settings", help="JSON file with GameSettings overrides.")
+    parser.add_argument("--max-months", type=int, default=None)
+    parser.add_argument("--start-money", type=float, default=DEFAULT_START_MONEY)
+    parser.add_argument(
+        "--engine",
+        choices=("scalar", "vectorized"),
+        default="scalar",
+        help="The vectorized engine needs NumPy (the 'simulation' extra).",
+    )
+    args = parser.parse_args(argv)
+    settings = _load_settings(args.settings, max_months=args.max_months)
+    names = list(DEFAULT_STRATEGIES)
+    if args.strategies is not None:
+        names = [name.strip() for name in args.strategies.split(",")]
+
+    if args.engine == "vectorized":
+        from fabricat_backend.game_logic.vectorized import (  # noqa: PLC0415
+            DEFAULT_VECTORIZED_STRATEGIES,
+            simulate_vectorized,
+        )
+
+        if args.strategies is None:
+            names = list(DEFAULT_VECTORIZED_STRATEGIES)
+        try:
+            outcome = simulate_vectorized(
+                settings,
+                names,
+                sessions=args.games,
+                seed=args.seed,
+                start_money=args.start_money,
+            )
+        except ValueError as exc:
+            parser.error(str(exc))
+        summary = outcome.summary()
+    else:
+        summary = run_batch(
+            games=args.games,
+            settings=settings,
+            strategy_names=names,
+            base_seed=args.seed,
+            workers=args.workers,
+            start_money=args.start_money,
+        )
+    sys.stdout.write(json.dumps(summary.to_dict(), indent=2) + "\n")
+
+
+__all__ = [
+    "DEFAULT_START_MONEY",
+    "DEFAULT_STRATEGIES",
+    "MAX_SEATS",
+    "STRATEGY_FACTORIES",
+    "PassiveStrategy",
+    "PlayerStrategy",
+    "ProducerStrategy",
+    "RandomStrategy",
+    "SeatSummary",
+    "SimulationSummary",
+    "build_strategies",
+    "main",
+    "run_batch",
+    "simulate_game",
+]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,583 @@
+"""Vectorized Monte Carlo engine that plays thousands of sessions at once.
+
+The engine applies the monthly rules of `GameSession` as NumPy array
+operations: every array has one row per independent session and one column
+per player (with a trailing axis for factory and loan slots). Markets are
+drawn from a NumPy generator instead of `random.Random`, so individual games
+differ from the scalar engine while the distribution of outcomes matches it.
+
+Only scripted seats whose decisions can be expressed as array operations are
+supported, see `VECTORIZED_STRATEGIES`. NumPy is an optional dependency that
+ships with the ``simulation`` extra.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from fabricat_backend.game_logic.session import (
+    AUTO_FACTORY_PRODUCTION,
+    BASIC_FACTORY_PRODUCTION,
+)
+from fabricat_backend.game_logic.simulation import (
+    DEFAULT_START_MONEY,
+    MAX_SEATS,
+    SeatSummary,
+    SimulationSummary,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from numpy.typing import NDArray
+
+    from fabricat_backend.game_logic.session import GameSettings
+
+VECTORIZED_STRATEGIES: tuple[str, ...] = ("passive", "producer", "borrower")
+DEFAULT_VECTORIZED_STRATEGIES: tuple[str, ...] = (
+    "producer",
+    "producer",
+    "borrower",
+    "passive",
+)
+
+_EXPANSION_RESERVE = 2.0
+
+_BASIC = 1
+_AUTO = 2
+_BUILDS_BASIC = 3
+_BUILDS_AUTO = 4
+_UPGRADES = 5
+
+_IDLE = 0
+_CALL = 1
+_IN_PROGRESS = 2
+
+
+def _ceil_div(numerator: NDArray[np.int64], denominator: int) -> NDArray[np.int64]:
+    """Return ``ceil(numerator / denominator)`` for non-negative integers."""
+    return -(-numerator // denominator)
+
+
+def _pay(
+    money: NDArray[np.float64],
+    bankrupt: NDArray[np.bool_],
+    amount: NDArray[np.float64],
+    mask: NDArray[np.bool_],
+) -> NDArray[np.bool_]:
+    """Apply `Player.pay` in place where ``mask`` holds.
+
+    Returns ``False`` for players whose payment failed and who were therefore
+    zeroed out and declared bankrupt.
+    """
+    charge = mask & (amount > 0)
+    short = charge & (money < amount)
+    np.subtract(money, amount, out=money, where=charge & ~short)
+    money[short] = 0.0
+    bankrupt |= short
+    return ~short
+
+
+@dataclass(slots=True)
+class VectorizedOutcome:
+    """Final standings of a batch, one row per session and column per seat."""
+
+    strategies: tuple[str, ...]
+    capital: NDArray[np.float64]
+    place: NDArray[np.int64]
+    bankrupt: NDArray[np.bool_]
+    completed_months: NDArray[np.int64]
+
+    @property
+    def sessions(self) -> int:
+        """Return the number of simulated sessions."""
+        return int(self.capital.shape[0])
+
+    def summary(self) -> SimulationSummary:
+        """Aggregate the batch into the scalar engine's summary format."""
+        seats = [
+            SeatSummary(
+                strategy=name,
+                games=self.sessions,
+                wins=int((self.place[:, seat] == 1).sum()),
+                bankruptcies=int(self.bankrupt[:, seat].sum()),
+                total_capital=float(self.capital[:, seat].sum()),
+                total_place=int(self.place[:, seat].sum()),
+            )
+            for seat, name in enumerate(self.strategies)
+        ]
+        return SimulationSummary(games=self.sessions, seats=seats)
+
+
+class _SessionBatch:
+    """Array state of many sessions advancing through the month in lockstep.
+
+    Each method mirrors the `GameSession` phase handler of the same name,
+    including the order in which players pay and the early exits taken when a
+    payment bankrupts a player. Seat decisions follow `ProducerStrategy` with
+    its default reserve. Finished sessions are frozen by masking.
+    """
+
+    def __init__(
+        self,
+        settings: GameSettings,
+        strategy_names: tuple[str, ...],
+        *,
+        sessions: int,
+        rng: np.random.Generator,
+        start_money: float,
+    ) -> None:
+        self.settings = settings
+        self.rng = rng
+        self.month = 1
+
+        players = len(strategy_names)
+        slots = max(settings.max_factories, settings.start_factory_count)
+        loans = len(settings.available_loans)
+        shape = (sessions, players)
+        names = np.array(strategy_names)
+        self.players = players
+        self.producers = np.broadcast_to(names != "passive", shape)
+        self.borrowers = np.broadcast_to(names == "borrower", shape)
+
+        self.finished = np.zeros(sessions, dtype=bool)
+        self.completed_months = np.zeros(sessions, dtype=np.int64)
+        self.money = np.full(shape, start_money, dtype=np.float64)
+        self.bankrupt = np.zeros(shape, dtype=bool)
+        self.priority = rng.permuted(
+            np.tile(np.arange(1, players + 1, dtype=np.int64), (sessions, 1)),
+            axis=1,
+        )
+        self.raw = np.zeros(shape, dtype=np.int64)
+        self.finished_goods = np.zeros(shape, dtype=np.int64)
+
+        self.factory_type = np.zeros((*shape, slots), dtype=np.int64)
+        self.factory_type[:, :, : settings.start_factory_count] = _BASIC
+        self.factory_expenses = np.where(
+            self.factory_type == _BASIC, settings.basic_factory_monthly_expenses, 0.0
+        )
+        self.factory_due = np.zeros((*shape, slots), dtype=np.int64)
+        self.payment_month = np.zeros((*shape, slots), dtype=np.int64)
+        self.payment_amount = np.zeros((*shape, slots), dtype=np.float64)
+        self.factory_count = np.full(shape, settings.start_factory_count)
+
+        self.loan_amount = np.zeros((*shape, loans), dtype=np.float64)
+        self.loan_return = np.zeros((*shape, loans), dtype=np.int64)
+        self.loan_status = np.zeros((*shape, loans), dtype=np.int64)
+
+        self.loan_nominals = np.array(settings.available_loans, dtype=np.float64)
+        self.loan_terms = np.array(settings.loan_terms_in_months, dtype=np.int64)
+        self.bank_money = np.full(sessions, settings.bank_start_money)
+        self.bank_loans = np.tile(self.loan_nominals, (sessions, 1))
+        self.raw_volume = np.zeros(sessions, dtype=np.int64)
+        self.finished_volume = np.zeros(sessions, dtype=np.int64)
+        self.min_price = np.zeros(sessions, dtype=np.float64)
+        self.max_price = np.zeros(sessions, dtype=np.float64)
+
+    def _live(self) -> NDArray[np.bool_]:
+        """Return players that are solvent in a session still being played."""
+        return ~self.finished[:, None] & ~self.bankrupt
+
+    def _pay(
+        self, amount: NDArray[np.float64], mask: NDArray[np.bool_]
+    ) -> NDArray[np.bool_]:
+        return _pay(self.money, self.bankrupt, amount, mask)
+
+    def _evaluate_game_completion(self) -> None:
+        active = (~self.bankrupt).sum(axis=1)
+        eliminated = (self.players > 1) & (active <= 1)
+        timed_out = self.month - 1 >= self.settings.max_months
+        newly = ~self.finished & (eliminated | timed_out)
+        self.completed_months[newly] = max(self.month - 1, 0)
+        self.finished |= newly
+
+    def _priority_order(self) -> NDArray[np.int64]:
+        """Return player columns sorted by seniority for every session."""
+        return np.argsort(self.priority, axis=1, kind="stable")
+
+    def _capacity(self) -> tuple[NDArray[np.int64], NDArray[np.int64]]:
+        """Vectorized `ProducerStrategy._capacity`."""
+        state = self.settings
+        margin = (self.max_price - self.min_price)[:, None]
+        basic_factories = np.isin(self.factory_type, (_BASIC, _UPGRADES)).sum(axis=2)
+        auto_factories = (self.factory_type == _AUTO).sum(axis=2)
+        basic = np.where(
+            margin * BASIC_FACTORY_PRODUCTION > state.basic_factory_launch_cost,
+            BASIC_FACTORY_PRODUCTION * basic_factories,
+            0,
+        )
+        auto = np.where(
+            margin * AUTO_FACTORY_PRODUCTION > state.auto_factory_launch_cost,
+            AUTO_FACTORY_PRODUCTION * auto_factories,
+            0,
+        )
+        return basic, auto
+
+    def collect_expenses(self) -> None:
+        live = self._live()
+        for slot in range(self.factory_type.shape[2]):
+            live &= self._pay(self.factory_expenses[:, :, slot], live)
+        raw_upkeep = self.raw * self.settings.raw_material_monthly_expenses
+        live &= self._pay(raw_upkeep.astype(np.float64, copy=False), live)
+        finished_upkeep = (
+            self.finished_goods * self.settings.finished_good_monthly_expenses
+        )
+        self._pay(finished_upkeep.astype(np.float64, copy=False), live)
+        self._evaluate_game_completion()
+
+    def set_market(self) -> None:
+        state = self.settings
+        running = ~self.finished
+        sessions = running.size
+        raw_low, raw_high = state.bank_raw_material_sell_volume_range
+        fin_low, fin_high = state.bank_finished_good_buy_volume_range
+        min_low, min_high = state.bank_raw_material_sell_min_price_range
+        max_low, max_high = state.bank_finished_good_buy_max_price_range
+        draws = (
+            self.rng.integers(raw_low, raw_high + 1, size=sessions),
+            self.rng.integers(fin_low, fin_high + 1, size=sessions),
+            self.rng.uniform(min_low, min_high, size=sessions),
+            self.rng.uniform(max_low, max_high, size=sessions),
+        )
+        self.raw_volume = np.where(running, draws[0], self.raw_volume)
+        self.finished_volume = np.where(running, draws[1], self.finished_volume)
+        self.min_price = np.where(running, draws[2], self.min_price)
+        self.max_price = np.where(running, draws[3], self.max_price)
+
+    def process_buy_bids(self) -> None:
+        """Settle producer bids, which share a price, in seniority order."""
+        basic, auto = self._capacity()
+        headroom = self.settings.max_raw_material_storage - self.raw
+        quantity = np.maximum(np.minimum(basic + auto - self.raw, headroom), 0)
+        quantity = np.where(self.producers & self._live(), quantity, 0)
+        price = np.ceil(self.min_price)
+        unit_price = np.where(price > 0, price, 1.0)
+        rows = np.arange(price.size)
+
+        for column in self._priority_order().T:
+            affordable = (self.money[rows, column] // unit_price).astype(np.int64)
+            filled = np.minimum.reduce(
+                [
+                    quantity[rows, column],
+                    self.raw_volume,
+                    headroom[rows, column],
+                    affordable,
+                ]
+            )
+            filled = np.maximum(filled, 0)
+            total = filled * price
+            self.raw_volume -= filled
+            self.bank_money += total
+            self.money[rows, column] -= total
+            self.raw[rows, column] += filled
+
+    def _resolve_production_runs(
+        self,
+        requested: NDArray[np.int64],
+        factories: NDArray[np.int64],
+        units_per_factory: int,
+        launch_cost: float,
+    ) -> tuple[NDArray[np.int64], NDArray[np.float64]]:
+        """Vectorized `GameSession._resolve_production_runs`."""
+        space = self.settings.max_finished_good_storage - self.finished_goods
+        max_units = np.minimum.reduce(
+            [requested, factories * units_per_factory, self.raw, space]
+        )
+        runs_needed = _ceil_div(np.maximum(max_units, 0), units_per_factory)
+        if launch_cost <= 0:
+            affordable = runs_needed
+        else:
+            affordable = np.minimum(
+                runs_needed, (self.money // launch_cost).astype(np.int64)
+            )
+        valid = (
+            (requested > 0)
+            & (factories > 0)
+            & (self.raw > 0)
+            & (space > 0)
+            & (max_units > 0)
+            & (affordable > 0)
+        )
+        produced = np.where(
+            valid, np.minimum(max_units, affordable * units_per_factory), 0
+        )
+        cost = _ceil_div(produced, units_per_factory) * launch_cost
+        return produced, cost.astype(np.float64, copy=False)
+
+    def start_production(self) -> None:
+        state = self.settings
+        basic_call, auto_call = self._capacity()
+        live = self._live() & self.producers
+        basic_factories = np.isin(self.factory_type, (_BASIC, _UPGRADES)).sum(axis=2)
+        auto_factories = (self.factory_type == _AUTO).sum(axis=2)
+
+        for call, factories, units_per_factory, launch_cost in (
+            (
+                basic_call,
+                basic_factories,
+                BASIC_FACTORY_PRODUCTION,
+                state.basic_factory_launch_cost,
+            ),
+            (
+                auto_call,
+                auto_factories,
+                AUTO_FACTORY_PRODUCTION,
+                state.auto_factory_launch_cost,
+            ),
+        ):
+            units, cost = self._resolve_production_runs(
+                np.where(live, call, 0), factories, units_per_factory, launch_cost
+            )
+            launched = live & (units > 0)
+            launched &= self._pay(cost, launched)
+            units = np.where(launched, units, 0)
+            self.raw -= units
+            self.finished_goods += units
+        self._evaluate_game_completion()
+
+    def process_sell_bids(self) -> None:
+        """Settle producer offers, which share a price, in seniority order."""
+        quantity = np.where(self.producers & self._live(), self.finished_goods, 0)
+        price = np.floor(self.max_price)
+        rows = np.arange(price.size)
+
+        for column in self._priority_order().T:
+            sold = np.maximum(
+                np.minimum.reduce(
+                    [
+                        quantity[rows, column],
+                        self.finished_volume,
+                        self.finished_goods[rows, column],
+                    ]
+                ),
+                0,
+            )
+            total = sold * price
+            self.finished_volume -= sold
+            self.bank_money -= total
+            self.money[rows, column] += total
+            self.finished_goods[rows, column] -= sold
+
+    def process_loans(self) -> None:
+        calling = self.borrowers & self._live()
+        self.loan_status[calling[:, :, None] & (self.loan_status == _IDLE)] = _CALL
+
+        rate = self.settings.loans_monthly_expenses_in_percents
+        rows = np.arange(self.finished.size)
+        for column in self._priority_order().T:
+            live = self._live()[rows, column]
+            status = self.loan_status[rows, column]
+            amount = self.loan_amount[rows, column]
+            money = self.money[rows, column]
+            bankrupt = self.bankrupt[rows, column]
+
+            for slot in range(status.shape[1]):
+                interest = amount[:, slot] * rate
+                due = live & (status[:, slot] == _IN_PROGRESS) & (interest > 0)
+                paid = _pay(money, bankrupt, interest, due)
+                self.bank_money += np.where(due & paid, interest, 0.0)
+                live &= paid
+
+            for slot in range(status.shape[1]):
+                due = (
+                    live
+                    & (status[:, slot] == _IN_PROGRESS)
+                    & (self.loan_return[rows, column, slot] == self.month)
+                )
+                paid = _pay(money, bankrupt, amount[:, slot], due)
+                repaid = due & paid
+                self.bank_money += np.where(repaid, amount[:, slot], 0.0)
+                amount[repaid, slot] = 0.0
+                status[repaid, slot] = _IDLE
+                self.loan_return[rows[repaid], column[repaid], slot] = 0
+                self.bank_loans[repaid, slot] = self.loan_nominals[slot]
+                live &= paid
+
+            for slot in range(status.shape[1]):
+                offered = self.bank_loans[:, slot]
+                issued = (
+                    live
+                    & (status[:, slot] == _CALL)
+                    & (offered > 0)
+                    & (self.bank_money >= offered)
+                )
+                amount[issued, slot] = offered[issued]
+                status[issued, slot] = _IN_PROGRESS
+                self.loan_return[rows[issued], column[issued], slot] = (
+                    self.month + self.loan_terms[slot]
+                )
+                money[issued] += offered[issued]
+                self.bank_money[issued] -= offered[issued]
+                self.bank_loans[issued, slot] = 0.0
+
+            self.loan_status[rows, column] = status
+            self.loan_amount[rows, column] = amount
+            self.money[rows, column] = money
+            self.bankrupt[rows, column] = bankrupt
+        self._evaluate_game_completion()
+
+    def build_or_upgrade(self) -> None:
+        state = self.settings
+        expand = (
+            self.producers
+            & self._live()
+            & (self.factory_count < state.max_factories)
+            & (self.money >= state.build_basic_cost * _EXPANSION_RESERVE)
+        )
+
+        live = self._live()
+        for slot in range(self.factory_type.shape[2]):
+            due = (
+                live
+                & (self.payment_month[:, :, slot] > 0)
+                & (self.payment_amount[:, :, slot] > 0)
+                & (self.month >= self.payment_month[:, :, slot])
+            )
+            paid = self._pay(self.payment_amount[:, :, slot], due)
+            cleared = due & paid
+            self.payment_month[:, :, slot][cleared] = 0
+            self.payment_amount[:, :, slot][cleared] = 0.0
+            live &= paid
+
+            kind = self.factory_type[:, :, slot]
+            completed = live & (self.factory_due[:, :, slot] == self.month)
+            built_basic = completed & (kind == _BUILDS_BASIC)
+            built_auto = completed & np.isin(kind, (_BUILDS_AUTO, _UPGRADES))
+            kind[built_basic] = _BASIC
+            kind[built_auto] = _AUTO
+            self.factory_expenses[:, :, slot][built_basic] = (
+                state.basic_factory_monthly_expenses
+            )
+            self.factory_expenses[:, :, slot][built_auto] = (
+                state.auto_factory_monthly_expenses
+            )
+            self.factory_due[:, :, slot][built_basic | built_auto] = 0
+            self.payment_month[:, :, slot][built_basic | built_auto] = 0
+            self.payment_amount[:, :, slot][built_basic | built_auto] = 0.0
+
+        initial_payment = state.build_basic_cost * state.build_basic_payment_share
+        start = expand & live & (self.money >= initial_payment)
+        start &= self._pay(np.full_like(self.money, initial_payment), start)
+        sessions, players = np.nonzero(start)
+        slots = self.factory_count[sessions, players]
+        end_month = self.month + state.month_for_build_basic
+        remaining = max(state.build_basic_cost - initial_payment, 0.0)
+        self.factory_type[sessions, players, slots] = _BUILDS_BASIC
+        self.factory_expenses[sessions, players, slots] = (
+            state.basic_factory_monthly_expenses
+        )
+        self.factory_due[sessions, players, slots] = end_month
+        if remaining > 0:
+            self.payment_month[sessions, players, slots] = max(
+                self.month + 1, end_month - state.build_basic_final_payment_offset
+            )
+            self.payment_amount[sessions, players, slots] = remaining
+        self.factory_count[sessions, players] += 1
+        self._evaluate_game_completion()
+
+    def end_month(self) -> None:
+        running = ~self.finished[:, None]
+        self.bankrupt |= running & (self.money < 0)
+        rotated = np.where(self.priority <= 1, self.players, self.priority - 1)
+        self.priority = np.where(running, rotated, self.priority)
+        self.month += 1
+        self._evaluate_game_completion()
+
+    def calculate_capital(self) -> NDArray[np.float64]:
+        """Vectorized `GameSession.calculate_capital`."""
+        state = self.settings
+        factory_value = np.select(
+            [
+                np.isin(self.factory_type, (_AUTO, _BUILDS_AUTO)),
+                np.isin(self.factory_type, (_BASIC, _BUILDS_BASIC, _UPGRADES)),
+            ],
+            [state.build_auto_cost, state.build_basic_cost],
+            0.0,
+        ).sum(axis=2)
+        outstanding = np.maximum(self.payment_amount, 0.0).sum(axis=2)
+        loan_debt = np.where(
+            self.loan_status == _IN_PROGRESS, self.loan_amount, 0.0
+        ).sum(axis=2)
+        return (
+            self.money
+            + factory_value
+            + self.raw * self.min_price[:, None]
+            + self.finished_goods * self.max_price[:, None]
+            - loan_debt
+            - outstanding
+        )
+
+    def final_places(self, capital: NDArray[np.float64]) -> NDArray[np.int64]:
+        """Rank players like `GameSession.build_final_player_stats`."""
+        seats = np.broadcast_to(np.arange(self.players), capital.shape)
+        order = np.lexsort((seats, self.priority, -capital, self.bankrupt), axis=1)
+        place = np.empty_like(order)
+        np.put_along_axis(place, order, np.arange(1, self.players + 1)[None, :], axis=1)
+        return place
+
+
+def simulate_vectorized(
+    settings: GameSettings,
+    strategy_names: Sequence[str],
+    *,
+    sessions: int,
+    seed: int = 0,
+    start_money: float = DEFAULT_START_MONEY,
+) -> VectorizedOutcome:
+    """Play ``sessions`` independent games in lockstep and return the standings.
+
+    Seat ``i`` is controlled by ``strategy_names[i]`` in every session, the
+    same layout `simulate_game` uses for player ``i + 1``.
+    """
+    names = tuple(strategy_names)
+    if not 1 <= len(names) <= MAX_SEATS:
+        msg = f"Between 1 and {MAX_SEATS} strategies are required."
+        raise ValueError(msg)
+    unsupported = sorted(set(names) - set(VECTORIZED_STRATEGIES))
+    if unsupported:
+        msg = f"Strategies not supported by the vectorized engine: {unsupported}"
+        raise ValueError(msg)
+    if sessions < 0:
+        msg = "Number of sessions must be non-negative."
+        raise ValueError(msg)
+
+    batch = _SessionBatch(
+        settings,
+        names,
+        sessions=sessions,
+        rng=np.random.default_rng(seed),
+        start_money=start_money,
+    )
+    handlers = (
+        batch.collect_expenses,
+        batch.set_market,
+        batch.process_buy_bids,
+        batch.start_production,
+        batch.process_sell_bids,
+        batch.process_loans,
+        batch.build_or_upgrade,
+        batch.end_month,
+    )
+    while not batch.finished.all():
+        for handler in handlers:
+            handler()
+
+    capital = batch.calculate_capital()
+    return VectorizedOutcome(
+        strategies=names,
+        capital=capital,
+        place=batch.final_places(capital),
+        bankrupt=batch.bankrupt.copy(),
+        completed_months=batch.completed_months,
+    )
+
+
+__all__ = [
+    "DEFAULT_VECTORIZED_STRATEGIES",
+    "VECTORIZED_STRATEGIES",
+    "VectorizedOutcome",
+    "simulate_vectorized",
+]
@@ -1,5 +1,9 @@
 """Shared utilities, shared models and cross-cutting helpers for the backend."""
 
-from fabricat_backend.shared.enums import AvatarIcon
+from fabricat_backend.shared.enums import (
+    AvatarIcon,
+    LeaderboardMetric,
+    LeaderboardWindow,
+)
 
-__all__ = ["AvatarIcon"]
+__all__ = ["AvatarIcon", "LeaderboardMetric", "LeaderboardWindow"]
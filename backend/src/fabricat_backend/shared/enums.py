@@ -16,3 +16,23 @@ class AvatarIcon(StrEnum):
     INVENTOR = "inventor"
     PILOT = "pilot"
     SCIENTIST = "scientist"
+
+
+class LeaderboardMetric(StrEnum):
+    """Statistic that orders a leaderboard."""
+
+    WINS = "wins"
+    AVERAGE_PLACE = "average_place"
+
+
+class LeaderboardWindow(StrEnum):
+    """Period of finished games a leaderboard covers."""
+
+    ALL_TIME = "all"
+    WEEK = "7d"
+    MONTH = "30d"
+
+    @property
+    def days(self) -> int | None:
+        """Length of the rolling window in days, ``None`` for all time."""
+        return {"all": None, "7d": 7, "30d": 30}[self.value]
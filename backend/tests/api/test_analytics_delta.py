@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+
+from pydantic import BaseModel
+
+from fabricat_backend.api.models.session import (
+    PhaseReportDeltaResponse,
+    PhaseReportResponse,
+    PhaseStatusResponse,
+)
+from fabricat_backend.api.routers.session import SessionRuntime
+from fabricat_backend.api.services import AnalyticsDeltaEncoder
+from fabricat_backend.game_logic.phases import GamePhase
+from fabricat_backend.game_logic.session import (
+    GameSession,
+    Player,
+    default_game_settings,
+)
+
+
+def _session() -> GameSession:
+    players = [
+        Player(id_=1, money=10_000.0, priority=1),
+        Player(id_=2, money=10_000.0, priority=2),
+    ]
+    return GameSession(players=players, settings=default_game_settings())
+
+
+def test_encoder_emits_only_changed_fields() -> None:
+    session = _session()
+    encoder = AnalyticsDeltaEncoder()
+
+    seq, snapshot = encoder.snapshot(session.snapshot_analytics())
+    assert seq == 1
+    assert snapshot.players[0].player_id == 1
+
+    market = encoder.publish(session.run_phase(GamePhase.MARKET).analytics)
+    assert (market.base_seq, market.seq) == (1, 2)
+    assert market.players == []
+    assert set(market.fields) == {
+        "bank_raw_material_volume",
+        "bank_raw_material_min_price",
+        "bank_finished_good_volume",
+        "bank_finished_good_max_price",
+    }
+
+    expenses = encoder.publish(session.run_phase(GamePhase.EXPENSES).analytics)
+    assert expenses.seq == 3
+    assert [entry.changes for entry in expenses.players] == [
+        {"money": 8_000.0},
+        {"money": 8_000.0},
+    ]
+    assert expenses.fields == {}
+
+
+def test_encoder_keeps_sequence_when_nothing_changed() -> None:
+    session = _session()
+    encoder = AnalyticsDeltaEncoder()
+    encoder.publish(session.snapshot_analytics())
+
+    delta = encoder.publish(session.run_phase(GamePhase.BUY).analytics)
+
+    assert delta.seq == delta.base_seq == 1
+    assert delta.players == []
+    assert delta.fields == {}
+
+
+def test_runtime_sends_deltas_only_to_delta_listeners() -> None:
+    session = _session()
+    runtime = SessionRuntime(
+        session=session, phase_duration=0, sender=None, session_code="delta"
+    )
+    full: list[BaseModel] = []
+    delta: list[BaseModel] = []
+
+    async def full_sender(model: BaseModel) -> None:
+        full.append(model)
+
+    async def delta_sender(model: BaseModel) -> None:
+        delta.append(model)
+
+    runtime.add_sender(full_sender)
+    runtime.add_sender(delta_sender, protocol="delta")
+    seq, _ = runtime.analytics_snapshot()
+    settings = default_game_settings()
+
+    async def publish() -> None:
+        report = session.run_phase(GamePhase.EXPENSES)
+        await runtime.broadcast(PhaseReportResponse(report=report))
+        for _ in range(2):
+            await runtime.broadcast(
+                PhaseStatusResponse(
+                    month=session.month,
+                    phase=GamePhase.MARKET,
+                    analytics=session.snapshot_analytics(),
+                    settings=settings,
+                )
+            )
+
+    asyncio.run(publish())
+
+    assert isinstance(full[0], PhaseReportResponse)
+    report_delta = delta[0]
+    assert isinstance(report_delta, PhaseReportDeltaResponse)
+    assert report_delta.delta.base_seq == seq
+    assert report_delta.delta.seq == seq + 1
+    assert all(isinstance(model, PhaseStatusResponse) for model in delta[1:])
+    first_status, second_status = delta[1:]
+    assert first_status.analytics is None
+    assert first_status.analytics_seq == seq + 1
+    assert first_status.analytics_delta is None
+    assert first_status.settings == settings
+    assert second_status.settings is None
+    assert full[2].settings == settings
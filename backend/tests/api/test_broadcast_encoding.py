@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from fabricat_backend.api.models.session import ActionAckResponse, PhaseReportResponse
+from fabricat_backend.api.routers import session as session_router
+from fabricat_backend.api.routers.session import SessionRuntime
+from fabricat_backend.api.services import encode_message
+from fabricat_backend.game_logic.phases import GamePhase
+from fabricat_backend.game_logic.session import (
+    GameSession,
+    Player,
+    default_game_settings,
+)
+
+
+class _RecordingSender:
+    def __init__(self) -> None:
+        self.frames: list[str] = []
+
+    async def __call__(self, model: ActionAckResponse) -> None:
+        await self.send_encoded(encode_message(model))
+
+    async def send_encoded(self, data: str, *, droppable: bool = False) -> None:
+        del droppable
+        self.frames.append(data)
+
+
+def test_broadcast_encodes_each_view_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    session = GameSession(
+        players=[
+            Player(id_=1, money=10_000.0, priority=1),
+            Player(id_=2, money=10_000.0, priority=2),
+        ],
+        settings=default_game_settings(),
+    )
+    runtime = SessionRuntime(
+        session=session, phase_duration=0, sender=None, session_code="encode"
+    )
+    senders = [_RecordingSender() for _ in range(4)]
+    for sender in senders[:3]:
+        runtime.add_sender(sender)
+    runtime.add_sender(senders[3], protocol="delta")
+
+    calls: list[str] = []
+
+    def counting_encode(model: object) -> str:
+        calls.append(type(model).__name__)
+        return encode_message(model)
+
+    monkeypatch.setattr(session_router, "encode_message", counting_encode)
+    report = session.run_phase(GamePhase.EXPENSES)
+    asyncio.run(runtime.broadcast(PhaseReportResponse(report=report)))
+
+    assert calls == ["PhaseReportResponse", "PhaseReportDeltaResponse"]
+    assert senders[0].frames == senders[1].frames == senders[2].frames
+    assert json.loads(senders[0].frames[0])["type"] == "phase_report"
+    assert json.loads(senders[3].frames[0])["type"] == "phase_report_delta"
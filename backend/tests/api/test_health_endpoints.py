@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from fabricat_backend.api import create_api
+from fabricat_backend.database import (
+    DatabasePoolConfig,
+    DatabaseService,
+    get_database,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_database_health_reports_pool_metrics(tmp_path: Path) -> None:
+    database = DatabaseService(
+        f"sqlite:///{tmp_path / 'health.sqlite3'}",
+        pool=DatabasePoolConfig(size=4, max_overflow=4),
+    )
+    with database.session() as session:
+        session.execute(text("SELECT 1"))
+    app = create_api()
+    app.dependency_overrides[get_database] = lambda: database
+
+    with TestClient(app) as client:
+        response = client.get("/health/database")
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["capacity"] == 8
+    assert payload["checkouts"] == 1
+    assert payload["saturation"] == 0.0
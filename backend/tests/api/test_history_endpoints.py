@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
 from uuid import UUID, uuid4
 
 import pytest
@@ -18,6 +19,7 @@ class _DummyUser:
 
 class _SessionRow:
     def __init__(self, code: str, finished_at: datetime) -> None:
+        self.id = uuid4()
         self.session_code = code
         self.finished_at = finished_at
 
@@ -41,14 +43,22 @@ class _FakeHistoryRepo:
     def __init__(self, *, session_row: _SessionRow | None) -> None:
         self._session_row = session_row
         self.requested_limit: int | None = None
+        self.requested_before: tuple[datetime, UUID] | None = None
 
-    def get_player_stats_for_session(self, *, user_id: UUID, session_code: str):
+    async def get_player_stats_for_session(self, *, user_id: UUID, session_code: str):
         if self._session_row is None or self._session_row.session_code != session_code:
             return None
         return self._session_row, _StatsRow(place=1)
 
-    def get_recent_player_stats(self, *, user_id: UUID, limit: int):
+    async def get_recent_player_stats(
+        self,
+        *,
+        user_id: UUID,
+        limit: int,
+        before: tuple[datetime, UUID] | None = None,
+    ):
         self.requested_limit = limit
+        self.requested_before = before
         base_time = datetime.now(tz=UTC)
         rows = []
         for idx in range(limit):
@@ -59,14 +69,68 @@ class _FakeHistoryRepo:
         return rows
 
 
+class _FakeStatsRepo:
+    def __init__(self) -> None:
+        self.summaries: dict[UUID, SimpleNamespace] = {}
+
+    async def get(self, user_id: UUID) -> SimpleNamespace | None:
+        return self.summaries.get(user_id)
+
+
+class _FakeLeaderboard:
+    def __init__(self, size: int) -> None:
+        self.rows = [
+            SimpleNamespace(
+                user_id=uuid4(),
+                nickname=f"player-{index}",
+                icon=None,
+                games_played=10,
+                wins=10 - index,
+                average_place=1.0 + index / 10,
+            )
+            for index in range(size)
+        ]
+        self.requests: list[tuple[str, str, int, int]] = []
+
+    def page(self, *, metric: str, window: str, offset: int, limit: int):
+        self.requests.append((metric, window, offset, limit))
+        return self.rows[offset : offset + limit]
+
+
+@pytest.fixture
+def repo() -> _FakeHistoryRepo:
+    return _FakeHistoryRepo(session_row=_SessionRow("abc123", datetime.now(tz=UTC)))
+
+
+@pytest.fixture
+def dummy_user() -> _DummyUser:
+    return _DummyUser()
+
+
 @pytest.fixture
-def client() -> TestClient:
+def stats_repo() -> _FakeStatsRepo:
+    return _FakeStatsRepo()
+
+
+@pytest.fixture
+def leaderboard() -> _FakeLeaderboard:
+    return _FakeLeaderboard(size=5)
+
+
+@pytest.fixture
+def client(
+    repo: _FakeHistoryRepo,
+    stats_repo: _FakeStatsRepo,
+    leaderboard: _FakeLeaderboard,
+    dummy_user: _DummyUser,
+) -> TestClient:
     app = create_api()
-    dummy_user = _DummyUser()
-    repo = _FakeHistoryRepo(session_row=_SessionRow("abc123", datetime.now(tz=UTC)))
 
-    app.dependency_overrides[get_current_user] = lambda: dummy_user
-    app.dependency_overrides[history_router.get_history_repository] = lambda: repo
+    overrides = app.dependency_overrides
+    overrides[get_current_user] = lambda: dummy_user
+    overrides[history_router.get_history_repository] = lambda: repo
+    overrides[history_router.get_user_stats_repository] = lambda: stats_repo
+    overrides[history_router.get_leaderboard_service] = lambda: leaderboard
 
     with TestClient(app) as test_client:
         yield test_client
@@ -95,3 +159,78 @@ def test_get_recent_games_honors_limit(client: TestClient) -> None:
     payload = response.json()
     assert len(payload["items"]) == 2
     assert payload["items"][0]["session_code"] == "code-0"
+
+
+def test_get_recent_games_returns_cursor_for_next_page(
+    client: TestClient, repo: _FakeHistoryRepo
+) -> None:
+    first = client.get("/history/games/me", params={"limit": 2}).json()
+    assert repo.requested_limit == 3
+    assert first["next_cursor"]
+
+    response = client.get(
+        "/history/games/me", params={"limit": 2, "cursor": first["next_cursor"]}
+    )
+
+    assert response.status_code == 200
+    assert repo.requested_before is not None
+    finished_at, _ = repo.requested_before
+    assert finished_at == datetime.fromisoformat(first["items"][-1]["finished_at"])
+
+
+def test_get_recent_games_rejects_malformed_cursor(client: TestClient) -> None:
+    response = client.get("/history/games/me", params={"cursor": "%%%"})
+    assert response.status_code == 400
+
+
+def test_get_career_stats_derives_rates_from_summary(
+    client: TestClient, stats_repo: _FakeStatsRepo, dummy_user: _DummyUser
+) -> None:
+    finished_at = datetime(2026, 5, 1, tzinfo=UTC)
+    stats_repo.summaries[dummy_user.id] = SimpleNamespace(
+        games_played=4,
+        wins=1,
+        bankruptcies=2,
+        total_capital=2_000.0,
+        best_capital=1_200.0,
+        total_place=10,
+        last_finished_at=finished_at,
+    )
+
+    payload = client.get("/history/stats/me").json()
+
+    assert payload["games_played"] == 4
+    assert payload["win_rate"] == 0.25
+    assert payload["bankruptcy_rate"] == 0.5
+    assert payload["average_capital"] == 500.0
+    assert payload["average_place"] == 2.5
+    assert datetime.fromisoformat(payload["last_finished_at"]) == finished_at
+
+
+def test_get_career_stats_is_empty_without_games(client: TestClient) -> None:
+    payload = client.get("/history/stats/me").json()
+
+    assert payload["games_played"] == 0
+    assert payload["win_rate"] == 0.0
+    assert payload["last_finished_at"] is None
+
+
+def test_leaderboard_pages_are_ranked_with_next_offset(
+    client: TestClient, leaderboard: _FakeLeaderboard
+) -> None:
+    first = client.get(
+        "/history/leaderboard", params={"window": "7d", "limit": 2}
+    ).json()
+    last = client.get("/history/leaderboard", params={"offset": 4, "limit": 2}).json()
+
+    assert [item["rank"] for item in first["items"]] == [1, 2]
+    assert first["items"][0]["nickname"] == "player-0"
+    assert first["next_offset"] == 2
+    assert [item["rank"] for item in last["items"]] == [5]
+    assert last["next_offset"] is None
+    assert leaderboard.requests == [("wins", "7d", 0, 3), ("wins", "all", 4, 3)]
+
+
+def test_leaderboard_rejects_unknown_window(client: TestClient) -> None:
+    response = client.get("/history/leaderboard", params={"window": "1y"})
+    assert response.status_code == 422
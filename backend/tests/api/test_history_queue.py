@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, cast
+from uuid import uuid4
+
+from sqlalchemy import func, select
+
+from fabricat_backend.api.services import (
+    GameHistoryEntry,
+    GameHistoryQueue,
+    GameHistoryRecorder,
+    PlayerHistoryPayload,
+)
+from fabricat_backend.database import (
+    BaseSchema,
+    DatabaseService,
+    GamePlayerStatsSchema,
+    GameSessionSchema,
+)
+from fabricat_backend.game_logic.session import PlayerFinalStats
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _entry(code: str, *, players: int = 2) -> GameHistoryEntry:
+    return GameHistoryEntry(
+        session_code=code,
+        finished_at=datetime(2026, 1, 1, tzinfo=UTC),
+        stats=[
+            PlayerHistoryPayload(
+                user_id=uuid4() if slot == 1 else None,
+                stats=PlayerFinalStats(
+                    player_id=slot,
+                    capital=1_000.0 * slot,
+                    place=slot,
+                    is_bankrupt=False,
+                    is_top1=slot == 1,
+                    has_debt=False,
+                    total_debt=0.0,
+                    factories_basic=2,
+                    factories_auto=0,
+                    factories_builds_basic=0,
+                    factories_builds_auto=0,
+                    factories_upgrades=0,
+                ),
+            )
+            for slot in range(1, players + 1)
+        ],
+    )
+
+
+class _FakeRecorder:
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+        self.rejected: set[str] = set()
+        self.written = threading.Event()
+
+    def record_batch(self, entries: list[GameHistoryEntry]) -> None:
+        codes = [entry.session_code for entry in entries]
+        if self.rejected.intersection(codes):
+            msg = "database unavailable"
+            raise RuntimeError(msg)
+        self.batches.append(codes)
+        self.written.set()
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _queue(recorder: _FakeRecorder, path: Path, **kwargs: object) -> GameHistoryQueue:
+    return GameHistoryQueue(
+        recorder=cast("GameHistoryRecorder", recorder),
+        path=str(path / "queue.sqlite3"),
+        **kwargs,  # type: ignore[arg-type]
+    )
+
+
+def test_background_writer_persists_finished_games_in_one_batch(
+    tmp_path: Path,
+) -> None:
+    recorder = _FakeRecorder()
+
+    async def scenario() -> int:
+        queue = _queue(recorder, tmp_path, flush_interval_seconds=0.01)
+        for index in range(5):
+            await queue.put(_entry(f"game-{index}"))
+        queue.start()
+        await asyncio.to_thread(recorder.written.wait, 2.0)
+        # Waits for the batch the writer is finishing instead of redoing it.
+        await queue.flush()
+        pending = await queue.pending()
+        await queue.aclose()
+        return pending
+
+    assert asyncio.run(scenario()) == 0
+    assert recorder.batches == [[f"game-{index}" for index in range(5)]]
+
+
+def test_failing_game_is_isolated_and_retried_with_backoff(tmp_path: Path) -> None:
+    recorder = _FakeRecorder()
+    recorder.rejected.add("bad")
+    clock = _Clock()
+
+    async def scenario() -> tuple[int, int, int, int]:
+        queue = _queue(recorder, tmp_path, retry_base_seconds=5.0, clock=clock)
+        for code in ("one", "bad", "two"):
+            await queue.put(_entry(code))
+        first = await queue.flush()
+        still_pending = await queue.pending()
+        recorder.rejected.clear()
+        too_early = await queue.flush()
+        clock.now += 5.0
+        retried = await queue.flush()
+        await queue.aclose()
+        return first, still_pending, too_early, retried
+
+    assert asyncio.run(scenario()) == (2, 1, 0, 1)
+    assert recorder.batches == [["one"], ["two"], ["bad"]]
+
+
+def test_unwritten_games_survive_a_restart(tmp_path: Path) -> None:
+    recorder = _FakeRecorder()
+    recorder.rejected.add("kept")
+    clock = _Clock()
+
+    async def crash() -> None:
+        queue = _queue(recorder, tmp_path, clock=clock)
+        await queue.put(_entry("kept"))
+        await queue.aclose()
+
+    async def restart() -> tuple[int, int]:
+        clock.now += 60.0
+        queue = _queue(recorder, tmp_path, clock=clock)
+        before = await queue.pending()
+        await queue.flush()
+        after = await queue.pending()
+        await queue.aclose()
+        return before, after
+
+    asyncio.run(crash())
+    recorder.rejected.clear()
+
+    assert asyncio.run(restart()) == (1, 0)
+    assert recorder.batches == [["kept"]]
+
+
+def test_recorder_writes_a_batch_in_one_transaction(tmp_path: Path) -> None:
+    database = DatabaseService(f"sqlite:///{tmp_path / 'history.sqlite3'}")
+    BaseSchema.metadata.create_all(database.engine)
+    recorder = GameHistoryRecorder(database=database)
+
+    recorder.record_batch([_entry("a"), _entry("b", players=3)])
+
+    with database.session() as session:
+        sessions = session.scalar(select(func.count()).select_from(GameSessionSchema))
+        stats = session.scalar(select(func.count()).select_from(GamePlayerStatsSchema))
+    assert (sessions, stats) == (2, 5)
@@ -0,0 +1,124 @@
+"""Verified-token and user-identity caches behind ``get_current_user``."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+import jwt
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from fabricat_backend.api import create_api
+from fabricat_backend.api.dependencies import get_auth_service, get_identity_cache
+from fabricat_backend.api.services import (
+    AuthenticatedUser,
+    AuthService,
+    TokenPayload,
+    UserIdentityCache,
+    VerifiedTokenCache,
+)
+from fabricat_backend.database import (
+    AsyncDatabaseService,
+    BackendSettings,
+    BaseSchema,
+    DatabaseService,
+    UserRepository,
+    UserSchema,
+    get_async_database,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class _Clock:
+    def __init__(self, now: float) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _identity() -> AuthenticatedUser:
+    return AuthenticatedUser(id=uuid4(), nickname="player", icon="diver")
+
+
+def test_token_cache_keeps_payloads_until_expiry() -> None:
+    clock = _Clock(1_000.0)
+    cache = VerifiedTokenCache(max_entries=2, clock=clock)
+    payload = TokenPayload(sub="user", exp=datetime.fromtimestamp(1_060, tz=UTC))
+
+    cache.put("token-a", payload)
+    cache.put("token-b", payload)
+    assert cache.get("token-a") is payload
+    cache.put("token-c", payload)
+
+    assert cache.get("token-b") is None
+    assert b"token-a" not in b"".join(cache._entries)
+    clock.now = 1_060.0
+    assert cache.get("token-a") is None
+    assert len(cache) == 1
+
+
+def test_identity_cache_expires_and_invalidates() -> None:
+    clock = _Clock(0.0)
+    cache = UserIdentityCache(ttl_seconds=30.0, clock=clock)
+    first, second = cache.put(_identity()), cache.put(_identity())
+
+    assert cache.get(first.id) is first
+    cache.invalidate(first.id)
+    assert cache.get(first.id) is None
+    clock.now = 30.0
+    assert cache.get(second.id) is None
+
+
+def test_repeat_requests_skip_decoding_and_user_lookup(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    url = f"sqlite:///{tmp_path / 'identity.sqlite3'}"
+    sync_database = DatabaseService(url)
+    BaseSchema.metadata.create_all(sync_database.engine)
+    user_id = uuid4()
+    with sync_database.session() as session:
+        UserRepository(session).add(
+            UserSchema(id=user_id, nickname="cached", password_hash="-", icon="diver")
+        )
+    database = AsyncDatabaseService(url)
+    auth = AuthService(
+        settings=BackendSettings(auth_secret_key="x" * 32),
+        token_cache=VerifiedTokenCache(),
+    )
+    decodes: list[str] = []
+    real_decode = jwt.decode
+
+    def counting_decode(token: str, *args: object, **kwargs: object) -> object:
+        decodes.append(token)
+        return real_decode(token, *args, **kwargs)
+
+    monkeypatch.setattr(jwt, "decode", counting_decode)
+    user_queries: list[str] = []
+
+    @event.listens_for(database.engine.sync_engine, "before_cursor_execute")
+    def count_user_queries(*args: object) -> None:
+        statement = str(args[2])
+        if "FROM users" in statement:
+            user_queries.append(statement)
+
+    app = create_api()
+    app.dependency_overrides[get_async_database] = lambda: database
+    app.dependency_overrides[get_auth_service] = lambda: auth
+    identities = UserIdentityCache()
+    app.dependency_overrides[get_identity_cache] = lambda: identities
+    headers = {"Authorization": f"Bearer {auth.create_access_token(str(user_id))}"}
+
+    with TestClient(app) as client:
+        responses = [client.get("/history/stats/me", headers=headers) for _ in range(3)]
+        client.portal.call(database.dispose)
+
+    assert [response.status_code for response in responses] == [200, 200, 200]
+    assert len(decodes) == 1
+    assert len(user_queries) == 1
+    assert identities.get(user_id) is not None
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+from uuid import UUID, uuid4
+
+import pytest
+
+from fabricat_backend.api.services import (
+    GameHistoryEntry,
+    GameHistoryRecorder,
+    LeaderboardService,
+    PlayerHistoryPayload,
+)
+from fabricat_backend.database import BaseSchema, DatabaseService
+from fabricat_backend.database.repositories import leaderboard as leaderboard_repo
+from fabricat_backend.game_logic.session import PlayerFinalStats
+from fabricat_backend.shared import LeaderboardMetric, LeaderboardWindow
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _win(winner: UUID, loser: UUID) -> GameHistoryEntry:
+    return GameHistoryEntry(
+        session_code=uuid4().hex[:8],
+        finished_at=datetime.now(tz=UTC),
+        stats=[
+            PlayerHistoryPayload(
+                user_id=user_id,
+                stats=PlayerFinalStats(
+                    player_id=place,
+                    capital=100.0,
+                    place=place,
+                    is_bankrupt=False,
+                    is_top1=place == 1,
+                    has_debt=False,
+                    total_debt=0.0,
+                    factories_basic=2,
+                    factories_auto=0,
+                    factories_builds_basic=0,
+                    factories_builds_auto=0,
+                    factories_upgrades=0,
+                ),
+            )
+            for place, user_id in enumerate((winner, loser), start=1)
+        ],
+    )
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def database(tmp_path: Path) -> DatabaseService:
+    service = DatabaseService(f"sqlite:///{tmp_path / 'leaderboard.sqlite3'}")
+    BaseSchema.metadata.create_all(service.engine)
+    return service
+
+
+def test_top_pages_are_cached_and_refreshed_on_write(
+    database: DatabaseService, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    queries: list[int] = []
+    ranking = leaderboard_repo.LeaderboardRepository.ranking
+
+    def counting_ranking(self, **kwargs):  # noqa: ANN001, ANN003, ANN202
+        queries.append(kwargs["limit"])
+        return ranking(self, **kwargs)
+
+    monkeypatch.setattr(
+        leaderboard_repo.LeaderboardRepository, "ranking", counting_ranking
+    )
+    service = LeaderboardService(database=database, top_k=10, clock=_Clock())
+    recorder = GameHistoryRecorder(database=database, leaderboard=service)
+    first, second = uuid4(), uuid4()
+    recorder.record_batch([_win(first, second)])
+
+    def leaders() -> list[tuple[UUID, int]]:
+        rows = service.page(
+            metric=LeaderboardMetric.WINS,
+            window=LeaderboardWindow.WEEK,
+            offset=0,
+            limit=2,
+        )
+        return [(row.user_id, row.wins) for row in rows]
+
+    assert leaders() == [(first, 1), (second, 0)]
+    assert leaders() == [(first, 1), (second, 0)]
+    assert queries == [10]
+
+    recorder.record_batch([_win(second, first), _win(second, first)])
+
+    assert leaders() == [(second, 2), (first, 1)]
+    assert queries == [10, 10]
+
+
+def test_pages_beyond_top_k_and_expired_entries_hit_the_database(
+    database: DatabaseService,
+) -> None:
+    clock = _Clock()
+    service = LeaderboardService(
+        database=database, top_k=1, ttl_seconds=5.0, clock=clock
+    )
+    recorder = GameHistoryRecorder(database=database)
+    first, second = uuid4(), uuid4()
+    recorder.record_batch([_win(first, second)])
+
+    def page(offset: int) -> list[UUID]:
+        rows = service.page(
+            metric=LeaderboardMetric.WINS,
+            window=LeaderboardWindow.ALL_TIME,
+            offset=offset,
+            limit=1,
+        )
+        return [row.user_id for row in rows]
+
+    assert page(0) == [first]
+    assert page(1) == [second]
+
+    # Written without telling the service: only the TTL reveals it.
+    recorder.record_batch([_win(second, first), _win(second, first)])
+    assert page(0) == [first]
+    clock.now = 6.0
+    assert page(0) == [second]
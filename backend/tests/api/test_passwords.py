@@ -0,0 +1,67 @@
+"""Bounded PBKDF2 hashing with upgradable parameters."""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import threading
+
+import pytest
+
+from fabricat_backend.api.services import (
+    HashingBusyError,
+    PasswordHasher,
+    PasswordHashParams,
+)
+
+
+def _legacy_hash(password: str) -> str:
+    salt = b"0123456789abcdef"
+    digest = hashlib.pbkdf2_hmac("sha256", password.encode(), salt, 100_000)
+    return f"{base64.b64encode(salt).decode()}:{base64.b64encode(digest).decode()}"
+
+
+def test_hashes_carry_their_parameters() -> None:
+    hasher = PasswordHasher(params=PasswordHashParams(iterations=1_000))
+
+    encoded = hasher.hash_password("hunter2")
+
+    assert encoded.startswith("pbkdf2_sha256$1000$")
+    assert hasher.verify_password("hunter2", encoded)
+    assert not hasher.verify_password("hunter3", encoded)
+    assert not hasher.verify_password("hunter2", "not-a-hash")
+    assert not hasher.needs_rehash(encoded)
+
+
+def test_legacy_and_weaker_hashes_need_rehash() -> None:
+    old = PasswordHasher(params=PasswordHashParams(iterations=1_000))
+    current = PasswordHasher(params=PasswordHashParams(iterations=2_000))
+    legacy = _legacy_hash("hunter2")
+
+    assert current.verify_password("hunter2", legacy)
+    assert current.needs_rehash(legacy)
+    assert current.needs_rehash(old.hash_password("hunter2"))
+    assert not old.needs_rehash(current.hash_password("hunter2"))
+
+
+def test_saturated_pool_rejects_instead_of_queueing() -> None:
+    hasher = PasswordHasher(
+        params=PasswordHashParams(iterations=1_000), max_workers=1, max_pending=1
+    )
+    gate = threading.Event()
+
+    async def scenario() -> str:
+        blocked = asyncio.ensure_future(hasher._submit(gate.wait))
+        await asyncio.sleep(0)
+        with pytest.raises(HashingBusyError):
+            await hasher.ahash_password("hunter2")
+        gate.set()
+        await blocked
+        return await hasher.ahash_password("hunter2")
+
+    encoded = asyncio.run(scenario())
+    hasher.close()
+
+    assert hasher.verify_password("hunter2", encoded)
+    assert hasher.pending == 0
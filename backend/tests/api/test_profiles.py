@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from contextlib import contextmanager
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, cast
+from uuid import UUID, uuid4
+
+from fabricat_backend.api.services import (
+    ANONYMOUS_PROFILE,
+    UserProfile,
+    UserProfileService,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from fabricat_backend.database.service import DatabaseService
+
+
+class _FakeSession:
+    def __init__(self, database: _FakeDatabase) -> None:
+        self._database = database
+
+    def get(self, _schema: object, user_id: UUID) -> Any:
+        self._database.queries += 1
+        self._database.release.wait(timeout=2.0)
+        return self._database.users.get(user_id)
+
+
+class _FakeDatabase:
+    def __init__(self) -> None:
+        self.users: dict[UUID, SimpleNamespace] = {}
+        self.queries = 0
+        self.release = threading.Event()
+        self.release.set()
+
+    @contextmanager
+    def session(self) -> Iterator[_FakeSession]:
+        yield _FakeSession(self)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _service(database: _FakeDatabase, **kwargs: Any) -> UserProfileService:
+    return UserProfileService(database=cast("DatabaseService", database), **kwargs)
+
+
+def test_concurrent_lookups_share_one_query() -> None:
+    database = _FakeDatabase()
+    user_id = uuid4()
+    database.users[user_id] = SimpleNamespace(nickname="cat", icon="fox")
+    service = _service(database)
+
+    async def scenario() -> list[UserProfile]:
+        database.release.clear()
+        lookups = [asyncio.create_task(service.get(str(user_id))) for _ in range(10)]
+        await asyncio.sleep(0.01)
+        database.release.set()
+        return await asyncio.gather(*lookups)
+
+    profiles = asyncio.run(scenario())
+
+    assert profiles == [UserProfile(nickname="cat", icon="fox")] * 10
+    assert database.queries == 1
+
+
+def test_cached_profiles_expire_and_can_be_invalidated() -> None:
+    database = _FakeDatabase()
+    user_id = uuid4()
+    database.users[user_id] = SimpleNamespace(nickname="old", icon="fox")
+    clock = _Clock()
+    service = _service(database, ttl_seconds=10.0, clock=clock)
+
+    async def scenario() -> list[str | None]:
+        names = [(await service.get(str(user_id))).nickname]
+        database.users[user_id] = SimpleNamespace(nickname="new", icon="fox")
+        names.append((await service.get(str(user_id))).nickname)
+        clock.now = 11.0
+        names.append((await service.get(str(user_id))).nickname)
+        database.users[user_id] = SimpleNamespace(nickname="newer", icon="fox")
+        service.invalidate(str(user_id))
+        names.append((await service.get(str(user_id))).nickname)
+        return names
+
+    assert asyncio.run(scenario()) == ["old", "old", "new", "newer"]
+    assert database.queries == 3
+
+
+def test_cache_is_bounded_and_ignores_invalid_identifiers() -> None:
+    database = _FakeDatabase()
+    service = _service(database, max_entries=2)
+
+    async def scenario() -> UserProfile:
+        for _ in range(5):
+            await service.get(str(uuid4()))
+        return await service.get("not-a-uuid")
+
+    assert asyncio.run(scenario()) is ANONYMOUS_PROFILE
+    assert len(service) == 2
+    assert database.queries == 5
@@ -0,0 +1,201 @@
+"""Binary replay logs and the headless replay engine."""
+
+from __future__ import annotations
+
+import asyncio
+from random import Random
+from typing import TYPE_CHECKING
+
+import pytest
+from pydantic import ValidationError
+
+from fabricat_backend.api.models.session import PhaseActionRequest
+from fabricat_backend.api.routers.session import SessionRuntime
+from fabricat_backend.api.services import (
+    ReplayFormatError,
+    ReplayLog,
+    ReplayPhase,
+    ReplayRecorder,
+    apply_phase_action,
+    replay,
+)
+from fabricat_backend.game_logic.phases import PHASE_SEQUENCE, GamePhase
+from fabricat_backend.game_logic.session import (
+    GameSession,
+    GameSettings,
+    Player,
+    default_game_settings,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        self.now += 0.25
+        return self.now
+
+
+def _roster() -> list[Player]:
+    return [
+        Player(id_=11, money=10_000.0, priority=1),
+        Player(id_=12, money=10_000.0, priority=2),
+        Player(id_=13, money=10_000.0, priority=3),
+    ]
+
+
+def _settings(max_months: int = 6) -> GameSettings:
+    return default_game_settings().model_copy(
+        update={"max_months": max_months, "rng_seed": 2024}
+    )
+
+
+def _action(phase: GamePhase, rng: Random) -> PhaseActionRequest:
+    payloads = {
+        GamePhase.BUY: {
+            "kind": "submit_buy_bid",
+            "quantity": rng.randint(1, 4),
+            "price": rng.uniform(300, 900),
+        },
+        GamePhase.PRODUCTION: {
+            "kind": "production_plan",
+            "basic": rng.randint(0, 2),
+            "auto": 0,
+        },
+        GamePhase.SELL: {
+            "kind": "submit_sell_bid",
+            "quantity": rng.randint(1, 3),
+            "price": rng.uniform(2_000, 6_000),
+        },
+        GamePhase.LOANS: {
+            "kind": "loan_decision",
+            "slot": rng.randint(0, 1),
+            "decision": rng.choice(["call", "skip"]),
+        },
+        GamePhase.CONSTRUCTION: {
+            "kind": "construction_request",
+            "project": rng.choice(["idle", "build_basic", "upgrade"]),
+        },
+    }
+    payload = payloads.get(phase)
+    if payload is None or rng.random() < 0.2:
+        payload = {"kind": "skip"}
+    return PhaseActionRequest.model_validate(
+        {"type": "phase_action", "phase": phase, "payload": payload}
+    )
+
+
+def _play(settings: GameSettings) -> ReplayRecorder:
+    players = _roster()
+    recorder = ReplayRecorder(players, settings, clock=_Clock())
+    session = GameSession(players=players, settings=settings)
+    rng = Random(5)
+    while not session.is_finished:
+        for phase in PHASE_SEQUENCE:
+            for player in players:
+                request = _action(phase, rng)
+                apply_phase_action(player, request)
+                recorder.record_action(player.id_, request)
+            report = session.run_phase(phase)
+            recorder.record_phase(phase, report.month)
+            if session.is_finished:
+                break
+    recorder.finish(session.build_final_player_stats())
+    return recorder
+
+
+def test_replay_reproduces_recorded_standings() -> None:
+    settings = _settings()
+    data = _play(settings).getvalue()
+
+    log = ReplayLog.from_bytes(data)
+    result = replay(log)
+
+    assert log.settings == settings
+    assert [player.id_ for player in log.roster] == [11, 12, 13]
+    assert result.matches
+    assert result.phases == sum(isinstance(event, ReplayPhase) for event in log.events)
+    assert result.actions == len(log.events) - result.phases
+    assert log.to_bytes() == data
+    assert len(data) < 40 * len(log.events) + 1_024
+
+
+def test_replay_flags_diverging_standings() -> None:
+    log = ReplayLog.from_bytes(_play(_settings(max_months=2)).getvalue())
+    assert log.final_stats is not None
+    first = log.final_stats[0]
+    log.final_stats[0] = first.model_copy(update={"capital": first.capital + 1})
+
+    assert not replay(log).matches
+
+
+def test_malformed_logs_are_rejected() -> None:
+    data = _play(_settings(max_months=1)).getvalue()
+
+    with pytest.raises(ReplayFormatError, match="Not a replay log"):
+        ReplayLog.from_bytes(b"NOTREPLY" + data[8:])
+    with pytest.raises(ReplayFormatError, match="truncated"):
+        ReplayLog.from_bytes(data[:-3])
+
+
+def test_largest_accepted_payloads_fit_the_replay_format() -> None:
+    largest = {
+        GamePhase.BUY: {"kind": "submit_buy_bid", "quantity": 9_999, "price": 1e300},
+        GamePhase.SELL: {"kind": "submit_sell_bid", "quantity": 9_999, "price": 1.0},
+        GamePhase.PRODUCTION: {"kind": "production_plan", "basic": 9_999, "auto": 0},
+        GamePhase.LOANS: {"kind": "loan_decision", "slot": 9_999, "decision": "call"},
+    }
+    recorder = ReplayRecorder(_roster(), _settings(), clock=_Clock())
+    for phase, payload in largest.items():
+        request = PhaseActionRequest.model_validate(
+            {"type": "phase_action", "phase": phase, "payload": payload}
+        )
+        recorder.record_action(11, request)
+
+    log = ReplayLog.from_bytes(recorder.getvalue())
+
+    assert [event.request.payload.model_dump() for event in log.events] == list(
+        largest.values()
+    )
+    with pytest.raises(ValidationError):
+        PhaseActionRequest.model_validate(
+            {
+                "type": "phase_action",
+                "phase": GamePhase.BUY,
+                "payload": {"kind": "submit_buy_bid", "quantity": 2**63, "price": 1.0},
+            }
+        )
+
+
+def test_runtime_saves_replay_when_game_finishes(tmp_path: Path) -> None:
+    settings = _settings(max_months=1)
+    players = _roster()
+    path = tmp_path / "replays" / "game.fcreplay"
+    recorder = ReplayRecorder(players, settings, path=path)
+    session = GameSession(players=players, settings=settings)
+    runtime = SessionRuntime(
+        session=session,
+        phase_duration=0,
+        sender=None,
+        session_code="replay",
+        replay=recorder,
+    )
+    request = _action(GamePhase.BUY, Random(1))
+    apply_phase_action(players[0], request)
+    runtime.record_action(players[0], request)
+
+    async def play() -> None:
+        await runtime.start()
+        await asyncio.wait_for(runtime._task, timeout=30)
+        await runtime.stop()
+
+    asyncio.run(play())
+
+    log = ReplayLog.read(path)
+    assert recorder.saved
+    assert log.final_stats == session.build_final_player_stats()
+    assert replay(log).matches
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from fabricat_backend.api.join_benchmark import benchmark_joins
+from fabricat_backend.api.routers import session as session_router
+from fabricat_backend.api.services import (
+    ANONYMOUS_PROFILE,
+    InProcessSessionStore,
+    UserProfile,
+)
+
+if TYPE_CHECKING:
+    import pytest
+    from pydantic import BaseModel
+
+
+async def _anonymous_profile(_user_identifier: str) -> UserProfile:
+    return ANONYMOUS_PROFILE
+
+
+async def _discard(_model: BaseModel) -> None:
+    return None
+
+
+def _isolate(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(session_router, "_SESSION_REGISTRY", {})
+    monkeypatch.setattr(session_router, "_SESSION_STORE", InProcessSessionStore())
+    monkeypatch.setattr(session_router, "_load_user_profile", _anonymous_profile)
+
+
+def test_busy_lobby_does_not_block_joins_elsewhere(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _isolate(monkeypatch)
+
+    async def scenario() -> tuple[bool, int]:
+        busy, *_ = await session_router._register_connection(
+            requested_code="busy", user_identifier="a", send=_discard
+        )
+        async with busy.lock:
+            other, *_ = await asyncio.wait_for(
+                session_router._register_connection(
+                    requested_code="other", user_identifier="b", send=_discard
+                ),
+                1.0,
+            )
+            blocked = asyncio.create_task(
+                session_router._register_connection(
+                    requested_code="busy", user_identifier="c", send=_discard
+                )
+            )
+            await asyncio.sleep(0.01)
+            waited = not blocked.done()
+        await blocked
+        return waited, busy.connections + other.connections
+
+    waited, connections = asyncio.run(scenario())
+
+    assert waited
+    assert connections == 3
+
+
+def test_concurrent_first_joins_share_one_lobby(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _isolate(monkeypatch)
+
+    async def scenario() -> set[int]:
+        results = await asyncio.gather(
+            *(
+                session_router._register_connection(
+                    requested_code="race",
+                    user_identifier=f"user-{index}",
+                    send=_discard,
+                )
+                for index in range(4)
+            )
+        )
+        return {id(context) for context, *_ in results}
+
+    contexts = asyncio.run(scenario())
+
+    assert len(contexts) == 1
+    assert session_router._SESSION_REGISTRY["race"].connections == 4
+
+
+def test_released_lobby_is_recreated_on_next_join(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    _isolate(monkeypatch)
+
+    async def scenario() -> tuple[bool, bool]:
+        first, *_ = await session_router._register_connection(
+            requested_code="again", user_identifier="a", send=_discard
+        )
+        await session_router._release_connection(
+            first, user_identifier="a", sender=_discard
+        )
+        second, *_ = await session_router._register_connection(
+            requested_code="again", user_identifier="a", send=_discard
+        )
+        return first.closed, second is first
+
+    closed, reused = asyncio.run(scenario())
+
+    assert closed
+    assert not reused
+
+
+def test_join_benchmark_reports_every_join(monkeypatch: pytest.MonkeyPatch) -> None:
+    _isolate(monkeypatch)
+
+    result = asyncio.run(benchmark_joins(users=12, lobbies=3))
+
+    assert result.joined == 12
+    assert result.rejected == 0
+    assert result.max_ms >= result.p95_ms >= result.p50_ms >= 0
+    assert session_router._SESSION_REGISTRY == {}
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import TYPE_CHECKING
+
+from fastapi import WebSocketDisconnect
+
+from fabricat_backend.api.routers import session as session_router
+from fabricat_backend.api.services import (
+    ANONYMOUS_PROFILE,
+    InProcessSessionStore,
+    UserProfile,
+)
+
+if TYPE_CHECKING:
+    import pytest
+
+
+async def _anonymous_profile(_user_identifier: str) -> UserProfile:
+    return ANONYMOUS_PROFILE
+
+
+class _RemoteOwnerStore(InProcessSessionStore):
+    """Reports the first claim as owned by another worker, then grants it.
+
+    Both workers share this process, so the second claim is the one the owning
+    worker makes when it serves the relayed join.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(worker_id="owner")
+        self.claims = 0
+
+    async def claim(self, session_code: str) -> str:
+        self.claims += 1
+        if self.claims == 1:
+            return "edge-sees-owner"
+        return await super().claim(session_code)
+
+
+class _ScriptedSocket:
+    def __init__(self, messages: list[dict[str, object]]) -> None:
+        self._inbound: asyncio.Queue[dict[str, object] | None] = asyncio.Queue()
+        for message in messages:
+            self._inbound.put_nowait(message)
+        self.sent: list[dict[str, object]] = []
+        self.received = asyncio.Event()
+
+    async def receive_json(self) -> object:
+        message = await self._inbound.get()
+        if message is None:
+            raise WebSocketDisconnect(code=1000)
+        return message
+
+    async def send_text(self, data: str) -> None:
+        self.sent.append(json.loads(data))
+        self.received.set()
+
+    async def close(self, code: int = 1000, reason: str = "") -> None:
+        del code, reason
+
+    def disconnect(self) -> None:
+        self._inbound.put_nowait(None)
+
+
+def test_join_for_remote_session_is_relayed_to_owner(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    store = _RemoteOwnerStore()
+    store.subscribe("worker:edge-sees-owner", session_router._accept_relayed_connection)
+    monkeypatch.setattr(session_router, "_SESSION_STORE", store)
+    monkeypatch.setattr(session_router, "_SESSION_REGISTRY", {})
+    monkeypatch.setattr(session_router, "_load_user_profile", _anonymous_profile)
+
+    async def scenario() -> tuple[list[dict[str, object]], bool]:
+        socket = _ScriptedSocket([{"type": "join", "session_code": "remote"}])
+        edge = asyncio.create_task(
+            session_router._serve_connection(socket, user_identifier="alice")
+        )
+        await asyncio.wait_for(socket.received.wait(), 2.0)
+        hosted = "remote" in session_router._SESSION_REGISTRY
+        socket.disconnect()
+        await asyncio.wait_for(edge, 2.0)
+        await asyncio.gather(*session_router._RELAY_TASKS)
+        return socket.sent, hosted and not session_router._SESSION_REGISTRY
+
+    sent, cleaned_up = asyncio.run(scenario())
+
+    assert sent[0]["type"] == "welcome"
+    assert sent[0]["session_code"] == "remote"
+    assert cleaned_up
+
+
+class _SlowSocket:
+    """Socket that yields while writing and records frames and the close."""
+
+    def __init__(self) -> None:
+        self.events: list[object] = []
+
+    async def receive_json(self) -> object:
+        await asyncio.Event().wait()
+        return None
+
+    async def send_text(self, data: str) -> None:
+        for _ in range(3):
+            await asyncio.sleep(0)
+        self.events.append(json.loads(data))
+
+    async def close(self, code: int = 1000, reason: str = "") -> None:
+        del reason
+        self.events.append(code)
+
+
+def test_relayed_close_is_sent_after_pending_frames(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    store = InProcessSessionStore()
+    monkeypatch.setattr(session_router, "_SESSION_STORE", store)
+
+    async def owner(data: str) -> None:
+        _, outbound = session_router._relay_channels(json.loads(data)["connection_id"])
+        for index in range(3):
+            await store.publish(outbound, session_router._relay_frame(str(index)))
+        close = {"kind": "close", "code": 1013, "reason": "overloaded"}
+        await store.publish(outbound, json.dumps(close))
+
+    store.subscribe(session_router._worker_channel("owner"), owner)
+
+    async def scenario() -> list[object]:
+        socket = _SlowSocket()
+        send = session_router.WebSocketSender(socket)
+        send.start()
+        await asyncio.wait_for(
+            session_router._relay_to_owner(
+                socket,
+                send,
+                owner="owner",
+                user_identifier="alice",
+                join_message={"type": "join"},
+            ),
+            2.0,
+        )
+        await send.aclose()
+        return socket.events
+
+    assert asyncio.run(scenario()) == [0, 1, 2, 1013]
@@ -0,0 +1,175 @@
+"""Snapshots that let live sessions survive a server restart."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from dataclasses import asdict
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING
+
+import pytest
+
+from fabricat_backend.api.models.session import PhaseTickResponse
+from fabricat_backend.api.routers import session as session_router
+from fabricat_backend.api.services import (
+    ANONYMOUS_PROFILE,
+    InProcessSessionStore,
+    SessionSnapshot,
+    SnapshotFormatError,
+    SnapshotStore,
+    UserProfile,
+    decode_snapshot,
+    encode_snapshot,
+)
+from fabricat_backend.game_logic.phases import PHASE_SEQUENCE, GamePhase, PhaseTimer
+from fabricat_backend.game_logic.session import (
+    GameSession,
+    Player,
+    default_game_settings,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pydantic import BaseModel
+
+
+async def _anonymous_profile(_user_identifier: str) -> UserProfile:
+    return ANONYMOUS_PROFILE
+
+
+async def _discard(_model: BaseModel) -> None:
+    return None
+
+
+def _snapshot(session_code: str = "snap") -> SessionSnapshot:
+    players = [
+        Player(id_=1, money=10_000.0, priority=1),
+        Player(id_=2, money=10_000.0, priority=2),
+    ]
+    settings = default_game_settings()
+    session = GameSession(players=players, settings=settings)
+    return SessionSnapshot(
+        session_code=session_code,
+        taken_at=datetime.now(tz=UTC),
+        settings=settings,
+        game=session.snapshot(),
+        phase_index=2,
+        remaining_seconds=None,
+        assignments={"a": 1, "b": 2},
+    )
+
+
+def test_store_keeps_only_fresh_readable_snapshots(tmp_path: Path) -> None:
+    store = SnapshotStore(tmp_path, max_age_seconds=60.0)
+    fresh = _snapshot("fresh")
+    store.save("fresh", fresh.model_dump_json().encode())
+    stale = store.save("stale", _snapshot("stale").model_dump_json().encode())
+    os.utime(stale, (0, 0))
+    (tmp_path / "broken.fcsnap").write_bytes(b"garbage")
+
+    snapshots = store.load_all()
+
+    assert [snapshot.session_code for snapshot in snapshots] == ["fresh"]
+    assert snapshots[0].model_dump_json() == fresh.model_dump_json()
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["fresh.fcsnap"]
+    assert store.path_for("../escape").parent == tmp_path
+    store.close()
+
+
+def test_snapshots_are_versioned() -> None:
+    data = encode_snapshot(_snapshot().model_dump_json().encode())
+
+    assert decode_snapshot(data).assignments == {"a": 1, "b": 2}
+    with pytest.raises(SnapshotFormatError, match="version 2"):
+        decode_snapshot(data[:8] + b"\x02\x00" + data[10:])
+    with pytest.raises(SnapshotFormatError, match="Corrupt"):
+        decode_snapshot(data[:-4])
+
+
+def test_runtime_resumes_mid_phase_countdown() -> None:
+    snapshot = _snapshot()
+    runtime = session_router.SessionRuntime(
+        session=GameSession.restore(snapshot.game),
+        phase_duration=5,
+        sender=None,
+        session_code="resume",
+    )
+    runtime._timer = PhaseTimer(default_duration_seconds=5, tick_resolution_seconds=0)
+    runtime.resume_from(3, 2)
+    ticks: list[PhaseTickResponse] = []
+
+    async def collect(model: BaseModel) -> None:
+        if isinstance(model, PhaseTickResponse):
+            ticks.append(model)
+        if len(ticks) == 3:
+            await runtime.stop()
+
+    runtime.add_sender(collect)
+
+    async def play() -> None:
+        await runtime.start()
+        await asyncio.wait_for(runtime._stopped.wait(), timeout=5)
+
+    asyncio.run(play())
+
+    assert [tick.tick.remaining_seconds for tick in ticks[:3]] == [2, 1, 0]
+    assert ticks[0].tick.phase == PHASE_SEQUENCE[3]
+    assert ticks[0].tick.total_seconds == 5
+
+
+def test_started_session_is_restored_for_returning_players(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = SnapshotStore(tmp_path)
+    monkeypatch.setattr(session_router, "_SESSION_REGISTRY", {})
+    monkeypatch.setattr(session_router, "_SESSION_STORE", InProcessSessionStore())
+    monkeypatch.setattr(session_router, "_SNAPSHOT_STORE", store)
+    monkeypatch.setattr(session_router, "_RESTORE_TASKS", set())
+    monkeypatch.setattr(session_router, "_load_user_profile", _anonymous_profile)
+
+    async def snapshot_game() -> tuple[list[dict[str, object]], dict[str, int]]:
+        for user in ("a", "b"):
+            context, *_ = await session_router._register_connection(
+                requested_code="snap", user_identifier=user, send=_discard
+            )
+        context.session_started = True
+        for phase in PHASE_SEQUENCE[:3]:
+            context.session.run_phase(phase)
+        context.runtime.resume_from(3, None)
+        await session_router._persist_snapshot(context)
+        await context.runtime.stop()
+        return (
+            [asdict(player) for player in context.players],
+            {user: player.id_ for user, player in context.assignments.items()},
+        )
+
+    players, assignments = asyncio.run(snapshot_game())
+    session_router._SESSION_REGISTRY.clear()
+
+    async def restart() -> session_router.SessionContext:
+        await session_router._restore_sessions()
+        restored = session_router._SESSION_REGISTRY["snap"]
+        assert restored.restored
+        assert not restored.runtime.has_started
+        with pytest.raises(session_router.SessionJoinError, match="in progress"):
+            await session_router._register_connection(
+                requested_code="snap", user_identifier="stranger", send=_discard
+            )
+        context, _, player, created = await session_router._register_connection(
+            requested_code="snap", user_identifier="a", send=_discard
+        )
+        assert context is restored
+        assert not created
+        assert player.id_ == assignments["a"]
+        assert context.runtime.has_started
+        assert context.runtime.current_phase == GamePhase.PRODUCTION
+        await context.runtime.stop()
+        return context
+
+    context = asyncio.run(restart())
+
+    assert not context.restored
+    assert [asdict(player) for player in context.players] == players
+    store.close()
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+
+from fabricat_backend.api.services import (
+    InProcessSessionStore,
+    SessionStore,
+    SqliteSessionStore,
+    create_session_store,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_in_process_store_owns_every_session_and_relays_locally() -> None:
+    async def scenario() -> tuple[str, list[str]]:
+        store = InProcessSessionStore(worker_id="solo")
+        received: list[str] = []
+
+        async def handler(data: str) -> None:
+            received.append(data)
+
+        store.subscribe("channel", handler)
+        owner = await store.claim("abc")
+        await store.publish("channel", "hello")
+        store.unsubscribe("channel", handler)
+        await store.publish("channel", "ignored")
+        return owner, received
+
+    owner, received = asyncio.run(scenario())
+
+    assert owner == "solo"
+    assert received == ["hello"]
+
+
+def test_sqlite_store_grants_each_session_to_one_worker(tmp_path: Path) -> None:
+    path = str(tmp_path / "sessions.sqlite3")
+
+    async def scenario() -> tuple[str, str, str]:
+        first = SqliteSessionStore(path, worker_id="a")
+        second = SqliteSessionStore(path, worker_id="b")
+        try:
+            claimed = await first.claim("abc")
+            contested = await second.claim("abc")
+            await first.release("abc")
+            reclaimed = await second.claim("abc")
+        finally:
+            await first.aclose()
+            await second.aclose()
+        return claimed, contested, reclaimed
+
+    assert asyncio.run(scenario()) == ("a", "a", "b")
+
+
+def test_sqlite_store_takes_over_expired_leases(tmp_path: Path) -> None:
+    path = str(tmp_path / "sessions.sqlite3")
+
+    async def scenario() -> str:
+        crashed = SqliteSessionStore(path, worker_id="a", lease_seconds=0.01)
+        survivor = SqliteSessionStore(path, worker_id="b")
+        try:
+            await crashed.claim("abc")
+            crashed._owned.clear()  # simulate a worker that stopped renewing
+            await asyncio.sleep(0.05)
+            return await survivor.claim("abc")
+        finally:
+            await crashed.aclose()
+            await survivor.aclose()
+
+    assert asyncio.run(scenario()) == "b"
+
+
+def test_sqlite_store_relays_messages_between_workers(tmp_path: Path) -> None:
+    path = str(tmp_path / "sessions.sqlite3")
+
+    async def scenario() -> list[str]:
+        sender = SqliteSessionStore(path, worker_id="a", poll_interval_seconds=0.01)
+        receiver = SqliteSessionStore(path, worker_id="b", poll_interval_seconds=0.01)
+        received: list[str] = []
+        delivered = asyncio.Event()
+
+        async def handler(data: str) -> None:
+            received.append(data)
+            if len(received) == 2:
+                delivered.set()
+
+        receiver.subscribe("relay:1:out", handler)
+        try:
+            await sender.publish("relay:1:out", "first")
+            await sender.publish("relay:2:out", "elsewhere")
+            await sender.publish("relay:1:out", "second")
+            await asyncio.wait_for(delivered.wait(), 2.0)
+        finally:
+            await sender.aclose()
+            await receiver.aclose()
+        return received
+
+    assert asyncio.run(scenario()) == ["first", "second"]
+
+
+def test_create_session_store_selects_backend(tmp_path: Path) -> None:
+    memory = create_session_store("memory://")
+    assert isinstance(memory, InProcessSessionStore)
+    assert isinstance(memory, SessionStore)
+
+    shared = create_session_store(f"sqlite:///{tmp_path / 'sessions.sqlite3'}")
+    assert isinstance(shared, SqliteSessionStore)
+    asyncio.run(shared.aclose())
+
+    with pytest.raises(ValueError, match="Unsupported session store"):
+        create_session_store("redis://localhost")
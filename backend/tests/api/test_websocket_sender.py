@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import asyncio
+
+from fabricat_backend.api.routers.session import WebSocketSender
+
+
+class _StalledWebSocket:
+    """Socket whose writes block until released."""
+
+    def __init__(self) -> None:
+        self.sent: list[str] = []
+        self.release = asyncio.Event()
+        self.close_code: int | None = None
+
+    async def send_text(self, data: str) -> None:
+        await self.release.wait()
+        self.sent.append(data)
+
+    async def close(self, code: int, reason: str) -> None:
+        del reason
+        self.close_code = code
+
+
+def test_ticks_are_coalesced_while_reports_are_kept() -> None:
+    async def scenario() -> list[str]:
+        socket = _StalledWebSocket()
+        sender = WebSocketSender(socket)
+        sender.start()
+        await sender.send_encoded("report-1")
+        await asyncio.sleep(0)
+        for second in range(5):
+            await sender.send_encoded(f"tick-{second}", droppable=True)
+        await sender.send_encoded("report-2")
+        await sender.send_encoded("tick-5", droppable=True)
+        await sender.send_encoded("tick-6", droppable=True)
+
+        assert sender.pending == 3
+        socket.release.set()
+        while sender.pending:
+            await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        await sender.aclose()
+        return socket.sent
+
+    assert asyncio.run(scenario()) == ["report-1", "tick-4", "report-2", "tick-6"]
+
+
+def test_slow_consumer_over_high_water_is_disconnected() -> None:
+    async def scenario() -> tuple[bool, int | None]:
+        socket = _StalledWebSocket()
+        sender = WebSocketSender(socket, high_water=2, overload_grace_seconds=0.0)
+        sender.start()
+        for index in range(4):
+            await sender.send_encoded(f"report-{index}")
+            await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        closed = sender.closed
+        await sender.aclose()
+        return closed, socket.close_code
+
+    closed, code = asyncio.run(scenario())
+
+    assert closed
+    assert code == 1013
+
+
+def test_enqueue_does_not_wait_for_stalled_socket() -> None:
+    async def scenario() -> int:
+        sender = WebSocketSender(_StalledWebSocket())
+        sender.start()
+        for index in range(10):
+            await asyncio.wait_for(sender.send_encoded(f"report-{index}"), 0.1)
+        pending = sender.pending
+        await sender.aclose()
+        return pending
+
+    assert asyncio.run(scenario()) >= 9
+
+
+def test_drain_waits_for_queued_frames_within_timeout() -> None:
+    async def scenario() -> tuple[list[str], list[str]]:
+        socket = _StalledWebSocket()
+        sender = WebSocketSender(socket)
+        sender.start()
+        await sender.send_encoded("report-1")
+        await sender.drain(wait_seconds=0.01)
+        stalled = list(socket.sent)
+
+        await sender.send_encoded("report-2")
+        asyncio.get_running_loop().call_later(0.01, socket.release.set)
+        await sender.drain(wait_seconds=2.0)
+        flushed = list(socket.sent)
+        await sender.aclose()
+        return stalled, flushed
+
+    stalled, flushed = asyncio.run(scenario())
+
+    assert stalled == []
+    assert flushed == ["report-1", "report-2"]
@@ -0,0 +1,168 @@
+"""Async database service and repositories over aiosqlite."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+from uuid import UUID, uuid4
+
+import pytest
+
+from fabricat_backend.api.services import (
+    AuthenticatedUser,
+    AuthService,
+    InvalidCredentialsError,
+    UserIdentityCache,
+)
+from fabricat_backend.database import (
+    AsyncDatabaseService,
+    AsyncGameHistoryRepository,
+    AsyncUserRepository,
+    AsyncUserStatsSummaryRepository,
+    BackendSettings,
+    BaseSchema,
+    DatabasePoolConfig,
+    DatabaseService,
+    GameHistoryRepository,
+    PlayerStatsRecord,
+    SessionHistoryRecord,
+)
+from fabricat_backend.shared import AvatarIcon
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_BASE = datetime(2026, 5, 1, tzinfo=UTC)
+
+
+def _stats(user_id: UUID, place: int) -> PlayerStatsRecord:
+    return PlayerStatsRecord(
+        user_id=user_id,
+        player_slot_id=place,
+        capital=1_000.0 * place,
+        place=place,
+        is_bankrupt=False,
+        is_top1=place == 1,
+        has_debt=False,
+        total_debt=0.0,
+        factories_basic=2,
+        factories_auto=0,
+        factories_builds_basic=0,
+        factories_builds_auto=0,
+        factories_upgrades=0,
+    )
+
+
+@pytest.fixture
+def url(tmp_path: Path) -> str:
+    url = f"sqlite:///{tmp_path / 'async.sqlite3'}"
+    BaseSchema.metadata.create_all(DatabaseService(url).engine)
+    return url
+
+
+def test_sync_url_is_served_by_an_async_driver(url: str) -> None:
+    database = AsyncDatabaseService(url, pool=DatabasePoolConfig(size=2))
+
+    assert database.engine.url.drivername == "sqlite+aiosqlite"
+    assert database.pool_metrics().capacity == 2 + DatabasePoolConfig().max_overflow
+    asyncio.run(database.dispose())
+
+
+def _auth(iterations: int, identities: UserIdentityCache | None = None) -> AuthService:
+    settings = BackendSettings(
+        auth_secret_key="x" * 32, auth_hash_iterations=iterations
+    )
+    return AuthService(settings=settings, identities=identities)
+
+
+def test_auth_round_trip_through_async_session(url: str) -> None:
+    auth = _auth(1_000)
+    database = AsyncDatabaseService(url)
+
+    async def scenario() -> None:
+        async with database.session() as session:
+            user, _ = await auth.aregister_user(
+                session=session,
+                nickname="async",
+                password="secret-1",
+                icon=AvatarIcon.DIVER,
+            )
+        async with database.session() as session:
+            found, token = await auth.aauthenticate_user(
+                session=session, nickname="async", password="secret-1"
+            )
+            assert found.id == user.id
+            assert auth.decode_access_token(token).sub == str(user.id)
+            with pytest.raises(InvalidCredentialsError):
+                await auth.aauthenticate_user(
+                    session=session, nickname="async", password="wrong"
+                )
+        await database.dispose()
+
+    asyncio.run(scenario())
+
+
+def test_login_upgrades_outdated_password_hash(url: str) -> None:
+    database = AsyncDatabaseService(url)
+    identities = UserIdentityCache()
+    upgraded = _auth(2_000, identities)
+
+    async def scenario() -> str:
+        async with database.session() as session:
+            user, _ = await _auth(1_000).aregister_user(
+                session=session,
+                nickname="legacy",
+                password="secret-1",
+                icon=AvatarIcon.DIVER,
+            )
+        identities.put(AuthenticatedUser.from_schema(user))
+        async with database.session() as session:
+            await upgraded.aauthenticate_user(
+                session=session, nickname="legacy", password="secret-1"
+            )
+        async with database.session() as session:
+            stored = await AsyncUserRepository(session).get_by_id(user.id)
+        await database.dispose()
+        assert stored is not None
+        assert identities.get(user.id) is None
+        return stored.password_hash
+
+    stored_hash = asyncio.run(scenario())
+
+    assert stored_hash.startswith("pbkdf2_sha256$2000$")
+    assert upgraded.verify_password("secret-1", stored_hash)
+
+
+def test_async_history_reads_match_recorded_games(url: str) -> None:
+    user_id = uuid4()
+    with DatabaseService(url).session() as session:
+        GameHistoryRepository(session).record_sessions(
+            [
+                SessionHistoryRecord(
+                    session_code=f"game-{index}",
+                    player_stats=[_stats(user_id, place=1 + index % 2)],
+                    finished_at=_BASE + timedelta(hours=index),
+                )
+                for index in range(3)
+            ]
+        )
+    database = AsyncDatabaseService(url)
+
+    async def scenario() -> None:
+        async with database.session() as session:
+            history = AsyncGameHistoryRepository(session)
+            recent = await history.get_recent_player_stats(user_id=user_id, limit=2)
+            single = await history.get_player_stats_for_session(
+                user_id=user_id, session_code="game-1"
+            )
+            summary = await AsyncUserStatsSummaryRepository(session).get(user_id)
+        await database.dispose()
+
+        assert [row[0].session_code for row in recent] == ["game-2", "game-1"]
+        assert single is not None
+        assert single[1].place == 2
+        assert summary is not None
+        assert (summary.games_played, summary.wins) == (3, 2)
+
+    asyncio.run(scenario())
@@ -0,0 +1,65 @@
+"""Connection pool configuration and health metrics."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from fabricat_backend.database import (
+    BackendSettings,
+    DatabasePoolConfig,
+    DatabaseService,
+    get_database,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_pool_reports_saturation_latency_and_timeouts(tmp_path: Path) -> None:
+    database = DatabaseService(
+        f"sqlite:///{tmp_path / 'pool.sqlite3'}",
+        pool=DatabasePoolConfig(size=2, max_overflow=0, timeout_seconds=0.05),
+    )
+
+    held = [database.engine.connect() for _ in range(2)]
+    busy = database.pool_metrics()
+    with pytest.raises(PoolTimeoutError):
+        database.engine.connect()
+    for connection in held:
+        connection.close()
+    with database.session() as session:
+        session.execute(text("SELECT 1"))
+    idle = database.pool_metrics()
+
+    assert (busy.capacity, busy.checked_out, busy.saturation) == (2, 2, 1.0)
+    assert (idle.checked_out, idle.peak_checked_out) == (0, 2)
+    assert (idle.checkouts, idle.timeouts) == (3, 1)
+    assert idle.wait_max_ms >= idle.wait_p95_ms >= idle.wait_p50_ms > 0
+
+
+def test_in_memory_sqlite_keeps_its_single_connection_pool() -> None:
+    database = DatabaseService("sqlite://", pool=DatabasePoolConfig(size=5))
+
+    with database.session() as session:
+        assert session.execute(text("SELECT 1")).scalar() == 1
+    assert database.pool_metrics().capacity == 0
+
+
+def test_get_database_shares_one_service_per_configuration(tmp_path: Path) -> None:
+    url = f"sqlite:///{tmp_path / 'shared.sqlite3'}"
+    settings = BackendSettings(
+        auth_secret_key="x" * 32,
+        database_url=url,
+        db_pool_size=3,
+        db_pool_max_overflow=1,
+    )
+
+    database = get_database(settings)
+
+    assert get_database(settings.model_copy()) is database
+    assert database.engine.pool.size() == 3
+    assert database.pool_metrics().capacity == 4
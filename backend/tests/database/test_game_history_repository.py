@@ -0,0 +1,166 @@
+"""Bulk recording of finished sessions."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event, func, select
+
+from fabricat_backend.database import (
+    BaseSchema,
+    DatabaseService,
+    GameHistoryRepository,
+    GamePlayerStatsSchema,
+    GameSessionSchema,
+    PlayerStatsRecord,
+    SessionHistoryRecord,
+    UserStatsSummarySchema,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _stats(slot: int) -> PlayerStatsRecord:
+    return PlayerStatsRecord(
+        user_id=uuid4(),
+        player_slot_id=slot,
+        capital=500.0 * slot,
+        place=slot,
+        is_bankrupt=False,
+        is_top1=slot == 1,
+        has_debt=slot > 1,
+        total_debt=10.0 * (slot - 1),
+        factories_basic=2,
+        factories_auto=slot,
+        factories_builds_basic=0,
+        factories_builds_auto=0,
+        factories_upgrades=1,
+    )
+
+
+@pytest.fixture
+def database(tmp_path: Path) -> DatabaseService:
+    service = DatabaseService(f"sqlite:///{tmp_path / 'history.sqlite3'}")
+    BaseSchema.metadata.create_all(service.engine)
+    return service
+
+
+def test_record_sessions_issues_one_insert_per_table(
+    database: DatabaseService,
+) -> None:
+    finished_at = datetime(2026, 3, 1, tzinfo=UTC)
+    records = [
+        SessionHistoryRecord(
+            session_code=f"code-{index}",
+            player_stats=[_stats(slot) for slot in range(1, 4)],
+            finished_at=finished_at,
+        )
+        for index in range(5)
+    ]
+    statements: list[tuple[str, bool]] = []
+    event.listen(
+        database.engine,
+        "before_cursor_execute",
+        lambda *args: statements.append((args[2], args[5])),
+    )
+
+    with database.session() as session:
+        ids = GameHistoryRepository(session).record_sessions(records)
+
+    inserts = [many for sql, many in statements if sql.startswith("INSERT INTO game_")]
+    assert inserts == [True, True]
+    with database.session() as session:
+        stored = session.scalars(select(GameSessionSchema)).all()
+        stats_per_session = dict(
+            session.execute(
+                select(GamePlayerStatsSchema.session_id, func.count()).group_by(
+                    GamePlayerStatsSchema.session_id
+                )
+            ).all()
+        )
+        by_id = {row.id: row for row in stored}
+        assert set(by_id) == set(ids)
+        assert [by_id[session_id].session_code for session_id in ids] == [
+            f"code-{index}" for index in range(5)
+        ]
+        assert stats_per_session == dict.fromkeys(ids, 3)
+
+
+def test_record_sessions_ignores_copy_outside_postgresql(
+    database: DatabaseService,
+) -> None:
+    records = [SessionHistoryRecord(session_code="solo", player_stats=[_stats(1)])]
+
+    with database.session() as session:
+        ids = GameHistoryRepository(session).record_sessions(records, use_copy=True)
+
+    with database.session() as session:
+        row = session.get(GameSessionSchema, ids[0])
+        assert row is not None
+        assert row.finished_at is not None
+        assert row.created_at is not None
+
+
+def test_record_sessions_skips_sessions_already_stored(
+    database: DatabaseService,
+) -> None:
+    record = SessionHistoryRecord(
+        session_code="retried",
+        player_stats=[_stats(1), _stats(2)],
+        session_id=uuid4(),
+    )
+
+    for _ in range(2):
+        with database.session() as session:
+            ids = GameHistoryRepository(session).record_sessions([record, record])
+        assert ids == [record.session_id, record.session_id]
+
+    with database.session() as session:
+        assert session.scalar(select(func.count(GameSessionSchema.id))) == 1
+        assert session.scalar(select(func.count(GamePlayerStatsSchema.id))) == 2
+        played = session.scalars(select(UserStatsSummarySchema.games_played)).all()
+        assert played == [1, 1]
+
+
+def test_recent_player_stats_pages_through_ties_by_keyset(
+    database: DatabaseService,
+) -> None:
+    user_id = uuid4()
+    base = datetime(2026, 3, 1, tzinfo=UTC)
+    records = []
+    for index in range(7):
+        stats = _stats(1)
+        stats.user_id = user_id
+        records.append(
+            SessionHistoryRecord(
+                session_code=f"code-{index}",
+                player_stats=[stats, _stats(2)],
+                # Pairs of games share a timestamp to exercise the id tiebreak.
+                finished_at=base + timedelta(minutes=index // 2),
+            )
+        )
+    with database.session() as session:
+        GameHistoryRepository(session).record_sessions(records)
+
+    pages: list[list[str]] = []
+    before = None
+    with database.session() as session:
+        repository = GameHistoryRepository(session)
+        while True:
+            rows = repository.get_recent_player_stats(
+                user_id=user_id, limit=3, before=before
+            )
+            if not rows:
+                break
+            pages.append([row.session_code for row, _ in rows])
+            last, _ = rows[-1]
+            before = (last.finished_at, last.id)
+
+    assert [len(page) for page in pages] == [3, 3, 1]
+    codes = [code for page in pages for code in page]
+    assert sorted(codes) == sorted(f"code-{index}" for index in range(7))
+    assert codes[0] == "code-6"
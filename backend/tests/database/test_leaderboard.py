@@ -0,0 +1,147 @@
+"""Leaderboard rankings over all-time and rolling windows."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import delete
+
+from fabricat_backend.database import (
+    BaseSchema,
+    DatabaseService,
+    GameHistoryRepository,
+    LeaderboardDailySchema,
+    LeaderboardRepository,
+    PlayerStatsRecord,
+    SessionHistoryRecord,
+    UserSchema,
+)
+from fabricat_backend.shared import LeaderboardMetric, LeaderboardWindow
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_NOW = datetime(2026, 6, 30, 12, tzinfo=UTC)
+
+
+def _stats(user_id: UUID, place: int) -> PlayerStatsRecord:
+    return PlayerStatsRecord(
+        user_id=user_id,
+        player_slot_id=place,
+        capital=1_000.0 / place,
+        place=place,
+        is_bankrupt=False,
+        is_top1=place == 1,
+        has_debt=False,
+        total_debt=0.0,
+        factories_basic=2,
+        factories_auto=0,
+        factories_builds_basic=0,
+        factories_builds_auto=0,
+        factories_upgrades=0,
+    )
+
+
+def _game(days_ago: int, *placements: UUID) -> SessionHistoryRecord:
+    return SessionHistoryRecord(
+        session_code=f"g{uuid4().hex[:8]}",
+        finished_at=_NOW - timedelta(days=days_ago),
+        player_stats=[
+            _stats(user_id, place) for place, user_id in enumerate(placements, 1)
+        ],
+    )
+
+
+@pytest.fixture
+def players(tmp_path: Path) -> tuple[DatabaseService, UUID, UUID, UUID]:
+    database = DatabaseService(f"sqlite:///{tmp_path / 'leaderboard.sqlite3'}")
+    BaseSchema.metadata.create_all(database.engine)
+    veteran, rookie, regular = uuid4(), uuid4(), uuid4()
+    with database.session() as session:
+        session.add(
+            UserSchema(id=veteran, nickname="veteran", password_hash="x", icon="pilot")
+        )
+        GameHistoryRepository(session).record_sessions(
+            [
+                # Old games: the veteran dominated a month ago.
+                _game(40, veteran, regular),
+                _game(40, veteran, regular),
+                _game(39, veteran, rookie),
+                # This week: the rookie wins twice, the regular once.
+                _game(2, rookie, veteran),
+                _game(1, rookie, regular),
+                _game(0, regular, veteran),
+            ]
+        )
+    return database, veteran, rookie, regular
+
+
+def _ranking(
+    database: DatabaseService,
+    metric: LeaderboardMetric,
+    window: LeaderboardWindow,
+    *,
+    min_games: int = 1,
+) -> list[tuple[UUID, int, int]]:
+    with database.session() as session:
+        rows = LeaderboardRepository(session).ranking(
+            metric=metric,
+            window=window,
+            limit=10,
+            min_games=min_games,
+            today=_NOW.date(),
+        )
+    return [(row.user_id, row.games_played, row.wins) for row in rows]
+
+
+def test_all_time_and_rolling_rankings_differ(
+    players: tuple[DatabaseService, UUID, UUID, UUID],
+) -> None:
+    database, veteran, rookie, regular = players
+
+    all_time = _ranking(database, LeaderboardMetric.WINS, LeaderboardWindow.ALL_TIME)
+    week = _ranking(database, LeaderboardMetric.WINS, LeaderboardWindow.WEEK)
+
+    assert all_time == [(veteran, 5, 3), (rookie, 3, 2), (regular, 4, 1)]
+    assert week == [(rookie, 2, 2), (regular, 2, 1), (veteran, 2, 0)]
+
+
+def test_average_place_ranking_respects_min_games_and_joins_profiles(
+    players: tuple[DatabaseService, UUID, UUID, UUID],
+) -> None:
+    database, veteran, rookie, _regular = players
+
+    ranked = _ranking(
+        database,
+        LeaderboardMetric.AVERAGE_PLACE,
+        LeaderboardWindow.ALL_TIME,
+        min_games=4,
+    )
+    with database.session() as session:
+        top = LeaderboardRepository(session).ranking(
+            metric=LeaderboardMetric.AVERAGE_PLACE,
+            window=LeaderboardWindow.ALL_TIME,
+            limit=1,
+            min_games=4,
+        )[0]
+
+    assert [user_id for user_id, *_ in ranked][0] == veteran
+    assert rookie not in [user_id for user_id, *_ in ranked]
+    assert (top.user_id, top.nickname, top.average_place) == (veteran, "veteran", 1.4)
+
+
+def test_rebuild_restores_incremental_daily_totals(
+    players: tuple[DatabaseService, UUID, UUID, UUID],
+) -> None:
+    database, *_ = players
+    before = _ranking(database, LeaderboardMetric.WINS, LeaderboardWindow.MONTH)
+
+    with database.session() as session:
+        session.execute(delete(LeaderboardDailySchema))
+    with database.session() as session:
+        assert LeaderboardRepository(session).rebuild() == 10
+
+    assert _ranking(database, LeaderboardMetric.WINS, LeaderboardWindow.MONTH) == before
@@ -0,0 +1,133 @@
+"""Incremental and rebuilt per-user career summaries."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import delete
+
+from fabricat_backend.database import (
+    BaseSchema,
+    DatabaseService,
+    GameHistoryRepository,
+    PlayerStatsRecord,
+    SessionHistoryRecord,
+    UserStatsSummaryRepository,
+    UserStatsSummarySchema,
+)
+from fabricat_backend.database.rebuild_stats import main
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_BASE = datetime(2026, 5, 1, tzinfo=UTC)
+
+
+def _stats(
+    user_id: UUID | None, *, place: int, capital: float, bankrupt: bool = False
+) -> PlayerStatsRecord:
+    return PlayerStatsRecord(
+        user_id=user_id,
+        player_slot_id=place,
+        capital=capital,
+        place=place,
+        is_bankrupt=bankrupt,
+        is_top1=place == 1,
+        has_debt=False,
+        total_debt=0.0,
+        factories_basic=2,
+        factories_auto=0,
+        factories_builds_basic=0,
+        factories_builds_auto=0,
+        factories_upgrades=0,
+    )
+
+
+def _snapshot(database: DatabaseService, user_id: UUID) -> tuple[object, ...]:
+    with database.session() as session:
+        row = UserStatsSummaryRepository(session).get(user_id)
+        assert row is not None
+        return (
+            row.games_played,
+            row.wins,
+            row.bankruptcies,
+            row.total_capital,
+            row.best_capital,
+            row.total_place,
+            row.last_finished_at.replace(tzinfo=UTC),
+        )
+
+
+@pytest.fixture
+def database(tmp_path: Path) -> DatabaseService:
+    service = DatabaseService(f"sqlite:///{tmp_path / 'stats.sqlite3'}")
+    BaseSchema.metadata.create_all(service.engine)
+    return service
+
+
+def test_summaries_follow_recorded_games_and_match_a_rebuild(
+    database: DatabaseService,
+) -> None:
+    alice, bob = uuid4(), uuid4()
+    with database.session() as session:
+        GameHistoryRepository(session).record_sessions(
+            [
+                SessionHistoryRecord(
+                    session_code="one",
+                    finished_at=_BASE,
+                    player_stats=[
+                        _stats(alice, place=1, capital=900.0),
+                        _stats(bob, place=2, capital=100.0, bankrupt=True),
+                        _stats(None, place=3, capital=50.0),
+                    ],
+                ),
+                SessionHistoryRecord(
+                    session_code="two",
+                    finished_at=_BASE + timedelta(hours=2),
+                    player_stats=[
+                        _stats(bob, place=1, capital=700.0),
+                        _stats(alice, place=2, capital=300.0),
+                    ],
+                ),
+            ]
+        )
+    with database.session() as session:
+        GameHistoryRepository(session).record_session(
+            session_code="three",
+            finished_at=_BASE + timedelta(hours=1),
+            player_stats=[_stats(alice, place=1, capital=600.0)],
+        )
+
+    expected_alice = (3, 2, 0, 1_800.0, 900.0, 4, _BASE + timedelta(hours=2))
+    expected_bob = (2, 1, 1, 800.0, 700.0, 3, _BASE + timedelta(hours=2))
+    assert _snapshot(database, alice) == expected_alice
+    assert _snapshot(database, bob) == expected_bob
+
+    with database.session() as session:
+        session.execute(delete(UserStatsSummarySchema))
+    assert main(["--database-url", str(database.engine.url)]) is None
+
+    assert _snapshot(database, alice) == expected_alice
+    assert _snapshot(database, bob) == expected_bob
+
+
+def test_rebuild_drops_summaries_without_history(database: DatabaseService) -> None:
+    with database.session() as session:
+        session.add(
+            UserStatsSummarySchema(
+                user_id=uuid4(),
+                games_played=4,
+                wins=1,
+                bankruptcies=0,
+                total_capital=10.0,
+                best_capital=5.0,
+                total_place=8,
+                last_finished_at=_BASE,
+            )
+        )
+
+    with database.session() as session:
+        assert UserStatsSummaryRepository(session).rebuild() == 0
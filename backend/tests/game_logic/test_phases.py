@@ -1,8 +1,16 @@
 """Tests for phase timer utilities."""
 
 import asyncio
+import math
 
-from fabricat_backend.game_logic.phases import GamePhase, PhaseTimer
+import pytest
+
+from fabricat_backend.game_logic.phases import (
+    GamePhase,
+    PhaseTimer,
+    TickScheduler,
+    get_tick_scheduler,
+)
 
 
 def test_phase_timer_counts_down_quickly() -> None:
@@ -30,3 +38,65 @@ def test_phase_timer_can_cancel_midway() -> None:
 
     asyncio.run(collect())
     assert ticks == [5, 4, 3]
+
+
+def test_phase_timer_does_not_drift_behind_slow_consumers() -> None:
+    timer = PhaseTimer(default_duration_seconds=10, tick_resolution_seconds=0.02)
+
+    async def collect() -> tuple[list[int], float]:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        ticks: list[int] = []
+        async for tick in timer.ticks(phase=GamePhase.BUY):
+            ticks.append(tick.remaining_seconds)
+            await asyncio.sleep(0.03)
+        return ticks, loop.time() - started
+
+    ticks, elapsed = asyncio.run(collect())
+
+    assert ticks[0] == 10
+    assert ticks[-1] == 0
+    assert ticks == sorted(ticks, reverse=True)
+    assert len(ticks) < 11
+    assert elapsed < 0.4
+
+
+def test_tick_scheduler_releases_same_slot_in_one_batch() -> None:
+    async def scenario() -> tuple[int, list[bool]]:
+        loop = asyncio.get_running_loop()
+        scheduler = TickScheduler(loop, granularity_seconds=0.05)
+        slot_start = math.ceil(loop.time() / 0.05) * 0.05
+        waiters = [
+            scheduler.wait_until(slot_start + 0.001 + 0.01 * index)
+            for index in range(5)
+        ]
+        cancelled = scheduler.wait_until(slot_start + 0.02)
+        cancelled.set_result(False)
+        pending_before = scheduler.pending
+        await waiters[0]
+        return pending_before, [waiter.done() for waiter in waiters]
+
+    pending, done = asyncio.run(scenario())
+
+    assert pending == 5
+    assert all(done)
+
+
+def test_tick_scheduler_is_shared_per_loop() -> None:
+    async def scheduler_pair() -> tuple[TickScheduler, TickScheduler]:
+        return get_tick_scheduler(), get_tick_scheduler()
+
+    first, second = asyncio.run(scheduler_pair())
+    third, _ = asyncio.run(scheduler_pair())
+
+    assert first is second
+    assert first is not third
+
+
+def test_tick_scheduler_rejects_negative_granularity() -> None:
+    loop = asyncio.new_event_loop()
+    try:
+        with pytest.raises(ValueError, match="granularity"):
+            TickScheduler(loop, granularity_seconds=-1)
+    finally:
+        loop.close()
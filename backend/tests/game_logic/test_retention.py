@@ -0,0 +1,90 @@
+"""Tests for bounded report and journal retention."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from fabricat_backend.game_logic.phases import (
+    PHASE_SEQUENCE,
+    GamePhase,
+    PhaseJournalEntry,
+)
+from fabricat_backend.game_logic.retention import RetainedLog, RetentionPolicy
+from fabricat_backend.game_logic.session import (
+    GameSession,
+    Player,
+    default_game_settings,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _entry(index: int) -> PhaseJournalEntry:
+    return PhaseJournalEntry(
+        month=1, phase=GamePhase.BUY, message=f"entry {index}", payload={"i": index}
+    )
+
+
+def test_log_spills_oldest_entries_and_reads_them_back(tmp_path: Path) -> None:
+    log = RetainedLog(PhaseJournalEntry, max_entries=3, spill_dir=tmp_path)
+
+    log.extend(_entry(index) for index in range(10))
+
+    assert len(log) == 10
+    assert log.spilled_count == 7
+    assert [entry.payload["i"] for entry in log] == list(range(10))
+    assert [entry.payload["i"] for entry in log.recent()] == [7, 8, 9]
+    assert len(list(tmp_path.iterdir())) == 1
+
+    log.close()
+
+    assert list(tmp_path.iterdir()) == []
+    assert len(log) == 0
+
+
+def test_unbounded_log_never_touches_disk(tmp_path: Path) -> None:
+    log = RetainedLog(PhaseJournalEntry, spill_dir=tmp_path)
+
+    log.extend(_entry(index) for index in range(100))
+
+    assert log.spilled_count == 0
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_policy_rejects_empty_buffers() -> None:
+    with pytest.raises(ValueError, match="at least one entry"):
+        RetentionPolicy(max_reports=0)
+
+
+def test_session_keeps_recent_reports_in_memory(tmp_path: Path) -> None:
+    players = [
+        Player(id_=1, money=10_000.0, priority=1),
+        Player(id_=2, money=10_000.0, priority=2),
+    ]
+    session = GameSession(
+        players=players,
+        settings=default_game_settings(),
+        retention=RetentionPolicy(
+            max_reports=2, max_journal_entries=4, spill_dir=tmp_path
+        ),
+    )
+
+    reports = [session.run_phase(phase) for phase in PHASE_SEQUENCE * 2]
+    journal = [entry for report in reports for entry in report.journal]
+
+    assert [report.model_dump() for report in session.phase_reports] == [
+        report.model_dump() for report in reports
+    ]
+    assert list(session.iter_phase_reports(retained_only=True)) == reports[-2:]
+    assert session.latest_phase_report is reports[-1]
+    assert session.action_journal == journal
+    assert len(list(session.iter_action_journal(retained_only=True))) == min(
+        len(journal), 4
+    )
+
+    session.close()
+
+    assert list(tmp_path.iterdir()) == []
@@ -5,17 +5,20 @@ from random import Random
 
 import pytest
 
-from fabricat_backend.game_logic.phases import GamePhase
+from fabricat_backend.game_logic import session as session_module
+from fabricat_backend.game_logic.phases import PHASE_SEQUENCE, GamePhase
 from fabricat_backend.game_logic.session import (
     Bid,
     Factory,
-    FinishedGood,
     GameSession,
+    GameSessionSnapshot,
     GameSettings,
     Loan,
     Player,
-    RawMaterial,
+    RawMaterialStock,
+    default_game_settings,
 )
+from fabricat_backend.game_logic.simulation import PlayerStrategy, build_strategies
 
 
 def make_settings(**overrides: object) -> GameSettings:
@@ -68,15 +71,11 @@ def make_player(
 
 
 def add_raw_materials(player: Player, count: int) -> None:
-    player.raw_materials.extend(
-        RawMaterial(monthly_expenses=300.0) for _ in range(count)
-    )
+    player.raw_materials.add(count)
 
 
 def add_finished_goods(player: Player, count: int) -> None:
-    player.finished_goods.extend(
-        FinishedGood(monthly_expenses=500.0) for _ in range(count)
-    )
+    player.finished_goods.add(count)
 
 
 def add_factories(player: Player, types: Iterable[str]) -> None:
@@ -107,16 +106,86 @@ def test_buy_bids_sorted_by_price_then_priority_and_respect_limits() -> None:
 
     session.process_buy_bids()
 
-    assert len(players[1].raw_materials) == 2
+    assert players[1].raw_materials.count == 2
     assert players[1].money == pytest.approx(500.0)
 
-    assert len(players[0].raw_materials) == 2
+    assert players[0].raw_materials.count == 2
     assert players[0].money == pytest.approx(500.0)
 
-    assert len(players[2].raw_materials) == 0
+    assert players[2].raw_materials.count == 0
     assert players[2].money == pytest.approx(1_000.0)
 
 
+def _random_amount(rng: Random, low: int, high: int) -> float:
+    """Return an integral amount most of the time and a fractional one otherwise."""
+    if rng.random() < 0.2:
+        return rng.uniform(low, high)
+    return float(rng.randint(low, high))
+
+
+def _settle_random_market(seed: int) -> tuple[object, ...]:
+    rng = Random(seed)
+    settings = make_settings(
+        bank_raw_material_sell_volume_range=(0, 40),
+        bank_finished_good_buy_volume_range=(0, 40),
+        bank_raw_material_sell_min_price_range=(100.0, 300.0),
+        bank_finished_good_buy_max_price_range=(300.0, 600.0),
+        bank_start_money=_random_amount(rng, 0, 50_000),
+        max_raw_material_storage=rng.randint(0, 30),
+    )
+    players = [
+        make_player(
+            player_id=idx,
+            money=_random_amount(rng, 0, 8_000),
+            priority=idx,
+        )
+        for idx in range(1, 5)
+    ]
+    for player in players:
+        add_raw_materials(player, rng.randint(0, 12))
+        add_finished_goods(player, rng.randint(0, 25))
+        player.buy_bid = Bid(
+            quantity=rng.randint(0, 30), price=_random_amount(rng, 50, 400)
+        )
+        player.sell_bid = Bid(
+            quantity=rng.randint(0, 30), price=_random_amount(rng, 200, 700)
+        )
+
+    session = GameSession(players=players, settings=settings, seed_seniority=False)
+    session.run_phase(GamePhase.MARKET)
+    buy_report = session.run_phase(GamePhase.BUY)
+    sell_report = session.run_phase(GamePhase.SELL)
+
+    return (
+        session._bank.money,
+        session._bank.raw_material_sell_volume,
+        session._bank.finished_good_buy_volume,
+        [
+            (
+                player.money,
+                player.raw_materials.count,
+                player.finished_goods.count,
+                player.is_bankrupt,
+            )
+            for player in players
+        ],
+        [entry.payload for entry in buy_report.journal],
+        [entry.payload for entry in sell_report.journal],
+    )
+
+
+def test_bulk_bid_settlement_matches_unit_by_unit_loop(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    for seed in range(300):
+        bulk = _settle_random_market(seed)
+        with monkeypatch.context() as patch:
+            patch.setattr(session_module, "_is_exact_integral", lambda *_: False)
+            per_unit = _settle_random_market(seed)
+
+        assert bulk == per_unit
+
+
 def test_start_production_respects_costs_and_upgrade_factories() -> None:
     player = make_player(player_id=1, money=20_000.0, priority=1)
     add_factories(player, ["basic", "upgrades", "auto"])
@@ -131,13 +200,46 @@ def test_start_production_respects_costs_and_upgrade_factories() -> None:
     )
     session.start_production()
 
-    assert len(player.raw_materials) == 1
-    assert len(player.finished_goods) == 4
+    assert player.raw_materials.count == 1
+    assert player.finished_goods.count == 4
     assert player.money == pytest.approx(13_000.0)
     assert player.production_call_for_basic == 1
     assert player.production_call_for_auto == 1
 
 
+def test_engine_records_reject_invalid_values() -> None:
+    with pytest.raises(ValueError, match="priority"):
+        make_player(player_id=1, priority=5)
+    with pytest.raises(ValueError, match="negative"):
+        RawMaterialStock(count=-1)
+    with pytest.raises(TypeError):
+        Player(1, 10_000.0, 1)  # type: ignore[misc]
+
+
+def test_collect_expenses_charges_counted_stock_in_one_payment() -> None:
+    player = make_player(player_id=1, money=100_000.0, priority=1)
+    add_raw_materials(player, 100)
+    add_finished_goods(player, 20)
+    session = GameSession(
+        players=[player],
+        settings=make_settings(),
+        seed_seniority=False,
+    )
+
+    session.collect_expenses()
+
+    assert player.raw_materials.unit_monthly_expenses == pytest.approx(300.0)
+    assert player.finished_goods.unit_monthly_expenses == pytest.approx(500.0)
+    assert player.money == pytest.approx(60_000.0)
+    assert player.is_bankrupt is False
+
+    player.raw_materials.add(1_000)
+    session.collect_expenses()
+
+    assert player.money == pytest.approx(0.0)
+    assert player.is_bankrupt is True
+
+
 def test_process_loans_issues_interest_and_repayment() -> None:
     player = make_player(player_id=1, money=5_000.0, priority=1)
     player.loans[0].loan_status = "call"
@@ -315,6 +417,50 @@ def test_run_phase_returns_report_with_journal_entries() -> None:
     assert report.analytics.players[0].player_id == player.id_
 
 
+def test_phase_analytics_rebuilds_only_dirty_players() -> None:
+    players = [
+        make_player(player_id=1, money=5_000.0, priority=1),
+        make_player(player_id=2, money=5_000.0, priority=2),
+    ]
+    add_factories(players[0], ["basic"])
+    add_raw_materials(players[0], 1)
+    session = GameSession(
+        players=players,
+        settings=make_settings(basic_factory_launch_cost=100.0),
+        seed_seniority=False,
+    )
+    initial = session.snapshot_analytics()
+
+    assert session.snapshot_analytics() is initial
+
+    market = session.run_phase(GamePhase.MARKET).analytics
+    assert market.players[0] is initial.players[0]
+    assert market.players[1] is initial.players[1]
+    assert market.bank_raw_material_volume == 5
+
+    players[0].production_call_for_basic = 1
+    production = session.run_phase(GamePhase.PRODUCTION).analytics
+    assert production.players[0] is not market.players[0]
+    assert production.players[0].finished_goods == 1
+    assert production.players[1] is market.players[1]
+    assert market.players[0].finished_goods == 0
+
+
+def test_invalidate_analytics_picks_up_external_changes() -> None:
+    player = make_player(player_id=1, money=5_000.0, priority=1)
+    session = GameSession(
+        players=[player],
+        settings=make_settings(),
+        seed_seniority=False,
+    )
+    assert session.snapshot_analytics().players[0].nickname is None
+
+    player.nickname = "Ada"
+    session.invalidate_analytics(player.id_)
+
+    assert session.snapshot_analytics().players[0].nickname == "Ada"
+
+
 def test_seniority_history_tracks_rotations() -> None:
     players = [
         make_player(player_id=1, money=5_000.0, priority=1),
@@ -374,3 +520,41 @@ def test_final_player_stats_collects_capital_and_factories() -> None:
     assert p2.is_top1 is False
     assert p2.has_debt is False
     assert (p2.factories_basic, p2.factories_upgrades) == (1, 1)
+
+
+def test_restored_session_continues_identically() -> None:
+    settings = default_game_settings().model_copy(update={"max_months": 6})
+    names = ["producer", "borrower", "random"]
+    players = [Player(id_=seat, money=10_000.0, priority=seat) for seat in range(1, 4)]
+    session = GameSession(players=players, settings=settings)
+    phases = iter(PHASE_SEQUENCE * settings.max_months)
+
+    def play(
+        game: GameSession, phase: GamePhase, strategies: list[PlayerStrategy]
+    ) -> None:
+        for player, strategy in zip(game.players, strategies, strict=True):
+            if not player.is_bankrupt:
+                strategy.act(phase, player, game)
+        game.run_phase(phase)
+
+    warmup = build_strategies(names, seed=3)
+    for phase in [next(phases) for _ in range(13)]:
+        play(session, phase, warmup)
+
+    encoded = session.snapshot().model_dump_json()
+    restored = GameSession.restore(GameSessionSnapshot.model_validate_json(encoded))
+
+    assert restored.players == session.players
+    assert restored.seniority_history == session.seniority_history
+    assert restored.phase_reports == []
+
+    original_strategies = build_strategies(names, seed=4)
+    restored_strategies = build_strategies(names, seed=4)
+    for phase in phases:
+        play(session, phase, original_strategies)
+        play(restored, phase, restored_strategies)
+        if session.is_finished:
+            break
+
+    assert restored.is_finished
+    assert restored.build_final_player_stats() == session.build_final_player_stats()
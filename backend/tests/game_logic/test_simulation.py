@@ -0,0 +1,82 @@
+"""Tests for the headless batch simulation engine."""
+
+import pytest
+
+from fabricat_backend.game_logic.phase_benchmark import benchmark_phases
+from fabricat_backend.game_logic.phases import PHASE_SEQUENCE, GamePhase
+from fabricat_backend.game_logic.session import (
+    GameSession,
+    Player,
+    default_game_settings,
+)
+from fabricat_backend.game_logic.simulation import (
+    build_strategies,
+    run_batch,
+    simulate_game,
+)
+
+
+def test_advance_phase_skips_reports_and_journal() -> None:
+    players = [
+        Player(id_=1, money=10_000.0, priority=1),
+        Player(id_=2, money=10_000.0, priority=2),
+    ]
+    session = GameSession(players=players, settings=default_game_settings())
+
+    session.advance_phase(GamePhase.EXPENSES)
+    session.advance_phase(GamePhase.MARKET)
+
+    assert session.phase_reports == []
+    assert session.action_journal == []
+    assert players[0].money == pytest.approx(8_000.0)
+    assert session.bank.raw_material_sell_volume > 0
+
+
+def test_simulate_game_is_deterministic_per_seed() -> None:
+    settings = default_game_settings()
+    names = ("producer", "random", "passive")
+
+    first = simulate_game(settings, build_strategies(names, seed=7), seed=7)
+    second = simulate_game(settings, build_strategies(names, seed=7), seed=7)
+
+    assert first == second
+    assert sorted(stat.place for stat in first) == [1, 2, 3]
+
+
+def test_run_batch_aggregates_every_seat() -> None:
+    settings = default_game_settings().model_copy(update={"max_months": 3})
+
+    summary = run_batch(
+        games=5,
+        settings=settings,
+        strategy_names=("producer", "passive"),
+    )
+
+    assert summary.games == 5
+    assert [seat.strategy for seat in summary.seats] == ["producer", "passive"]
+    assert all(seat.games == 5 for seat in summary.seats)
+    assert sum(seat.wins for seat in summary.seats) == 5
+
+
+def test_run_batch_is_independent_of_worker_count() -> None:
+    settings = default_game_settings().model_copy(update={"max_months": 3})
+    names = ("producer", "random")
+
+    serial = run_batch(games=6, settings=settings, strategy_names=names, workers=1)
+    pooled = run_batch(games=6, settings=settings, strategy_names=names, workers=2)
+
+    assert pooled.to_dict() == serial.to_dict()
+
+
+def test_phase_benchmark_times_every_phase() -> None:
+    result = benchmark_phases(games=2, max_months=2, reports=True)
+
+    assert list(result.phases) == [phase.value for phase in PHASE_SEQUENCE]
+    assert result.setup.calls == 2
+    assert all(timing.calls == 4 for timing in result.phases.values())
+    assert result.to_dict()["month_us"] == pytest.approx(result.month_us, abs=0.01)
+
+
+def test_run_batch_rejects_unknown_strategy() -> None:
+    with pytest.raises(ValueError, match="Unknown strategy"):
+        run_batch(games=1, strategy_names=("producer", "oracle"))
@@ -0,0 +1,109 @@
+"""Tests for the vectorized Monte Carlo engine."""
+
+import json
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from fabricat_backend.game_logic.session import (  # noqa: E402
+    GameSettings,
+    default_game_settings,
+)
+from fabricat_backend.game_logic.simulation import (  # noqa: E402
+    build_strategies,
+    main,
+    simulate_game,
+)
+from fabricat_backend.game_logic.vectorized import (  # noqa: E402
+    DEFAULT_VECTORIZED_STRATEGIES,
+    simulate_vectorized,
+)
+
+SCALAR_GAMES = 400
+VECTORIZED_SESSIONS = 20_000
+STRATEGIES = ("producer", "borrower", "passive")
+
+
+def _profitable_settings() -> GameSettings:
+    """Cheap production so producers trade, build, borrow, and sometimes fail."""
+    return default_game_settings().model_copy(
+        update={
+            "basic_factory_launch_cost": 50.0,
+            "auto_factory_launch_cost": 80.0,
+            "build_basic_cost": 2_000.0,
+            "raw_material_monthly_expenses": 20.0,
+            "finished_good_monthly_expenses": 30.0,
+            "basic_factory_monthly_expenses": 100.0,
+            "auto_factory_monthly_expenses": 150.0,
+        }
+    )
+
+
+def _within(scalar: np.ndarray, vectorized: np.ndarray, *, floor: float) -> bool:
+    """Return whether two sample means agree within five standard errors."""
+    error = np.sqrt(
+        scalar.var() / scalar.size + vectorized.var() / vectorized.size + floor**2
+    )
+    return abs(scalar.mean() - vectorized.mean()) <= 5 * error
+
+
+def test_vectorized_engine_matches_scalar_distributions() -> None:
+    settings = _profitable_settings()
+    scalar = [
+        sorted(
+            simulate_game(settings, build_strategies(STRATEGIES, seed=seed), seed=seed),
+            key=lambda stats: stats.player_id,
+        )
+        for seed in range(SCALAR_GAMES)
+    ]
+    outcome = simulate_vectorized(
+        settings, STRATEGIES, sessions=VECTORIZED_SESSIONS, seed=1
+    )
+
+    for seat in range(len(STRATEGIES)):
+        capital = np.array([game[seat].capital for game in scalar])
+        bankrupt = np.array([game[seat].is_bankrupt for game in scalar], dtype=float)
+        wins = np.array([game[seat].is_top1 for game in scalar], dtype=float)
+
+        assert _within(capital, outcome.capital[:, seat], floor=1.0)
+        assert _within(bankrupt, outcome.bankrupt[:, seat].astype(float), floor=0.01)
+        assert _within(wins, (outcome.place[:, seat] == 1).astype(float), floor=0.01)
+
+
+def test_vectorized_outcome_summary_is_consistent() -> None:
+    outcome = simulate_vectorized(
+        default_game_settings(), ("producer", "passive"), sessions=50, seed=3
+    )
+    summary = outcome.summary()
+
+    assert summary.games == 50
+    assert sum(seat.wins for seat in summary.seats) == 50
+    assert sorted(np.unique(outcome.place)) == [1, 2]
+    assert (outcome.completed_months <= default_game_settings().max_months).all()
+
+
+def test_vectorized_engine_rejects_unsupported_strategy() -> None:
+    with pytest.raises(ValueError, match="not supported"):
+        simulate_vectorized(default_game_settings(), ("random",), sessions=1)
+
+
+def test_cli_runs_vectorized_engine_with_default_seats(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    main(["--engine", "vectorized", "--games", "50", "--max-months", "2"])
+
+    summary = json.loads(capsys.readouterr().out)
+    assert summary["games"] == 50
+    assert [seat["strategy"] for seat in summary["seats"]] == list(
+        DEFAULT_VECTORIZED_STRATEGIES
+    )
+
+
+def test_cli_rejects_seats_the_vectorized_engine_cannot_play(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    with pytest.raises(SystemExit):
+        main(["--engine", "vectorized", "--strategies", "random"])
+
+    assert "not supported" in capsys.readouterr().err
@@ -7,10 +7,12 @@ import pytest
 from fastapi.testclient import TestClient
 
 from fabricat_backend.api import create_api
-from fabricat_backend.database import UserSchema, get_session
+from fabricat_backend.api.dependencies import get_auth_service
+from fabricat_backend.api.services import AuthService, HashingBusyError
+from fabricat_backend.database import BackendSettings, UserSchema, get_async_session
 
 if TYPE_CHECKING:
-    from collections.abc import Generator, Iterator
+    from collections.abc import AsyncGenerator, Iterator
     from uuid import UUID
 
 
@@ -26,16 +28,16 @@ class FakeUserRepository:
     def reset(cls) -> None:
         cls._store = {}
 
-    def get_by_id(self, user_id: UUID) -> UserSchema | None:
+    async def get_by_id(self, user_id: UUID) -> UserSchema | None:
         return type(self)._store.get(user_id)
 
-    def get_by_nickname(self, nickname: str) -> UserSchema | None:
+    async def get_by_nickname(self, nickname: str) -> UserSchema | None:
         return next(
             (user for user in type(self)._store.values() if user.nickname == nickname),
             None,
         )
 
-    def add(self, user: UserSchema) -> UserSchema:
+    async def add(self, user: UserSchema) -> UserSchema:
         if getattr(user, "created_at", None) is None:
             timestamp = datetime.now(UTC)
             user.created_at = timestamp
@@ -54,18 +56,18 @@ def reset_repo() -> Iterator[None]:
 @pytest.fixture
 def client(monkeypatch: pytest.MonkeyPatch) -> Iterator[TestClient]:
     monkeypatch.setattr(
-        "fabricat_backend.api.services.auth.UserRepository", FakeUserRepository
+        "fabricat_backend.api.services.auth.AsyncUserRepository", FakeUserRepository
     )
     monkeypatch.setattr(
-        "fabricat_backend.api.dependencies.UserRepository", FakeUserRepository
+        "fabricat_backend.api.dependencies.AsyncUserRepository", FakeUserRepository
     )
 
     app = create_api()
 
-    def override_session() -> Generator[None, None, None]:
+    async def override_session() -> AsyncGenerator[None, None]:
         yield None
 
-    app.dependency_overrides[get_session] = override_session
+    app.dependency_overrides[get_async_session] = override_session
     with TestClient(app) as test_client:
         yield test_client
     app.dependency_overrides.clear()
@@ -127,3 +129,25 @@ def test_login_user_invalid_credentials(client: TestClient) -> None:
     response = client.post("/auth/login", json=payload)
 
     assert response.status_code == 401
+
+
+class _SaturatedHasher:
+    async def ahash_password(self, password: str) -> str:
+        raise HashingBusyError(password)
+
+
+def test_register_is_rejected_while_hashing_is_saturated(client: TestClient) -> None:
+    settings = BackendSettings(auth_secret_key="x" * 32)
+    client.app.dependency_overrides[get_auth_service] = lambda: AuthService(
+        settings=settings, hasher=_SaturatedHasher()
+    )
+    payload = {
+        "nickname": "PlayerThree",
+        "password": "Password123",
+        "icon": "astronaut",
+    }
+
+    response = client.post("/auth/register", json=payload)
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
@@ -12,20 +12,18 @@ from fastapi.testclient import TestClient
 from fabricat_backend.api import create_api
 from fabricat_backend.api.models.session import GamePhase
 from fabricat_backend.api.routers import session as session_router
-from fabricat_backend.database import UserSchema, get_session
+from fabricat_backend.database import UserSchema, get_async_session
 from fabricat_backend.game_logic.phases import PHASE_SEQUENCE, PhaseReport, PhaseTick
 from fabricat_backend.game_logic.session import (
-    FinishedGood,
     GameSettings,
     Player,
-    RawMaterial,
 )
 from fabricat_backend.game_logic.session import (
     GameSession as OriginalGameSession,
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Generator, Iterator
+    from collections.abc import AsyncGenerator, Callable, Generator, Iterator
     from uuid import UUID
 
     from starlette.testclient import WebSocketTestSession
@@ -43,16 +41,16 @@ class FakeUserRepository:
     def reset(cls) -> None:
         cls._store = {}
 
-    def get_by_id(self, user_id: UUID) -> UserSchema | None:
+    async def get_by_id(self, user_id: UUID) -> UserSchema | None:
         return type(self)._store.get(user_id)
 
-    def get_by_nickname(self, nickname: str) -> UserSchema | None:
+    async def get_by_nickname(self, nickname: str) -> UserSchema | None:
         return next(
             (user for user in type(self)._store.values() if user.nickname == nickname),
             None,
         )
 
-    def add(self, user: UserSchema) -> UserSchema:
+    async def add(self, user: UserSchema) -> UserSchema:
         if getattr(user, "created_at", None) is None:
             timestamp = datetime.now(UTC)
             user.created_at = timestamp
@@ -138,16 +136,8 @@ class SharedSessionHarness:
         ]
 
         for player in players:
-            player.raw_materials.append(
-                RawMaterial(
-                    monthly_expenses=self.settings.raw_material_monthly_expenses
-                )
-            )
-            player.finished_goods.append(
-                FinishedGood(
-                    monthly_expenses=self.settings.finished_good_monthly_expenses
-                )
-            )
+            player.raw_materials.add(1)
+            player.finished_goods.add(1)
 
         player_one = players[0]
         player_one.loans[0].amount = 1_000.0
@@ -262,7 +252,7 @@ class PatchedSessionRuntime:
     def has_started(self) -> bool:
         return self._task is not None
 
-    def add_sender(self, sender: Any) -> None:
+    def add_sender(self, sender: Any, **_kwargs: Any) -> None:
         if sender not in self._senders:
             self._senders.append(sender)
             self._refcount += 1
@@ -354,18 +344,18 @@ def reset_repo() -> Iterator[None]:
 @pytest.fixture
 def client(monkeypatch: pytest.MonkeyPatch) -> Iterator[TestClient]:
     monkeypatch.setattr(
-        "fabricat_backend.api.services.auth.UserRepository", FakeUserRepository
+        "fabricat_backend.api.services.auth.AsyncUserRepository", FakeUserRepository
     )
     monkeypatch.setattr(
-        "fabricat_backend.api.dependencies.UserRepository", FakeUserRepository
+        "fabricat_backend.api.dependencies.AsyncUserRepository", FakeUserRepository
     )
 
     app = create_api()
 
-    def override_session() -> Generator[None, None, None]:
+    async def override_session() -> AsyncGenerator[None, None]:
         yield None
 
-    app.dependency_overrides[get_session] = override_session
+    app.dependency_overrides[get_async_session] = override_session
     with TestClient(app) as test_client:
         yield test_client
     app.dependency_overrides.clear()